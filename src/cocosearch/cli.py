@@ -170,6 +170,11 @@ def index_command(args: argparse.Namespace) -> int:
     config_kwargs: dict[str, Any] = {
         "chunk_size": project_config.indexing.chunkSize,
         "chunk_overlap": project_config.indexing.chunkOverlap,
+        "vector_index": project_config.indexing.vectorIndex,
+        "hnsw_m": project_config.indexing.hnswM,
+        "hnsw_ef_construction": project_config.indexing.hnswEfConstruction,
+        "ivfflat_lists": project_config.indexing.ivfflatLists,
+        "vector_storage": project_config.indexing.vectorStorage,
     }
     if project_config.indexing.includePatterns:
         config_kwargs["include_patterns"] = project_config.indexing.includePatterns
@@ -180,19 +185,17 @@ def index_command(args: argparse.Namespace) -> int:
     # Merge CLI args with config (CLI overrides config)
     if args.include:
         # Append CLI includes to config includes
-        config = IndexingConfig(
-            include_patterns=list(config.include_patterns) + list(args.include),
-            exclude_patterns=config.exclude_patterns,
-            chunk_size=config.chunk_size,
-            chunk_overlap=config.chunk_overlap,
+        config = config.model_copy(
+            update={
+                "include_patterns": list(config.include_patterns) + list(args.include)
+            }
         )
     if args.exclude:
         # Append CLI excludes to config excludes
-        config = IndexingConfig(
-            include_patterns=config.include_patterns,
-            exclude_patterns=list(config.exclude_patterns) + list(args.exclude),
-            chunk_size=config.chunk_size,
-            chunk_overlap=config.chunk_overlap,
+        config = config.model_copy(
+            update={
+                "exclude_patterns": list(config.exclude_patterns) + list(args.exclude)
+            }
         )
 
     # Detect git branch/commit for metadata tracking
@@ -220,8 +223,8 @@ def index_command(args: argparse.Namespace) -> int:
             branch=branch,
             commit_hash=commit_hash,
             branch_commit_count=branch_commit_count,
+            status="indexing",
         )
-        set_index_status(index_name, "indexing")
     except Exception:
         pass  # Best-effort — don't block indexing on metadata failures
 
@@ -469,6 +472,7 @@ def search_command(args: argparse.Namespace) -> int:
             symbol_type=symbol_type,
             symbol_name=symbol_name,
             no_cache=no_cache,
+            include_content=True,
         )
     except Exception as e:
         if args.pretty:
@@ -575,6 +579,7 @@ def analyze_command(args: argparse.Namespace) -> int:
             symbol_type=symbol_type,
             symbol_name=symbol_name,
             no_cache=no_cache,
+            include_content=True,
         )
     except Exception as e:
         if args.json:
@@ -647,18 +652,18 @@ def list_command(args: argparse.Namespace) -> int:
                         # Compact git status indicator (best-effort)
                         try:
                             from cocosearch.management.git import (
-                                get_commit_hash,
-                                get_commits_behind,
+                                get_cached_commits_behind,
+                                get_git_state,
                             )
 
                             check_path = meta.get("canonical_path")
                             indexed_commit = meta.get("commit_hash")
                             if check_path and indexed_commit:
-                                current = get_commit_hash(check_path)
+                                current = get_git_state(check_path).commit
                                 if current and current == indexed_commit:
                                     branch_display += " \u2713"
                                 elif current and current != indexed_commit:
-                                    behind = get_commits_behind(
+                                    behind = get_cached_commits_behind(
                                         check_path, indexed_commit
                                     )
                                     if behind is not None and behind > 0:
@@ -1,18 +1,35 @@
 """HTTP client for remote CocoSearch server.
 
 Forwards CLI commands to a running CocoSearch server via HTTP API.
-Uses stdlib urllib.request to avoid adding dependencies.
+Uses stdlib http.client to avoid adding dependencies:
+- connections are kept alive and reused (up to ``pool_size`` idle ones),
+  so repeated calls skip TCP (and TLS) setup
+- connection failures and 502 responses are retried with exponential
+  backoff (calls that start or delete work are not retried)
 """
 
+import http.client
 import json
 import os
+import threading
 import time
-import urllib.error
-import urllib.request
+import urllib.parse
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from cocosearch.exceptions import CocoSearchError
 
+# Responses worth retrying (a proxy that couldn't reach the server)
+_RETRY_STATUSES = frozenset({502})
+
+# Errors meaning the server closed an idle keep-alive connection
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
 
 class CocoSearchConnectionError(CocoSearchError):
     """Raised when the client cannot connect to the server."""
@@ -22,13 +39,75 @@ class CocoSearchClientError(CocoSearchError):
     """Raised when the server returns an error response."""
 
 
+def _iter_lines(response: http.client.HTTPResponse) -> Iterator[bytes]:
+    """Yield response body lines as they arrive."""
+    buffer = b""
+    while chunk := response.read1(65536):
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        yield from lines
+    if buffer:
+        yield buffer
+
+
+def _error_message(response: http.client.HTTPResponse, data: bytes) -> str:
+    """Extract the ``error`` field of an error response, if it has one."""
+    fallback = f"HTTP Error {response.status}: {response.reason}"
+    try:
+        return json.loads(data.decode("utf-8")).get("error", fallback)
+    except Exception:
+        return fallback
+
+
 class CocoSearchClient:
-    """HTTP client for communicating with a remote CocoSearch server."""
+    """HTTP client for communicating with a remote CocoSearch server.
+
+    Safe to share between threads. Use as a context manager, or call
+    ``close()``, to close pooled connections.
+
+    Args:
+        server_url: Server base URL (http or https, optionally with a path).
+        timeout: Socket timeout in seconds for connecting and each read.
+        retries: Retries after a connection failure or 502.
+        backoff: Delay in seconds before the first retry; doubles each time.
+        pool_size: Idle connections kept open for reuse.
+    """
 
-    def __init__(self, server_url: str):
+    def __init__(
+        self,
+        server_url: str,
+        timeout: float = 30.0,
+        retries: int = 2,
+        backoff: float = 0.25,
+        pool_size: int = 4,
+    ):
         self.server_url = server_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
         self._path_prefix = os.environ.get("COCOSEARCH_PATH_PREFIX", "")
 
+        url = urllib.parse.urlsplit(self.server_url)
+        self._scheme = url.scheme
+        self._netloc = url.netloc
+        self._base_path = url.path
+        self._idle: list[http.client.HTTPConnection] = []
+        self._idle_lock = threading.Lock()
+
+    def __enter__(self) -> "CocoSearchClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
     def _translate_path_to_container(self, path: str) -> str:
         """Translate a host path to a container path."""
         if not self._path_prefix:
@@ -55,36 +134,125 @@ class CocoSearchClient:
             return host_prefix + path[len(container_prefix) :]
         return path
 
-    def _request(self, method: str, path: str, body: dict | None = None) -> dict | list:
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Take an idle pooled connection, or open a new one.
+
+        Returns:
+            The connection and whether it was reused from the pool.
+        """
+        with self._idle_lock:
+            if self._idle:
+                return self._idle.pop(), True
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(
+                self._netloc, timeout=self.timeout
+            ), False
+        if self._scheme != "http" or not self._netloc:
+            raise CocoSearchConnectionError(
+                f"Cannot connect to CocoSearch server at {self.server_url}: "
+                "URL must start with http:// or https://"
+            )
+        return http.client.HTTPConnection(self._netloc, timeout=self.timeout), False
+
+    def _release(
+        self, conn: http.client.HTTPConnection, response: http.client.HTTPResponse
+    ) -> None:
+        """Return a connection whose response was fully read to the pool."""
+        if not response.will_close:
+            with self._idle_lock:
+                if len(self._idle) < self.pool_size:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        body: dict | None,
+        accept: str,
+        retry: bool,
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send a request and return the connection and unread response.
+
+        A reused connection the server has already closed is replaced
+        without counting as a retry. With ``retry``, connection failures
+        (other than timeouts) and 502 responses are retried up to
+        ``retries`` times with exponential backoff.
+        """
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {"Accept": accept}
+        if data is not None:
+            headers["Content-Type"] = "application/json"
+
+        attempt = 0
+        while True:
+            conn, reused = self._acquire()
+            try:
+                conn.request(method, self._base_path + path, body=data, headers=headers)
+                response = conn.getresponse()
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                if reused and isinstance(e, _STALE_CONNECTION_ERRORS):
+                    continue
+                if not retry or attempt >= self.retries or isinstance(e, TimeoutError):
+                    raise CocoSearchConnectionError(
+                        f"Cannot connect to CocoSearch server at {self.server_url}: {e}"
+                    ) from e
+            else:
+                if (
+                    not retry
+                    or attempt >= self.retries
+                    or response.status not in _RETRY_STATUSES
+                ):
+                    return conn, response
+                response.read()
+                self._release(conn, response)
+            time.sleep(self.backoff * 2**attempt)
+            attempt += 1
+
+    def _request(
+        self, method: str, path: str, body: dict | None = None, retry: bool = True
+    ) -> dict | list:
         """Make an HTTP request to the server."""
-        url = f"{self.server_url}{path}"
+        conn, response = self._send(method, path, body, "application/json", retry)
+        try:
+            data = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise CocoSearchConnectionError(
+                f"Lost connection to CocoSearch server at {self.server_url}: {e}"
+            ) from e
+        self._release(conn, response)
 
-        if body is not None:
-            data = json.dumps(body).encode("utf-8")
-        else:
-            data = None
+        if response.status >= 400:
+            raise CocoSearchClientError(_error_message(response, data))
+        return json.loads(data.decode("utf-8"))
 
-        req = urllib.request.Request(
-            url,
-            data=data,
-            method=method,
-            headers={"Content-Type": "application/json"} if data else {},
-        )
+    def _stream(self, method: str, path: str, body: dict) -> Iterator[dict]:
+        """Make an HTTP request and yield each line of an NDJSON response."""
+        conn, response = self._send(method, path, body, "application/x-ndjson", True)
+        if response.status >= 400:
+            data = response.read()
+            self._release(conn, response)
+            raise CocoSearchClientError(_error_message(response, data))
 
+        finished = False
         try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                return json.loads(resp.read().decode("utf-8"))
-        except urllib.error.HTTPError as e:
-            try:
-                error_body = json.loads(e.read().decode("utf-8"))
-                msg = error_body.get("error", str(e))
-            except Exception:
-                msg = str(e)
-            raise CocoSearchClientError(msg) from e
-        except urllib.error.URLError as e:
+            for line in _iter_lines(response):
+                if line.strip():
+                    yield json.loads(line.decode("utf-8"))
+            finished = True
+        except (OSError, http.client.HTTPException) as e:
             raise CocoSearchConnectionError(
-                f"Cannot connect to CocoSearch server at {self.server_url}: {e.reason}"
+                f"Lost connection to CocoSearch server at {self.server_url}: {e}"
             ) from e
+        finally:
+            # A partly read response can't be reused
+            if finished:
+                self._release(conn, response)
+            else:
+                conn.close()
 
     def search(
         self,
@@ -102,6 +270,174 @@ class CocoSearchClient:
         context_after: int | None = None,
     ) -> dict:
         """Search indexed code."""
+        body = self._search_body(
+            query,
+            index_name,
+            limit=limit,
+            min_score=min_score,
+            language=language,
+            use_hybrid=use_hybrid,
+            symbol_type=symbol_type,
+            symbol_name=symbol_name,
+            no_cache=no_cache,
+            smart_context=smart_context,
+            context_before=context_before,
+            context_after=context_after,
+        )
+        result = self._request("POST", "/api/search", body)
+
+        # Translate container paths back to host paths
+        if isinstance(result, dict) and "results" in result:
+            for r in result["results"]:
+                if "file_path" in r:
+                    r["file_path"] = self._translate_path_to_host(r["file_path"])
+
+        return result
+
+    def search_stream(
+        self,
+        query: str,
+        index_name: str,
+        limit: int = 10,
+        min_score: float = 0.3,
+        language: str | None = None,
+        use_hybrid: bool | None = None,
+        symbol_type: list[str] | None = None,
+        symbol_name: str | None = None,
+        no_cache: bool = False,
+        smart_context: bool = False,
+        context_before: int | None = None,
+        context_after: int | None = None,
+    ) -> Iterator[dict]:
+        """Search indexed code, yielding results as the server sends them.
+
+        Uses ``/api/search/stream``: each result arrives as soon as the
+        server has read it and expanded its context, instead of after the
+        whole result list is built.
+
+        Yields:
+            Result dicts (as in ``search()["results"]``), in rank order.
+
+        Raises:
+            CocoSearchClientError: If the search fails, before or during
+                the stream.
+        """
+        body = self._search_body(
+            query,
+            index_name,
+            limit=limit,
+            min_score=min_score,
+            language=language,
+            use_hybrid=use_hybrid,
+            symbol_type=symbol_type,
+            symbol_name=symbol_name,
+            no_cache=no_cache,
+            smart_context=smart_context,
+            context_before=context_before,
+            context_after=context_after,
+        )
+        for event in self._stream("POST", "/api/search/stream", body):
+            if event.get("type") == "error":
+                raise CocoSearchClientError(event.get("error", "Search failed"))
+            if event.get("type") == "result":
+                r = event["result"]
+                if "file_path" in r:
+                    r["file_path"] = self._translate_path_to_host(r["file_path"])
+                yield r
+
+    def search_batch(
+        self,
+        queries: list[str],
+        index_name: str,
+        limit: int = 10,
+        min_score: float = 0.3,
+        language: str | None = None,
+        use_hybrid: bool | None = None,
+        symbol_type: list[str] | None = None,
+        symbol_name: str | None = None,
+        no_cache: bool = False,
+        smart_context: bool = False,
+        context_before: int | None = None,
+        context_after: int | None = None,
+    ) -> dict:
+        """Run several queries with one filter set in a single request.
+
+        Uses ``/api/search/batch``, which embeds the queries together and
+        runs one SQL statement per search leg for the whole batch.
+
+        Returns:
+            Response with one ``batches`` entry per query, in order.
+        """
+        body = self._search_body(
+            "",
+            index_name,
+            limit=limit,
+            min_score=min_score,
+            language=language,
+            use_hybrid=use_hybrid,
+            symbol_type=symbol_type,
+            symbol_name=symbol_name,
+            no_cache=no_cache,
+            smart_context=smart_context,
+            context_before=context_before,
+            context_after=context_after,
+        )
+        del body["query"]
+        body["queries"] = list(queries)
+
+        result = self._request("POST", "/api/search/batch", body)
+
+        if isinstance(result, dict):
+            for batch in result.get("batches", []):
+                for r in batch.get("results", []):
+                    if "file_path" in r:
+                        r["file_path"] = self._translate_path_to_host(r["file_path"])
+
+        return result
+
+    def search_many(self, searches: Iterable[dict], max_workers: int = 4) -> list[dict]:
+        """Run independent searches concurrently over pooled connections.
+
+        For searches that differ in index or filters; queries sharing
+        both are cheaper as one ``search_batch()`` call.
+
+        Args:
+            searches: Keyword arguments for ``search()``, one dict per search.
+            max_workers: Searches in flight at once.
+
+        Returns:
+            Responses in the order of ``searches``.
+
+        Raises:
+            CocoSearchClientError, CocoSearchConnectionError: The first
+                failure among the searches.
+        """
+        searches = list(searches)
+        if not searches:
+            return []
+        workers = max(1, min(max_workers, len(searches)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="cocosearch-client"
+        ) as pool:
+            return list(pool.map(lambda kwargs: self.search(**kwargs), searches))
+
+    @staticmethod
+    def _search_body(
+        query: str,
+        index_name: str,
+        *,
+        limit: int,
+        min_score: float,
+        language: str | None,
+        use_hybrid: bool | None,
+        symbol_type: list[str] | None,
+        symbol_name: str | None,
+        no_cache: bool,
+        smart_context: bool,
+        context_before: int | None,
+        context_after: int | None,
+    ) -> dict:
+        """Build the request body shared by the search endpoints."""
         body: dict[str, Any] = {
             "query": query,
             "index_name": index_name,
@@ -124,16 +460,7 @@ class CocoSearchClient:
             body["context_before"] = context_before
         if context_after is not None:
             body["context_after"] = context_after
-
-        result = self._request("POST", "/api/search", body)
-
-        # Translate container paths back to host paths
-        if isinstance(result, dict) and "results" in result:
-            for r in result["results"]:
-                if "file_path" in r:
-                    r["file_path"] = self._translate_path_to_host(r["file_path"])
-
-        return result
+        return body
 
     def index(
         self,
@@ -160,7 +487,8 @@ class CocoSearchClient:
         if fresh:
             body["fresh"] = True
 
-        result = self._request("POST", "/api/index", body)
+        # Not retried: a retry could start a second indexing run
+        result = self._request("POST", "/api/index", body, retry=False)
         resolved_name = result.get("index_name", index_name or "")
 
         # Poll for completion
@@ -191,7 +519,9 @@ class CocoSearchClient:
 
     def clear(self, index_name: str) -> dict:
         """Delete an index."""
-        return self._request("POST", "/api/delete-index", {"index_name": index_name})
+        return self._request(
+            "POST", "/api/delete-index", {"index_name": index_name}, retry=False
+        )
 
     def analyze(
         self,
@@ -285,6 +615,8 @@ def run_client_command(args, server_url: str) -> int:
     except CocoSearchClientError as e:
         console.print(f"[bold red]Server error:[/bold red] {e}")
         return 1
+    finally:
+        client.close()
 
 
 def _client_search(client: CocoSearchClient, args, console) -> int:
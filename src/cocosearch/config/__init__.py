@@ -13,6 +13,7 @@ from .resolver import ConfigResolver, config_key_to_env_var, parse_env_value
 from .schema import (
     CocoSearchConfig,
     ConfigError,
+    DatabaseSection,
     EmbeddingSection,
     IndexingSection,
     SearchSection,
@@ -21,6 +22,7 @@ from .schema import (
 __all__ = [
     "CocoSearchConfig",
     "ConfigError",
+    "DatabaseSection",
     "EmbeddingSection",
     "IndexingSection",
     "SearchSection",
@@ -7,15 +7,28 @@ from pydantic import ValidationError
 
 # Valid field names for each configuration section
 VALID_FIELDS = {
-    "root": ["indexName", "indexing", "search", "embedding"],
+    "root": ["indexName", "indexing", "search", "embedding", "database"],
     "indexing": [
         "includePatterns",
         "excludePatterns",
         "chunkSize",
         "chunkOverlap",
+        "vectorIndex",
+        "hnswM",
+        "hnswEfConstruction",
+        "ivfflatLists",
+        "vectorStorage",
+    ],
+    "search": [
+        "resultLimit",
+        "minScore",
+        "hnswEfSearch",
+        "ivfflatProbes",
+        "iterativeScan",
+        "rerankFactor",
     ],
-    "search": ["resultLimit", "minScore"],
     "embedding": ["model"],
+    "database": ["poolMinSize", "poolMaxSize", "poolTimeout", "poolMaxIdle"],
 }
 
 
@@ -28,6 +28,15 @@ indexing: {}
   # chunkSize: 1000
   # chunkOverlap: 300
 
+  # Vector index (built by `cocosearch index`)
+  # vectorIndex: hnsw        # hnsw or ivfflat
+  # hnswM: 16                # HNSW graph connections per node
+  # hnswEfConstruction: 64   # HNSW build-time candidate list size
+  # ivfflatLists: 100        # IVFFlat inverted lists
+  # Index embeddings quantized to shrink the vector index: full, halfvec
+  # (half size) or binary (1/32 size); searches re-rank with full precision
+  # vectorStorage: full
+
 # Search settings
 search: {}
   # Maximum results returned
@@ -36,10 +45,30 @@ search: {}
   # Minimum similarity score (0.0 - 1.0)
   # minScore: 0.3
 
+  # Vector index scan tuning (per query)
+  # hnswEfSearch: 40         # HNSW search candidate list size
+  # ivfflatProbes: 1         # IVFFlat lists probed
+  # Keep scanning the index until filtered queries fill the limit
+  # (pgvector 0.8+): off, strict_order, or relaxed_order
+  # iterativeScan: relaxed_order
+  # Candidates re-ranked per result with halfvec/binary vectorStorage
+  # rerankFactor: 4
+
 # Embedding settings
 embedding: {}
   # Ollama model for embeddings
   # model: nomic-embed-text
+
+# Database connection pool
+database: {}
+  # Connections kept open (pre-opened by the MCP server at startup)
+  # poolMinSize: 2
+  # Upper bound under concurrent load
+  # poolMaxSize: 10
+  # Seconds a request waits for a free connection before failing
+  # poolTimeout: 30
+  # Seconds an idle connection above poolMinSize stays open
+  # poolMaxIdle: 600
 """
 
 
@@ -3,6 +3,7 @@
 import json
 import os
 import re
+import types
 from pathlib import Path
 from typing import Any
 
@@ -57,11 +58,19 @@ def parse_env_value(raw: str, field_type: type) -> Any:
         True
         >>> parse_env_value('["*.py"]', list[str])
         ['*.py']
+        >>> parse_env_value("64", int | None)
+        64
     """
     # Handle None indicators
     if raw.lower() in ("", "null", "none"):
         return None
 
+    # Optional fields (e.g. int | None) parse as their non-None type
+    if isinstance(field_type, types.UnionType):
+        non_none = [t for t in field_type.__args__ if t is not type(None)]
+        if len(non_none) == 1:
+            field_type = non_none[0]
+
     # Get the origin type for generic types like list[str]
     origin = getattr(field_type, "__origin__", field_type)
 
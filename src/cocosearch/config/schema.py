@@ -1,5 +1,7 @@
 """Configuration schema for CocoSearch using Pydantic."""
 
+from typing import Literal
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -18,6 +20,11 @@ class IndexingSection(BaseModel):
     excludePatterns: list[str] = Field(default_factory=list)
     chunkSize: int = Field(default=1000, gt=0)
     chunkOverlap: int = Field(default=300, ge=0)
+    vectorIndex: Literal["hnsw", "ivfflat"] = Field(default="hnsw")
+    hnswM: int | None = Field(default=None, ge=2, le=100)
+    hnswEfConstruction: int | None = Field(default=None, ge=4, le=1000)
+    ivfflatLists: int | None = Field(default=None, ge=1)
+    vectorStorage: Literal["full", "halfvec", "binary"] = Field(default="full")
 
 
 class SearchSection(BaseModel):
@@ -27,6 +34,12 @@ class SearchSection(BaseModel):
 
     resultLimit: int = Field(default=10, gt=0)
     minScore: float = Field(default=0.3, ge=0.0, le=1.0)
+    hnswEfSearch: int | None = Field(default=None, ge=1, le=1000)
+    ivfflatProbes: int | None = Field(default=None, ge=1)
+    iterativeScan: Literal["off", "strict_order", "relaxed_order"] = Field(
+        default="relaxed_order"
+    )
+    rerankFactor: int = Field(default=4, ge=1, le=100)
 
 
 class EmbeddingSection(BaseModel):
@@ -37,6 +50,17 @@ class EmbeddingSection(BaseModel):
     model: str = Field(default="nomic-embed-text")
 
 
+class DatabaseSection(BaseModel):
+    """Configuration for the PostgreSQL connection pool."""
+
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+    poolMinSize: int = Field(default=2, ge=0)
+    poolMaxSize: int = Field(default=10, ge=1)
+    poolTimeout: float = Field(default=30.0, gt=0)
+    poolMaxIdle: float = Field(default=600.0, gt=0)
+
+
 class CocoSearchConfig(BaseModel):
     """Root configuration model for CocoSearch."""
 
@@ -46,3 +70,4 @@ class CocoSearchConfig(BaseModel):
     indexing: IndexingSection = Field(default_factory=IndexingSection)
     search: SearchSection = Field(default_factory=SearchSection)
     embedding: EmbeddingSection = Field(default_factory=EmbeddingSection)
+    database: DatabaseSection = Field(default_factory=DatabaseSection)
@@ -36,34 +36,64 @@ export async function executeSearch() {
         if (symbolType) body.symbol_type = symbolType;
         if (useHybrid !== undefined) body.use_hybrid = useHybrid;
 
-        const resp = await fetch('/api/search', {
+        const resp = await fetch('/api/search/stream', {
             method: 'POST',
-            headers: {'Content-Type': 'application/json'},
+            headers: {'Content-Type': 'application/json', 'Accept': 'application/x-ndjson'},
             body: JSON.stringify(body)
         });
-        const data = await resp.json();
-
-        document.getElementById('searchLoading').style.display = 'none';
-        document.getElementById('searchBtn').disabled = false;
 
         if (!resp.ok) {
-            document.getElementById('searchError').textContent = data.error || 'Search failed';
-            document.getElementById('searchError').style.display = 'block';
-            document.getElementById('clearSearchBtn').style.display = '';
+            const data = await resp.json();
+            showSearchError(data.error || 'Search failed');
             return;
         }
 
-        displaySearchResults(data);
-        document.getElementById('clearSearchBtn').style.display = '';
-    } catch (err) {
+        // Render each result as soon as the server sends it
+        let rendered = 0;
+        await readNdjson(resp, (event) => {
+            if (event.type === 'meta') {
+                document.getElementById('searchLoading').style.display = 'none';
+                showResultsInfo(event.total, event.query_time_ms);
+            } else if (event.type === 'result') {
+                appendSearchResult(event.result, rendered++);
+            } else if (event.type === 'error') {
+                throw new Error(event.error);
+            }
+        });
+
         document.getElementById('searchLoading').style.display = 'none';
         document.getElementById('searchBtn').disabled = false;
-        document.getElementById('searchError').textContent = 'Search failed: ' + err.message;
-        document.getElementById('searchError').style.display = 'block';
         document.getElementById('clearSearchBtn').style.display = '';
+    } catch (err) {
+        showSearchError('Search failed: ' + err.message);
     }
 }
 
+async function readNdjson(resp, onEvent) {
+    const reader = resp.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    for (;;) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+        for (const line of lines) {
+            if (line.trim()) onEvent(JSON.parse(line));
+        }
+    }
+    if (buffer.trim()) onEvent(JSON.parse(buffer));
+}
+
+function showSearchError(message) {
+    document.getElementById('searchLoading').style.display = 'none';
+    document.getElementById('searchBtn').disabled = false;
+    document.getElementById('searchError').textContent = message;
+    document.getElementById('searchError').style.display = 'block';
+    document.getElementById('clearSearchBtn').style.display = '';
+}
+
 export function clearSearch() {
     document.getElementById('searchInput').value = '';
     document.getElementById('searchResults').innerHTML = '';
@@ -74,65 +104,66 @@ export function clearSearch() {
     document.getElementById('clearSearchBtn').style.display = 'none';
 }
 
-function displaySearchResults(data) {
-    const results = data.results || [];
-    const container = document.getElementById('searchResults');
-    const infoEl = document.getElementById('searchResultsInfo');
-    const emptyEl = document.getElementById('searchEmpty');
-
-    if (results.length === 0) {
+function showResultsInfo(total, queryTimeMs) {
+    if (total === 0) {
+        const emptyEl = document.getElementById('searchEmpty');
         emptyEl.textContent = 'No results found. Try a different query or broader filters.';
         emptyEl.style.display = 'block';
         return;
     }
 
-    infoEl.textContent = `${data.total} result${data.total !== 1 ? 's' : ''} in ${data.query_time_ms}ms`;
+    const infoEl = document.getElementById('searchResultsInfo');
+    infoEl.textContent = `${total} result${total !== 1 ? 's' : ''} in ${queryTimeMs}ms`;
     infoEl.style.display = 'block';
+}
 
-    container.innerHTML = results.map((r, i) => {
-        const scoreClass = r.score >= 0.7 ? 'badge-score-high' : r.score >= 0.4 ? 'badge-score-mid' : 'badge-score-low';
-        const matchBadge = r.match_type ? `<span class="search-result-badge badge-match">${escapeHtml(r.match_type)}</span>` : '';
-        const langBadge = r.language_id ? `<span class="search-result-badge badge-lang">${escapeHtml(r.language_id)}</span>` : '';
-        const lineRange = r.start_line && r.end_line ? `Lines ${r.start_line}-${r.end_line}` : '';
-        const escapedPath = escapeHtml(r.file_path).replace(/'/g, "\\'");
-
-        let symbolHtml = '';
-        if (r.symbol_type || r.symbol_name) {
-            const parts = [];
-            if (r.symbol_type) parts.push(`[${escapeHtml(r.symbol_type)}]`);
-            if (r.symbol_name) parts.push(escapeHtml(r.symbol_name));
-            symbolHtml = `<div class="search-result-symbol">${parts.join(' ')}</div>`;
-        }
+function appendSearchResult(r, i) {
+    document.getElementById('searchResults').insertAdjacentHTML('beforeend', renderSearchResult(r, i));
+}
 
-        const lines = (r.content || '').split('\n');
-        const previewLines = lines.slice(0, 8);
-        const hasMore = lines.length > 8;
-        const previewText = escapeHtml(previewLines.join('\n'));
-        const fullText = escapeHtml(r.content || '');
-
-        return `<div class="search-result-card">
-            <div class="search-result-header">
-                <span class="search-result-path clickable" onclick="copyPathWithFeedback(this, '${escapedPath}')" title="Click to copy path">${escapeHtml(r.file_path)}</span>
-                <div class="search-result-meta">
-                    <span style="font-size: 12px; color: var(--text-muted);">${escapeHtml(lineRange)}</span>
-                    <span class="search-result-badge ${scoreClass}">${r.score.toFixed(2)}</span>
-                    ${matchBadge}
-                    ${langBadge}
-                </div>
-            </div>
-            ${symbolHtml}
-            <div class="search-result-code">
-                <pre id="code-preview-${i}">${previewText}</pre>
-                ${hasMore ? `<button class="expand-btn" onclick="toggleCodeExpand(${i}, this)" data-full="${fullText.replace(/"/g, '&quot;')}" data-preview="${previewText.replace(/"/g, '&quot;')}">Show all ${lines.length} lines</button>` : ''}
-            </div>
-            <div class="search-result-actions">
-                <button onclick="copyToClipboard('${escapedPath}')">Copy Path</button>
-                <button onclick="copyToClipboard(document.getElementById('code-preview-${i}').textContent)">Copy Code</button>
-                <button onclick="openInEditor('${escapedPath}', ${r.start_line || 1})">Open</button>
-                <button onclick="viewFile('${escapedPath}', ${r.start_line || 1}, ${r.end_line || r.start_line || 1})">View File</button>
+function renderSearchResult(r, i) {
+    const scoreClass = r.score >= 0.7 ? 'badge-score-high' : r.score >= 0.4 ? 'badge-score-mid' : 'badge-score-low';
+    const matchBadge = r.match_type ? `<span class="search-result-badge badge-match">${escapeHtml(r.match_type)}</span>` : '';
+    const langBadge = r.language_id ? `<span class="search-result-badge badge-lang">${escapeHtml(r.language_id)}</span>` : '';
+    const lineRange = r.start_line && r.end_line ? `Lines ${r.start_line}-${r.end_line}` : '';
+    const escapedPath = escapeHtml(r.file_path).replace(/'/g, "\\'");
+
+    let symbolHtml = '';
+    if (r.symbol_type || r.symbol_name) {
+        const parts = [];
+        if (r.symbol_type) parts.push(`[${escapeHtml(r.symbol_type)}]`);
+        if (r.symbol_name) parts.push(escapeHtml(r.symbol_name));
+        symbolHtml = `<div class="search-result-symbol">${parts.join(' ')}</div>`;
+    }
+
+    const lines = (r.content || '').split('\n');
+    const previewLines = lines.slice(0, 8);
+    const hasMore = lines.length > 8;
+    const previewText = escapeHtml(previewLines.join('\n'));
+    const fullText = escapeHtml(r.content || '');
+
+    return `<div class="search-result-card">
+        <div class="search-result-header">
+            <span class="search-result-path clickable" onclick="copyPathWithFeedback(this, '${escapedPath}')" title="Click to copy path">${escapeHtml(r.file_path)}</span>
+            <div class="search-result-meta">
+                <span style="font-size: 12px; color: var(--text-muted);">${escapeHtml(lineRange)}</span>
+                <span class="search-result-badge ${scoreClass}">${r.score.toFixed(2)}</span>
+                ${matchBadge}
+                ${langBadge}
             </div>
-        </div>`;
-    }).join('');
+        </div>
+        ${symbolHtml}
+        <div class="search-result-code">
+            <pre id="code-preview-${i}">${previewText}</pre>
+            ${hasMore ? `<button class="expand-btn" onclick="toggleCodeExpand(${i}, this)" data-full="${fullText.replace(/"/g, '&quot;')}" data-preview="${previewText.replace(/"/g, '&quot;')}">Show all ${lines.length} lines</button>` : ''}
+        </div>
+        <div class="search-result-actions">
+            <button onclick="copyToClipboard('${escapedPath}')">Copy Path</button>
+            <button onclick="copyToClipboard(document.getElementById('code-preview-${i}').textContent)">Copy Code</button>
+            <button onclick="openInEditor('${escapedPath}', ${r.start_line || 1})">Open</button>
+            <button onclick="viewFile('${escapedPath}', ${r.start_line || 1}, ${r.end_line || r.start_line || 1})">View File</button>
+        </div>
+    </div>`;
 }
 
 export function toggleCodeExpand(index, btn) {
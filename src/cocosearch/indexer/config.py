@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
 from pydantic import BaseModel, Field
@@ -94,6 +94,13 @@ class IndexingConfig(BaseModel):
     exclude_patterns: list[str] = []
     chunk_size: int = 1000  # bytes
     chunk_overlap: int = 300  # bytes
+    # Vector index method and build parameters (None: pgvector default)
+    vector_index: Literal["hnsw", "ivfflat"] = "hnsw"
+    hnsw_m: int | None = None
+    hnsw_ef_construction: int | None = None
+    ivfflat_lists: int | None = None
+    # Quantized vector index storage ("full" keeps the float32 index)
+    vector_storage: Literal["full", "halfvec", "binary"] = "full"
 
 
 def load_config(codebase_path: str) -> IndexingConfig:
@@ -0,0 +1,126 @@
+"""Single-parse per-file analysis for the indexing flow.
+
+Each file is parsed with tree-sitter once. The resulting tree yields:
+- every symbol definition with its character range, so chunks take their
+  symbol by range instead of re-parsing chunk text (chunks that start
+  inside a definition get the enclosing symbol)
+- the file's parse status, recorded for ``track_parse_results`` so changed
+  files are not parsed a second time after the flow finishes
+
+Chunks also list every symbol they contain (``chunk_symbols``); the flow
+exports those rows to the per-index symbols table used by symbol filters.
+"""
+
+import dataclasses
+import logging
+
+import cocoindex
+
+from cocosearch.indexer.parse_tracking import (
+    parse_status_from_tree,
+    remember_parse_status,
+)
+from cocosearch.indexer.symbols import (
+    LANGUAGE_MAP,
+    FileSymbol,
+    SymbolMetadata,
+    _get_parser,
+    extract_tree_symbols,
+    get_symbol_query,
+    select_chunk_symbol,
+    select_chunk_symbols,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class FileAnalysis:
+    """Per-file analysis result consumed by chunk-level transforms."""
+
+    symbols: list[FileSymbol]
+
+
+@cocoindex.op.function(behavior_version=1)
+def analyze_file(content: str, language: str) -> FileAnalysis:
+    """Parse a file once and extract its symbols and parse status.
+
+    This is a CocoIndex transform function run once per new or changed
+    file. The parse status is recorded as a side result (see
+    ``remember_parse_status``); symbols are returned for the chunks.
+
+    Args:
+        content: Full file content.
+        language: Language identifier (e.g., "py", "ts", "go").
+
+    Returns:
+        FileAnalysis with symbols ordered by start offset (empty for
+        languages without a grammar or symbol query, or on failure).
+    """
+    ts_language = LANGUAGE_MAP.get(language)
+    if ts_language is None:
+        return FileAnalysis(symbols=[])
+
+    source = bytes(content, "utf8")
+    try:
+        tree = _get_parser(ts_language).parse(source)
+    except Exception as e:
+        remember_parse_status(content, language, ("error", str(e)))
+        return FileAnalysis(symbols=[])
+    remember_parse_status(content, language, parse_status_from_tree(tree))
+
+    try:
+        query = get_symbol_query(ts_language)
+        if query is None:
+            # No query file for this language - index without symbols
+            return FileAnalysis(symbols=[])
+        return FileAnalysis(
+            symbols=extract_tree_symbols(tree, source, ts_language, query)
+        )
+    except Exception as e:
+        logger.error(f"Symbol extraction failed: {e}", exc_info=True)
+        return FileAnalysis(symbols=[])
+
+
+@cocoindex.op.function(behavior_version=1)
+def chunk_symbol_metadata(
+    location: cocoindex.Range, symbols: list[FileSymbol]
+) -> SymbolMetadata:
+    """Select symbol metadata for a chunk from its file's symbols.
+
+    Args:
+        location: Chunk (start, end) character range within the file.
+        symbols: Symbols from ``analyze_file`` for the chunk's file.
+
+    Returns:
+        SymbolMetadata for the selected symbol, or NULL fields if none.
+    """
+    symbol = select_chunk_symbol(location[0], location[1], symbols)
+    if symbol is None:
+        return SymbolMetadata(
+            symbol_type=None,
+            symbol_name=None,
+            symbol_signature=None,
+        )
+    return SymbolMetadata(
+        symbol_type=symbol.symbol_type,
+        symbol_name=symbol.symbol_name,
+        symbol_signature=symbol.symbol_signature,
+    )
+
+
+@cocoindex.op.function(behavior_version=1)
+def chunk_symbols(
+    location: cocoindex.Range, symbols: list[FileSymbol]
+) -> list[FileSymbol]:
+    """List every symbol a chunk contains, for the symbols side table.
+
+    Args:
+        location: Chunk (start, end) character range within the file.
+        symbols: Symbols from ``analyze_file`` for the chunk's file.
+
+    Returns:
+        Definitions starting in the chunk, plus the innermost definition
+        enclosing its start.
+    """
+    return select_chunk_symbols(location[0], location[1], symbols)
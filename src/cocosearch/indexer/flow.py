@@ -25,9 +25,18 @@ from cocosearch.indexer.embedder import (
 from cocosearch.indexer.tsvector import text_to_tsvector_sql
 from cocosearch.handlers import get_custom_languages, extract_chunk_metadata
 from cocosearch.indexer.file_filter import build_exclude_patterns
-from cocosearch.indexer.symbols import extract_symbol_metadata
+from cocosearch.indexer.file_analysis import (
+    analyze_file,
+    chunk_symbol_metadata,
+    chunk_symbols,
+)
+from cocosearch.indexer.symbols import reload_symbol_queries
 from cocosearch.indexer.schema_migration import (
+    ensure_filter_indexes,
+    ensure_vector_storage,
+    ensure_line_columns,
     ensure_symbol_columns,
+    ensure_symbols_table_indexes,
     ensure_parse_results_table,
 )
 from cocosearch.indexer.parse_tracking import track_parse_results
@@ -44,6 +53,8 @@ def create_code_index_flow(
     exclude_patterns: list[str],
     chunk_size: int = 1000,
     chunk_overlap: int = 300,
+    vector_index_method: cocoindex.index.VectorIndexMethod | None = None,
+    vector_storage: str = "full",
 ) -> cocoindex.Flow:
     """Create a CocoIndex flow for indexing a codebase.
 
@@ -54,6 +65,11 @@ def create_code_index_flow(
         exclude_patterns: File patterns to exclude.
         chunk_size: Maximum chunk size in bytes (default 1000).
         chunk_overlap: Overlap between chunks in bytes (default 300).
+        vector_index_method: HNSW or IVFFlat parameters for the embedding
+            index (see ``vector_index_method``); None uses CocoIndex's default.
+        vector_storage: "full" declares the float32 vector index; "halfvec"
+            and "binary" declare none, leaving the quantized expression index
+            to ``ensure_vector_storage``.
 
     Returns:
         CocoIndex Flow instance configured for the codebase.
@@ -74,8 +90,10 @@ def create_code_index_flow(
             )
         )
 
-        # Step 2: Create collector for code chunks with embeddings
+        # Step 2: Create collectors for code chunks with embeddings and for
+        # every symbol each chunk contains (symbol filter side table)
         code_embeddings = data_scope.add_collector()
+        chunk_symbol_rows = data_scope.add_collector()
 
         # Step 3: Process each file
         with data_scope["files"].row() as file:
@@ -85,6 +103,12 @@ def create_code_index_flow(
                 extract_language, content=file["content"]
             )
 
+            # Parse the file once: symbols for every chunk (by range) and
+            # the parse status later stored by track_parse_results
+            file["analysis"] = file["content"].transform(
+                analyze_file, language=file["extension"]
+            )
+
             # Chunk using Tree-sitter + custom handler languages (SplitRecursively)
             file["chunks"] = file["content"].transform(
                 cocoindex.functions.SplitRecursively(
@@ -110,14 +134,31 @@ def create_code_index_flow(
                     language_id=file["extension"],
                 )
 
-                # Extract symbol metadata (function/class/method info)
-                chunk["symbol_metadata"] = chunk["text"].transform(
-                    extract_symbol_metadata,
-                    language=file["extension"],
+                # Symbol metadata (function/class/method info) from the file's
+                # parse tree, selected by the chunk's character range
+                chunk["symbol_metadata"] = chunk["location"].transform(
+                    chunk_symbol_metadata,
+                    symbols=file["analysis"]["symbols"],
                 )
 
+                # All symbols in the chunk, keyed back to the chunk row
+                chunk["symbols"] = chunk["location"].transform(
+                    chunk_symbols,
+                    symbols=file["analysis"]["symbols"],
+                )
+                with chunk["symbols"].row() as symbol:
+                    chunk_symbol_rows.collect(
+                        filename=file["filename"],
+                        location=chunk["location"],
+                        name=symbol["name"],
+                        qualified_name=symbol["symbol_name"],
+                        symbol_type=symbol["symbol_type"],
+                        symbol_start=symbol["start"],
+                        symbol_end=symbol["end"],
+                    )
+
                 # v1.7 Hybrid Search: Store chunk text and tsvector for keyword search
-                # content_text: Raw text for storage and potential future use
+                # content_text: Raw chunk text (keyword search and result rendering)
                 # content_tsv_input: Preprocessed text for PostgreSQL to_tsvector()
                 # Filename tokens appended so keyword search matches file paths
                 chunk["content_tsv_input"] = chunk["text"].transform(
@@ -128,6 +169,9 @@ def create_code_index_flow(
                 code_embeddings.collect(
                     filename=file["filename"],
                     location=chunk["location"],
+                    # 1-based line span, so results render without reading files
+                    start_line=chunk["start"]["line"],
+                    end_line=chunk["end"]["line"],
                     embedding=chunk["embedding"],
                     content_text=chunk["text"],  # Raw text for hybrid search
                     content_tsv_input=chunk[
@@ -150,13 +194,43 @@ def create_code_index_flow(
                 cocoindex.VectorIndexDef(
                     field_name="embedding",
                     metric=cocoindex.VectorSimilarityMetric.COSINE_SIMILARITY,
+                    method=vector_index_method,
                 )
+            ]
+            if vector_storage == "full"
+            else [],
+        )
+        chunk_symbol_rows.export(
+            f"{index_name}_symbols",
+            cocoindex.targets.Postgres(),
+            primary_key_fields=[
+                "filename",
+                "location",
+                "symbol_start",
+                "qualified_name",
             ],
         )
 
     return code_index_flow
 
 
+def vector_index_method(config: IndexingConfig) -> cocoindex.index.VectorIndexMethod:
+    """Build the embedding index method from indexing configuration.
+
+    Args:
+        config: Indexing configuration.
+
+    Returns:
+        HnswVectorIndexMethod or IvfFlatVectorIndexMethod; unset parameters
+        keep pgvector's defaults.
+    """
+    if config.vector_index == "ivfflat":
+        return cocoindex.IvfFlatVectorIndexMethod(lists=config.ivfflat_lists)
+    return cocoindex.HnswVectorIndexMethod(
+        m=config.hnsw_m, ef_construction=config.hnsw_ef_construction
+    )
+
+
 def run_index(
     index_name: str,
     codebase_path: str,
@@ -216,6 +290,8 @@ def run_index(
         exclude_patterns=exclude_patterns,
         chunk_size=config.chunk_size,
         chunk_overlap=config.chunk_overlap,
+        vector_index_method=vector_index_method(config),
+        vector_storage=config.vector_storage,
     )
 
     # Drop and recreate if --fresh (cleans up both table and CocoIndex metadata)
@@ -239,7 +315,7 @@ def run_index(
     # Setup flow (creates tables if needed)
     flow.setup()
 
-    # Ensure symbol columns exist in target table
+    # Ensure symbol and line columns exist in target table
     # This must happen after setup (table exists) but before update (data insertion)
     db_url = get_database_url()
 
@@ -249,20 +325,63 @@ def run_index(
     # Target name: {index_name}_chunks
     table_name = f"codeindex_{index_name}__{index_name}_chunks"
 
+    vector_storage_options = dict(
+        vector_index=config.vector_index,
+        hnsw_m=config.hnsw_m,
+        hnsw_ef_construction=config.hnsw_ef_construction,
+        ivfflat_lists=config.ivfflat_lists,
+    )
     with psycopg.connect(db_url) as conn:
         symbol_result = ensure_symbol_columns(conn, table_name)
+        line_result = ensure_line_columns(conn, table_name)
+        ensure_filter_indexes(conn, table_name)
+        storage_result = ensure_vector_storage(
+            conn, table_name, config.vector_storage, **vector_storage_options
+        )
+        ensure_symbols_table_indexes(conn, index_name)
         ensure_parse_results_table(conn, index_name)
 
-    # Invalidate symbol columns cache after migration so searches
+    # Invalidate column caches after migration so searches
     # pick up newly added columns without requiring a process restart
     if symbol_result.get("columns_added"):
         from cocosearch.search.db import reset_symbol_columns_cache
 
         reset_symbol_columns_cache()
+    if line_result.get("columns_added"):
+        from cocosearch.search.db import reset_line_columns_cache
+
+        reset_line_columns_cache()
+    # setup() may have just created the symbols side table, and the
+    # quantized embedding index may have changed; statements built for the
+    # old schema are rebuilt and re-prepared
+    from cocosearch.search.catalog import invalidate_catalog
+    from cocosearch.search.db import (
+        invalidate_statements,
+        reset_symbols_table_cache,
+        reset_vector_storage_cache,
+    )
+
+    reset_symbols_table_cache()
+    reset_vector_storage_cache()
+    invalidate_statements()
+    invalidate_catalog()
+
+    # Pick up symbol query overrides edited since the last run
+    reload_symbol_queries()
 
     # Run indexing and return statistics
     update_info = flow.update()
 
+    if storage_result.get("deferred"):
+        # An IVFFlat index needs rows to train its lists on, so it is built
+        # once the first update has populated the table
+        with psycopg.connect(db_url) as conn:
+            ensure_vector_storage(
+                conn, table_name, config.vector_storage, **vector_storage_options
+            )
+        reset_vector_storage_cache()
+        invalidate_statements()
+
     # Determine if any files actually changed
     has_changes = True  # conservative default
     if hasattr(update_info, "stats") and isinstance(update_info.stats, dict):
@@ -274,8 +393,9 @@ def run_index(
         )
         has_changes = total > 0
 
-    if has_changes:
+    if has_changes or fresh:
         # Invalidate query cache so stale results aren't served after reindex
+        # (a --fresh run rebuilt the table even if it reports no changes)
         try:
             removed = invalidate_index_cache(index_name)
             if removed > 0:
@@ -285,6 +405,7 @@ def run_index(
         except Exception as e:
             logger.warning(f"Cache invalidation failed (non-fatal): {e}")
 
+    if has_changes:
         # Track parse status for all indexed files
         try:
             with psycopg.connect(db_url) as conn:
@@ -295,8 +416,6 @@ def run_index(
         except Exception as e:
             logger.warning(f"Parse tracking failed (non-fatal): {e}")
     else:
-        logger.info(
-            "No file changes detected — skipping parse tracking and cache invalidation"
-        )
+        logger.info("No file changes detected — skipping parse tracking")
 
     return update_info
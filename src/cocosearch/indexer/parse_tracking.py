@@ -1,7 +1,8 @@
 """Parse failure tracking for indexed files.
 
 Detects tree-sitter parse status for each file after indexing completes.
-Stores results in a per-index parse_results table for stats and diagnostics.
+Stores results in a per-index parse_results table for stats and diagnostics,
+re-parsing only files whose mtime or size changed since the last run.
 
 Parse status categories:
 - ok: Clean parse, no ERROR nodes in tree
@@ -10,14 +11,25 @@ Parse status categories:
 - no_grammar: No tree-sitter grammar available for this language
 """
 
+import functools
+import hashlib
 import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from stat import S_ISREG
 
 import psycopg
+from tree_sitter import Parser
 from tree_sitter_language_pack import get_parser as pack_get_parser
 
 from cocosearch.indexer.symbols import LANGUAGE_MAP
 from cocosearch.handlers import get_registered_grammars
+from cocosearch.management.bulk_write import replace_rows, upsert_rows
 from cocosearch.validation import validate_index_name
 
 logger = logging.getLogger(__name__)
@@ -54,6 +66,32 @@ _SKIP_PARSE_EXTENSIONS = frozenset(
 # Grammar handler names — these files get domain-specific chunking, not tree-sitter parsing
 _GRAMMAR_NAMES = frozenset(g.GRAMMAR_NAME for g in get_registered_grammars())
 
+# Error lines reported per file; the walk stops once one more is found
+MAX_REPORTED_ERROR_LINES = 10
+
+# Parse changed files in worker processes once there are this many
+PARALLEL_PARSE_MIN_FILES = 200
+PARSE_WORKERS = min(os.cpu_count() or 1, 8)
+
+# Statuses recorded by the indexing flow's per-file parse, keyed by
+# (language_id, content digest) and consumed by track_parse_results
+MAX_REMEMBERED_STATUSES = 50_000
+_REMEMBERED_STATUSES: OrderedDict[tuple[str, bytes], tuple[str, str | None]] = (
+    OrderedDict()
+)
+_REMEMBERED_LOCK = threading.Lock()
+
+# Parser cache (per process, so each pool worker builds its own)
+_PARSERS: dict[str, Parser] = {}
+
+
+def _get_parser(language: str) -> Parser:
+    """Get or create the tree-sitter parser for a language in this process."""
+    parser = _PARSERS.get(language)
+    if parser is None:
+        parser = _PARSERS[language] = pack_get_parser(language)
+    return parser
+
 
 def detect_parse_status(file_content: str, language_ext: str) -> tuple[str, str | None]:
     """Detect parse status for a file using tree-sitter.
@@ -74,43 +112,198 @@ def detect_parse_status(file_content: str, language_ext: str) -> tuple[str, str
         return ("no_grammar", None)
 
     try:
-        parser = pack_get_parser(ts_language)
+        parser = _get_parser(ts_language)
         tree = parser.parse(bytes(file_content, "utf8"))
+        return parse_status_from_tree(tree)
 
-        if not tree.root_node.has_error:
-            return ("ok", None)
+    except Exception as e:
+        return ("error", str(e))
 
-        # Collect ERROR node locations for diagnostics
-        error_lines = _collect_error_lines(tree.root_node)
-        error_msg = (
-            f"ERROR nodes at lines: {', '.join(str(line) for line in error_lines[:10])}"
-        )
-        if len(error_lines) > 10:
-            error_msg += f" (+{len(error_lines) - 10} more)"
 
-        return ("partial", error_msg)
+def parse_status_from_tree(tree) -> tuple[str, str | None]:
+    """Derive parse status from an existing tree-sitter tree.
 
-    except Exception as e:
-        return ("error", str(e))
+    Args:
+        tree: Tree-sitter tree for the whole file.
+
+    Returns:
+        Tuple of (status, error_message), either ("ok", None) or
+        ("partial", "ERROR nodes at lines: ...").
+    """
+    if not tree.root_node.has_error:
+        return ("ok", None)
+
+    # Collect ERROR node locations for diagnostics
+    error_lines = _collect_error_lines(
+        tree.root_node, limit=MAX_REPORTED_ERROR_LINES + 1
+    )
+    shown = error_lines[:MAX_REPORTED_ERROR_LINES]
+    error_msg = f"ERROR nodes at lines: {', '.join(str(line) for line in shown)}"
+    if len(error_lines) > MAX_REPORTED_ERROR_LINES:
+        error_msg += " (+more)"
+
+    return ("partial", error_msg)
 
 
-def _collect_error_lines(node) -> list[int]:
-    """Recursively find all ERROR and MISSING node line numbers.
+def _content_key(file_content: str, language_ext: str) -> tuple[str, bytes]:
+    digest = hashlib.blake2b(
+        file_content.encode("utf-8", errors="replace"), digest_size=16
+    )
+    return (language_ext, digest.digest())
+
+
+def remember_parse_status(
+    file_content: str, language_ext: str, status: tuple[str, str | None]
+) -> None:
+    """Record a parse status computed while the indexing flow parsed a file.
+
+    Keyed by content, so ``track_parse_results`` can reuse it for any
+    changed file with identical content instead of parsing it again.
+    Entries are consumed on use and bounded by MAX_REMEMBERED_STATUSES.
+
+    Args:
+        file_content: Full file content as string.
+        language_ext: File extension (e.g., "py", "ts", "go").
+        status: Tuple of (status, error_message).
+    """
+    key = _content_key(file_content, language_ext)
+    with _REMEMBERED_LOCK:
+        _REMEMBERED_STATUSES[key] = status
+        _REMEMBERED_STATUSES.move_to_end(key)
+        while len(_REMEMBERED_STATUSES) > MAX_REMEMBERED_STATUSES:
+            _REMEMBERED_STATUSES.popitem(last=False)
+
+
+def _recall_parse_status(
+    file_content: str, language_ext: str
+) -> tuple[str, str | None] | None:
+    """Pop a status recorded by ``remember_parse_status``, if any."""
+    key = _content_key(file_content, language_ext)
+    with _REMEMBERED_LOCK:
+        return _REMEMBERED_STATUSES.pop(key, None)
+
+
+def _collect_error_lines(node, limit: int | None = None) -> list[int]:
+    """Find ERROR and MISSING node line numbers with an iterative cursor walk.
+
+    Only subtrees whose root reports has_error are entered, and the walk
+    stops once limit errors have been found.
 
     Args:
         node: Tree-sitter node to walk.
+        limit: Stop after this many errors (None = find all).
 
     Returns:
         Sorted list of 1-indexed line numbers where errors were found.
     """
-    lines = []
-    if node.is_error or node.is_missing:
-        lines.append(node.start_point[0] + 1)  # 1-indexed
-    for child in node.children:
-        lines.extend(_collect_error_lines(child))
+    lines: list[int] = []
+    cursor = node.walk()
+    while True:
+        current = cursor.node
+        if current.is_error or current.is_missing:
+            lines.append(current.start_point[0] + 1)  # 1-indexed
+            if limit is not None and len(lines) >= limit:
+                break
+        if current.has_error and cursor.goto_first_child():
+            continue
+        # Advance to the next sibling, climbing until one exists
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return sorted(lines)
     return sorted(lines)
 
 
+def _parse_file(codebase_path: str, item: tuple[str, str, int, int]) -> dict:
+    """Read and parse one file, returning its parse_results row.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        codebase_path: Absolute path to the codebase root.
+        item: (filename, language_id, mtime_ns, size) of the file.
+
+    Returns:
+        Dict with file_path, language, parse_status, error_message,
+        file_mtime_ns and file_size.
+    """
+    filename, language_id, mtime_ns, size = item
+    row = {"file_path": filename, "file_mtime_ns": mtime_ns, "file_size": size}
+    try:
+        file_content = (Path(codebase_path) / filename).read_text(
+            encoding="utf-8", errors="replace"
+        )
+    except Exception as e:
+        # File exists but unreadable — record as error
+        row.update(
+            language=language_id,
+            parse_status="error",
+            error_message=f"Read error: {e}",
+        )
+        return row
+
+    return _status_row(row, language_id, detect_parse_status(file_content, language_id))
+
+
+def _status_row(row: dict, language_id: str, status: tuple[str, str | None]) -> dict:
+    # Map extension to tree-sitter language name for storage
+    # For languages without a grammar, store the language_id as-is
+    row.update(
+        language=LANGUAGE_MAP.get(language_id, language_id),
+        parse_status=status[0],
+        error_message=status[1],
+    )
+    return row
+
+
+def _recalled_row(codebase_path: str, item: tuple[str, str, int, int]) -> dict | None:
+    """Build a row from a status the indexing flow recorded, if any."""
+    filename, language_id, mtime_ns, size = item
+    try:
+        file_content = (Path(codebase_path) / filename).read_text(
+            encoding="utf-8", errors="replace"
+        )
+    except OSError:
+        return None
+    status = _recall_parse_status(file_content, language_id)
+    if status is None:
+        return None
+    row = {"file_path": filename, "file_mtime_ns": mtime_ns, "file_size": size}
+    return _status_row(row, language_id, status)
+
+
+def _parse_files(
+    codebase_path: str, pending: list[tuple[str, str, int, int]]
+) -> Iterator[dict]:
+    """Parse files, sharding across worker processes for large batches.
+
+    Files whose status was recorded by the indexing flow's per-file parse
+    are not parsed again. The rest are parsed in input order, and rows are
+    yielded as they become available so the caller can stream them to the
+    database while parsing continues.
+    """
+    if _REMEMBERED_STATUSES:
+        unparsed = []
+        for item in pending:
+            row = _recalled_row(codebase_path, item)
+            if row is None:
+                unparsed.append(item)
+            else:
+                yield row
+        pending = unparsed
+
+    parse = functools.partial(_parse_file, codebase_path)
+    if len(pending) < PARALLEL_PARSE_MIN_FILES or PARSE_WORKERS < 2:
+        yield from map(parse, pending)
+        return
+
+    # Spawn (not fork): the indexer process runs CocoIndex and DB threads
+    with ProcessPoolExecutor(
+        max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        chunksize = max(1, len(pending) // (PARSE_WORKERS * 4))
+        yield from executor.map(parse, pending, chunksize=chunksize)
+
+
 def track_parse_results(
     conn: psycopg.Connection,
     index_name: str,
@@ -120,8 +313,11 @@ def track_parse_results(
     """Track parse status for all indexed files.
 
     Main orchestration function called from run_index() after flow.update().
-    Queries the chunks table for distinct files, reads each from disk,
-    runs tree-sitter parse detection, and stores results.
+    Queries the chunks table for distinct files and compares each file's
+    mtime and size on disk with the state recorded when it was last parsed.
+    Only new or changed files are read and parsed (in a process pool for
+    large batches) and streamed to the database; rows for files that left
+    the index are deleted. Unchanged rows are kept as-is.
 
     Args:
         conn: PostgreSQL connection.
@@ -130,14 +326,26 @@ def track_parse_results(
         table_name: Name of the chunks table to query for indexed files.
 
     Returns:
-        Summary dict: {"total_files": N, "ok": N, "partial": N, "error": N, "no_grammar": N}
+        Summary dict: {"total_files": N, "ok": N, "partial": N, "error": N,
+        "no_grammar": N, "parsed": N, "removed": N}. Status counts cover all
+        tracked files; "parsed" and "removed" count rows written and deleted
+        by this run.
     """
+    validate_index_name(index_name)
+    parse_table = f"cocosearch_parse_results_{index_name}"
+
     # Query chunks table for distinct indexed files
     with conn.cursor() as cur:
         cur.execute(f"SELECT DISTINCT filename, language_id FROM {table_name}")
         files = cur.fetchall()
+        cur.execute(
+            f"SELECT file_path, parse_status, file_mtime_ns, file_size "
+            f"FROM {parse_table}"
+        )
+        previous = {row[0]: row[1:] for row in cur.fetchall()}
 
-    results = []
+    pending: list[tuple[str, str, int, int]] = []
+    tracked: set[str] = set()
     summary = {"total_files": 0, "ok": 0, "partial": 0, "error": 0, "no_grammar": 0}
 
     for filename, language_id in files:
@@ -150,93 +358,113 @@ def track_parse_results(
 
         summary["total_files"] += 1
 
-        # Read file content from disk
+        # Stat file on disk
         file_path = Path(codebase_path) / filename
-        if not file_path.is_file():
+        try:
+            file_stat = file_path.stat()
+        except OSError:
+            file_stat = None
+        if file_stat is None or not S_ISREG(file_stat.st_mode):
             # File deleted from disk but chunks remain in DB (stale index)
             # — skip silently rather than reporting a false error
             continue
-        try:
-            file_content = file_path.read_text(encoding="utf-8", errors="replace")
-        except Exception as e:
-            # File exists but unreadable — record as error
-            results.append(
-                {
-                    "file_path": filename,
-                    "language": language_id,
-                    "parse_status": "error",
-                    "error_message": f"Read error: {e}",
-                }
-            )
-            summary["error"] += 1
-            continue
 
-        # Detect parse status
-        status, error_message = detect_parse_status(file_content, language_id)
+        tracked.add(filename)
 
-        # Map extension to tree-sitter language name for storage
-        # For languages without a grammar, store the language_id as-is
-        ts_language = LANGUAGE_MAP.get(language_id, language_id)
-
-        results.append(
-            {
-                "file_path": filename,
-                "language": ts_language,
-                "parse_status": status,
-                "error_message": error_message,
-            }
-        )
-        summary[status] += 1
+        # Unchanged since last parse — keep the stored status
+        state = (file_stat.st_mtime_ns, file_stat.st_size)
+        prev = previous.get(filename)
+        if prev is not None and prev[1:] == state:
+            summary[prev[0]] = summary.get(prev[0], 0) + 1
+            continue
 
-    # Persist results
-    rebuild_parse_results(conn, index_name, results)
+        pending.append((filename, language_id, *state))
+
+    def _tally(rows: Iterable[dict]) -> Iterator[dict]:
+        for row in rows:
+            summary[row["parse_status"]] += 1
+            yield row
+
+    # Persist changes only, streaming parsed rows as they arrive
+    removed = sorted(set(previous) - tracked)
+    summary["parsed"] = update_parse_results(
+        conn,
+        index_name,
+        _tally(_parse_files(codebase_path, pending)),
+        removed,
+        replace=bool(previous) and len(pending) == len(tracked),
+    )
+    summary["removed"] = len(removed)
 
     logger.info(
         f"Parse tracking complete for '{index_name}': "
         f"{summary['total_files']} files, "
         f"{summary['ok']} ok, {summary['partial']} partial, "
-        f"{summary['error']} error, {summary['no_grammar']} no_grammar"
+        f"{summary['error']} error, {summary['no_grammar']} no_grammar "
+        f"({summary['parsed']} parsed, {summary['removed']} removed)"
     )
 
     return summary
 
 
-def rebuild_parse_results(
+_PARSE_RESULT_COLUMNS = (
+    "file_path",
+    "language",
+    "parse_status",
+    "error_message",
+    "file_mtime_ns",
+    "file_size",
+)
+_PARSE_RESULT_TYPES = ("text", "text", "text", "text", "bigint", "bigint")
+
+
+def update_parse_results(
     conn: psycopg.Connection,
     index_name: str,
-    results: list[dict],
-) -> None:
-    """Truncate and rebuild parse results for an index.
+    results: Iterable[dict],
+    removed: list[str],
+    *,
+    replace: bool = False,
+) -> int:
+    """Write changed parse results and delete rows for removed files.
 
-    Matches CONTEXT.md decision: rebuild on each index run, always reflects
-    current state.
+    Rows are streamed with binary COPY into a staging table and merged in a
+    single transaction (see ``cocosearch.management.bulk_write``).
 
     Args:
         conn: PostgreSQL connection.
         index_name: Index name.
-        results: List of dicts with file_path, language, parse_status, error_message.
+        results: Dicts with file_path, language, parse_status, error_message,
+            file_mtime_ns and file_size (may be a lazy iterator).
+        removed: File paths whose rows should be deleted.
+        replace: Swap the whole table for ``results`` instead of upserting.
+            Used when no stored row survives, so ``removed`` is implied.
+
+    Returns:
+        Number of rows written.
     """
     validate_index_name(index_name)
     parse_table = f"cocosearch_parse_results_{index_name}"
+    rows = (tuple(r[col] for col in _PARSE_RESULT_COLUMNS) for r in results)
 
     with conn.cursor() as cur:
-        # Truncate existing results
-        cur.execute(f"TRUNCATE TABLE {parse_table}")
-
-        # Batch insert all results
-        if results:
-            cur.executemany(
-                f"INSERT INTO {parse_table} (file_path, language, parse_status, error_message) "
-                f"VALUES (%s, %s, %s, %s)",
-                [
-                    (
-                        r["file_path"],
-                        r["language"],
-                        r["parse_status"],
-                        r["error_message"],
-                    )
-                    for r in results
-                ],
+        if replace:
+            written = replace_rows(
+                cur, parse_table, _PARSE_RESULT_COLUMNS, _PARSE_RESULT_TYPES, rows
+            )
+        else:
+            if removed:
+                cur.execute(
+                    f"DELETE FROM {parse_table} WHERE file_path = ANY(%s)", (removed,)
+                )
+            written = upsert_rows(
+                cur,
+                parse_table,
+                _PARSE_RESULT_COLUMNS,
+                _PARSE_RESULT_TYPES,
+                rows,
+                key="file_path",
             )
 
     conn.commit()
+    return written
@@ -3,6 +3,13 @@
 Adds PostgreSQL-specific columns, indexes, and tables that CocoIndex doesn't support natively:
 - content_tsv: TSVECTOR generated column from content_tsv_input
 - GIN index on content_tsv for fast keyword search
+- start_line/end_line: chunk line numbers for indexes created before they were collected
+- Quantized (halfvec / binary) expression indexes on the embedding column,
+  replacing the full-precision vector index when opted in
+- Filter indexes on the chunks table: btree on symbol_type, language_id and
+  lower(symbol_name), plus a pg_trgm GIN index on symbol_name when available
+- Lookup indexes on the CocoIndex-exported symbols side table (btree, plus
+  pg_trgm GIN indexes for glob filters when the extension is available)
 - cocosearch_parse_results_{index}: Per-file parse status tracking table
 """
 
@@ -210,6 +217,351 @@ def verify_symbol_columns(conn: psycopg.Connection, table_name: str) -> bool:
         return len(existing) == 3
 
 
+def ensure_line_columns(conn: psycopg.Connection, table_name: str) -> dict[str, Any]:
+    """Ensure chunk line number columns exist on a table.
+
+    This is idempotent - safe to call multiple times.
+    Adds nullable INTEGER columns; rows indexed before the columns existed
+    keep NULL and search falls back to deriving lines from byte offsets.
+
+    Args:
+        conn: PostgreSQL connection
+        table_name: Name of the chunks table (e.g., "myindex_chunks")
+
+    Returns:
+        Dict with migration results:
+        - columns_added: list of column names added
+        - already_exists: bool if all columns existed
+    """
+    results = {
+        "columns_added": [],
+        "already_exists": False,
+    }
+
+    line_columns = ["start_line", "end_line"]
+
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name = %s AND column_name = ANY(%s)
+        """,
+            (table_name, line_columns),
+        )
+        existing = {row[0] for row in cur.fetchall()}
+
+        if len(existing) == len(line_columns):
+            results["already_exists"] = True
+            logger.info(f"Line columns already exist for {table_name}")
+            return results
+
+        for col in line_columns:
+            if col not in existing:
+                logger.info(f"Adding {col} column to {table_name}")
+                cur.execute(f"ALTER TABLE {table_name} ADD COLUMN {col} INTEGER NULL")
+                results["columns_added"].append(col)
+
+        conn.commit()
+
+    logger.info(f"Line column migration complete for {table_name}: {results}")
+    return results
+
+
+# Expression and operator class indexed for each quantized storage mode
+_QUANTIZED_INDEXES = {
+    "halfvec": ("(embedding::halfvec({dims}))", "halfvec_cosine_ops"),
+    "binary": ("(binary_quantize(embedding)::bit({dims}))", "bit_hamming_ops"),
+}
+
+
+def ensure_vector_storage(
+    conn: psycopg.Connection,
+    table_name: str,
+    storage: str,
+    vector_index: str = "hnsw",
+    hnsw_m: int | None = None,
+    hnsw_ef_construction: int | None = None,
+    ivfflat_lists: int | None = None,
+) -> dict[str, Any]:
+    """Ensure the quantized embedding index matching ``storage`` exists.
+
+    This is idempotent - safe to call multiple times. The embedding column
+    itself stays a full-precision vector (CocoIndex owns its type); for
+    "halfvec" and "binary" storage the flow declares no vector index and the
+    ANN index is built over a quantized expression instead, which searches
+    re-rank with the full-precision column. Indexes for other modes are
+    dropped, so switching modes in config migrates on the next index run,
+    and an index whose method or build options no longer match the config
+    is rebuilt. An IVFFlat index is not built on an empty table (its lists
+    would be trained on no data); call again after the table is populated.
+
+    Args:
+        conn: PostgreSQL connection
+        table_name: Name of the chunks table (e.g., "myindex_chunks")
+        storage: "full", "halfvec" or "binary"
+        vector_index: Index method, "hnsw" or "ivfflat"
+        hnsw_m: HNSW m parameter (None: pgvector default)
+        hnsw_ef_construction: HNSW ef_construction (None: pgvector default)
+        ivfflat_lists: IVFFlat lists (None: pgvector default)
+
+    Returns:
+        Dict with migration results:
+        - index: name of the quantized index in place, or None
+        - dropped: list of index names dropped (including rebuilt ones)
+        - deferred: True if the IVFFlat index waits for the table to have rows
+    """
+    results: dict[str, Any] = {"index": None, "dropped": [], "deferred": False}
+
+    with conn.cursor() as cur:
+        for mode in _QUANTIZED_INDEXES:
+            if mode == storage:
+                continue
+            index_name = f"idx_{table_name}_embedding_{mode}"
+            cur.execute(
+                "SELECT 1 FROM pg_indexes WHERE tablename = %s AND indexname = %s",
+                (table_name, index_name),
+            )
+            if cur.fetchone() is not None:
+                logger.info(f"Dropping {mode} embedding index on {table_name}")
+                cur.execute(f"DROP INDEX {index_name}")
+                results["dropped"].append(index_name)
+
+        if storage in _QUANTIZED_INDEXES:
+            # The quantized types need the vector dimensions (vector typmod)
+            cur.execute(
+                """
+                SELECT atttypmod FROM pg_attribute
+                WHERE attrelid = %s::regclass AND attname = 'embedding'
+            """,
+                (table_name,),
+            )
+            row = cur.fetchone()
+            if row is None or row[0] <= 0:
+                raise ValueError(
+                    f"Cannot use {storage} vector storage: {table_name}.embedding "
+                    "has no fixed dimensions"
+                )
+            expression, opclass = _QUANTIZED_INDEXES[storage]
+            if vector_index == "ivfflat":
+                params = {"lists": ivfflat_lists}
+            else:
+                params = {"m": hnsw_m, "ef_construction": hnsw_ef_construction}
+            options = {k: v for k, v in params.items() if v}
+            index_name = f"idx_{table_name}_embedding_{storage}"
+
+            # Rebuild an existing index whose method or build options changed
+            cur.execute(
+                """
+                SELECT am.amname, c.reloptions
+                FROM pg_class c JOIN pg_am am ON am.oid = c.relam
+                WHERE c.relname = %s
+            """,
+                (index_name,),
+            )
+            existing = cur.fetchone()
+            wanted = (vector_index, sorted(f"{k}={v}" for k, v in options.items()))
+            if (
+                existing is not None
+                and (existing[0], sorted(existing[1] or [])) != wanted
+            ):
+                logger.info(
+                    f"Rebuilding {storage} embedding index on {table_name} "
+                    f"(settings changed)"
+                )
+                cur.execute(f"DROP INDEX {index_name}")
+                results["dropped"].append(index_name)
+                existing = None
+
+            if existing is not None:
+                results["index"] = index_name
+            else:
+                # IVFFlat trains its lists on the rows present at build time;
+                # built on an empty table it would give poor recall
+                empty = False
+                if vector_index == "ivfflat":
+                    cur.execute(f"SELECT NOT EXISTS (SELECT 1 FROM {table_name})")
+                    (empty,) = cur.fetchone()
+                if empty:
+                    logger.info(
+                        f"Deferring ivfflat {storage} embedding index on "
+                        f"{table_name} until it has rows"
+                    )
+                    results["deferred"] = True
+                else:
+                    with_sql = ", ".join(f"{k} = {v}" for k, v in options.items())
+                    logger.info(f"Creating {storage} embedding index on {table_name}")
+                    cur.execute(f"""
+                        CREATE INDEX {index_name} ON {table_name}
+                        USING {vector_index} ({expression.format(dims=row[0])} {opclass})
+                        {f"WITH ({with_sql})" if with_sql else ""}
+                    """)
+                    results["index"] = index_name
+
+    conn.commit()
+    logger.info(f"Vector storage migration complete for {table_name}: {results}")
+    return results
+
+
+def ensure_filter_indexes(conn: psycopg.Connection, table_name: str) -> dict[str, Any]:
+    """Ensure indexes serving symbol and language filters exist on a table.
+
+    This is idempotent - safe to call multiple times. Columns missing from
+    older indexes are skipped. Without pg_trgm, exact names, symbol types
+    and languages are still index-served; only glob names scan.
+
+    Indexes:
+    - btree on symbol_type and language_id
+    - btree on lower(symbol_name) (exact name filters)
+    - GIN gin_trgm_ops on symbol_name (glob filters, if pg_trgm is available)
+
+    Args:
+        conn: PostgreSQL connection
+        table_name: Name of the chunks table (e.g., "myindex_chunks")
+
+    Returns:
+        Dict with migration results:
+        - indexes: list of index names ensured
+        - trigram_indexes: bool - whether the trigram index is in place
+    """
+    results = {
+        "indexes": [],
+        "trigram_indexes": False,
+    }
+
+    btree_indexes = {
+        "symbol_type": f"idx_{table_name}_symbol_type",
+        "language_id": f"idx_{table_name}_language_id",
+        "lower(symbol_name)": f"idx_{table_name}_symbol_name",
+    }
+
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name = %s AND column_name = ANY(%s)
+        """,
+            (table_name, ["symbol_type", "symbol_name", "language_id"]),
+        )
+        existing = {row[0] for row in cur.fetchall()}
+
+        for expression, index_name in btree_indexes.items():
+            column = expression.removeprefix("lower(").removesuffix(")")
+            if column not in existing:
+                continue
+            cur.execute(f"""
+                CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({expression})
+            """)
+            results["indexes"].append(index_name)
+
+    conn.commit()
+
+    if "symbol_name" in existing and ensure_trigram_extension(conn):
+        index_name = f"idx_{table_name}_symbol_name_trgm"
+        with conn.cursor() as cur:
+            cur.execute(f"""
+                CREATE INDEX IF NOT EXISTS {index_name}
+                ON {table_name} USING GIN (symbol_name gin_trgm_ops)
+            """)
+        conn.commit()
+        results["indexes"].append(index_name)
+        results["trigram_indexes"] = True
+
+    logger.info(f"Filter indexes ensured for {table_name}: {results}")
+    return results
+
+
+def ensure_trigram_extension(conn: psycopg.Connection) -> bool:
+    """Ensure the pg_trgm extension is installed, if permitted.
+
+    Creating an extension needs database-owner privileges, so failure is
+    logged and reported rather than raised.
+
+    Args:
+        conn: PostgreSQL connection
+
+    Returns:
+        True if pg_trgm is available.
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        if cur.fetchone() is not None:
+            return True
+        try:
+            with conn.transaction():
+                cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except psycopg.Error as e:
+            logger.warning(
+                f"pg_trgm extension unavailable, glob symbol filters will scan: {e}"
+            )
+            return False
+    conn.commit()
+    return True
+
+
+def ensure_symbols_table_indexes(
+    conn: psycopg.Connection, index_name: str
+) -> dict[str, Any]:
+    """Create lookup indexes on the per-index symbols side table.
+
+    The table itself is exported by the CocoIndex flow (one row per symbol
+    per chunk); this adds the indexes symbol filters rely on. Idempotent,
+    and a no-op until flow setup has created the table.
+
+    Table: codeindex_{index_name}__{index_name}_symbols
+    Indexes:
+    - btree on symbol_type, lower(name), lower(qualified_name)
+    - GIN gin_trgm_ops on name and qualified_name (if pg_trgm is available)
+
+    Args:
+        conn: PostgreSQL connection
+        index_name: Index name (used in table and index names)
+
+    Returns:
+        Dict with migration results:
+        - table_exists: bool
+        - trigram_indexes: bool - whether trigram indexes are in place
+    """
+    validate_index_name(index_name)
+    table_name = f"codeindex_{index_name}__{index_name}_symbols"
+    prefix = f"idx_cocosearch_symbols_{index_name}"
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT to_regclass(%s)", (table_name,))
+        row = cur.fetchone()
+        if row is None or row[0] is None:
+            return {"table_exists": False, "trigram_indexes": False}
+
+        cur.execute(f"""
+            CREATE INDEX IF NOT EXISTS {prefix}_type ON {table_name} (symbol_type)
+        """)
+        cur.execute(f"""
+            CREATE INDEX IF NOT EXISTS {prefix}_name ON {table_name} (lower(name))
+        """)
+        cur.execute(f"""
+            CREATE INDEX IF NOT EXISTS {prefix}_qualified
+            ON {table_name} (lower(qualified_name))
+        """)
+    conn.commit()
+
+    trigram = ensure_trigram_extension(conn)
+    if trigram:
+        with conn.cursor() as cur:
+            cur.execute(f"""
+                CREATE INDEX IF NOT EXISTS {prefix}_name_trgm
+                ON {table_name} USING GIN (name gin_trgm_ops)
+            """)
+            cur.execute(f"""
+                CREATE INDEX IF NOT EXISTS {prefix}_qualified_trgm
+                ON {table_name} USING GIN (qualified_name gin_trgm_ops)
+            """)
+        conn.commit()
+
+    logger.info(f"Symbols table indexes ensured: {table_name}")
+    return {"table_exists": True, "trigram_indexes": trigram}
+
+
 def ensure_parse_results_table(
     conn: psycopg.Connection, index_name: str
 ) -> dict[str, Any]:
@@ -224,6 +576,8 @@ def ensure_parse_results_table(
     - language TEXT NOT NULL
     - parse_status TEXT NOT NULL
     - error_message TEXT
+    - file_mtime_ns BIGINT, file_size BIGINT (file state when parsed, used
+      to skip unchanged files; added to existing tables as nullable)
 
     Args:
         conn: PostgreSQL connection
@@ -242,9 +596,17 @@ def ensure_parse_results_table(
                 language TEXT NOT NULL,
                 parse_status TEXT NOT NULL,
                 error_message TEXT,
+                file_mtime_ns BIGINT,
+                file_size BIGINT,
                 PRIMARY KEY (file_path)
             )
         """)
+        # Tables created before incremental tracking lack the file state columns
+        cur.execute(f"""
+            ALTER TABLE {table_name}
+            ADD COLUMN IF NOT EXISTS file_mtime_ns BIGINT,
+            ADD COLUMN IF NOT EXISTS file_size BIGINT
+        """)
         cur.execute(f"""
             CREATE INDEX IF NOT EXISTS idx_cocosearch_parse_results_{index_name}_lang_status
             ON {table_name} (language, parse_status)
@@ -20,7 +20,8 @@ Supported languages:
 - CSS: rule sets (class/ID/element selectors), @keyframes, @media queries
 
 Features:
-- Query-based extraction using external .scm files
+- Query-based extraction using external .scm files, compiled once per
+  language and reused for every chunk (see reload_symbol_queries())
 - User-extensible: override queries in ~/.cocosearch/queries/ or .cocosearch/queries/
 - Methods use qualified names: "ClassName.method_name"
 - Graceful error handling (returns NULL fields on parse errors)
@@ -29,6 +30,8 @@ Features:
 import dataclasses
 import logging
 import importlib.resources
+import threading
+from importlib.resources.abc import Traversable
 from pathlib import Path
 from tree_sitter import Parser, Query, QueryCursor
 from tree_sitter_language_pack import get_parser as pack_get_parser, get_language
@@ -46,6 +49,22 @@ class SymbolMetadata:
     symbol_signature: str | None
 
 
+@dataclasses.dataclass
+class FileSymbol:
+    """A symbol definition located in a whole file.
+
+    ``start`` and ``end`` are character offsets into the file content, the
+    same unit as chunk locations produced by the splitter.
+    """
+
+    start: int
+    end: int
+    name: str
+    symbol_type: str
+    symbol_name: str
+    symbol_signature: str
+
+
 # ============================================================================
 # Language Mapping (file extension to tree-sitter language name)
 # ============================================================================
@@ -136,15 +155,17 @@ def _get_parser(language: str) -> Parser:
 # ============================================================================
 
 
-def resolve_query_file(language: str, project_path: Path | None = None) -> str | None:
-    """Resolve query file with priority: Project > User > Built-in.
+def _resolve_query_path(
+    language: str, project_path: Path | None = None
+) -> Traversable | None:
+    """Locate the query file with priority: Project > User > Built-in.
 
     Args:
         language: Tree-sitter language name (e.g., "python", "javascript").
         project_path: Optional project root path for project-level overrides.
 
     Returns:
-        Query file contents as string, or None if language not supported.
+        Path to the query file, or None if language not supported.
     """
     query_name = f"{language}.scm"
 
@@ -152,34 +173,120 @@ def resolve_query_file(language: str, project_path: Path | None = None) -> str |
     if project_path:
         project_query = project_path / ".cocosearch" / "queries" / query_name
         if project_query.exists():
-            return project_query.read_text()
+            return project_query
 
     # Priority 2: User-level override
     user_path = Path.home() / ".cocosearch" / "queries" / query_name
     if user_path.exists():
-        return user_path.read_text()
+        return user_path
 
     # Priority 3: Built-in queries
+    builtin = importlib.resources.files("cocosearch.indexer.queries").joinpath(
+        query_name
+    )
+    if builtin.is_file():
+        return builtin
+    return None
+
+
+def resolve_query_file(language: str, project_path: Path | None = None) -> str | None:
+    """Resolve query file with priority: Project > User > Built-in.
+
+    Args:
+        language: Tree-sitter language name (e.g., "python", "javascript").
+        project_path: Optional project root path for project-level overrides.
+
+    Returns:
+        Query file contents as string, or None if language not supported.
+    """
+    path = _resolve_query_path(language, project_path)
+    if path is None:
+        return None
+    return path.read_text()
+
+
+# ============================================================================
+# Compiled Query Registry
+# ============================================================================
+
+# Compiled queries keyed by (language, resolved path, mtime)
+_COMPILED_QUERIES: dict[tuple[str, str, float], Query] = {}
+# Query in use per language (None = no query file); cleared by reload
+_ACTIVE_QUERIES: dict[str, Query | None] = {}
+_QUERY_LOCK = threading.Lock()
+
+
+def _query_mtime(path: Traversable) -> float:
+    """Return the query file's mtime, or 0.0 if it can't be stat'ed."""
     try:
-        return (
-            importlib.resources.files("cocosearch.indexer.queries")
-            .joinpath(query_name)
-            .read_text()
-        )
-    except FileNotFoundError:
+        return Path(str(path)).stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _load_query(language: str) -> Query | None:
+    """Resolve and compile the query for a language (caller holds the lock)."""
+    path = _resolve_query_path(language)
+    if path is None:
         return None
 
+    key = (language, str(path), _query_mtime(path))
+    query = _COMPILED_QUERIES.get(key)
+    if query is None:
+        query = Query(get_language(language), path.read_text())
+        # Drop compiled versions of this language's previous query file
+        for stale in [k for k in _COMPILED_QUERIES if k[0] == language]:
+            del _COMPILED_QUERIES[stale]
+        _COMPILED_QUERIES[key] = query
+        logger.debug(f"Compiled symbol query for {language} from {path}")
+    return query
+
+
+def get_symbol_query(language: str) -> Query | None:
+    """Get the compiled symbol query for a language.
+
+    The query file is resolved and compiled on first use and then reused
+    for every chunk, so extraction costs no filesystem access. Call
+    reload_symbol_queries() to pick up edited or added override files.
+
+    Args:
+        language: Tree-sitter language name (e.g., "python", "javascript").
+
+    Returns:
+        Compiled Query, or None if the language has no query file.
+    """
+    try:
+        return _ACTIVE_QUERIES[language]
+    except KeyError:
+        pass
+
+    with _QUERY_LOCK:
+        if language not in _ACTIVE_QUERIES:
+            _ACTIVE_QUERIES[language] = _load_query(language)
+        return _ACTIVE_QUERIES[language]
+
+
+def reload_symbol_queries() -> None:
+    """Re-resolve symbol query files on next use.
+
+    Queries whose (path, mtime) is unchanged are reused from the compiled
+    registry; edited or newly added override files are recompiled.
+    """
+    with _QUERY_LOCK:
+        _ACTIVE_QUERIES.clear()
+
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
 
-def _get_node_text(source_text: str, node) -> str:
+def _get_node_text(source_text: str | bytes, node) -> str:
     """Extract text from syntax tree node.
 
     Args:
-        source_text: The full source code text.
+        source_text: The source that was parsed. Node offsets are byte
+            offsets, so pass the UTF-8 bytes for non-ASCII sources.
         node: Tree-sitter node to extract text from.
 
     Returns:
@@ -187,7 +294,10 @@ def _get_node_text(source_text: str, node) -> str:
     """
     if node is None:
         return ""
-    return source_text[node.start_byte : node.end_byte]
+    text = source_text[node.start_byte : node.end_byte]
+    if isinstance(text, bytes):
+        return text.decode("utf8", errors="replace")
+    return text
 
 
 def _map_symbol_type(raw_type: str) -> str:
@@ -215,12 +325,12 @@ def _map_symbol_type(raw_type: str) -> str:
     return mapping.get(raw_type, "function")
 
 
-def _get_container_name(node, chunk_text: str, language: str) -> str | None:
+def _get_container_name(node, chunk_text: str | bytes, language: str) -> str | None:
     """Extract name from container node (class, struct, module, etc.).
 
     Args:
         node: Container node.
-        chunk_text: Source code text.
+        chunk_text: Source that was parsed (text or UTF-8 bytes).
         language: Language name.
 
     Returns:
@@ -239,13 +349,15 @@ def _get_container_name(node, chunk_text: str, language: str) -> str | None:
     return None
 
 
-def _build_qualified_name(node, name: str, chunk_text: str, language: str) -> str:
+def _build_qualified_name(
+    node, name: str, chunk_text: str | bytes, language: str
+) -> str:
     """Build qualified name with parent context (e.g., ClassName.method_name).
 
     Args:
         node: Definition node.
         name: Symbol name.
-        chunk_text: Source code text.
+        chunk_text: Source that was parsed (text or UTF-8 bytes).
         language: Language name.
 
     Returns:
@@ -317,7 +429,9 @@ def _build_qualified_name(node, name: str, chunk_text: str, language: str) -> st
     return separator.join(reversed(parents)) + separator + name
 
 
-def _build_signature(node, chunk_text: str, language: str, symbol_type: str) -> str:
+def _build_signature(
+    node, chunk_text: str | bytes, language: str, symbol_type: str
+) -> str:
     """Build symbol signature from node.
 
     Extracts the declaration line without the body. For functions, this means
@@ -326,7 +440,7 @@ def _build_signature(node, chunk_text: str, language: str, symbol_type: str) ->
 
     Args:
         node: Definition node.
-        chunk_text: Source code text.
+        chunk_text: Source that was parsed (text or UTF-8 bytes).
         language: Language name.
         symbol_type: Symbol type (function, class, etc.).
 
@@ -378,24 +492,20 @@ def _build_signature(node, chunk_text: str, language: str, symbol_type: str) ->
 # ============================================================================
 
 
-def _extract_symbols_with_query(
-    chunk_text: str, language: str, query_text: str
-) -> list[dict]:
-    """Extract symbols using tree-sitter query.
+def _collect_symbols(tree, source: bytes, language: str, query: Query) -> list:
+    """Run a compiled symbol query over a parse tree.
 
     Args:
-        chunk_text: Source code text.
+        tree: Tree-sitter tree parsed from ``source``.
+        source: UTF-8 bytes that were parsed.
         language: Tree-sitter language name.
-        query_text: Query file contents (.scm format).
+        query: Compiled symbol query.
 
     Returns:
-        List of symbol dicts with symbol_type, symbol_name, symbol_signature.
+        List of (definition node, name, symbol dict) tuples, where name is
+        the unqualified identifier. Symbol dicts have symbol_type,
+        symbol_name (qualified), symbol_signature.
     """
-    lang = get_language(language)
-    parser = _get_parser(language)
-    tree = parser.parse(bytes(chunk_text, "utf8"))
-
-    query = Query(lang, query_text)
     cursor = QueryCursor(query)
     captures_dict = cursor.captures(tree.root_node)
 
@@ -419,7 +529,7 @@ def _extract_symbols_with_query(
                 parent = node.parent
                 while parent:
                     if parent.id in definitions:
-                        names[parent.id] = chunk_text[node.start_byte : node.end_byte]
+                        names[parent.id] = _get_node_text(source, node)
                         break
                     parent = parent.parent
 
@@ -427,20 +537,156 @@ def _extract_symbols_with_query(
         name = names.get(node_id)
         if name:
             # Build qualified name for methods
-            qualified_name = _build_qualified_name(node, name, chunk_text, language)
-            signature = _build_signature(node, chunk_text, language, symbol_type)
+            qualified_name = _build_qualified_name(node, name, source, language)
+            signature = _build_signature(node, source, language, symbol_type)
 
             symbols.append(
-                {
-                    "symbol_type": _map_symbol_type(symbol_type),
-                    "symbol_name": qualified_name,
-                    "symbol_signature": signature,
-                }
+                (
+                    node,
+                    name,
+                    {
+                        "symbol_type": _map_symbol_type(symbol_type),
+                        "symbol_name": qualified_name,
+                        "symbol_signature": signature,
+                    },
+                )
             )
 
     return symbols
 
 
+def _extract_symbols_with_query(
+    chunk_text: str, language: str, query: Query | str
+) -> list[dict]:
+    """Extract symbols using tree-sitter query.
+
+    Args:
+        chunk_text: Source code text.
+        language: Tree-sitter language name.
+        query: Compiled query, or query file contents (.scm format) to compile.
+
+    Returns:
+        List of symbol dicts with symbol_type, symbol_name, symbol_signature.
+    """
+    source = bytes(chunk_text, "utf8")
+    tree = _get_parser(language).parse(source)
+
+    if isinstance(query, str):
+        query = Query(get_language(language), query)
+    return [
+        symbol
+        for _node, _name, symbol in _collect_symbols(tree, source, language, query)
+    ]
+
+
+def extract_tree_symbols(
+    tree, source: bytes, language: str, query: Query
+) -> list[FileSymbol]:
+    """Extract every symbol from a whole-file parse tree.
+
+    Used by the per-file indexing transform, which parses each file once
+    and assigns symbols to chunks by range (see ``select_chunk_symbol``).
+
+    Args:
+        tree: Tree-sitter tree parsed from ``source``.
+        source: UTF-8 bytes of the file content.
+        language: Tree-sitter language name.
+        query: Compiled symbol query.
+
+    Returns:
+        Symbols ordered by start offset, outer definitions first on ties.
+    """
+    found = _collect_symbols(tree, source, language, query)
+    byte_offsets = {n.start_byte for n, _, _ in found} | {
+        n.end_byte for n, _, _ in found
+    }
+    char_offsets = _byte_to_char_offsets(source, byte_offsets)
+
+    symbols = [
+        FileSymbol(
+            start=char_offsets[node.start_byte],
+            end=char_offsets[node.end_byte],
+            name=name,
+            **symbol,
+        )
+        for node, name, symbol in found
+    ]
+    symbols.sort(key=lambda sym: (sym.start, -sym.end))
+    return symbols
+
+
+def _byte_to_char_offsets(source: bytes, byte_offsets: set[int]) -> dict[int, int]:
+    """Map UTF-8 byte offsets (on character boundaries) to character offsets."""
+    if source.isascii():
+        return {offset: offset for offset in byte_offsets}
+
+    char_offsets = {}
+    prev_byte = prev_char = 0
+    for offset in sorted(byte_offsets):
+        prev_char += len(source[prev_byte:offset].decode("utf8", errors="replace"))
+        prev_byte = offset
+        char_offsets[offset] = prev_char
+    return char_offsets
+
+
+def select_chunk_symbol(
+    start: int, end: int, symbols: list[FileSymbol]
+) -> FileSymbol | None:
+    """Pick the symbol that describes a chunk spanning [start, end).
+
+    The first definition starting inside the chunk wins. A chunk with no
+    definition of its own takes the innermost definition enclosing its
+    start, so chunks from the middle of a long function or class still
+    carry that symbol.
+
+    Args:
+        start: Chunk start character offset.
+        end: Chunk end character offset.
+        symbols: File symbols as returned by ``extract_tree_symbols``.
+
+    Returns:
+        The selected symbol, or None.
+    """
+    enclosing = None
+    for symbol in symbols:
+        if symbol.start >= end:
+            break
+        if symbol.start >= start:
+            return symbol
+        if symbol.end > start:
+            enclosing = symbol
+    return enclosing
+
+
+def select_chunk_symbols(
+    start: int, end: int, symbols: list[FileSymbol]
+) -> list[FileSymbol]:
+    """List every symbol a chunk spanning [start, end) should match.
+
+    That is each definition starting inside the chunk, plus the innermost
+    definition enclosing the chunk start (if any), so symbol filters find
+    chunks by any method they contain rather than only the first.
+
+    Args:
+        start: Chunk start character offset.
+        end: Chunk end character offset.
+        symbols: File symbols as returned by ``extract_tree_symbols``.
+
+    Returns:
+        Selected symbols in start order.
+    """
+    enclosing = None
+    inside = []
+    for symbol in symbols:
+        if symbol.start >= end:
+            break
+        if symbol.start >= start:
+            inside.append(symbol)
+        elif symbol.end > start:
+            enclosing = symbol
+    return [enclosing, *inside] if enclosing is not None else inside
+
+
 # ============================================================================
 # Main Extract Function
 # ============================================================================
@@ -481,8 +727,8 @@ def extract_symbol_metadata(text: str, language: str) -> SymbolMetadata:
         )
 
     try:
-        query_text = resolve_query_file(ts_language)
-        if query_text is None:
+        query = get_symbol_query(ts_language)
+        if query is None:
             # No query file for this language - index without symbols
             return SymbolMetadata(
                 symbol_type=None,
@@ -490,7 +736,7 @@ def extract_symbol_metadata(text: str, language: str) -> SymbolMetadata:
                 symbol_signature=None,
             )
 
-        symbols = _extract_symbols_with_query(text, ts_language, query_text)
+        symbols = _extract_symbols_with_query(text, ts_language, query)
 
         if symbols:
             return SymbolMetadata(**symbols[0])
@@ -510,4 +756,14 @@ def extract_symbol_metadata(text: str, language: str) -> SymbolMetadata:
         )
 
 
-__all__ = ["extract_symbol_metadata", "SymbolMetadata", "LANGUAGE_MAP"]
+__all__ = [
+    "extract_symbol_metadata",
+    "extract_tree_symbols",
+    "FileSymbol",
+    "select_chunk_symbol",
+    "select_chunk_symbols",
+    "get_symbol_query",
+    "reload_symbol_queries",
+    "SymbolMetadata",
+    "LANGUAGE_MAP",
+]
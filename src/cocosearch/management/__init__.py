@@ -2,9 +2,10 @@
 
 Provides functions for index discovery, statistics, clearing,
 git-based index name detection, project context detection,
-and path-to-index metadata storage.
+path-to-index metadata storage, and bulk table writes.
 """
 
+from cocosearch.management.bulk_write import copy_rows, replace_rows, upsert_rows
 from cocosearch.management.clear import clear_index
 from cocosearch.management.context import (
     derive_index_name,
@@ -42,6 +43,7 @@ __all__ = [
     "auto_recover_stale_indexing",
     "clear_index",
     "clear_index_path",
+    "copy_rows",
     "derive_index_from_git",
     "derive_index_name",
     "get_commit_hash",
@@ -61,6 +63,8 @@ __all__ = [
     "get_stats",
     "list_indexes",
     "register_index_path",
+    "replace_rows",
     "resolve_index_name",
     "set_index_status",
+    "upsert_rows",
 ]
@@ -0,0 +1,138 @@
+"""Bulk row writer for cocosearch-owned tables.
+
+Streams rows into PostgreSQL with binary ``COPY`` instead of per-row
+INSERTs. Rows are first copied into a transaction-scoped staging table and
+then merged into the target with a single statement, so a failed or
+in-progress write never shows readers a partially written table:
+
+- ``upsert_rows``: merge staged rows with INSERT ... ON CONFLICT.
+- ``replace_rows``: swap the target's contents for the staged rows
+  (DELETE + INSERT ... SELECT in the caller's transaction).
+
+Callers own the transaction and must commit after writing.
+"""
+
+from collections.abc import Iterable, Sequence
+
+import psycopg
+
+
+def copy_rows(
+    cur: psycopg.Cursor,
+    table: str,
+    columns: Sequence[str],
+    types: Sequence[str],
+    rows: Iterable[Sequence],
+) -> int:
+    """Stream rows into a table with binary COPY.
+
+    Args:
+        cur: Open cursor.
+        table: Target table name (must already be validated).
+        columns: Column names, in row order.
+        types: PostgreSQL type name for each column (e.g. "text", "bigint").
+            Binary COPY sends values without casts, so they must match the
+            table's column types.
+        rows: Row tuples (may be a lazy iterator).
+
+    Returns:
+        Number of rows written.
+    """
+    written = 0
+    with cur.copy(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN (FORMAT BINARY)"
+    ) as copy:
+        copy.set_types(list(types))
+        for row in rows:
+            copy.write_row(row)
+            written += 1
+    return written
+
+
+def _stage_rows(
+    cur: psycopg.Cursor,
+    table: str,
+    columns: Sequence[str],
+    types: Sequence[str],
+    rows: Iterable[Sequence],
+) -> tuple[str, int]:
+    """Copy rows into an empty staging table shaped like ``table``.
+
+    Returns:
+        Tuple of (staging table name, number of rows staged).
+    """
+    staging = f"{table}_staging"
+    cur.execute(
+        f"CREATE TEMP TABLE IF NOT EXISTS {staging} "
+        f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+    # Reused within the same transaction: start from an empty table
+    cur.execute(f"TRUNCATE {staging}")
+    return staging, copy_rows(cur, staging, columns, types, rows)
+
+
+def upsert_rows(
+    cur: psycopg.Cursor,
+    table: str,
+    columns: Sequence[str],
+    types: Sequence[str],
+    rows: Iterable[Sequence],
+    *,
+    key: str,
+) -> int:
+    """Insert or update rows through a binary COPY staging table.
+
+    Args:
+        cur: Open cursor.
+        table: Target table name (must already be validated).
+        columns: Column names, in row order. Must include ``key``.
+        types: PostgreSQL type name for each column.
+        rows: Row tuples (may be a lazy iterator).
+        key: Unique column used for conflict detection.
+
+    Returns:
+        Number of rows written.
+    """
+    staging, written = _stage_rows(cur, table, columns, types, rows)
+    if written:
+        column_list = ", ".join(columns)
+        updates = ", ".join(f"{col} = EXCLUDED.{col}" for col in columns if col != key)
+        cur.execute(
+            f"INSERT INTO {table} ({column_list}) "
+            f"SELECT {column_list} FROM {staging} "
+            f"ON CONFLICT ({key}) DO UPDATE SET {updates}"
+        )
+    return written
+
+
+def replace_rows(
+    cur: psycopg.Cursor,
+    table: str,
+    columns: Sequence[str],
+    types: Sequence[str],
+    rows: Iterable[Sequence],
+) -> int:
+    """Replace every row of a table with the given rows.
+
+    The slow part (COPY) fills the staging table without touching the
+    target. The target is then emptied and refilled in the caller's
+    transaction, so concurrent readers keep seeing the old rows until
+    commit. Indexes, grants, and constraints on the target are untouched.
+
+    Args:
+        cur: Open cursor.
+        table: Target table name (must already be validated).
+        columns: Column names, in row order.
+        types: PostgreSQL type name for each column.
+        rows: Row tuples (may be a lazy iterator).
+
+    Returns:
+        Number of rows written.
+    """
+    staging, written = _stage_rows(cur, table, columns, types, rows)
+    column_list = ", ".join(columns)
+    cur.execute(f"DELETE FROM {table}")
+    cur.execute(
+        f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging}"
+    )
+    return written
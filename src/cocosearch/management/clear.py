@@ -4,7 +4,14 @@ Provides functions to delete indexes from the PostgreSQL database.
 """
 
 from cocosearch.exceptions import IndexNotFoundError
-from cocosearch.search.db import get_connection_pool, get_table_name
+from cocosearch.search.cache import invalidate_index_cache
+from cocosearch.search.catalog import invalidate_catalog
+from cocosearch.search.db import (
+    get_connection_pool,
+    get_symbols_table_name,
+    get_table_name,
+    invalidate_statements,
+)
 from cocosearch.validation import validate_index_name
 
 
@@ -52,6 +59,10 @@ def clear_index(index_name: str) -> dict:
             cur.execute(f"DROP TABLE {table_name}")
             conn.commit()
 
+            # Drop the symbols side table if it exists (older indexes lack it)
+            cur.execute(f"DROP TABLE IF EXISTS {get_symbols_table_name(index_name)}")
+            conn.commit()
+
             # Drop parse results table if it exists (non-critical)
             parse_table = f"cocosearch_parse_results_{index_name}"
             try:
@@ -60,6 +71,15 @@ def clear_index(index_name: str) -> dict:
             except Exception:
                 pass  # Table may not exist for pre-v46 indexes
 
+    # Statements prepared against the dropped tables are stale, and the
+    # catalog still lists them
+    invalidate_statements()
+    invalidate_catalog()
+
+    # Persisted query cache entries would otherwise outlive the index (and
+    # be served for a re-created index of the same name)
+    invalidate_index_cache(index_name)
+
     # Clear path-to-index metadata (non-critical, log but don't fail)
     try:
         from cocosearch.management.metadata import clear_index_path
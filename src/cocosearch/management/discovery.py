@@ -4,20 +4,29 @@ Provides functions to discover and list all CocoIndex tables
 in the PostgreSQL database.
 """
 
+from cocosearch.search.catalog import get_catalog, index_name_from_table
 from cocosearch.search.db import get_connection_pool
 
 
-def list_indexes() -> list[dict]:
+def list_indexes(cached: bool = False) -> list[dict]:
     """List all indexes stored in PostgreSQL.
 
     Queries information_schema.tables for tables matching the CocoIndex
     naming pattern `codeindex_%__%_chunks` and parses the index names.
 
+    Args:
+        cached: Read from the in-process index catalog instead of querying
+            (up to ``CATALOG_TTL`` seconds old for indexes created or
+            dropped by other processes). Used by per-request paths.
+
     Returns:
         List of dicts with keys:
         - name: The extracted index name
         - table_name: The full PostgreSQL table name
     """
+    if cached:
+        return get_catalog().indexes()
+
     pool = get_connection_pool()
 
     query = """
@@ -36,13 +45,8 @@ def list_indexes() -> list[dict]:
             rows = cur.fetchall()
 
             for (table_name,) in rows:
-                # Parse table name: codeindex_{name}__{name}_chunks
-                # Extract name from the part before '__'
-                if "__" in table_name:
-                    prefix_part = table_name.split("__")[0]
-                    # Remove 'codeindex_' prefix
-                    if prefix_part.startswith("codeindex_"):
-                        name = prefix_part[len("codeindex_") :]
-                        indexes.append({"name": name, "table_name": table_name})
+                name = index_name_from_table(table_name)
+                if name is not None:
+                    indexes.append({"name": name, "table_name": table_name})
 
     return indexes
@@ -1,12 +1,22 @@
 """Git integration module for cocosearch.
 
 Provides functions to detect git repository root and derive
-index names from git repositories.
+index names from git repositories, plus a per-project cache of git
+state (branch, commit, commits behind, remote URL) for staleness checks.
 """
 
+import dataclasses
 import subprocess
+import threading
+import time
+from collections.abc import Callable, Hashable
 from pathlib import Path
 
+# Cached git state is reused while the watched .git files are unchanged,
+# for at most this long; without a .git directory to watch, a short TTL
+GIT_STATE_MAX_AGE = 300.0
+GIT_STATE_TTL = 10.0
+
 
 def get_git_root() -> Path | None:
     """Get the root directory of the current git repository.
@@ -186,3 +196,161 @@ def derive_index_from_git() -> str | None:
     from cocosearch.management.context import derive_index_name
 
     return derive_index_name(str(git_root))
+
+
+@dataclasses.dataclass(frozen=True)
+class GitState:
+    """Current branch and short commit hash of a project."""
+
+    branch: str | None
+    commit: str | None
+
+
+@dataclasses.dataclass
+class _GitStateEntry:
+    fingerprint: tuple | None
+    checked_at: float
+    values: dict[Hashable, object] = dataclasses.field(default_factory=dict)
+
+
+_git_state: dict[str, _GitStateEntry] = {}
+_git_state_lock = threading.Lock()
+
+
+def _find_git_dirs(path: Path) -> tuple[Path, Path] | None:
+    """Locate a project's git directory and common directory.
+
+    Handles worktrees and submodules, where ``.git`` is a file pointing at
+    the real git directory (whose ``commondir`` holds shared refs).
+
+    Returns:
+        Tuple of (git_dir, common_dir), or None if no ``.git`` is found in
+        ``path`` or its parents.
+    """
+    for directory in (path, *path.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git, dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text().strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = (directory / content[len("gitdir:") :].strip()).resolve()
+            common_dir = git_dir
+            try:
+                common = (git_dir / "commondir").read_text().strip()
+                common_dir = (git_dir / common).resolve()
+            except OSError:
+                pass
+            return git_dir, common_dir
+    return None
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _git_fingerprint(path: Path) -> tuple | None:
+    """Modification stamps of the files that determine a project's git state.
+
+    Covers HEAD (checkout), the current branch's ref and packed-refs
+    (commits, resets) and config (remote URL).
+
+    Returns:
+        Tuple of (mtime_ns, size) stamps, or None without a git directory.
+    """
+    dirs = _find_git_dirs(path)
+    if dirs is None:
+        return None
+    git_dir, common_dir = dirs
+    head = git_dir / "HEAD"
+    branch_ref = None
+    try:
+        content = head.read_text().strip()
+        if content.startswith("ref:"):
+            branch_ref = content[len("ref:") :].strip()
+    except OSError:
+        pass
+    return (
+        _stat_key(head),
+        _stat_key(common_dir / branch_ref) if branch_ref else None,
+        _stat_key(common_dir / "packed-refs"),
+        _stat_key(common_dir / "config"),
+    )
+
+
+def _cached_git_value(path: str | Path, key: Hashable, compute: Callable[[], object]):
+    """Return a memoized git value for a project, recomputing after changes.
+
+    All values for a project are dropped together when the watched ``.git``
+    files change, after ``GIT_STATE_MAX_AGE`` seconds, or (for paths
+    without a git directory) after ``GIT_STATE_TTL`` seconds.
+    """
+    resolved = Path(path).resolve()
+    fingerprint = _git_fingerprint(resolved)
+    now = time.monotonic()
+    max_age = GIT_STATE_MAX_AGE if fingerprint is not None else GIT_STATE_TTL
+    cache_key = str(resolved)
+
+    with _git_state_lock:
+        entry = _git_state.get(cache_key)
+        if (
+            entry is None
+            or entry.fingerprint != fingerprint
+            or now - entry.checked_at >= max_age
+        ):
+            entry = _GitStateEntry(fingerprint=fingerprint, checked_at=now)
+            _git_state[cache_key] = entry
+        if key in entry.values:
+            return entry.values[key]
+
+    # Run git outside the lock; concurrent misses compute the same value
+    value = compute()
+    with _git_state_lock:
+        entry.values[key] = value
+    return value
+
+
+def get_git_state(path: str | Path) -> GitState:
+    """Get a project's current branch and commit, cached (see ``_cached_git_value``).
+
+    Args:
+        path: Project directory.
+
+    Returns:
+        GitState with the branch (None for detached HEAD or non-git dirs)
+        and short commit hash (None outside a git repo).
+    """
+    return _cached_git_value(
+        path,
+        "state",
+        lambda: GitState(branch=get_current_branch(path), commit=get_commit_hash(path)),
+    )
+
+
+def get_cached_commits_behind(path: str | Path, from_commit: str) -> int | None:
+    """Cached ``get_commits_behind`` for a project directory."""
+    return _cached_git_value(
+        path, ("behind", from_commit), lambda: get_commits_behind(path, from_commit)
+    )
+
+
+def get_cached_repo_url(path: str | Path) -> str | None:
+    """Cached ``get_repo_url`` for a project directory."""
+    return _cached_git_value(path, "repo_url", lambda: get_repo_url(path))
+
+
+def reset_git_state_cache() -> None:
+    """Forget all cached git state.
+
+    Used by tests to ensure clean state between test runs.
+    """
+    with _git_state_lock:
+        _git_state.clear()
@@ -11,6 +11,7 @@ from functools import lru_cache
 from pathlib import Path
 
 from cocosearch.management.context import get_canonical_path
+from cocosearch.search.catalog import invalidate_catalog
 from cocosearch.search.db import get_connection_pool
 
 logger = logging.getLogger(__name__)
@@ -61,11 +62,60 @@ def ensure_metadata_table() -> None:
         conn.commit()
 
 
-def get_index_metadata(index_name: str) -> dict | None:
+_METADATA_COLUMNS = """
+    index_name, canonical_path, created_at, updated_at, status,
+    branch, commit_hash, branch_commit_count
+"""
+
+
+def metadata_from_row(row: tuple) -> dict:
+    """Build the metadata dict for a ``cocosearch_index_metadata`` row.
+
+    Args:
+        row: Row with the columns selected by ``get_index_metadata``.
+
+    Returns:
+        Dict with keys: index_name, canonical_path, created_at, updated_at,
+        status, branch, commit_hash, branch_commit_count, plus
+        ``indexing_elapsed_seconds`` when status is "indexing".
+    """
+    status = row[4] if len(row) > 4 else "indexed"
+    updated_at = row[3]
+
+    result = {
+        "index_name": row[0],
+        "canonical_path": row[1],
+        "created_at": row[2],
+        "updated_at": updated_at,
+        "status": status,
+        "branch": row[5] if len(row) > 5 else None,
+        "commit_hash": row[6] if len(row) > 6 else None,
+        "branch_commit_count": row[7] if len(row) > 7 else None,
+    }
+
+    # Provide elapsed time so callers can warn about
+    # possibly-stale "indexing" status without mutating the DB.
+    if status == "indexing" and updated_at is not None:
+        try:
+            if not updated_at.tzinfo:
+                now = datetime.now()
+            else:
+                now = datetime.now(timezone.utc)
+            result["indexing_elapsed_seconds"] = (now - updated_at).total_seconds()
+        except Exception:
+            pass
+
+    return result
+
+
+def get_index_metadata(index_name: str, cached: bool = False) -> dict | None:
     """Get metadata for an index by name.
 
     Args:
         index_name: The name of the index to look up.
+        cached: Read from the in-process index catalog instead of querying
+            (up to ``CATALOG_TTL`` seconds old for changes made by other
+            processes). Used by per-request search paths.
 
     Returns:
         Dict with keys: index_name, canonical_path, created_at, updated_at, status
@@ -75,14 +125,18 @@ def get_index_metadata(index_name: str) -> dict | None:
         key is included so callers can decide how to present possibly-stale
         indexing status without mutating the database.
     """
+    if cached:
+        from cocosearch.search.catalog import get_catalog
+
+        return get_catalog().index_metadata(index_name)
+
     pool = get_connection_pool()
     try:
         with pool.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
-                    SELECT index_name, canonical_path, created_at, updated_at, status,
-                           branch, commit_hash, branch_commit_count
+                    f"""
+                    SELECT {_METADATA_COLUMNS}
                     FROM cocosearch_index_metadata
                     WHERE index_name = %s
                     """,
@@ -91,40 +145,32 @@ def get_index_metadata(index_name: str) -> dict | None:
                 row = cur.fetchone()
                 if row is None:
                     return None
-                status = row[4] if len(row) > 4 else "indexed"
-                updated_at = row[3]
-
-                result = {
-                    "index_name": row[0],
-                    "canonical_path": row[1],
-                    "created_at": row[2],
-                    "updated_at": updated_at,
-                    "status": status,
-                    "branch": row[5] if len(row) > 5 else None,
-                    "commit_hash": row[6] if len(row) > 6 else None,
-                    "branch_commit_count": row[7] if len(row) > 7 else None,
-                }
-
-                # Provide elapsed time so callers can warn about
-                # possibly-stale "indexing" status without mutating the DB.
-                if status == "indexing" and updated_at is not None:
-                    try:
-                        if not updated_at.tzinfo:
-                            now = datetime.now()
-                        else:
-                            now = datetime.now(timezone.utc)
-                        result["indexing_elapsed_seconds"] = (
-                            now - updated_at
-                        ).total_seconds()
-                    except Exception:
-                        pass
-
-                return result
+                return metadata_from_row(row)
     except Exception:
         # Table doesn't exist yet (fresh database, never indexed)
         return None
 
 
+def list_index_metadata_rows() -> list[tuple]:
+    """Get every metadata row, for loading the index catalog.
+
+    Returns:
+        Rows with the columns used by ``metadata_from_row``; empty when the
+        metadata table doesn't exist yet.
+    """
+    pool = get_connection_pool()
+    try:
+        with pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"SELECT {_METADATA_COLUMNS} FROM cocosearch_index_metadata"
+                )
+                return list(cur.fetchall())
+    except Exception:
+        # Table doesn't exist yet (fresh database, never indexed)
+        return []
+
+
 @lru_cache(maxsize=128)
 def get_index_for_path(canonical_path: str) -> str | None:
     """Get the index name for a canonical path.
@@ -165,6 +211,7 @@ def register_index_path(
     branch: str | None = None,
     commit_hash: str | None = None,
     branch_commit_count: int | None = None,
+    status: str | None = None,
 ) -> None:
     """Register a path-to-index mapping with collision detection.
 
@@ -173,6 +220,10 @@ def register_index_path(
         project_path: The project directory path (will be resolved to canonical form)
         branch: Git branch name at time of indexing (optional)
         commit_hash: Git commit hash at time of indexing (optional)
+        branch_commit_count: Commits on the branch at time of indexing (optional)
+        status: Status to write in the same statement (optional). New rows
+            default to 'indexing'; existing rows keep their status unless
+            this is given, which saves a separate ``set_index_status`` call.
 
     Raises:
         ValueError: If index_name already maps to a different path (collision)
@@ -196,28 +247,37 @@ def register_index_path(
         )
 
     # Upsert the mapping
+    status_update = ",\n                    status = EXCLUDED.status" if status else ""
     pool = get_connection_pool()
     with pool.connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                """
+                f"""
                 INSERT INTO cocosearch_index_metadata
                     (index_name, canonical_path, created_at, updated_at, status,
                      branch, commit_hash, branch_commit_count)
-                VALUES (%s, %s, NOW(), NOW(), 'indexing', %s, %s, %s)
+                VALUES (%s, %s, NOW(), NOW(), %s, %s, %s, %s)
                 ON CONFLICT (index_name) DO UPDATE SET
                     canonical_path = EXCLUDED.canonical_path,
                     updated_at = NOW(),
                     branch = EXCLUDED.branch,
                     commit_hash = EXCLUDED.commit_hash,
-                    branch_commit_count = EXCLUDED.branch_commit_count
+                    branch_commit_count = EXCLUDED.branch_commit_count{status_update}
                 """,
-                (index_name, canonical, branch, commit_hash, branch_commit_count),
+                (
+                    index_name,
+                    canonical,
+                    status or "indexing",
+                    branch,
+                    commit_hash,
+                    branch_commit_count,
+                ),
             )
         conn.commit()
 
-    # Clear cache since database changed
+    # Clear caches since database changed
     get_index_for_path.cache_clear()
+    invalidate_catalog()
 
 
 def clear_index_path(index_name: str) -> bool:
@@ -244,8 +304,9 @@ def clear_index_path(index_name: str) -> bool:
                 deleted = cur.rowcount > 0
             conn.commit()
 
-        # Clear cache since database changed
+        # Clear caches since database changed
         get_index_for_path.cache_clear()
+        invalidate_catalog()
 
         return deleted
     except Exception:
@@ -332,6 +393,7 @@ def set_index_status(
                     )
                 updated = cur.rowcount > 0
             conn.commit()
+        invalidate_catalog()
         return updated
     except Exception:
         # Table doesn't exist yet (fresh database)
@@ -521,12 +521,16 @@ def get_parse_failures(
     ]
 
 
-def check_staleness(index_name: str, threshold_days: int = 7) -> tuple[bool, int]:
+def check_staleness(
+    index_name: str, threshold_days: int = 7, metadata: dict | None = None
+) -> tuple[bool, int]:
     """Check if an index is stale (not updated recently).
 
     Args:
         index_name: The name of the index.
         threshold_days: Days before considering index stale (default: 7).
+        metadata: Index metadata already fetched by the caller
+            (``get_index_metadata``); skips the database query.
 
     Returns:
         Tuple of (is_stale, days_since_update):
@@ -536,6 +540,9 @@ def check_staleness(index_name: str, threshold_days: int = 7) -> tuple[bool, int
     Note:
         If metadata is missing or updated_at is NULL, returns (True, -1).
     """
+    if metadata is not None:
+        return _staleness_since(metadata.get("updated_at"), threshold_days)
+
     pool = get_connection_pool()
 
     try:
@@ -549,41 +556,47 @@ def check_staleness(index_name: str, threshold_days: int = 7) -> tuple[bool, int
                 """
                 cur.execute(metadata_query, (index_name,))
                 row = cur.fetchone()
+                return _staleness_since(row[0] if row else None, threshold_days)
+    except Exception:
+        # Table doesn't exist or other database error - treat as no metadata
+        return True, -1
 
-                if not row or row[0] is None:
-                    # No metadata or no updated_at
-                    return True, -1
-
-                updated_at = row[0]
-                # Calculate days since update
-                from datetime import datetime, timezone
-
-                now = datetime.now(timezone.utc)
-                # Handle timezone-aware and naive datetimes
-                if updated_at.tzinfo is None:
-                    # Assume UTC if naive
-                    from datetime import timezone
 
-                    updated_at = updated_at.replace(tzinfo=timezone.utc)
+def _staleness_since(updated_at, threshold_days: int) -> tuple[bool, int]:
+    """Compute (is_stale, days_since_update) from an index's updated_at."""
+    if updated_at is None:
+        # No metadata or no updated_at
+        return True, -1
 
-                delta = now - updated_at
-                days_since_update = delta.days
+    from datetime import datetime, timezone
 
-                is_stale = days_since_update >= threshold_days
+    now = datetime.now(timezone.utc)
+    # Handle timezone-aware and naive datetimes
+    if updated_at.tzinfo is None:
+        # Assume UTC if naive
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
 
-                return is_stale, days_since_update
-    except Exception:
-        # Table doesn't exist or other database error - treat as no metadata
-        return True, -1
+    days_since_update = (now - updated_at).days
+    return days_since_update >= threshold_days, days_since_update
 
 
-def check_branch_staleness(index_name: str, project_path: str | None = None) -> dict:
+def check_branch_staleness(
+    index_name: str,
+    project_path: str | None = None,
+    metadata: dict | None = None,
+) -> dict:
     """Check if current git state differs from indexed state.
 
+    The project's git state comes from the shared git state cache
+    (``get_git_state``), so repeated checks don't spawn git processes
+    until the repository's HEAD, refs or config change.
+
     Args:
         index_name: The name of the index.
         project_path: Path to the project directory. If None, uses the
             canonical_path from index metadata.
+        metadata: Index metadata already fetched by the caller
+            (``get_index_metadata``); skips the database query.
 
     Returns:
         Dict with keys:
@@ -594,11 +607,7 @@ def check_branch_staleness(index_name: str, project_path: str | None = None) ->
         - current_branch: str | None
         - current_commit: str | None
     """
-    from cocosearch.management.git import (
-        get_current_branch,
-        get_commit_hash,
-        get_commits_behind,
-    )
+    from cocosearch.management.git import get_cached_commits_behind, get_git_state
 
     result = {
         "branch_changed": False,
@@ -611,7 +620,8 @@ def check_branch_staleness(index_name: str, project_path: str | None = None) ->
     }
 
     # Get indexed branch/commit from metadata
-    metadata = get_index_metadata(index_name)
+    if metadata is None:
+        metadata = get_index_metadata(index_name)
     if metadata is None:
         return result
 
@@ -624,8 +634,9 @@ def check_branch_staleness(index_name: str, project_path: str | None = None) ->
         return result
 
     # Get current git state
-    result["current_branch"] = get_current_branch(check_path)
-    result["current_commit"] = get_commit_hash(check_path)
+    git_state = get_git_state(check_path)
+    result["current_branch"] = git_state.branch
+    result["current_commit"] = git_state.commit
 
     # Compare
     if result["indexed_branch"] and result["current_branch"]:
@@ -636,7 +647,7 @@ def check_branch_staleness(index_name: str, project_path: str | None = None) ->
 
         # Count how many commits behind
         if result["commits_changed"]:
-            result["commits_behind"] = get_commits_behind(
+            result["commits_behind"] = get_cached_commits_behind(
                 check_path, result["indexed_commit"]
             )
         else:
@@ -871,9 +882,9 @@ def get_comprehensive_stats(
     )
 
     # Derive repo URL from source path
-    from cocosearch.management.git import get_repo_url
+    from cocosearch.management.git import get_cached_repo_url
 
-    repo_url = get_repo_url(source_path) if source_path else None
+    repo_url = get_cached_repo_url(source_path) if source_path else None
 
     # Get branch info from metadata
     branch = metadata.get("branch") if metadata else None
@@ -884,7 +895,9 @@ def get_comprehensive_stats(
     branch_staleness = None
     if source_path:
         try:
-            branch_staleness = check_branch_staleness(index_name, source_path)
+            branch_staleness = check_branch_staleness(
+                index_name, source_path, metadata=metadata
+            )
         except Exception:
             pass
 
@@ -0,0 +1,197 @@
+"""Bounded worker pool for blocking work in async MCP/API handlers.
+
+Search handlers are ``async def`` but their work — embedding calls,
+PostgreSQL queries, file reads for context expansion, tree-sitter parsing
+and git subprocesses — is synchronous. Running it on the event loop would
+stall every other request, the ``/api/logs`` stream and the heartbeat.
+
+Handlers hand that work to ``run_blocking()``, which runs it on a
+fixed-size thread pool:
+
+- at most ``COCOSEARCH_MCP_WORKERS`` calls (default 8) run at once; the
+  rest wait in the pool's queue
+- each call has a deadline (``COCOSEARCH_MCP_REQUEST_TIMEOUT`` seconds,
+  default 60); a call still queued at its deadline is dropped, a running
+  one is abandoned (its thread finishes in the background)
+- queue depth and call counters are reported by ``get_executor_stats()``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_WORKERS = 8
+DEFAULT_REQUEST_TIMEOUT = 60.0
+
+
+def _env_number(name: str, default: float, cast: Callable[[str], float]) -> float:
+    """Read a positive number from the environment, falling back to default."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = cast(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        logger.warning(f"Ignoring invalid {name}={raw!r}, using {default}")
+        return default
+    return value
+
+
+class BlockingExecutor:
+    """Thread pool with a concurrency limit, per-call timeouts and counters."""
+
+    def __init__(self, max_workers: int, timeout: float) -> None:
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cocosearch-worker"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run ``func(*args, **kwargs)`` on the pool and await its result.
+
+        Context variables are copied into the worker thread.
+
+        Args:
+            func: Blocking callable.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            The value returned by ``func``.
+
+        Raises:
+            TimeoutError: If the call did not finish before the deadline.
+            Exception: Anything raised by ``func``, unchanged.
+        """
+
+        def call() -> T:
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._active -= 1
+
+        with self._lock:
+            self._queued += 1
+        submitted = self._executor.submit(contextvars.copy_context().run, call)
+        wrapped = asyncio.wrap_future(submitted)
+        try:
+            done, _ = await asyncio.wait({wrapped}, timeout=self.timeout)
+        except BaseException:
+            self._drop(submitted)
+            wrapped.cancel()
+            raise
+        if not done:
+            self._drop(submitted)
+            wrapped.cancel()
+            with self._lock:
+                self._timed_out += 1
+            name = getattr(func, "__name__", "call")
+            raise TimeoutError(f"{name} timed out after {self.timeout:g}s")
+        try:
+            # Errors raised by func (including its own TimeoutErrors) pass through
+            result = wrapped.result()
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+        with self._lock:
+            self._completed += 1
+        return result
+
+    def _drop(self, submitted: Future) -> None:
+        """Internal: Cancel a call still in the queue (running calls can't be)."""
+        if submitted.cancel():
+            with self._lock:
+                self._queued -= 1
+
+    def stats(self) -> dict:
+        """Snapshot of the pool's load and cumulative call counters."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "timeout_s": self.timeout,
+                "active": self._active,
+                "queued": self._queued,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timed_out": self._timed_out,
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting work; running calls finish in the background."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# ---------------------------------------------------------------------------
+# Singleton lifecycle
+# ---------------------------------------------------------------------------
+
+_executor: BlockingExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> BlockingExecutor:
+    """Get or create the process-wide executor (sized from env vars)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = BlockingExecutor(
+                    max_workers=int(
+                        _env_number("COCOSEARCH_MCP_WORKERS", DEFAULT_WORKERS, int)
+                    ),
+                    timeout=_env_number(
+                        "COCOSEARCH_MCP_REQUEST_TIMEOUT",
+                        DEFAULT_REQUEST_TIMEOUT,
+                        float,
+                    ),
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call on the shared executor (see ``BlockingExecutor.run``)."""
+    return await get_executor().run(func, *args, **kwargs)
+
+
+def get_executor_stats() -> dict | None:
+    """Executor load and counters, or None if no work has been offloaded yet."""
+    if _executor is None:
+        return None
+    return _executor.stats()
+
+
+def reset_executor() -> None:
+    """Shut down and forget the shared executor.
+
+    Used by tests to ensure clean state between test runs.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+        _executor = None
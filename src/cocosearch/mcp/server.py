@@ -53,6 +53,7 @@ from cocosearch.management import (  # noqa: E402
     set_index_status,
 )
 from cocosearch.management.git import get_current_branch, get_commit_hash  # noqa: E402
+from cocosearch.mcp.executor import get_executor_stats, run_blocking  # noqa: E402
 from cocosearch.mcp.project_detection import (  # noqa: E402
     _detect_project,
     register_roots_notification,
@@ -63,9 +64,15 @@ from cocosearch.management.stats import (  # noqa: E402
     get_grammar_failures,
     get_parse_failures,
 )
-from cocosearch.search import byte_to_line, read_chunk_content, search  # noqa: E402
+from cocosearch.search import (  # noqa: E402
+    byte_to_line,
+    read_chunk_content,
+    search,
+    search_many,
+)
 from cocosearch.search.analyze import analyze as run_analyze  # noqa: E402
 from cocosearch.search.context_expander import ContextExpander  # noqa: E402
+from cocosearch.search.db import get_pool_stats, warm_connection_pool  # noqa: E402
 
 
 def _ensure_cocoindex_init() -> None:
@@ -110,7 +117,9 @@ def _apply_thread_liveness_status(
                     pass
 
 
-def _register_with_git(index_name: str, project_path: str) -> None:
+def _register_with_git(
+    index_name: str, project_path: str, status: str | None = None
+) -> None:
     """Register index path with current git branch/commit metadata."""
     from cocosearch.management.git import get_branch_commit_count
 
@@ -123,6 +132,7 @@ def _register_with_git(index_name: str, project_path: str) -> None:
         branch=branch,
         commit_hash=commit_hash,
         branch_commit_count=branch_commit_count,
+        status=status,
     )
 
 
@@ -304,6 +314,15 @@ async def api_stats(request) -> JSONResponse:
         )
 
 
+@mcp.custom_route("/api/metrics", methods=["GET"])
+async def api_metrics(request) -> JSONResponse:
+    """Server metrics: connection pool and search worker pool load."""
+    return JSONResponse(
+        {"pool": get_pool_stats(), "executor": get_executor_stats()},
+        headers={"Cache-Control": "no-cache, no-store, must-revalidate"},
+    )
+
+
 @mcp.custom_route("/api/stats/{index_name}", methods=["GET"])
 async def api_stats_single(request) -> JSONResponse:
     """Stats for a single index by name."""
@@ -457,12 +476,12 @@ async def api_project(request) -> JSONResponse:
     collision_message = None
     try:
         _ensure_cocoindex_init()
-        indexes = mgmt_list_indexes()
+        indexes = mgmt_list_indexes(cached=True)
         index_names = {idx["name"] for idx in indexes}
         is_indexed = index_name in index_names
 
         if is_indexed:
-            metadata = get_index_metadata(index_name)
+            metadata = get_index_metadata(index_name, cached=True)
             if metadata and metadata.get("canonical_path"):
                 canonical_cwd = str(project_root.resolve())
                 stored_path = metadata["canonical_path"]
@@ -533,8 +552,7 @@ async def api_index(request) -> JSONResponse:
         # Register metadata before starting
         try:
             ensure_metadata_table()
-            _register_with_git(index_name, project_path)
-            set_index_status(index_name, "indexing")
+            _register_with_git(index_name, project_path, status="indexing")
         except Exception as e:
             logger.warning(f"Metadata registration failed: {e}")
 
@@ -710,7 +728,7 @@ async def api_projects(request) -> JSONResponse:
     existing_indexes: set[str] = set()
     try:
         _ensure_cocoindex_init()
-        for idx in mgmt_list_indexes():
+        for idx in mgmt_list_indexes(cached=True):
             existing_indexes.add(idx["name"])
     except Exception:
         pass
@@ -781,7 +799,8 @@ async def api_analyze(request) -> JSONResponse:
         )
 
     try:
-        result = run_analyze(
+        result = await run_blocking(
+            run_analyze,
             query=query,
             index_name=index_name,
             limit=limit,
@@ -793,6 +812,8 @@ async def api_analyze(request) -> JSONResponse:
             no_cache=no_cache,
         )
         return JSONResponse({"success": True, **result.to_dict()})
+    except TimeoutError as e:
+        return JSONResponse({"error": str(e)}, status_code=504)
     except ValueError as e:
         return JSONResponse({"error": str(e)}, status_code=400)
     except Exception as e:
@@ -855,9 +876,263 @@ async def api_grammars(request) -> JSONResponse:
     return JSONResponse(grammars)
 
 
+def _format_search_result(
+    r,
+    expander: ContextExpander | None,
+    context_before: int | None,
+    context_after: int | None,
+    smart_context: bool,
+) -> dict:
+    """Convert a SearchResult into the dict returned by MCP tools and routes.
+
+    Adds line numbers and chunk content, context lines when an expander is
+    given, and hybrid search fields when present. Content and line numbers
+    stored in the index (r.content, r.start_line, r.end_line) are used as-is
+    instead of rereading the source file.
+    """
+    if r.content is not None:
+        content = r.content
+    else:
+        content = read_chunk_content(r.filename, r.start_byte, r.end_byte)
+
+    if r.start_line is not None and r.end_line is not None:
+        start_line, end_line = r.start_line, r.end_line
+    else:
+        start_line = byte_to_line(r.filename, r.start_byte)
+        if r.content is not None:
+            end_line = start_line + content.count("\n") if start_line else 0
+        else:
+            end_line = byte_to_line(r.filename, r.end_byte)
+
+    result_dict = {
+        "file_path": r.filename,
+        "start_line": start_line,
+        "end_line": end_line,
+        "score": r.score,
+        "content": content,
+        "block_type": r.block_type,
+        "hierarchy": r.hierarchy,
+        "language_id": r.language_id,
+        # Symbol metadata (always included, None if not available)
+        "symbol_type": r.symbol_type,
+        "symbol_name": r.symbol_name,
+        "symbol_signature": r.symbol_signature,
+    }
+
+    # Apply context expansion if requested
+    if expander is not None:
+        # Determine language for smart expansion
+        ext = os.path.splitext(r.filename)[1].lstrip(".")
+        language_name = _get_treesitter_language(ext)
+
+        before_lines, _match_lines, after_lines, _is_bof, _is_eof = (
+            expander.get_context_lines(
+                r.filename,
+                start_line,
+                end_line,
+                context_before=context_before or 0,
+                context_after=context_after or 0,
+                smart=smart_context
+                and (context_before is None and context_after is None),
+                language=language_name,
+            )
+        )
+
+        # Format context as strings (newline-separated)
+        context_before_text = "\n".join(line for _, line in before_lines)
+        context_after_text = "\n".join(line for _, line in after_lines)
+        if context_before_text or context_after_text:
+            result_dict["context_before"] = context_before_text
+            result_dict["context_after"] = context_after_text
+
+    # Include hybrid search fields when available
+    if r.match_type:
+        result_dict["match_type"] = r.match_type
+    if r.vector_score is not None:
+        result_dict["vector_score"] = r.vector_score
+    if r.keyword_score is not None:
+        result_dict["keyword_score"] = r.keyword_score
+
+    return result_dict
+
+
+def _search_options(body: dict) -> dict:
+    """Search options shared by the /api/search routes, with their defaults."""
+    return {
+        "limit": body.get("limit", 10),
+        "min_score": body.get("min_score", 0.3),
+        "language": body.get("language") or None,
+        "use_hybrid": body.get("use_hybrid"),
+        "symbol_type": body.get("symbol_type") or None,
+        "symbol_name": body.get("symbol_name") or None,
+        "no_cache": body.get("no_cache", False),
+        "smart_context": body.get("smart_context", False),
+        "context_before": body.get("context_before"),
+        "context_after": body.get("context_after"),
+    }
+
+
 @mcp.custom_route("/api/search", methods=["POST"])
 async def api_search(request) -> JSONResponse:
     """Search indexed code via the dashboard API."""
+    try:
+        body = await request.json()
+    except Exception:
+        return JSONResponse({"error": "Invalid JSON body"}, status_code=400)
+
+    query = body.get("query", "").strip()
+    index_name = body.get("index_name")
+
+    if not query:
+        return JSONResponse({"error": "query is required"}, status_code=400)
+    if not index_name:
+        return JSONResponse({"error": "index_name is required"}, status_code=400)
+
+    try:
+        _ensure_cocoindex_init()
+    except Exception as e:
+        logger.warning(f"CocoIndex init failed: {e}")
+        return JSONResponse(
+            {"error": "Database not initialized. Index a codebase first."},
+            status_code=503,
+        )
+
+    try:
+        payload = await run_blocking(
+            _search_payload,
+            query,
+            index_name,
+            **_search_options(body),
+        )
+    except TimeoutError as e:
+        return JSONResponse({"error": str(e)}, status_code=504)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    except Exception as e:
+        logger.error(f"Search failed: {e}")
+        return JSONResponse({"error": f"Search failed: {e}"}, status_code=500)
+
+    return JSONResponse(payload)
+
+
+def _search_payload(
+    query: str,
+    index_name: str,
+    *,
+    limit: int,
+    min_score: float,
+    language: str | None,
+    use_hybrid: bool | None,
+    symbol_type: str | list[str] | None,
+    symbol_name: str | None,
+    no_cache: bool,
+    smart_context: bool,
+    context_before: int | None,
+    context_after: int | None,
+) -> dict:
+    """Search and format results for /api/search (blocking; runs on the worker pool)."""
+    results, query_time_ms = _ranked_search(
+        query,
+        index_name,
+        limit=limit,
+        min_score=min_score,
+        language=language,
+        use_hybrid=use_hybrid,
+        symbol_type=symbol_type,
+        symbol_name=symbol_name,
+        no_cache=no_cache,
+    )
+
+    expander = _context_expander(smart_context, context_before, context_after)
+
+    try:
+        output = [
+            _format_search_result(
+                r, expander, context_before, context_after, smart_context
+            )
+            for r in results
+        ]
+    finally:
+        if expander is not None:
+            expander.clear_cache()
+
+    return {
+        "success": True,
+        "results": output,
+        "query_time_ms": query_time_ms,
+        "total": len(output),
+    }
+
+
+def _ranked_search(
+    query: str,
+    index_name: str,
+    *,
+    limit: int,
+    min_score: float,
+    language: str | None,
+    use_hybrid: bool | None,
+    symbol_type: str | list[str] | None,
+    symbol_name: str | None,
+    no_cache: bool,
+) -> tuple[list, int]:
+    """Run a search for the API routes (blocking; runs on the worker pool).
+
+    Returns:
+        Ranked SearchResults and the search time in milliseconds.
+    """
+    import time
+
+    start_time = time.monotonic()
+    results = search(
+        query=query,
+        index_name=index_name,
+        limit=limit,
+        min_score=min_score,
+        language_filter=language,
+        use_hybrid=use_hybrid,
+        symbol_type=symbol_type,
+        symbol_name=symbol_name,
+        no_cache=no_cache,
+        include_content=True,
+    )
+    return results, round((time.monotonic() - start_time) * 1000)
+
+
+def _context_expander(
+    smart_context: bool, context_before: int | None, context_after: int | None
+) -> ContextExpander | None:
+    """Create a context expander if the request asks for context lines."""
+    if smart_context or context_before is not None or context_after is not None:
+        return ContextExpander()
+    return None
+
+
+def _stream_event(event: str, data: dict, sse: bool) -> str:
+    """Encode one /api/search/stream event as an SSE frame or NDJSON line."""
+    import json as _json
+
+    if sse:
+        return f"event: {event}\ndata: {_json.dumps(data)}\n\n"
+    return _json.dumps({"type": event, **data}) + "\n"
+
+
+@mcp.custom_route("/api/search/stream", methods=["POST"])
+async def api_search_stream(request) -> StreamingResponse | JSONResponse:
+    """Stream search results as each one is enriched.
+
+    Takes the same body as /api/search. Ranking finishes before the
+    response starts, so its errors keep their status codes (400, 503, 504,
+    500). Results are then read and context-expanded one at a time and sent
+    as soon as each is ready, so the time to the first result doesn't grow
+    with ``limit`` or the context requested.
+
+    The response is NDJSON (one ``{"type": ...}`` object per line), or
+    Server-Sent Events when the request sends ``Accept: text/event-stream``.
+    Events: ``meta`` (``query_time_ms``, ``total``), one ``result`` per hit
+    (``rank``, ``result``), then ``done`` (``total``, ``elapsed_ms``) or
+    ``error`` (``error``).
+    """
     import time
 
     try:
@@ -873,16 +1148,10 @@ async def api_search(request) -> JSONResponse:
     if not index_name:
         return JSONResponse({"error": "index_name is required"}, status_code=400)
 
-    limit = body.get("limit", 10)
-    language = body.get("language") or None
-    symbol_type = body.get("symbol_type") or None
-    symbol_name = body.get("symbol_name") or None
-    min_score = body.get("min_score", 0.3)
-    use_hybrid = body.get("use_hybrid")
-    no_cache = body.get("no_cache", False)
-    smart_context = body.get("smart_context", False)
-    context_before = body.get("context_before")
-    context_after = body.get("context_after")
+    options = _search_options(body)
+    smart_context = options.pop("smart_context")
+    context_before = options.pop("context_before")
+    context_after = options.pop("context_after")
 
     try:
         _ensure_cocoindex_init()
@@ -895,95 +1164,162 @@ async def api_search(request) -> JSONResponse:
 
     start_time = time.monotonic()
     try:
-        results = search(
-            query=query,
-            index_name=index_name,
-            limit=limit,
-            min_score=min_score,
-            language_filter=language,
-            use_hybrid=use_hybrid,
-            symbol_type=symbol_type,
-            symbol_name=symbol_name,
-            no_cache=no_cache,
+        results, query_time_ms = await run_blocking(
+            _ranked_search, query, index_name, **options
         )
+    except TimeoutError as e:
+        return JSONResponse({"error": str(e)}, status_code=504)
     except ValueError as e:
         return JSONResponse({"error": str(e)}, status_code=400)
     except Exception as e:
         logger.error(f"Search failed: {e}")
         return JSONResponse({"error": f"Search failed: {e}"}, status_code=500)
 
-    query_time_ms = round((time.monotonic() - start_time) * 1000)
+    sse = "text/event-stream" in request.headers.get("accept", "")
 
-    # Create context expander if context is requested
-    expander = None
-    if smart_context or context_before is not None or context_after is not None:
-        expander = ContextExpander()
+    async def event_stream():
+        expander = _context_expander(smart_context, context_before, context_after)
+        try:
+            yield _stream_event(
+                "meta", {"query_time_ms": query_time_ms, "total": len(results)}, sse
+            )
+            for rank, r in enumerate(results, start=1):
+                item = await run_blocking(
+                    _format_search_result,
+                    r,
+                    expander,
+                    context_before,
+                    context_after,
+                    smart_context,
+                )
+                yield _stream_event("result", {"rank": rank, "result": item}, sse)
+            elapsed_ms = round((time.monotonic() - start_time) * 1000)
+            yield _stream_event(
+                "done", {"total": len(results), "elapsed_ms": elapsed_ms}, sse
+            )
+        except Exception as e:
+            # Headers are already sent; report the failure in-band
+            logger.error(f"Search stream failed: {e}")
+            yield _stream_event("error", {"error": f"Search failed: {e}"}, sse)
+        finally:
+            if expander is not None:
+                expander.clear_cache()
 
-    output = []
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@mcp.custom_route("/api/search/batch", methods=["POST"])
+async def api_search_batch(request) -> JSONResponse:
+    """Run several searches against one index in a single batch."""
     try:
-        for r in results:
-            start_line = byte_to_line(r.filename, r.start_byte)
-            end_line = byte_to_line(r.filename, r.end_byte)
-            content = read_chunk_content(r.filename, r.start_byte, r.end_byte)
-
-            result_dict = {
-                "file_path": r.filename,
-                "start_line": start_line,
-                "end_line": end_line,
-                "score": r.score,
-                "content": content,
-                "block_type": r.block_type,
-                "hierarchy": r.hierarchy,
-                "language_id": r.language_id,
-                "symbol_type": r.symbol_type,
-                "symbol_name": r.symbol_name,
-                "symbol_signature": r.symbol_signature,
-            }
+        body = await request.json()
+    except Exception:
+        return JSONResponse({"error": "Invalid JSON body"}, status_code=400)
 
-            # Apply context expansion if requested
-            if expander is not None:
-                ext = os.path.splitext(r.filename)[1].lstrip(".")
-                language_name = _get_treesitter_language(ext)
-
-                before_lines, _match_lines, after_lines, _is_bof, _is_eof = (
-                    expander.get_context_lines(
-                        r.filename,
-                        start_line,
-                        end_line,
-                        context_before=context_before or 0,
-                        context_after=context_after or 0,
-                        smart=smart_context
-                        and (context_before is None and context_after is None),
-                        language=language_name,
-                    )
-                )
+    queries = body.get("queries")
+    index_name = body.get("index_name")
 
-                context_before_text = "\n".join(line for _, line in before_lines)
-                context_after_text = "\n".join(line for _, line in after_lines)
-                if context_before_text or context_after_text:
-                    result_dict["context_before"] = context_before_text
-                    result_dict["context_after"] = context_after_text
+    if not isinstance(queries, list) or not queries:
+        return JSONResponse(
+            {"error": "queries must be a non-empty list"}, status_code=400
+        )
+    queries = [str(q).strip() for q in queries]
+    if not all(queries):
+        return JSONResponse({"error": "queries must not be empty"}, status_code=400)
+    if not index_name:
+        return JSONResponse({"error": "index_name is required"}, status_code=400)
 
-            if r.match_type:
-                result_dict["match_type"] = r.match_type
-            if r.vector_score is not None:
-                result_dict["vector_score"] = r.vector_score
-            if r.keyword_score is not None:
-                result_dict["keyword_score"] = r.keyword_score
+    try:
+        _ensure_cocoindex_init()
+    except Exception as e:
+        logger.warning(f"CocoIndex init failed: {e}")
+        return JSONResponse(
+            {"error": "Database not initialized. Index a codebase first."},
+            status_code=503,
+        )
 
-            output.append(result_dict)
+    try:
+        payload = await run_blocking(
+            _search_batch_payload,
+            queries,
+            index_name,
+            **_search_options(body),
+        )
+    except TimeoutError as e:
+        return JSONResponse({"error": str(e)}, status_code=504)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    except Exception as e:
+        logger.error(f"Batch search failed: {e}")
+        return JSONResponse({"error": f"Search failed: {e}"}, status_code=500)
+
+    return JSONResponse(payload)
+
+
+def _search_batch_payload(
+    queries: list[str],
+    index_name: str,
+    *,
+    limit: int,
+    min_score: float,
+    language: str | None,
+    use_hybrid: bool | None,
+    symbol_type: str | list[str] | None,
+    symbol_name: str | None,
+    no_cache: bool,
+    smart_context: bool,
+    context_before: int | None,
+    context_after: int | None,
+) -> dict:
+    """Run and format a /api/search/batch request (blocking; runs on the worker pool)."""
+    import time
+
+    start_time = time.monotonic()
+    batches = search_many(
+        queries=queries,
+        index_name=index_name,
+        limit=limit,
+        min_score=min_score,
+        language_filter=language,
+        use_hybrid=use_hybrid,
+        symbol_type=symbol_type,
+        symbol_name=symbol_name,
+        no_cache=no_cache,
+        include_content=True,
+    )
+    query_time_ms = round((time.monotonic() - start_time) * 1000)
+
+    # One expander for the whole batch so files shared between queries are read once
+    expander = _context_expander(smart_context, context_before, context_after)
+
+    try:
+        output = [
+            {
+                "query": query,
+                "results": [
+                    _format_search_result(
+                        r, expander, context_before, context_after, smart_context
+                    )
+                    for r in results
+                ],
+                "total": len(results),
+            }
+            for query, results in zip(queries, batches)
+        ]
     finally:
         if expander is not None:
             expander.clear_cache()
 
-    return JSONResponse(
-        {
-            "success": True,
-            "results": output,
-            "query_time_ms": query_time_ms,
-            "total": len(output),
-        }
-    )
+    return {
+        "success": True,
+        "batches": output,
+        "query_time_ms": query_time_ms,
+        "total": sum(len(b) for b in batches),
+    }
 
 
 @mcp.custom_route("/api/open-in-editor", methods=["POST"])
@@ -1248,6 +1584,93 @@ def _build_editor_command(editor: str, file_path: str, line: int | None) -> list
     return [editor_path, file_path]
 
 
+async def _auto_detect_index(
+    ctx: Context,
+) -> tuple[str, Path, str, dict | None]:
+    """Resolve the index for the client's project (search tools without index_name).
+
+    Returns:
+        Tuple of (index_name, root_path, detection_source, error). error is
+        a result dict explaining why the project can't be searched (not
+        indexed, or index name collision), otherwise None.
+    """
+    detected_path, source = await _detect_project(ctx)
+    return await run_blocking(_resolve_detected_index, detected_path, source)
+
+
+def _resolve_detected_index(
+    detected_path: Path, source: str
+) -> tuple[str, Path, str, dict | None]:
+    """Blocking part of ``_auto_detect_index`` (project root, index lookup)."""
+    root_path = detected_path
+
+    # Use find_project_root to walk up to actual git/config root from detected path
+    from cocosearch.management.context import find_project_root
+
+    project_root, detection_method = find_project_root(detected_path)
+    if project_root is not None:
+        root_path = project_root
+
+    # Resolve index name using priority chain
+    index_name = resolve_index_name(
+        root_path, detection_method if project_root else None
+    )
+    logger.info(
+        f"Auto-detected index: {index_name} from {root_path} (source: {source})"
+    )
+
+    # Check if index exists
+    indexes = mgmt_list_indexes(cached=True)
+    index_names = {idx["name"] for idx in indexes}
+
+    if index_name not in index_names:
+        # Project detected but not indexed
+        return (
+            index_name,
+            root_path,
+            source,
+            {
+                "error": "Index not found",
+                "message": (
+                    f"Project detected at {root_path} but not indexed. "
+                    f"Index this project first using:\n"
+                    f"  CLI: cocosearch index {root_path}\n"
+                    f"  MCP: index_codebase(path='{root_path}')"
+                ),
+                "detected_path": str(root_path),
+                "suggested_index_name": index_name,
+                "results": [],
+            },
+        )
+
+    # Check for collision (same index name, different path in metadata)
+    metadata = get_index_metadata(index_name, cached=True)
+    if metadata is not None:
+        canonical_cwd = str(root_path.resolve())
+        stored_path = metadata.get("canonical_path", "")
+        if stored_path and stored_path != canonical_cwd:
+            # Collision detected
+            return (
+                index_name,
+                root_path,
+                source,
+                {
+                    "error": "Index name collision",
+                    "message": (
+                        f"Index '{index_name}' is already mapped to a different project:\n"
+                        f"  Stored: {stored_path}\n"
+                        f"  Current: {canonical_cwd}\n\n"
+                        f"To resolve:\n"
+                        f"  1. Set explicit indexName in cocosearch.yaml, or\n"
+                        f"  2. Specify index_name parameter explicitly"
+                    ),
+                    "results": [],
+                },
+            )
+
+    return index_name, root_path, source, None
+
+
 @mcp.tool()
 async def search_code(
     query: Annotated[str, Field(description="Natural language search query")],
@@ -1329,69 +1752,51 @@ async def search_code(
 
     # Auto-detect index if not provided
     if index_name is None:
-        detected_path, source = await _detect_project(ctx)
-        auto_detected_source = source
-
-        root_path = detected_path
-
-        # Use find_project_root to walk up to actual git/config root from detected path
-        from cocosearch.management.context import find_project_root
-
-        project_root, detection_method = find_project_root(detected_path)
-        if project_root is not None:
-            root_path = project_root
-
-        # Resolve index name using priority chain
-        index_name = resolve_index_name(
-            root_path, detection_method if project_root else None
+        index_name, root_path, auto_detected_source, error = await _auto_detect_index(
+            ctx
         )
-        logger.info(
-            f"Auto-detected index: {index_name} from {root_path} (source: {source})"
-        )
-
-        # Check if index exists
-        indexes = mgmt_list_indexes()
-        index_names = {idx["name"] for idx in indexes}
+        if error is not None:
+            return [error]
 
-        if index_name not in index_names:
-            # Project detected but not indexed
-            return [
-                {
-                    "error": "Index not found",
-                    "message": (
-                        f"Project detected at {root_path} but not indexed. "
-                        f"Index this project first using:\n"
-                        f"  CLI: cocosearch index {root_path}\n"
-                        f"  MCP: index_codebase(path='{root_path}')"
-                    ),
-                    "detected_path": str(root_path),
-                    "suggested_index_name": index_name,
-                    "results": [],
-                }
-            ]
-
-        # Check for collision (same index name, different path in metadata)
-        metadata = get_index_metadata(index_name)
-        if metadata is not None:
-            canonical_cwd = str(root_path.resolve())
-            stored_path = metadata.get("canonical_path", "")
-            if stored_path and stored_path != canonical_cwd:
-                # Collision detected
-                return [
-                    {
-                        "error": "Index name collision",
-                        "message": (
-                            f"Index '{index_name}' is already mapped to a different project:\n"
-                            f"  Stored: {stored_path}\n"
-                            f"  Current: {canonical_cwd}\n\n"
-                            f"To resolve:\n"
-                            f"  1. Set explicit indexName in cocosearch.yaml, or\n"
-                            f"  2. Specify index_name parameter explicitly"
-                        ),
-                        "results": [],
-                    }
-                ]
+    try:
+        return await run_blocking(
+            _search_code_output,
+            query,
+            index_name,
+            root_path,
+            auto_detected_source,
+            limit=limit,
+            language=language,
+            use_hybrid_search=use_hybrid_search,
+            symbol_type=symbol_type,
+            symbol_name=symbol_name,
+            context_before=context_before,
+            context_after=context_after,
+            smart_context=smart_context,
+        )
+    except TimeoutError as e:
+        return [{"error": "Search timed out", "message": str(e), "results": []}]
+
+
+def _search_code_output(
+    query: str,
+    index_name: str,
+    root_path: Path | None,
+    auto_detected_source: str | None,
+    *,
+    limit: int,
+    language: str | None,
+    use_hybrid_search: bool | None,
+    symbol_type: str | list[str] | None,
+    symbol_name: str | None,
+    context_before: int | None,
+    context_after: int | None,
+    smart_context: bool,
+) -> list[dict]:
+    """Run a search_code call: search, context expansion, staleness checks.
 
+    Blocking; search_code runs it on the worker pool.
+    """
     # Initialize CocoIndex (required for embedding generation)
     try:
         _ensure_cocoindex_init()
@@ -1415,6 +1820,7 @@ async def search_code(
             use_hybrid=use_hybrid_search,
             symbol_type=symbol_type,
             symbol_name=symbol_name,
+            include_content=True,
         )
     except ValueError as e:
         # Symbol filter errors (invalid type or pre-v1.7 index)
@@ -1423,6 +1829,10 @@ async def search_code(
     # Create context expander for file caching
     expander = ContextExpander()
 
+    # Fetched once for the header and both staleness checks ({} when
+    # missing, so the checks don't query for it again)
+    metadata = get_index_metadata(index_name, cached=True) or {}
+
     # Build header with project context when auto-detecting
     output = []
     if root_path is not None:
@@ -1432,7 +1842,6 @@ async def search_code(
             "index_name": index_name,
         }
         # Include last_indexed_at so LLM clients know when the index was built
-        metadata = get_index_metadata(index_name)
         if metadata and metadata.get("updated_at"):
             search_header["last_indexed_at"] = str(metadata["updated_at"])
         output.append(search_header)
@@ -1440,68 +1849,20 @@ async def search_code(
     # Convert results to dicts with line numbers, content, and context.
     # Wrap in try/finally to ensure expander cache is always cleared,
     # preventing LRU cache leaks (up to 128 files) on exceptions.
+    wants_context = (
+        context_before is not None or context_after is not None or smart_context
+    )
     try:
         for r in results:
-            start_line = byte_to_line(r.filename, r.start_byte)
-            end_line = byte_to_line(r.filename, r.end_byte)
-            content = read_chunk_content(r.filename, r.start_byte, r.end_byte)
-
-            # Get context if requested or smart context enabled
-            context_before_text = ""
-            context_after_text = ""
-
-            if context_before is not None or context_after is not None or smart_context:
-                # Determine language for smart expansion
-                ext = os.path.splitext(r.filename)[1].lstrip(".")
-                language_name = _get_treesitter_language(ext)
-
-                before_lines, _match_lines, after_lines, _is_bof, _is_eof = (
-                    expander.get_context_lines(
-                        r.filename,
-                        start_line,
-                        end_line,
-                        context_before=context_before or 0,
-                        context_after=context_after or 0,
-                        smart=smart_context
-                        and (context_before is None and context_after is None),
-                        language=language_name,
-                    )
+            output.append(
+                _format_search_result(
+                    r,
+                    expander if wants_context else None,
+                    context_before,
+                    context_after,
+                    smart_context,
                 )
-
-                # Format context as strings (newline-separated)
-                context_before_text = "\n".join(line for _, line in before_lines)
-                context_after_text = "\n".join(line for _, line in after_lines)
-
-            # Build result dict
-            result_dict = {
-                "file_path": r.filename,
-                "start_line": start_line,
-                "end_line": end_line,
-                "score": r.score,
-                "content": content,
-                "block_type": r.block_type,
-                "hierarchy": r.hierarchy,
-                "language_id": r.language_id,
-                # Symbol metadata (always included, None if not available)
-                "symbol_type": r.symbol_type,
-                "symbol_name": r.symbol_name,
-                "symbol_signature": r.symbol_signature,
-            }
-
-            # Include context fields when context was requested
-            if context_before_text or context_after_text:
-                result_dict["context_before"] = context_before_text
-                result_dict["context_after"] = context_after_text
-
-            # Include hybrid search fields when available
-            if r.match_type:
-                result_dict["match_type"] = r.match_type
-            if r.vector_score is not None:
-                result_dict["vector_score"] = r.vector_score
-            if r.keyword_score is not None:
-                result_dict["keyword_score"] = r.keyword_score
-
-            output.append(result_dict)
+            )
     finally:
         expander.clear_cache()
 
@@ -1518,7 +1879,7 @@ async def search_code(
     try:
         from cocosearch.management.stats import check_branch_staleness
 
-        branch_staleness = check_branch_staleness(index_name)
+        branch_staleness = check_branch_staleness(index_name, metadata=metadata)
         if branch_staleness.get("branch_changed") or branch_staleness.get(
             "commits_changed"
         ):
@@ -1554,7 +1915,9 @@ async def search_code(
 
     # Check staleness and add footer warning if needed
     try:
-        is_stale, staleness_days = check_staleness(index_name, threshold_days=7)
+        is_stale, staleness_days = check_staleness(
+            index_name, threshold_days=7, metadata=metadata
+        )
     except Exception:
         # Database not available or other error - skip staleness check
         is_stale, staleness_days = False, -1
@@ -1577,6 +1940,145 @@ async def search_code(
     return output
 
 
+@mcp.tool()
+async def search_code_batch(
+    queries: Annotated[
+        list[str],
+        Field(
+            description="Natural language search queries (up to 32), "
+            "run together against the same index and filters"
+        ),
+    ],
+    ctx: Context,
+    index_name: Annotated[
+        str | None,
+        Field(
+            description="Name of the index to search. If not provided, auto-detects from current working directory."
+        ),
+    ] = None,
+    limit: Annotated[
+        int, Field(description="Maximum results to return per query")
+    ] = 10,
+    language: Annotated[
+        str | None,
+        Field(
+            description="Filter by language (e.g., python, typescript, hcl). "
+            "Comma-separated for multiple."
+        ),
+    ] = None,
+    use_hybrid_search: Annotated[
+        bool | None,
+        Field(
+            description="Enable hybrid search (vector + keyword matching). "
+            "None=auto per query, True=always use hybrid, False=vector-only"
+        ),
+    ] = None,
+    symbol_type: Annotated[
+        str | list[str] | None,
+        Field(
+            description="Filter by symbol type. "
+            "Single: 'function', 'class', 'method', 'interface'. "
+            "Array: ['function', 'method'] for OR filtering."
+        ),
+    ] = None,
+    symbol_name: Annotated[
+        str | None,
+        Field(description="Filter by symbol name pattern (glob)."),
+    ] = None,
+    smart_context: Annotated[
+        bool,
+        Field(description="Expand context to enclosing function/class boundaries."),
+    ] = True,
+) -> list[dict]:
+    """Search indexed code with several related queries at once.
+
+    Equivalent to calling search_code once per query, but the queries are
+    embedded together and each database lookup runs once for the whole
+    batch. Use this when fanning a task out into sub-questions.
+    Returns one entry per query: {"query": ..., "results": [...]}.
+    If index_name is not provided, auto-detects from current working directory.
+    """
+    if index_name is None:
+        index_name, _root_path, _source, error = await _auto_detect_index(ctx)
+        if error is not None:
+            return [error]
+
+    try:
+        return await run_blocking(
+            _search_code_batch_output,
+            queries,
+            index_name,
+            limit=limit,
+            language=language,
+            use_hybrid_search=use_hybrid_search,
+            symbol_type=symbol_type,
+            symbol_name=symbol_name,
+            smart_context=smart_context,
+        )
+    except TimeoutError as e:
+        return [{"error": "Search timed out", "message": str(e), "results": []}]
+
+
+def _search_code_batch_output(
+    queries: list[str],
+    index_name: str,
+    *,
+    limit: int,
+    language: str | None,
+    use_hybrid_search: bool | None,
+    symbol_type: str | list[str] | None,
+    symbol_name: str | None,
+    smart_context: bool,
+) -> list[dict]:
+    """Run a search_code_batch call (blocking; runs on the worker pool)."""
+    try:
+        _ensure_cocoindex_init()
+    except Exception as e:
+        logger.warning(f"CocoIndex init failed: {e}")
+        return [
+            {
+                "error": "Database not initialized",
+                "message": "Index a codebase first using index_codebase(path='.')",
+                "results": [],
+            }
+        ]
+
+    try:
+        batches = search_many(
+            queries=queries,
+            index_name=index_name,
+            limit=limit,
+            language_filter=language,
+            use_hybrid=use_hybrid_search,
+            symbol_type=symbol_type,
+            symbol_name=symbol_name,
+            include_content=True,
+        )
+    except ValueError as e:
+        return [{"error": "Search error", "message": str(e), "results": []}]
+
+    expander = ContextExpander()
+    try:
+        return [
+            {
+                "query": query,
+                "results": [
+                    _format_search_result(
+                        r,
+                        expander if smart_context else None,
+                        None,
+                        None,
+                        smart_context,
+                    )
+                    for r in results
+                ],
+            }
+            for query, results in zip(queries, batches)
+        ]
+    finally:
+        expander.clear_cache()
+
+
 @mcp.tool()
 async def analyze_query(
     query: Annotated[str, Field(description="Search query to analyze")],
@@ -1641,7 +2143,7 @@ async def analyze_query(
         )
 
         # Check if index exists
-        indexes = mgmt_list_indexes()
+        indexes = await run_blocking(mgmt_list_indexes, cached=True)
         index_names = {idx["name"] for idx in indexes}
 
         if index_name not in index_names:
@@ -1665,7 +2167,8 @@ async def analyze_query(
 
     # Run analysis
     try:
-        result = run_analyze(
+        result = await run_blocking(
+            run_analyze,
             query=query,
             index_name=index_name,
             limit=limit,
@@ -1776,8 +2279,7 @@ def index_codebase(
         # Set status to 'indexing' before starting (best-effort)
         try:
             ensure_metadata_table()
-            _register_with_git(index_name, path)
-            set_index_status(index_name, "indexing")
+            _register_with_git(index_name, path, status="indexing")
         except Exception:
             pass  # Best-effort — don't block indexing on metadata failures
 
@@ -1877,6 +2379,11 @@ def run_server(
     except Exception as e:
         logger.warning(f"CocoIndex pre-init failed (will retry on demand): {e}")
 
+    # Pre-open pooled database connections without delaying startup
+    threading.Thread(
+        target=warm_connection_pool, daemon=True, name="pool-warmup"
+    ).start()
+
     if transport == "stdio":
         if port != 3000:  # Non-default port specified
             logger.warning("--port is ignored with stdio transport")
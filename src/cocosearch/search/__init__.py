@@ -8,7 +8,7 @@ improved results on code identifier queries.
 """
 
 from cocosearch.search.analyze import AnalysisResult, analyze
-from cocosearch.search.query import SearchResult, search
+from cocosearch.search.query import SearchResult, search, search_many
 from cocosearch.search.utils import byte_to_line, read_chunk_content
 
 # Note: SearchREPL and run_repl are not exported here to avoid circular imports.
@@ -17,6 +17,7 @@ from cocosearch.search.utils import byte_to_line, read_chunk_content
 __all__ = [
     # Core search
     "search",
+    "search_many",
     "SearchResult",
     # Pipeline analysis
     "analyze",
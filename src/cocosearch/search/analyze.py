@@ -11,12 +11,16 @@ import logging
 import time
 from dataclasses import asdict, dataclass, field
 
+from cocosearch.indexer.embedder import code_to_embedding
 from cocosearch.search.cache import _compute_cache_key, get_query_cache
 from cocosearch.search.db import (
     check_column_exists,
     check_symbol_columns_exist,
+    check_symbols_table_exists,
+    get_symbols_table_name,
     get_table_name,
 )
+from cocosearch.search.embedding_cache import embed_query
 from cocosearch.search.filters import build_symbol_where_clause
 from cocosearch.search.hybrid import (
     DEFINITION_BOOST_MULTIPLIER,
@@ -300,7 +304,12 @@ def analyze(
     where_params: list = []
 
     if symbol_type is not None or symbol_name is not None:
-        sym_where, sym_params = build_symbol_where_clause(symbol_type, symbol_name)
+        symbols_table = None
+        if check_symbols_table_exists(index_name):
+            symbols_table = get_symbols_table_name(index_name)
+        sym_where, sym_params = build_symbol_where_clause(
+            symbol_type, symbol_name, symbols_table
+        )
         if sym_where:
             where_parts.append(sym_where)
             where_params.extend(sym_params)
@@ -323,35 +332,41 @@ def analyze(
     where_clause = " AND ".join(where_parts) if where_parts else ""
 
     # --- Stage 4: Embedding ---
+    # Embedded once, as search() does: used for the semantic cache probe and
+    # passed into the vector search so it isn't re-embedded.
     t0 = time.perf_counter()
-    # Embedding is always needed for vector search (even in hybrid mode,
-    # execute_vector_search calls code_to_embedding internally).
-    # We time it here but the actual embedding happens inside execute_vector_search.
-    embedding_ms = 0.0  # Will be measured around vector search
+    query_embedding = embed_query(query, code_to_embedding.eval)
+    embedding_ms = (time.perf_counter() - t0) * 1000
+
+    if not no_cache and not cache_hit:
+        t0 = time.perf_counter()
+        cached_results, cache_hit_type = cache.get(
+            query=query,
+            index_name=index_name,
+            limit=limit,
+            min_score=min_score,
+            language_filter=language_filter,
+            use_hybrid=use_hybrid,
+            symbol_type=symbol_type,
+            symbol_name=symbol_name,
+            query_embedding=query_embedding,
+        )
+        cache_info.hit = cached_results is not None
+        cache_info.hit_type = cache_hit_type
+        cache_check_ms += (time.perf_counter() - t0) * 1000
 
     # --- Stage 5: Vector search ---
     vector_limit = min(limit * 2, MAX_PREFETCH) if should_use_hybrid else limit
     t0 = time.perf_counter()
-    if should_use_hybrid:
-        vector_results = execute_vector_search(
-            query,
-            table_name,
-            vector_limit,
-            where_clause,
-            where_params if where_params else None,
-        )
-    else:
-        vector_results = execute_vector_search(
-            query,
-            table_name,
-            vector_limit,
-            where_clause,
-            where_params if where_params else None,
-        )
+    vector_results = execute_vector_search(
+        query,
+        table_name,
+        vector_limit,
+        where_clause,
+        where_params if where_params else None,
+        query_embedding=query_embedding,
+    )
     vector_search_ms = (time.perf_counter() - t0) * 1000
-    # embedding_ms is included in vector_search_ms since execute_vector_search
-    # does its own embedding internally
-    embedding_ms = 0.0  # Cannot separate — included in vector_search_ms
 
     vector_info = VectorSearchInfo(
         result_count=len(vector_results),
@@ -720,6 +735,7 @@ def format_analysis_pretty(analysis: AnalysisResult, index_name: str) -> None:
     # --- Timings panel ---
     t = analysis.timings
     timing_entries = [
+        ("Embedding", t.embedding_ms),
         ("Vector search", t.vector_search_ms),
         ("Keyword search", t.keyword_search_ms),
         ("RRF fusion", t.rrf_fusion_ms),
@@ -4,12 +4,17 @@ Implements two-level caching for search queries:
 1. Exact match: Hash-based lookup for identical queries
 2. Semantic: Embedding similarity for paraphrased queries (cosine > 0.95)
 
-Cache is in-memory for the session and invalidates on reindex.
+Entries live in memory for fast access and are written through to a
+SQLite database under the cache directory, so repeated CLI invocations and
+MCP restarts start warm. Both tiers invalidate on reindex.
 """
 
+import dataclasses
 import hashlib
+import json
 import logging
 import os
+import sqlite3
 import threading
 import time
 from dataclasses import dataclass
@@ -24,10 +29,15 @@ DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/cocosearch/queries")
 
 # Cache settings
 MAX_CACHE_ENTRIES = 500  # Max entries before LRU eviction
-MAX_SEMANTIC_SCAN = 50  # Max entries to scan for semantic similarity (O(n) search)
+EMBEDDING_INDEX_INITIAL_CAPACITY = 64  # Rows preallocated per index (doubles on demand)
 DEFAULT_TTL = 86400  # 24 hours
 SEMANTIC_THRESHOLD = 0.92  # Cosine similarity threshold for semantic cache hits
 
+# Persistent tier settings
+CACHE_DB_FILENAME = "cache.db"
+CACHE_DB_SCHEMA_VERSION = 2  # Bump to discard persisted rows on layout changes
+MAX_DISK_BYTES = 64 * 1024 * 1024  # Evict oldest rows beyond this payload size
+
 
 @dataclass
 class CacheEntry:
@@ -37,6 +47,68 @@ class CacheEntry:
     embedding: list[float] | None  # Query embedding for semantic matching
     timestamp: float
     index_name: str
+    params_key: str = ""  # Search parameters other than the query text
+
+
+def _search_param_parts(
+    index_name: str,
+    limit: int,
+    min_score: float,
+    language_filter: str | None,
+    use_hybrid: bool | None,
+    symbol_type: str | list[str] | None,
+    symbol_name: str | None,
+) -> list[str]:
+    """Build the deterministic key parts for every search parameter but the query."""
+    # Normalize symbol_type to sorted tuple for consistent hashing
+    if isinstance(symbol_type, list):
+        symbol_type_str = ",".join(sorted(symbol_type))
+    elif symbol_type:
+        symbol_type_str = symbol_type
+    else:
+        symbol_type_str = ""
+
+    return [
+        f"index={index_name}",
+        f"limit={limit}",
+        f"min_score={min_score}",
+        f"language={language_filter or ''}",
+        f"hybrid={use_hybrid}",
+        f"symbol_type={symbol_type_str}",
+        f"symbol_name={symbol_name or ''}",
+    ]
+
+
+def _compute_params_key(
+    index_name: str,
+    limit: int,
+    min_score: float,
+    language_filter: str | None,
+    use_hybrid: bool | None,
+    symbol_type: str | list[str] | None,
+    symbol_name: str | None,
+) -> str:
+    """Compute SHA256 hash key from every search parameter except the query.
+
+    Semantic matches are only considered among entries sharing this key, so
+    a paraphrased query never returns results computed with other filters
+    or limits.
+
+    Returns:
+        SHA256 hex digest identifying the filter/limit combination.
+    """
+    key_str = "|".join(
+        _search_param_parts(
+            index_name,
+            limit,
+            min_score,
+            language_filter,
+            use_hybrid,
+            symbol_type,
+            symbol_name,
+        )
+    )
+    return hashlib.sha256(key_str.encode()).hexdigest()
 
 
 def _compute_cache_key(
@@ -66,25 +138,16 @@ def _compute_cache_key(
     Returns:
         SHA256 hex digest as cache key.
     """
-    # Normalize symbol_type to sorted tuple for consistent hashing
-    if isinstance(symbol_type, list):
-        symbol_type_str = ",".join(sorted(symbol_type))
-    elif symbol_type:
-        symbol_type_str = symbol_type
-    else:
-        symbol_type_str = ""
-
     # Build deterministic key string
-    key_parts = [
-        f"query={query}",
-        f"index={index_name}",
-        f"limit={limit}",
-        f"min_score={min_score}",
-        f"language={language_filter or ''}",
-        f"hybrid={use_hybrid}",
-        f"symbol_type={symbol_type_str}",
-        f"symbol_name={symbol_name or ''}",
-    ]
+    key_parts = [f"query={query}"] + _search_param_parts(
+        index_name,
+        limit,
+        min_score,
+        language_filter,
+        use_hybrid,
+        symbol_type,
+        symbol_name,
+    )
     key_str = "|".join(key_parts)
 
     return hashlib.sha256(key_str.encode()).hexdigest()
@@ -113,6 +176,120 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     return float(dot / (norm_a * norm_b))
 
 
+def _serialize_results(results: list[Any]) -> str:
+    """Serialize cached results to JSON for the persistent tier.
+
+    SearchResult (and other dataclass) instances are tagged so they can be
+    rebuilt on load; plain JSON values are stored as-is.
+    """
+    return json.dumps(
+        [
+            {"__search_result__": dataclasses.asdict(r)}
+            if dataclasses.is_dataclass(r)
+            else r
+            for r in results
+        ]
+    )
+
+
+def _deserialize_results(payload: str) -> list[Any]:
+    """Rebuild a result list written by _serialize_results."""
+    # Imported lazily: query.py imports this module
+    from cocosearch.search.query import SearchResult
+
+    return [
+        SearchResult(**item["__search_result__"])
+        if isinstance(item, dict) and "__search_result__" in item
+        else item
+        for item in json.loads(payload)
+    ]
+
+
+def _encode_embedding(embedding: list[float] | None) -> bytes | None:
+    """Pack an embedding as float32 bytes for BLOB storage."""
+    if embedding is None:
+        return None
+    return np.asarray(embedding, dtype=np.float32).tobytes()
+
+
+def _decode_embedding(blob: bytes | None) -> list[float] | None:
+    """Unpack an embedding written by _encode_embedding."""
+    if blob is None:
+        return None
+    return np.frombuffer(blob, dtype=np.float32).tolist()
+
+
+class _EmbeddingIndex:
+    """Per-index semantic lookup table.
+
+    Stores L2-normalized float32 embeddings as rows of a preallocated
+    contiguous matrix alongside a parallel key list, so a lookup is one
+    matrix-vector product over every cached entry. Removal swaps the last
+    row into the vacated slot (O(1)).
+
+    Not thread-safe; QueryCache guards access with its lock.
+    """
+
+    def __init__(self, dim: int, capacity: int = EMBEDDING_INDEX_INITIAL_CAPACITY):
+        self.dim = dim
+        self._matrix = np.zeros((capacity, dim), dtype=np.float32)
+        self._keys: list[str] = []
+        self._rows: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def add(self, key: str, embedding: list[float]) -> None:
+        """Insert or overwrite the row for key."""
+        vec = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if norm > 0:
+            vec = vec / norm
+
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._keys)
+            if row == self._matrix.shape[0]:
+                grown = np.zeros((row * 2, self.dim), dtype=np.float32)
+                grown[:row] = self._matrix
+                self._matrix = grown
+            self._keys.append(key)
+            self._rows[key] = row
+        self._matrix[row] = vec
+
+    def remove(self, key: str) -> None:
+        """Remove key by moving the last row into its slot."""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        last = len(self._keys) - 1
+        if row != last:
+            moved_key = self._keys[last]
+            self._matrix[row] = self._matrix[last]
+            self._keys[row] = moved_key
+            self._rows[moved_key] = row
+        self._keys.pop()
+
+    def matches(
+        self, embedding: list[float], threshold: float
+    ) -> list[tuple[str, float]]:
+        """Return (key, similarity) pairs at or above threshold, best first."""
+        if not self._keys:
+            return []
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+
+        sims = self._matrix[: len(self._keys)] @ (query / norm)
+        candidates = np.flatnonzero(sims >= threshold)
+        order = candidates[np.argsort(-sims[candidates])]
+        return [(self._keys[i], float(sims[i])) for i in order]
+
+
 class QueryCache:
     """Two-level query cache with exact and semantic matching.
 
@@ -120,6 +297,8 @@ class QueryCache:
     Level 2 (Semantic): Embedding similarity for paraphrased queries
 
     Cache entries expire after TTL and are invalidated on reindex.
+    With persistence enabled, entries are written through to SQLite and
+    exact-match misses in memory fall back to the on-disk tier.
     """
 
     def __init__(
@@ -127,6 +306,8 @@ class QueryCache:
         cache_dir: str = DEFAULT_CACHE_DIR,
         ttl: int = DEFAULT_TTL,
         semantic_threshold: float = SEMANTIC_THRESHOLD,
+        persist: bool = True,
+        max_disk_bytes: int = MAX_DISK_BYTES,
     ):
         """Initialize the query cache.
 
@@ -134,24 +315,192 @@ class QueryCache:
             cache_dir: Directory for persistent cache storage.
             ttl: Time-to-live in seconds (default 24 hours).
             semantic_threshold: Cosine similarity threshold for semantic hits.
+            persist: Write entries through to SQLite in cache_dir (default True).
+            max_disk_bytes: Payload budget for the persistent tier.
         """
         self.cache_dir = cache_dir
         self.ttl = ttl
         self.semantic_threshold = semantic_threshold
+        self.max_disk_bytes = max_disk_bytes
         self._lock = threading.Lock()
 
         # In-memory cache for fast access (session-scoped)
         # Key: cache_key, Value: CacheEntry
         self._cache: dict[str, CacheEntry] = {}
 
-        # Embedding index for semantic search (index_name -> list of (key, embedding))
-        self._embedding_index: dict[str, list[tuple[str, list[float]]]] = {}
+        # Embedding index for semantic search, one normalized matrix per
+        # (index_name, params_key) group
+        self._embedding_index: dict[tuple[str, str], _EmbeddingIndex] = {}
+
+        # Indexes whose persisted embeddings were loaded into _embedding_index
+        self._warmed_indexes: set[str] = set()
 
         # Ensure cache directory exists
         os.makedirs(cache_dir, exist_ok=True)
 
+        self._db: sqlite3.Connection | None = None
+        if persist:
+            self._db = self._open_db(os.path.join(cache_dir, CACHE_DB_FILENAME))
+
         logger.debug(f"Query cache initialized at {cache_dir}")
 
+    def _open_db(self, path: str) -> sqlite3.Connection | None:
+        """Open (or create) the persistent tier and drop expired rows.
+
+        Returns None when the database can't be opened, in which case the
+        cache silently runs memory-only.
+        """
+        try:
+            db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            (version,) = db.execute("PRAGMA user_version").fetchone()
+            if version != CACHE_DB_SCHEMA_VERSION:
+                # Cached rows are disposable; rebuild rather than migrate
+                db.execute("DROP TABLE IF EXISTS query_cache")
+                db.execute(f"PRAGMA user_version = {CACHE_DB_SCHEMA_VERSION}")
+            db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS query_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    index_name TEXT NOT NULL,
+                    params_key TEXT NOT NULL,
+                    results TEXT NOT NULL,
+                    embedding BLOB,
+                    timestamp REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+                """
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS query_cache_index_name "
+                "ON query_cache (index_name)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS query_cache_timestamp "
+                "ON query_cache (timestamp)"
+            )
+            db.execute(
+                "DELETE FROM query_cache WHERE timestamp < ?",
+                (time.time() - self.ttl,),
+            )
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"Persistent query cache unavailable ({path}): {e}")
+            return None
+
+    def _disk_get(self, cache_key: str) -> CacheEntry | None:
+        """Load a non-expired entry from the persistent tier.
+
+        Must be called while holding self._lock.
+        """
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT index_name, params_key, results, embedding, timestamp "
+                "FROM query_cache WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                return None
+            index_name, params_key, payload, blob, timestamp = row
+            if time.time() - timestamp >= self.ttl:
+                self._db.execute(
+                    "DELETE FROM query_cache WHERE cache_key = ?", (cache_key,)
+                )
+                self._db.commit()
+                return None
+            return CacheEntry(
+                results=_deserialize_results(payload),
+                embedding=_decode_embedding(blob),
+                timestamp=timestamp,
+                index_name=index_name,
+                params_key=params_key,
+            )
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            logger.debug(f"Persistent cache read failed: {e}")
+            return None
+
+    def _disk_put(self, cache_key: str, entry: CacheEntry) -> None:
+        """Write an entry to the persistent tier and enforce the size budget.
+
+        Must be called while holding self._lock.
+        """
+        if self._db is None:
+            return
+        try:
+            payload = _serialize_results(entry.results)
+            blob = _encode_embedding(entry.embedding)
+            size = len(payload) + (len(blob) if blob else 0)
+            self._db.execute(
+                "INSERT OR REPLACE INTO query_cache (cache_key, index_name, "
+                "params_key, results, embedding, timestamp, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key,
+                    entry.index_name,
+                    entry.params_key,
+                    payload,
+                    blob,
+                    entry.timestamp,
+                    size,
+                ),
+            )
+            self._evict_disk()
+            self._db.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.debug(f"Persistent cache write failed: {e}")
+
+    def _evict_disk(self) -> None:
+        """Delete the oldest persisted rows until within max_disk_bytes.
+
+        Must be called while holding self._lock.
+        """
+        (total,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM query_cache"
+        ).fetchone()
+        if total <= self.max_disk_bytes:
+            return
+
+        stale_keys = []
+        for key, size in self._db.execute(
+            "SELECT cache_key, size FROM query_cache ORDER BY timestamp"
+        ):
+            if total <= self.max_disk_bytes:
+                break
+            stale_keys.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM query_cache WHERE cache_key = ?", stale_keys)
+
+    def _warm_embedding_index(self, index_name: str) -> None:
+        """Load persisted embeddings for an index into the semantic index.
+
+        Only (key, embedding) pairs are loaded; results are read from disk
+        when a semantic hit lands on a key not yet in memory.
+
+        Must be called while holding self._lock.
+        """
+        self._warmed_indexes.add(index_name)
+        if self._db is None:
+            return
+        try:
+            rows = self._db.execute(
+                "SELECT cache_key, params_key, embedding FROM query_cache "
+                "WHERE index_name = ? AND embedding IS NOT NULL AND timestamp >= ? "
+                "ORDER BY timestamp DESC LIMIT ?",
+                (index_name, time.time() - self.ttl, MAX_CACHE_ENTRIES),
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.debug(f"Persistent cache warmup failed: {e}")
+            return
+
+        # Oldest first, so the newest embedding dimension wins after a model change
+        for key, params_key, blob in reversed(rows):
+            self._add_to_embedding_index(
+                (index_name, params_key), key, _decode_embedding(blob)
+            )
+
     def get(
         self,
         query: str,
@@ -177,6 +526,9 @@ class QueryCache:
             symbol_name: Symbol name filter.
             query_embedding: Pre-computed embedding for semantic matching.
 
+        Semantic matches are restricted to entries cached with the same
+        filters and limit, so only the query wording may differ.
+
         Returns:
             Tuple of (results, hit_type) where:
             - results: Cached results or None if miss
@@ -192,6 +544,18 @@ class QueryCache:
             symbol_type,
             symbol_name,
         )
+        group = (
+            index_name,
+            _compute_params_key(
+                index_name,
+                limit,
+                min_score,
+                language_filter,
+                use_hybrid,
+                symbol_type,
+                symbol_name,
+            ),
+        )
 
         with self._lock:
             # Level 1: Exact match
@@ -204,25 +568,42 @@ class QueryCache:
                 else:
                     # Expired - remove from cache
                     del self._cache[cache_key]
-                    self._remove_from_embedding_index(index_name, cache_key)
+                    self._remove_from_embedding_index(group, cache_key)
+            else:
+                # Level 1b: Exact match from the persistent tier
+                entry = self._disk_get(cache_key)
+                if entry is not None:
+                    self._cache[cache_key] = entry
+                    if len(self._cache) > MAX_CACHE_ENTRIES:
+                        self._evict_oldest()
+                    logger.debug(f"Cache hit (exact, disk): {cache_key[:16]}...")
+                    return entry.results, "exact"
 
             # Level 2: Semantic match (only if we have embedding)
-            # Scan only the most recent entries to bound O(n) cost
-            if query_embedding and index_name in self._embedding_index:
-                entries = self._embedding_index[index_name]
-                for key, cached_embedding in entries[-MAX_SEMANTIC_SCAN:]:
-                    if key in self._cache:
-                        entry = self._cache[key]
-                        # Check TTL
-                        if time.time() - entry.timestamp >= self.ttl:
-                            continue
-
-                        sim = cosine_similarity(query_embedding, cached_embedding)
-                        if sim >= self.semantic_threshold:
-                            logger.debug(
-                                f"Cache hit (semantic, sim={sim:.3f}): {key[:16]}..."
-                            )
-                            return entry.results, "semantic"
+            # One matrix-vector product scores every cached embedding
+            if query_embedding and index_name not in self._warmed_indexes:
+                self._warm_embedding_index(index_name)
+            embedding_index = self._embedding_index.get(group)
+            if query_embedding and embedding_index is not None:
+                if len(query_embedding) != embedding_index.dim:
+                    return None, "miss"
+                matches = embedding_index.matches(
+                    query_embedding, self.semantic_threshold
+                )
+                for key, sim in matches:
+                    entry = self._cache.get(key)
+                    if entry is None:
+                        entry = self._disk_get(key)
+                    # Skip missing or expired entries
+                    if entry is None or time.time() - entry.timestamp >= self.ttl:
+                        self._remove_from_embedding_index(group, key)
+                        continue
+
+                    self._cache[key] = entry
+                    if len(self._cache) > MAX_CACHE_ENTRIES:
+                        self._evict_oldest()
+                    logger.debug(f"Cache hit (semantic, sim={sim:.3f}): {key[:16]}...")
+                    return entry.results, "semantic"
 
         return None, "miss"
 
@@ -263,12 +644,22 @@ class QueryCache:
             symbol_type,
             symbol_name,
         )
+        params_key = _compute_params_key(
+            index_name,
+            limit,
+            min_score,
+            language_filter,
+            use_hybrid,
+            symbol_type,
+            symbol_name,
+        )
 
         entry = CacheEntry(
             results=results,
             embedding=query_embedding,
             timestamp=time.time(),
             index_name=index_name,
+            params_key=params_key,
         )
 
         with self._lock:
@@ -276,14 +667,16 @@ class QueryCache:
 
             # Add to embedding index if we have embedding
             if query_embedding:
-                if index_name not in self._embedding_index:
-                    self._embedding_index[index_name] = []
-                self._embedding_index[index_name].append((cache_key, query_embedding))
+                self._add_to_embedding_index(
+                    (index_name, params_key), cache_key, query_embedding
+                )
 
             # LRU eviction: remove oldest entries when cache exceeds limit
             if len(self._cache) > MAX_CACHE_ENTRIES:
                 self._evict_oldest()
 
+            self._disk_put(cache_key, entry)
+
         logger.debug(f"Cache put: {cache_key[:16]}...")
 
     def invalidate_index(self, index_name: str) -> int:
@@ -311,8 +704,28 @@ class QueryCache:
                 removed += 1
 
             # Remove from embedding index
-            if index_name in self._embedding_index:
-                del self._embedding_index[index_name]
+            for group in [g for g in self._embedding_index if g[0] == index_name]:
+                del self._embedding_index[group]
+
+            self._warmed_indexes.discard(index_name)
+
+            # Remove from persistent tier, counting entries not loaded this session
+            if self._db is not None:
+                try:
+                    disk_keys = {
+                        row[0]
+                        for row in self._db.execute(
+                            "SELECT cache_key FROM query_cache WHERE index_name = ?",
+                            (index_name,),
+                        )
+                    }
+                    self._db.execute(
+                        "DELETE FROM query_cache WHERE index_name = ?", (index_name,)
+                    )
+                    self._db.commit()
+                    removed += len(disk_keys - set(keys_to_remove))
+                except sqlite3.Error as e:
+                    logger.warning(f"Persistent cache invalidation failed: {e}")
 
         logger.info(
             f"Cache invalidated for index '{index_name}': {removed} entries removed"
@@ -332,26 +745,52 @@ class QueryCache:
         sorted_keys = sorted(self._cache.keys(), key=lambda k: self._cache[k].timestamp)
         for key in sorted_keys[:entries_to_remove]:
             entry = self._cache.pop(key)
-            self._remove_from_embedding_index(entry.index_name, key)
+            self._remove_from_embedding_index((entry.index_name, entry.params_key), key)
 
-    def _remove_from_embedding_index(self, index_name: str, cache_key: str) -> None:
+    def _add_to_embedding_index(
+        self, group: tuple[str, str], cache_key: str, embedding: list[float]
+    ) -> None:
+        """Add (or refresh) a single entry in the embedding index.
+
+        Entries are grouped by (index_name, params_key). The first embedding
+        stored for a group fixes its dimension; embeddings of another
+        dimension (e.g., after a model change) restart the group rather than
+        mixing incomparable vectors.
+
+        Must be called while holding self._lock.
+        """
+        embedding_index = self._embedding_index.get(group)
+        if embedding_index is None or embedding_index.dim != len(embedding):
+            embedding_index = _EmbeddingIndex(dim=len(embedding))
+            self._embedding_index[group] = embedding_index
+        embedding_index.add(cache_key, embedding)
+
+    def _remove_from_embedding_index(
+        self, group: tuple[str, str], cache_key: str
+    ) -> None:
         """Remove a single entry from the embedding index.
 
-        Deletes the key entirely when the list becomes empty to prevent
-        accumulating empty lists over time.
+        Deletes the group entirely when it becomes empty to release its
+        matrix.
         """
-        if index_name in self._embedding_index:
-            self._embedding_index[index_name] = [
-                (k, e) for k, e in self._embedding_index[index_name] if k != cache_key
-            ]
-            if not self._embedding_index[index_name]:
-                del self._embedding_index[index_name]
+        embedding_index = self._embedding_index.get(group)
+        if embedding_index is not None:
+            embedding_index.remove(cache_key)
+            if not embedding_index:
+                del self._embedding_index[group]
 
     def clear(self) -> None:
         """Clear all cached entries."""
         with self._lock:
             self._cache.clear()
             self._embedding_index.clear()
+            self._warmed_indexes.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM query_cache")
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Persistent cache clear failed: {e}")
         logger.info("Cache cleared")
 
 
@@ -0,0 +1,210 @@
+"""In-process catalog of index tables, their columns and index metadata.
+
+Search and discovery hot paths used to probe ``information_schema`` on
+every request: ``list_indexes()`` on each auto-detected search and
+``/api/projects`` call, and ``check_column_exists()`` on each keyword
+search and ``analyze()``. The catalog loads all of it with two queries
+and serves it from memory:
+
+- columns of every ``codeindex_*`` table (which indexes exist, and which
+  schema features such as ``content_tsv`` they have)
+- the ``cocosearch_index_metadata`` rows
+
+The snapshot is refreshed when it is older than ``CATALOG_TTL`` seconds,
+when ``invalidate_catalog()`` is called (after indexing, schema
+migration, clearing an index and metadata writes in this process), and
+on a lookup for a table it has never seen (rate-limited, so a missing
+table does not turn every lookup back into a query).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import threading
+import time
+
+from cocosearch.search.db import get_connection_pool
+
+logger = logging.getLogger(__name__)
+
+# Seconds a catalog snapshot is served before it is reloaded. Bounds how
+# long changes made by other processes (e.g. a CLI indexing run) take to
+# become visible.
+CATALOG_TTL = 30.0
+
+# Minimum seconds between reloads triggered by lookups of unknown tables
+_MIN_RELOAD_INTERVAL = 1.0
+
+_TABLE_PREFIX = "codeindex_"
+_CHUNKS_SUFFIX = "_chunks"
+
+
+def index_name_from_table(table_name: str) -> str | None:
+    """Extract the index name from a chunks table name.
+
+    Args:
+        table_name: PostgreSQL table name (``codeindex_{name}__{name}_chunks``).
+
+    Returns:
+        The index name (the part between ``codeindex_`` and ``__``), or
+        None if the table is not an index chunks table.
+    """
+    if not (
+        table_name.startswith(_TABLE_PREFIX)
+        and table_name.endswith(_CHUNKS_SUFFIX)
+        and "__" in table_name
+    ):
+        return None
+    return table_name.split("__")[0][len(_TABLE_PREFIX) :]
+
+
+@dataclasses.dataclass(frozen=True)
+class IndexCatalog:
+    """Snapshot of index tables, their columns and index metadata."""
+
+    columns: dict[str, frozenset[str]]
+    metadata_rows: dict[str, tuple]
+    loaded_at: float
+
+    def has_table(self, table_name: str) -> bool:
+        """Whether the table existed when the snapshot was loaded."""
+        return table_name in self.columns
+
+    def has_column(self, table_name: str, column_name: str) -> bool:
+        """Whether the table had the column when the snapshot was loaded."""
+        return column_name in self.columns.get(table_name, frozenset())
+
+    def indexes(self) -> list[dict]:
+        """List indexes in the same shape as ``list_indexes()``.
+
+        Returns:
+            Dicts with ``name`` and ``table_name``, ordered by table name.
+        """
+        indexes = []
+        for table_name in sorted(self.columns):
+            name = index_name_from_table(table_name)
+            if name is not None:
+                indexes.append({"name": name, "table_name": table_name})
+        return indexes
+
+    def index_metadata(self, index_name: str) -> dict | None:
+        """Metadata for an index in the same shape as ``get_index_metadata()``.
+
+        Args:
+            index_name: The name of the index to look up.
+
+        Returns:
+            A fresh metadata dict (``indexing_elapsed_seconds`` is computed
+            at call time), or None if the index has no metadata row.
+        """
+        row = self.metadata_rows.get(index_name)
+        if row is None:
+            return None
+        from cocosearch.management.metadata import metadata_from_row
+
+        return metadata_from_row(row)
+
+
+_catalog: IndexCatalog | None = None
+_catalog_lock = threading.Lock()
+_last_forced_reload = 0.0
+
+
+def _load_columns() -> dict[str, frozenset[str]]:
+    """Internal: Load the columns of every index table in one query."""
+    columns: dict[str, set[str]] = {}
+    pool = get_connection_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT table_name, column_name
+                FROM information_schema.columns
+                WHERE table_schema = 'public'
+                  AND table_name LIKE 'codeindex_%'
+                """
+            )
+            for table_name, column_name in cur.fetchall():
+                columns.setdefault(table_name, set()).add(column_name)
+    return {table: frozenset(cols) for table, cols in columns.items()}
+
+
+def _load_catalog() -> IndexCatalog:
+    """Internal: Load a fresh catalog snapshot from the database."""
+    from cocosearch.management.metadata import list_index_metadata_rows
+
+    return IndexCatalog(
+        columns=_load_columns(),
+        metadata_rows={row[0]: row for row in list_index_metadata_rows()},
+        loaded_at=time.monotonic(),
+    )
+
+
+def get_catalog(max_age: float = CATALOG_TTL) -> IndexCatalog:
+    """Get the catalog, reloading it if it is older than ``max_age``.
+
+    Args:
+        max_age: Maximum snapshot age in seconds; 0 forces a reload.
+
+    Returns:
+        The current IndexCatalog.
+    """
+    global _catalog
+    catalog = _catalog
+    if catalog is not None and time.monotonic() - catalog.loaded_at < max_age:
+        return catalog
+    with _catalog_lock:
+        # Another thread may have reloaded while this one waited
+        catalog = _catalog
+        if catalog is None or time.monotonic() - catalog.loaded_at >= max_age:
+            catalog = _load_catalog()
+            _catalog = catalog
+            logger.debug(
+                f"Loaded index catalog: {len(catalog.columns)} tables, "
+                f"{len(catalog.metadata_rows)} metadata rows"
+            )
+    return catalog
+
+
+def _get_catalog_with_table(table_name: str) -> IndexCatalog:
+    """Internal: Get the catalog, reloading once if it lacks ``table_name``.
+
+    The table may have been created after the snapshot was loaded (e.g. by
+    an indexing run in another process). Forced reloads are spaced at
+    least ``_MIN_RELOAD_INTERVAL`` apart.
+    """
+    global _last_forced_reload
+    catalog = get_catalog()
+    if catalog.has_table(table_name):
+        return catalog
+    now = time.monotonic()
+    if now - max(catalog.loaded_at, _last_forced_reload) < _MIN_RELOAD_INTERVAL:
+        return catalog
+    _last_forced_reload = now
+    return get_catalog(max_age=0)
+
+
+def table_has_column(table_name: str, column_name: str) -> bool:
+    """Check if a column exists in an index table, using the catalog.
+
+    Args:
+        table_name: Full table name (e.g., "codeindex_myproject__myproject_chunks")
+        column_name: Column name to check (e.g., "content_tsv")
+
+    Returns:
+        True if the column exists, False otherwise.
+    """
+    return _get_catalog_with_table(table_name).has_column(table_name, column_name)
+
+
+def invalidate_catalog() -> None:
+    """Drop the catalog so the next lookup reloads it.
+
+    Called after indexing, schema migration, clearing an index and
+    metadata writes, and by tests to ensure clean state.
+    """
+    global _catalog, _last_forced_reload
+    with _catalog_lock:
+        _catalog = None
+        _last_forced_reload = 0.0
@@ -6,7 +6,9 @@ Includes LRU caching for efficient file reading during search sessions.
 
 Features:
 - Smart boundary detection finds enclosing function or class
-- LRU caching (128 files) prevents repeated I/O
+- LRU caching (128 files) prevents repeated I/O; each cached file keeps
+  its bytes, a line-start offset table, and parsed trees, so several
+  results in one file share one read and one parse
 - 50-line hard limit enforced on all results
 - Graceful fallback on parse errors
 """
@@ -15,7 +17,8 @@ import logging
 from functools import lru_cache
 from pathlib import Path
 
-from tree_sitter import Parser
+import numpy as np
+from tree_sitter import Parser, Tree
 from tree_sitter_language_pack import get_language
 
 logger = logging.getLogger(__name__)
@@ -121,35 +124,50 @@ def _truncate_line(line: str, max_length: int = LINE_TRUNCATION_LENGTH) -> str:
     return line[: max_length - 3] + "..."
 
 
-def _line_to_byte(lines: list[str], line_number: int) -> int:
-    """Convert 1-based line number to byte offset.
+class _FileIndex:
+    """Cached view of one source file for context expansion.
 
-    Args:
-        lines: List of file lines (with line endings stripped).
-        line_number: 1-based line number.
-
-    Returns:
-        Byte offset of start of line in original file.
+    Holds the raw bytes, the decoded lines, a sorted array of line-start
+    byte offsets (so line/byte conversions are binary searches), and
+    tree-sitter trees parsed on first use per language.
     """
-    # Accumulate bytes for all lines before target
-    byte_offset = 0
-    for i in range(min(line_number - 1, len(lines))):
-        # Add line length + 1 for newline
-        byte_offset += len(lines[i].encode("utf-8")) + 1
-    return byte_offset
 
+    def __init__(self, content: bytes):
+        """Build the line index for file content.
 
-def _byte_to_line(content: bytes, byte_offset: int) -> int:
-    """Convert byte offset to 1-based line number.
+        Args:
+            content: File content as bytes.
+        """
+        self.content = content
+        text = content.decode("utf-8", errors="replace")
+        lines = text.split("\n")
+        if lines[-1] == "":
+            # Trailing newline (or empty file) doesn't start another line
+            lines.pop()
+        self.lines = [line.rstrip("\r") for line in lines]
+        newlines = np.flatnonzero(np.frombuffer(content, dtype=np.uint8) == 0x0A)
+        self.line_starts = np.concatenate(([0], newlines + 1))
+        self._trees: dict[str, Tree] = {}
+
+    def line_to_byte(self, line_number: int) -> int:
+        """Convert 1-based line number to the byte offset of its start.
+
+        Line numbers past the end clamp to the start of the last line.
+        """
+        index = min(max(line_number - 1, 0), len(self.line_starts) - 1)
+        return int(self.line_starts[index])
 
-    Args:
-        content: File content as bytes.
-        byte_offset: Byte offset in the file.
+    def byte_to_line(self, byte_offset: int) -> int:
+        """Convert byte offset to 1-based line number."""
+        return int(np.searchsorted(self.line_starts, byte_offset, side="right"))
 
-    Returns:
-        1-based line number.
-    """
-    return content[:byte_offset].count(b"\n") + 1
+    def get_tree(self, language: str, parser: Parser) -> Tree:
+        """Return the parse tree for language, parsing on first use."""
+        tree = self._trees.get(language)
+        if tree is None:
+            tree = parser.parse(self.content)
+            self._trees[language] = tree
+        return tree
 
 
 # ============================================================================
@@ -161,8 +179,9 @@ class ContextExpander:
     """Manages context expansion with caching.
 
     Provides smart context expansion using tree-sitter to find enclosing
-    function/class boundaries. Caches file content and parser instances
-    for efficient repeated access during search sessions.
+    function/class boundaries. Caches file content, line offsets, parse
+    trees and parser instances for efficient repeated access during
+    search sessions.
 
     Usage:
         expander = ContextExpander()
@@ -197,21 +216,21 @@ class ContextExpander:
             self._parsers[language] = parser
         return self._parsers[language]
 
-    def _read_file_impl(self, filepath: str) -> list[str]:
-        """Read file lines (implementation for LRU cache).
+    def _read_file_impl(self, filepath: str) -> _FileIndex:
+        """Read and index a file (implementation for LRU cache).
 
         Args:
             filepath: Path to the source file.
 
         Returns:
-            List of lines with line endings stripped.
+            File index; empty if the file cannot be read.
         """
         try:
-            with open(filepath, encoding="utf-8", errors="replace") as f:
-                return [line.rstrip("\n\r") for line in f.readlines()]
+            with open(filepath, "rb") as f:
+                return _FileIndex(f.read())
         except (FileNotFoundError, IOError, OSError) as e:
             logger.debug(f"Cannot read file {filepath}: {e}")
-            return []
+            return _FileIndex(b"")
 
     def get_file_lines(self, filepath: str) -> list[str]:
         """Get file lines with LRU caching (max 128 files).
@@ -222,15 +241,16 @@ class ContextExpander:
         Returns:
             List of lines with line endings stripped, or empty list on error.
         """
-        return self._read_file_cached(filepath)
+        return self._read_file_cached(filepath).lines
 
     def find_enclosing_scope(
         self, filepath: str, start_line: int, end_line: int, language: str
     ) -> tuple[int, int]:
         """Find enclosing function/class boundaries using tree-sitter.
 
-        Parses the file and walks up the AST parent chain from the given
-        position to find the nearest enclosing function or class definition.
+        Parses the file (once per file and language, cached) and walks up
+        the AST parent chain from the given position to find the nearest
+        enclosing function or class definition.
 
         Args:
             filepath: Path to the source file.
@@ -248,13 +268,12 @@ class ContextExpander:
                 logger.debug(f"Language {language} not supported for scope detection")
                 return (start_line, end_line)
 
-            # Read file as bytes for tree-sitter
-            with open(filepath, "rb") as f:
-                content = f.read()
+            file_index = self._read_file_cached(filepath)
+            if not file_index.lines:
+                return (start_line, end_line)
 
-            # Parse with tree-sitter
-            parser = self._get_parser(language)
-            tree = parser.parse(content)
+            # Parse with tree-sitter (cached per file and language)
+            tree = file_index.get_tree(language, self._get_parser(language))
 
             # Log if parse has errors (still try to use partial tree)
             if tree.root_node.has_error:
@@ -262,13 +281,8 @@ class ContextExpander:
                     f"Parse errors in {filepath}, using best-effort boundaries"
                 )
 
-            # Get file lines for byte offset calculation
-            lines = self.get_file_lines(filepath)
-            if not lines:
-                return (start_line, end_line)
-
             # Calculate byte offset for start line
-            start_byte = _line_to_byte(lines, start_line)
+            start_byte = file_index.line_to_byte(start_line)
 
             # Find node at position
             node = tree.root_node.descendant_for_byte_range(start_byte, start_byte)
@@ -281,8 +295,8 @@ class ContextExpander:
             while current is not None:
                 if current.type in definition_types:
                     # Found enclosing scope - convert byte range to lines
-                    scope_start = _byte_to_line(content, current.start_byte)
-                    scope_end = _byte_to_line(content, current.end_byte)
+                    scope_start = file_index.byte_to_line(current.start_byte)
+                    scope_end = file_index.byte_to_line(current.end_byte)
                     return (scope_start, scope_end)
                 current = current.parent
 
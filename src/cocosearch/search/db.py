@@ -1,11 +1,16 @@
 """Database connection module for cocosearch search.
 
 Provides connection pool management and table name resolution for
-querying CocoIndex-created vector tables in PostgreSQL.
+querying CocoIndex-created vector tables in PostgreSQL, plus the search
+statement registry: SQL built once per (statement, table, filter shape)
+and run as server-side prepared statements on pooled connections.
 """
 
+import dataclasses
 import logging
 import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 
 from pgvector.psycopg import register_vector
 from psycopg_pool import ConnectionPool
@@ -18,9 +23,153 @@ logger = logging.getLogger(__name__)
 _pool: ConnectionPool | None = None
 _pool_lock = threading.Lock()
 
+# Counters reported by get_pool_stats() even before they are first incremented
+_POOL_COUNTERS = (
+    "requests_num",
+    "requests_queued",
+    "requests_wait_ms",
+    "requests_errors",
+    "usage_ms",
+    "returns_bad",
+    "connections_num",
+    "connections_ms",
+    "connections_errors",
+    "connections_lost",
+)
+
 # Module-level cache for symbol column availability per table
 _symbol_columns_available: dict[str, bool] = {}
 
+# Module-level cache for stored line number column availability per table
+_line_columns_available: dict[str, bool] = {}
+
+# Module-level cache for symbols side table availability per index
+_symbols_table_available: dict[str, bool] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool sizing and timeouts (``database`` config section)."""
+
+    min_size: int = 2
+    max_size: int = 10
+    timeout: float = 30.0
+    max_idle: float = 600.0
+
+
+@dataclasses.dataclass(frozen=True)
+class VectorSearchSettings:
+    """Per-query pgvector index scan settings (``search`` config section)."""
+
+    hnsw_ef_search: int | None = None
+    ivfflat_probes: int | None = None
+    iterative_scan: str = "relaxed_order"
+    rerank_factor: int = 4
+
+
+@dataclasses.dataclass(frozen=True)
+class VectorStorage:
+    """How an index's embeddings are indexed for nearest-neighbour search.
+
+    With "halfvec" or "binary" storage the ANN index covers a quantized
+    expression of the embedding column; searches order candidates by that
+    expression (so the index applies) and re-rank them with the
+    full-precision column.
+    """
+
+    mode: str = "full"
+    dimensions: int | None = None
+
+    @property
+    def quantized(self) -> bool:
+        return self.mode != "full"
+
+    def candidate_order_sql(self, query_vector: str) -> str:
+        """ORDER BY expression matching the quantized index.
+
+        Args:
+            query_vector: SQL expression of the query vector (e.g. "%s::vector").
+        """
+        if self.mode == "halfvec":
+            halfvec = f"halfvec({self.dimensions})"
+            return f"(embedding::{halfvec}) <=> ({query_vector})::{halfvec}"
+        if self.mode == "binary":
+            return (
+                f"(binary_quantize(embedding)::bit({self.dimensions})) "
+                f"<~> binary_quantize({query_vector})"
+            )
+        return f"embedding <=> {query_vector}"
+
+
+# Statement registry: SQL text per (statement, table, filter shape), LRU
+MAX_STATEMENTS = 256
+_statements: OrderedDict[Hashable, str] = OrderedDict()
+_statements_lock = threading.Lock()
+
+# Module-level cache for embedding index storage per table
+_vector_storage: dict[str, VectorStorage] = {}
+
+# Resolved once per process from env vars and cocosearch.yaml
+_vector_search_settings: VectorSearchSettings | None = None
+
+# Whether the installed pgvector (0.8+) supports iterative index scans
+_iterative_scan_supported: bool | None = None
+
+
+def _config_resolver(purpose: str) -> Callable[[str], object]:
+    """Build a resolver for config keys with env > cocosearch.yaml > default.
+
+    An invalid config file falls back to defaults (with a warning naming
+    ``purpose``).
+
+    Returns:
+        Function mapping a dot-notation config key to its resolved value.
+    """
+    from cocosearch.config import (
+        CocoSearchConfig,
+        ConfigError,
+        ConfigResolver,
+        config_key_to_env_var,
+        find_config_file,
+        load_config,
+    )
+
+    config_path = find_config_file()
+    try:
+        config = load_config(config_path) if config_path else CocoSearchConfig()
+    except ConfigError as e:
+        logger.warning(f"Ignoring invalid config for {purpose}: {e}")
+        config, config_path = CocoSearchConfig(), None
+    resolver = ConfigResolver(config, config_path)
+
+    def resolve(key: str):
+        value, _ = resolver.resolve(
+            key, cli_value=None, env_var=config_key_to_env_var(key)
+        )
+        return value
+
+    return resolve
+
+
+def get_pool_settings() -> PoolSettings:
+    """Get the connection pool settings.
+
+    Resolved with env > cocosearch.yaml > default precedence (e.g.
+    COCOSEARCH_DATABASE_POOL_MAX_SIZE overrides database.poolMaxSize).
+    A max size below the min size is raised to the min size.
+
+    Returns:
+        PoolSettings for the current process.
+    """
+    resolve = _config_resolver("pool settings")
+    min_size = resolve("database.poolMinSize")
+    return PoolSettings(
+        min_size=min_size,
+        max_size=max(resolve("database.poolMaxSize"), min_size),
+        timeout=resolve("database.poolTimeout"),
+        max_idle=resolve("database.poolMaxIdle"),
+    )
+
 
 def get_connection_pool() -> ConnectionPool:
     """Get or create the database connection pool.
@@ -30,7 +179,9 @@ def get_connection_pool() -> ConnectionPool:
     concurrent access.
 
     The pool reads the database URL from COCOSEARCH_DATABASE_URL environment
-    variable, falling back to the default if not set.
+    variable, falling back to the default if not set. Sizing and timeouts
+    come from ``get_pool_settings()``; connections are checked before being
+    handed out, so ones dropped by the server are replaced transparently.
 
     On fresh databases where the pgvector extension hasn't been created yet,
     vector registration is skipped gracefully — non-vector queries (list,
@@ -44,6 +195,7 @@ def get_connection_pool() -> ConnectionPool:
         with _pool_lock:
             if _pool is None:
                 conninfo = get_database_url()
+                settings = get_pool_settings()
 
                 def configure(conn):
                     try:
@@ -57,10 +209,54 @@ def get_connection_pool() -> ConnectionPool:
                 _pool = ConnectionPool(
                     conninfo=conninfo,
                     configure=configure,
+                    check=ConnectionPool.check_connection,
+                    min_size=settings.min_size,
+                    max_size=settings.max_size,
+                    timeout=settings.timeout,
+                    max_idle=settings.max_idle,
+                    name="cocosearch",
                 )
     return _pool
 
 
+def warm_connection_pool(timeout: float | None = None) -> bool:
+    """Open the pool's minimum connections before the first request.
+
+    Each connection is configured (pgvector registration) as it opens, so
+    the first searches don't pay for connecting.
+
+    Args:
+        timeout: Seconds to wait for the connections (default: the pool's
+            request timeout).
+
+    Returns:
+        True if all minimum connections opened in time, False otherwise.
+    """
+    pool = get_connection_pool()
+    try:
+        pool.wait(timeout=timeout if timeout is not None else pool.timeout)
+    except Exception as e:
+        logger.warning(f"Connection pool warmup incomplete: {e}")
+        return False
+    return True
+
+
+def get_pool_stats() -> dict | None:
+    """Get connection pool metrics.
+
+    Returns:
+        Dict of pool gauges (``pool_min``, ``pool_max``, ``pool_size``,
+        ``pool_available``, ``requests_waiting``) and cumulative counters
+        since the pool opened (requests, wait and usage time, connection
+        errors), or None if no pool has been created in this process.
+    """
+    if _pool is None:
+        return None
+    stats = dict.fromkeys(_POOL_COUNTERS, 0)
+    stats.update(_pool.get_stats())
+    return stats
+
+
 def get_table_name(index_name: str) -> str:
     """Get the PostgreSQL table name for an index.
 
@@ -87,6 +283,26 @@ def get_table_name(index_name: str) -> str:
     return f"{flow_name}__{target_name}"
 
 
+def get_symbols_table_name(index_name: str) -> str:
+    """Get the PostgreSQL table name of an index's symbols side table.
+
+    The flow exports one row per symbol per chunk to target
+    {index_name}_symbols, so CocoIndex names the table
+    codeindex_{index_name}__{index_name}_symbols.
+
+    Args:
+        index_name: The name of the search index.
+
+    Returns:
+        PostgreSQL table name following CocoIndex convention.
+
+    Raises:
+        ValueError: If index_name contains invalid characters.
+    """
+    validate_index_name(index_name)
+    return f"codeindex_{index_name}__{index_name}_symbols"
+
+
 def check_column_exists(table_name: str, column_name: str) -> bool:
     """Check if a column exists in a table.
 
@@ -97,9 +313,17 @@ def check_column_exists(table_name: str, column_name: str) -> bool:
         table_name: Full table name (e.g., "codeindex_myproject__myproject_chunks")
         column_name: Column name to check (e.g., "content_text")
 
+    Index tables (``codeindex_*``) are answered from the in-process index
+    catalog, so per-query feature checks don't reach ``information_schema``.
+
     Returns:
         True if column exists, False otherwise.
     """
+    if table_name.startswith("codeindex_"):
+        from cocosearch.search.catalog import table_has_column
+
+        return table_has_column(table_name, column_name)
+
     pool = get_connection_pool()
     with pool.connection() as conn:
         with conn.cursor() as cur:
@@ -169,3 +393,293 @@ def reset_symbol_columns_cache() -> None:
     """
     global _symbol_columns_available
     _symbol_columns_available = {}
+
+
+def check_line_columns_exist(table_name: str) -> bool:
+    """Check if stored line number columns exist in a table.
+
+    Uses module-level caching to avoid repeated database queries.
+    Indexes created before start_line/end_line were collected lack them;
+    callers then derive line numbers from byte offsets instead.
+
+    Args:
+        table_name: Full table name (e.g., "codeindex_myproject__myproject_chunks")
+
+    Returns:
+        True if both start_line and end_line columns exist.
+    """
+    if table_name in _line_columns_available:
+        return _line_columns_available[table_name]
+
+    pool = get_connection_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT column_name FROM information_schema.columns
+                WHERE table_name = %s AND column_name = ANY(%s)
+                """,
+                (table_name, ["start_line", "end_line"]),
+            )
+            existing = {row[0] for row in cur.fetchall()}
+
+    result = existing == {"start_line", "end_line"}
+    _line_columns_available[table_name] = result
+
+    if not result:
+        logger.info(f"Index {table_name} lacks stored line columns")
+
+    return result
+
+
+def reset_line_columns_cache() -> None:
+    """Reset the line columns availability cache.
+
+    Called after schema migration and by tests to ensure clean state.
+    """
+    global _line_columns_available
+    _line_columns_available = {}
+
+
+def check_symbols_table_exists(index_name: str) -> bool:
+    """Check if an index has the symbols side table.
+
+    Uses module-level caching to avoid repeated database queries.
+    Indexes built before the table was exported lack it; symbol filters
+    then match the chunk's own symbol columns instead.
+
+    Args:
+        index_name: The name of the search index.
+
+    Returns:
+        True if the symbols table exists.
+    """
+    if index_name in _symbols_table_available:
+        return _symbols_table_available[index_name]
+
+    table_name = get_symbols_table_name(index_name)
+    pool = get_connection_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT to_regclass(%s) IS NOT NULL", (table_name,))
+            row = cur.fetchone()
+
+    result = bool(row and row[0])
+    _symbols_table_available[index_name] = result
+
+    if not result:
+        logger.info(f"Index {index_name} lacks a symbols table")
+
+    return result
+
+
+def reset_symbols_table_cache() -> None:
+    """Reset the symbols table availability cache.
+
+    Called after flow setup and by tests to ensure clean state.
+    """
+    global _symbols_table_available
+    _symbols_table_available = {}
+
+
+def get_vector_search_settings() -> VectorSearchSettings:
+    """Get the vector index scan settings for search queries.
+
+    Resolved once per process with env > cocosearch.yaml > default
+    precedence (e.g. COCOSEARCH_SEARCH_HNSW_EF_SEARCH overrides
+    search.hnswEfSearch). An invalid config file falls back to defaults.
+
+    Returns:
+        VectorSearchSettings for the current process.
+    """
+    global _vector_search_settings
+    if _vector_search_settings is None:
+        resolve = _config_resolver("vector search settings")
+        _vector_search_settings = VectorSearchSettings(
+            hnsw_ef_search=resolve("search.hnswEfSearch"),
+            ivfflat_probes=resolve("search.ivfflatProbes"),
+            iterative_scan=resolve("search.iterativeScan"),
+            rerank_factor=resolve("search.rerankFactor"),
+        )
+    return _vector_search_settings
+
+
+def reset_vector_search_settings() -> None:
+    """Reset the resolved vector search settings and pgvector capability.
+
+    Used by tests to ensure clean state between test runs.
+    """
+    global _vector_search_settings, _iterative_scan_supported
+    _vector_search_settings = None
+    _iterative_scan_supported = None
+
+
+def _check_iterative_scan_supported(cur) -> bool:
+    """Check (once per process) whether pgvector supports iterative scans."""
+    global _iterative_scan_supported
+    if _iterative_scan_supported is None:
+        cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        row = cur.fetchone()
+        version = tuple(
+            int(part)
+            for part in (row[0] if row else "0").split(".")[:2]
+            if part.isdigit()
+        )
+        _iterative_scan_supported = version >= (0, 8)
+        if not _iterative_scan_supported:
+            logger.info("pgvector < 0.8: filtered vector search won't iterate scans")
+    return _iterative_scan_supported
+
+
+def apply_vector_search_settings(cur, filtered: bool) -> bool:
+    """Apply vector index scan settings to the current transaction.
+
+    Uses set_config(..., true), the parameterized form of SET LOCAL, so the
+    settings end with the search's transaction and never leak to other
+    users of the pooled connection. Nothing is sent when every setting is
+    at its default.
+
+    Filtered queries also enable pgvector's iterative index scans: the
+    index keeps returning candidates until the WHERE clause has let
+    through enough rows, instead of returning fewer than LIMIT results.
+
+    Args:
+        cur: Cursor whose transaction will run the vector query.
+        filtered: Whether the query has a WHERE clause.
+
+    Returns:
+        True if results may come back in relaxed order, in which case the
+        caller must re-sort them by score.
+    """
+    settings = get_vector_search_settings()
+    gucs: dict[str, str] = {}
+    if settings.hnsw_ef_search is not None:
+        gucs["hnsw.ef_search"] = str(settings.hnsw_ef_search)
+    if settings.ivfflat_probes is not None:
+        gucs["ivfflat.probes"] = str(settings.ivfflat_probes)
+
+    relaxed = False
+    if (
+        filtered
+        and settings.iterative_scan != "off"
+        and _check_iterative_scan_supported(cur)
+    ):
+        gucs["hnsw.iterative_scan"] = settings.iterative_scan
+        # IVFFlat only supports relaxed ordering
+        if settings.iterative_scan == "relaxed_order":
+            gucs["ivfflat.iterative_scan"] = settings.iterative_scan
+            relaxed = True
+
+    if gucs:
+        cur.execute(
+            "SELECT " + ", ".join(["set_config(%s, %s, true)"] * len(gucs)),
+            [item for pair in gucs.items() for item in pair],
+        )
+    return relaxed
+
+
+def get_vector_storage(table_name: str) -> VectorStorage:
+    """Detect how a table's embeddings are indexed.
+
+    Uses module-level caching to avoid repeated database queries. The mode
+    comes from the quantized expression index ``ensure_vector_storage``
+    creates (none means full precision), so searches always match the
+    index that actually exists.
+
+    Args:
+        table_name: Full table name (e.g., "codeindex_myproject__myproject_chunks")
+
+    Returns:
+        VectorStorage for the table.
+    """
+    if table_name in _vector_storage:
+        return _vector_storage[table_name]
+
+    storage = VectorStorage()
+    pool = get_connection_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT indexname FROM pg_indexes WHERE tablename = %s",
+                (table_name,),
+            )
+            index_names = {row[0] for row in cur.fetchall()}
+            for mode in ("halfvec", "binary"):
+                if f"idx_{table_name}_embedding_{mode}" in index_names:
+                    cur.execute(
+                        """
+                        SELECT atttypmod FROM pg_attribute
+                        WHERE attrelid = %s::regclass AND attname = 'embedding'
+                        """,
+                        (table_name,),
+                    )
+                    row = cur.fetchone()
+                    storage = VectorStorage(mode=mode, dimensions=row[0])
+                    break
+
+    _vector_storage[table_name] = storage
+    return storage
+
+
+def reset_vector_storage_cache() -> None:
+    """Reset the vector storage cache.
+
+    Called after schema migration and by tests to ensure clean state.
+    """
+    global _vector_storage
+    _vector_storage = {}
+
+
+def get_statement(key: Hashable, build: Callable[[], str]) -> str:
+    """Get a search statement from the registry, building it on first use.
+
+    Keys identify the statement, table and filter shape (e.g. the WHERE
+    clause with placeholders), never parameter values, so each distinct
+    SQL text is built once and stays byte-identical across calls, which
+    is what lets connections reuse its prepared statement.
+
+    Args:
+        key: Hashable statement key.
+        build: Returns the SQL text; called only on a registry miss.
+
+    Returns:
+        SQL text for the key.
+    """
+    with _statements_lock:
+        sql = _statements.get(key)
+        if sql is not None:
+            _statements.move_to_end(key)
+            return sql
+
+    sql = build()
+    with _statements_lock:
+        _statements[key] = sql
+        if len(_statements) > MAX_STATEMENTS:
+            _statements.popitem(last=False)
+    return sql
+
+
+def execute_statement(cur, sql: str, params: list) -> None:
+    """Execute a registry statement as a server-side prepared statement.
+
+    psycopg auto-prepares SQL a connection has run five times; ``prepare=True``
+    prepares registry statements on their first execution instead.
+
+    Args:
+        cur: Cursor of a pooled connection.
+        sql: SQL text from ``get_statement``.
+        params: Query parameters.
+    """
+    cur.execute(sql, params, prepare=True)
+
+
+def invalidate_statements() -> None:
+    """Drop registered statements after schema changes.
+
+    Called after schema migration and index removal, so statements are
+    rebuilt for the new schema. Plans already prepared on pooled
+    connections need no action: PostgreSQL revalidates them after DDL,
+    including DDL from other processes.
+    """
+    with _statements_lock:
+        _statements.clear()
@@ -0,0 +1,317 @@
+"""Query embedding cache for cocosearch.
+
+Every search needs the query embedded by Ollama, which is a blocking HTTP
+round-trip. The result cache (cache.py) keys on the full parameter set, so
+re-running a query with a different limit or filter would otherwise embed
+the same text again. This cache sits in front of ``code_to_embedding.eval``
+and is keyed only by (model, normalized text).
+
+Entries live in a bounded in-memory LRU and are optionally written through
+to a small SQLite database (as float32, the model's native precision), so
+CLI invocations start warm.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default cache directory (under user home)
+DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/cocosearch/embeddings")
+
+# Cache settings
+MAX_MEMORY_ENTRIES = 1024  # In-memory LRU bound (~6 KiB each for 768-dim)
+MAX_DISK_ENTRIES = 10000  # Oldest rows evicted beyond this count
+CACHE_DB_FILENAME = "embeddings.db"
+MAX_EMBED_WORKERS = 8  # Concurrent Ollama requests for batched queries
+DEFAULT_EMBEDDING_MODEL = "nomic-embed-text"  # Mirrors indexer/embedder.py
+
+
+def normalize_query_text(text: str) -> str:
+    """Normalize query text for embedding cache keys.
+
+    Strips and collapses whitespace only. Case is preserved because the
+    embedding model is case-sensitive.
+    """
+    return " ".join(text.split())
+
+
+def current_embedding_model() -> str:
+    """Return the embedding model name used for query embeddings."""
+    return os.environ.get("COCOSEARCH_EMBEDDING_MODEL", DEFAULT_EMBEDDING_MODEL)
+
+
+class EmbeddingCache:
+    """Bounded LRU cache of query embeddings with optional SQLite persistence.
+
+    Thread-safe: the MCP server embeds from worker threads.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_entries: int = MAX_MEMORY_ENTRIES,
+        persist: bool = True,
+        max_disk_entries: int = MAX_DISK_ENTRIES,
+    ):
+        """Initialize the embedding cache.
+
+        Args:
+            cache_dir: Directory for the persistent tier database.
+            max_entries: Maximum embeddings held in memory.
+            persist: Write entries through to SQLite under cache_dir.
+            max_disk_entries: Maximum rows kept in the persistent tier.
+        """
+        self._max_entries = max_entries
+        self._max_disk_entries = max_disk_entries
+        self._entries: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._db: sqlite3.Connection | None = None
+        if persist:
+            self._db = self._open_db(cache_dir)
+
+    def _open_db(self, cache_dir: str) -> sqlite3.Connection | None:
+        """Open the persistent tier, falling back to memory-only on error."""
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            db = sqlite3.connect(
+                os.path.join(cache_dir, CACHE_DB_FILENAME), check_same_thread=False
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, "
+                "text TEXT NOT NULL, "
+                "embedding BLOB NOT NULL, "
+                "last_used INTEGER NOT NULL, "
+                "PRIMARY KEY (model, text))"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used "
+                "ON embeddings (last_used)"
+            )
+            db.commit()
+            return db
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Embedding cache persistence disabled: {e}")
+            return None
+
+    def _disk_get(self, key: tuple[str, str]) -> np.ndarray | None:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT embedding FROM embeddings WHERE model = ? AND text = ?", key
+            ).fetchone()
+            if row is not None:
+                # Mark as most recently used so eviction is LRU, not FIFO
+                self._db.execute(
+                    "UPDATE embeddings SET last_used = "
+                    "(SELECT MAX(last_used) + 1 FROM embeddings) "
+                    "WHERE model = ? AND text = ?",
+                    key,
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32).astype(np.float64)
+
+    def _disk_put(self, key: tuple[str, str], embedding: np.ndarray) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO embeddings (model, text, embedding, last_used) "
+                "VALUES (?, ?, ?, "
+                "(SELECT COALESCE(MAX(last_used), 0) + 1 FROM embeddings))",
+                (*key, embedding.astype(np.float32).tobytes()),
+            )
+            self._db.execute(
+                "DELETE FROM embeddings WHERE rowid IN ("
+                "SELECT rowid FROM embeddings ORDER BY last_used DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self._max_disk_entries,),
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache write failed: {e}")
+
+    def _remember(self, key: tuple[str, str], embedding: np.ndarray) -> None:
+        """Insert into the memory LRU, evicting the least recently used."""
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, text: str, model: str | None = None) -> list[float] | None:
+        """Look up a cached embedding without computing it.
+
+        Args:
+            text: Query text (normalized before lookup).
+            model: Embedding model name (defaults to the configured model).
+
+        Returns:
+            The embedding, or None if not cached.
+        """
+        key = (model or current_embedding_model(), normalize_query_text(text))
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+            else:
+                embedding = self._disk_get(key)
+                if embedding is not None:
+                    self._remember(key, embedding)
+            if embedding is None:
+                return None
+        return embedding.tolist()
+
+    def put(self, text: str, embedding: Any, model: str | None = None) -> np.ndarray:
+        """Store an embedding for the given text.
+
+        Args:
+            text: Query text (normalized before storing).
+            embedding: Embedding vector (list or array of floats).
+            model: Embedding model name (defaults to the configured model).
+
+        Returns:
+            The stored vector.
+        """
+        key = (model or current_embedding_model(), normalize_query_text(text))
+        vector = np.asarray(embedding, dtype=np.float64)
+        with self._lock:
+            self._remember(key, vector)
+            self._disk_put(key, vector)
+        return vector
+
+    def get_or_embed(
+        self,
+        text: str,
+        embed_fn: Callable[[str], Any],
+        model: str | None = None,
+    ) -> list[float]:
+        """Return the cached embedding for text, computing it on a miss.
+
+        Args:
+            text: Query text to embed.
+            embed_fn: Function that embeds text (e.g. code_to_embedding.eval).
+            model: Embedding model name (defaults to the configured model).
+
+        Returns:
+            The query embedding.
+        """
+        cached = self.get(text, model=model)
+        if cached is not None:
+            with self._lock:
+                self.hits += 1
+            return cached
+
+        with self._lock:
+            self.misses += 1
+        return self.put(text, embed_fn(text), model=model).tolist()
+
+    def clear(self) -> None:
+        """Drop all cached embeddings (memory and disk) and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM embeddings")
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.debug(f"Embedding cache clear failed: {e}")
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "persistent": self._db is not None,
+            }
+
+
+# Global embedding cache instance
+_embedding_cache: EmbeddingCache | None = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get or create the global embedding cache singleton."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        with _embedding_cache_lock:
+            if _embedding_cache is None:
+                _embedding_cache = EmbeddingCache()
+    return _embedding_cache
+
+
+def embed_query(text: str, embed_fn: Callable[[str], Any]) -> list[float]:
+    """Embed a search query through the global embedding cache.
+
+    Args:
+        text: Query text to embed.
+        embed_fn: Function that embeds text (e.g. code_to_embedding.eval).
+
+    Returns:
+        The query embedding.
+    """
+    return get_embedding_cache().get_or_embed(text, embed_fn)
+
+
+def embed_queries(
+    texts: list[str], embed_fn: Callable[[str], Any]
+) -> list[list[float]]:
+    """Embed several search queries through the global embedding cache.
+
+    Duplicate texts (after normalization) are embedded once, and cache
+    misses are embedded concurrently, so a batch costs roughly one Ollama
+    round-trip instead of one per query.
+
+    Args:
+        texts: Query texts to embed.
+        embed_fn: Function that embeds a single text (e.g. code_to_embedding.eval).
+
+    Returns:
+        One embedding per input text, in input order.
+    """
+    cache = get_embedding_cache()
+    unique: dict[str, str] = {}
+    for text in texts:
+        unique.setdefault(normalize_query_text(text), text)
+
+    embeddings: dict[str, list[float]] = {}
+    if len(unique) <= 1:
+        for key, text in unique.items():
+            embeddings[key] = cache.get_or_embed(text, embed_fn)
+    else:
+        workers = min(len(unique), MAX_EMBED_WORKERS)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="cocosearch-embed"
+        ) as executor:
+            futures = {
+                key: executor.submit(cache.get_or_embed, text, embed_fn)
+                for key, text in unique.items()
+            }
+            embeddings = {key: future.result() for key, future in futures.items()}
+
+    return [embeddings[normalize_query_text(text)] for text in texts]
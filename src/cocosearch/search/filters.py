@@ -51,20 +51,54 @@ def glob_to_sql_pattern(glob_pattern: str) -> str:
     return result
 
 
+def _name_condition(columns: tuple[str, ...], symbol_name: str) -> tuple[str, list]:
+    """Build a name condition that the filter indexes can serve.
+
+    A name without wildcards compares lower() values, served by the btree
+    indexes on lower(column). Glob patterns use ILIKE, served by pg_trgm
+    GIN indexes when the extension is installed (and scanned otherwise).
+
+    Args:
+        columns: Name columns to match; any of them may match.
+        symbol_name: Exact name or glob pattern.
+
+    Returns:
+        Tuple of (condition, params).
+    """
+    if "*" in symbol_name or "?" in symbol_name:
+        template, value = "{} ILIKE %s", glob_to_sql_pattern(symbol_name)
+    else:
+        template, value = "lower({}) = lower(%s)", symbol_name
+
+    conditions = [template.format(column) for column in columns]
+    if len(conditions) == 1:
+        return conditions[0], [value]
+    return f"({' OR '.join(conditions)})", [value] * len(conditions)
+
+
 def build_symbol_where_clause(
     symbol_type: str | list[str] | None = None,
     symbol_name: str | None = None,
+    symbols_table: str | None = None,
 ) -> tuple[str, list]:
     """Build parameterized SQL WHERE clause for symbol filtering.
 
     Generates SQL conditions for filtering by symbol type and/or name.
     Returns a tuple of (where_clause, params) for use with parameterized queries.
 
+    Without ``symbols_table`` the conditions test the chunk's own (first)
+    symbol columns. With it, they become a semi-join on the index's symbols
+    side table, so a chunk matches on any symbol it contains and the lookup
+    can use that table's indexes.
+
     Args:
         symbol_type: Single type string, list of types, or None.
             Valid types: "function", "class", "method", "interface"
         symbol_name: Glob pattern for symbol name, or None.
-            Supports * (any chars) and ? (single char) wildcards.
+            Supports * (any chars) and ? (single char) wildcards; a name
+            without wildcards is matched exactly (case-insensitive).
+        symbols_table: Symbols side table name (see
+            ``cocosearch.search.db.get_symbols_table_name``), or None.
 
     Returns:
         Tuple of (where_clause, params):
@@ -84,6 +118,9 @@ def build_symbol_where_clause(
         >>> build_symbol_where_clause(symbol_name="get*")
         ('symbol_name ILIKE %s', ['get%'])
 
+        >>> build_symbol_where_clause(symbol_name="get_user")
+        ('lower(symbol_name) = lower(%s)', ['get_user'])
+
         >>> build_symbol_where_clause(symbol_type="function", symbol_name="get*")
         ('symbol_type = %s AND symbol_name ILIKE %s', ['function', 'get%'])
 
@@ -93,7 +130,7 @@ def build_symbol_where_clause(
     conditions = []
     params = []
 
-    # Handle symbol_type filter
+    types = None
     if symbol_type is not None:
         # Normalize to list
         types = [symbol_type] if isinstance(symbol_type, str) else list(symbol_type)
@@ -107,6 +144,11 @@ def build_symbol_where_clause(
                 f"Valid types: {valid_list}"
             )
 
+    if symbols_table is not None and (types or symbol_name is not None):
+        return _build_symbols_table_clause(types, symbol_name, symbols_table)
+
+    # Handle symbol_type filter
+    if types:
         if len(types) == 1:
             conditions.append("symbol_type = %s")
             params.append(types[0])
@@ -117,10 +159,39 @@ def build_symbol_where_clause(
 
     # Handle symbol_name filter
     if symbol_name is not None:
-        sql_pattern = glob_to_sql_pattern(symbol_name)
-        conditions.append("symbol_name ILIKE %s")
-        params.append(sql_pattern)
+        condition, name_params = _name_condition(("symbol_name",), symbol_name)
+        conditions.append(condition)
+        params.extend(name_params)
 
     # Combine conditions with AND
     where_clause = " AND ".join(conditions)
     return where_clause, params
+
+
+def _build_symbols_table_clause(
+    types: list[str] | None, symbol_name: str | None, symbols_table: str
+) -> tuple[str, list]:
+    """Build a semi-join condition on the symbols side table.
+
+    Names match either the bare or the qualified symbol name.
+    """
+    conditions = []
+    params: list = []
+
+    if types:
+        placeholders = ", ".join(["%s"] * len(types))
+        conditions.append(f"symbol_type IN ({placeholders})")
+        params.extend(types)
+
+    if symbol_name is not None:
+        condition, name_params = _name_condition(
+            ("name", "qualified_name"), symbol_name
+        )
+        conditions.append(condition)
+        params.extend(name_params)
+
+    where_clause = (
+        f"(filename, location) IN (SELECT filename, location FROM {symbols_table} "
+        f"WHERE {' AND '.join(conditions)})"
+    )
+    return where_clause, params
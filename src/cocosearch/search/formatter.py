@@ -16,6 +16,28 @@ from cocosearch.search.query import SearchResult
 from cocosearch.search.utils import byte_to_line, read_chunk_content
 
 
+def _line_span(r: SearchResult) -> tuple[int, int]:
+    """Return the 1-based (start_line, end_line) of a result.
+
+    Line numbers stored at index time are used as-is. Otherwise they are
+    derived from byte offsets; with stored chunk text the end line follows
+    from its newline count, saving a second scan of the file.
+    """
+    if r.start_line is not None and r.end_line is not None:
+        return r.start_line, r.end_line
+    start_line = byte_to_line(r.filename, r.start_byte)
+    if r.content is not None:
+        return start_line, start_line + r.content.count("\n") if start_line else 0
+    return start_line, byte_to_line(r.filename, r.end_byte)
+
+
+def _chunk_content(r: SearchResult) -> str:
+    """Return a result's chunk text, reading the source file only if needed."""
+    if r.content is not None:
+        return r.content
+    return read_chunk_content(r.filename, r.start_byte, r.end_byte)
+
+
 def format_json(
     results: list[SearchResult],
     context_lines: int | None = None,
@@ -52,8 +74,7 @@ def format_json(
 
     output = []
     for r in results:
-        start_line = byte_to_line(r.filename, r.start_byte)
-        end_line = byte_to_line(r.filename, r.end_byte)
+        start_line, end_line = _line_span(r)
 
         item = {
             "file_path": r.filename,
@@ -82,7 +103,7 @@ def format_json(
             item["symbol_signature"] = r.symbol_signature
 
         if include_content:
-            item["content"] = read_chunk_content(r.filename, r.start_byte, r.end_byte)
+            item["content"] = _chunk_content(r)
 
             if should_expand_context and expander is not None:
                 # Use ContextExpander for smart or explicit context
@@ -280,8 +301,7 @@ def format_pretty(
         console.print(f"[bold blue]{rel_path}[/bold blue]")
 
         for r in file_results:
-            start_line = byte_to_line(r.filename, r.start_byte)
-            end_line = byte_to_line(r.filename, r.end_byte)
+            start_line, end_line = _line_span(r)
 
             # Build match type indicator for hybrid search results
             match_indicator = ""
@@ -360,7 +380,7 @@ def format_pretty(
                     console.print("[dim]  [End of file][/dim]")
             else:
                 # No context expansion - show content with syntax highlighting (legacy mode)
-                content = read_chunk_content(r.filename, r.start_byte, r.end_byte)
+                content = _chunk_content(r)
                 if content:
                     lexer = _PYGMENTS_LEXER_MAP.get(display_lang, display_lang)
                     try:
@@ -10,15 +10,28 @@ RRF is chosen over score normalization because:
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
 from cocosearch.indexer.embedder import code_to_embedding
 from cocosearch.search.db import (
+    apply_vector_search_settings,
     check_column_exists,
+    check_line_columns_exist,
     check_symbol_columns_exist,
+    check_symbols_table_exists,
+    execute_statement,
     get_connection_pool,
+    get_statement,
+    get_symbols_table_name,
     get_table_name,
+    get_vector_search_settings,
+    VectorStorage,
+    get_vector_storage,
 )
+from cocosearch.search.embedding_cache import embed_query
 from cocosearch.search.filters import build_symbol_where_clause
 from cocosearch.search.query_analyzer import normalize_query_for_keyword
 
@@ -36,6 +49,21 @@ DEFINITION_BOOST_MULTIPLIER = 2.0
 # Fetching more candidates improves fusion quality at modest cost.
 MAX_PREFETCH = 100
 
+# Per-leg timeouts (seconds) for concurrent hybrid search. The vector leg
+# includes the Ollama embedding round-trip, so it gets the larger budget.
+# A timed-out keyword leg degrades to vector-only; a timed-out vector leg
+# fails the search.
+VECTOR_LEG_TIMEOUT = 30.0
+KEYWORD_LEG_TIMEOUT = 10.0
+
+# Worker threads shared by all concurrent hybrid searches: two legs for each
+# of the MCP server's default 8 search workers (COCOSEARCH_MCP_WORKERS), so
+# legs don't queue here. A queued leg's wait counts against its timeout.
+SEARCH_EXECUTOR_WORKERS = 16
+
+_search_executor: ThreadPoolExecutor | None = None
+_search_executor_lock = threading.Lock()
+
 
 @dataclass
 class KeywordResult:
@@ -46,12 +74,18 @@ class KeywordResult:
         start_byte: Start byte offset of the chunk in the file.
         end_byte: End byte offset of the chunk in the file.
         ts_rank: PostgreSQL ts_rank score (0-1 scale, higher = better match).
+        content: Chunk text from the content_text column (None if not selected).
+        start_line: Stored 1-based start line (None if not selected or not stored).
+        end_line: Stored 1-based end line (None if not selected or not stored).
     """
 
     filename: str
     start_byte: int
     end_byte: int
     ts_rank: float
+    content: str | None = None
+    start_line: int | None = None
+    end_line: int | None = None
 
 
 @dataclass
@@ -69,6 +103,9 @@ class VectorResult:
         symbol_type: Symbol type ("function", "class", "method", "interface", or None).
         symbol_name: Symbol name (e.g., "process_data", or None).
         symbol_signature: Symbol signature (e.g., "def process_data(items: list)", or None).
+        content: Chunk text from the content_text column (None if not selected).
+        start_line: Stored 1-based start line (None if not selected or not stored).
+        end_line: Stored 1-based end line (None if not selected or not stored).
     """
 
     filename: str
@@ -81,6 +118,9 @@ class VectorResult:
     symbol_type: str | None = None
     symbol_name: str | None = None
     symbol_signature: str | None = None
+    content: str | None = None
+    start_line: int | None = None
+    end_line: int | None = None
 
 
 @dataclass
@@ -101,6 +141,9 @@ class HybridSearchResult:
         symbol_type: Symbol type ("function", "class", "method", "interface", or None).
         symbol_name: Symbol name (e.g., "process_data", or None).
         symbol_signature: Symbol signature (e.g., "def process_data(items: list)", or None).
+        content: Chunk text from the content_text column (None if not selected).
+        start_line: Stored 1-based start line (None if not selected or not stored).
+        end_line: Stored 1-based end line (None if not selected or not stored).
     """
 
     filename: str
@@ -116,6 +159,9 @@ class HybridSearchResult:
     symbol_type: str | None = None
     symbol_name: str | None = None
     symbol_signature: str | None = None
+    content: str | None = None
+    start_line: int | None = None
+    end_line: int | None = None
 
 
 def _make_result_key(filename: str, start_byte: int, end_byte: int) -> str:
@@ -123,12 +169,60 @@ def _make_result_key(filename: str, start_byte: int, end_byte: int) -> str:
     return f"{filename}:{start_byte}:{end_byte}"
 
 
+def get_search_executor() -> ThreadPoolExecutor:
+    """Get or create the thread pool used to run hybrid search legs.
+
+    search() and search_many() also submit their keyword legs here, so the
+    legs overlap with query embedding.
+
+    Uses double-checked locking, mirroring get_connection_pool().
+    """
+    global _search_executor
+    if _search_executor is None:
+        with _search_executor_lock:
+            if _search_executor is None:
+                _search_executor = ThreadPoolExecutor(
+                    max_workers=SEARCH_EXECUTOR_WORKERS,
+                    thread_name_prefix="cocosearch-hybrid",
+                )
+    return _search_executor
+
+
+def _set_statement_timeout(cur, timeout: float | None) -> None:
+    """Bound the current transaction's statements to ``timeout`` seconds.
+
+    Lets PostgreSQL cancel a query whose caller has already given up on it,
+    so an abandoned search leg doesn't keep holding a pooled connection.
+    """
+    if timeout is not None:
+        cur.execute(
+            "SELECT set_config('statement_timeout', %s, true)",
+            (str(int(timeout * 1000)),),
+        )
+
+
+def _content_columns(table_name: str, include_content: bool) -> tuple[str, bool]:
+    """Return the extra SELECT columns used to render results.
+
+    content_text, followed by start_line/end_line when the index stores
+    them. Returns the column list (with a leading comma, or "" when content
+    isn't requested) and whether the line columns are included.
+    """
+    if not include_content:
+        return "", False
+    if check_line_columns_exist(table_name):
+        return ", content_text, start_line, end_line", True
+    return ", content_text", False
+
+
 def execute_keyword_search(
     query: str,
     table_name: str,
     limit: int = 10,
     where_clause: str = "",
     where_params: list | None = None,
+    statement_timeout: float | None = None,
+    include_content: bool = False,
 ) -> list[KeywordResult]:
     """Execute keyword search using PostgreSQL full-text search.
 
@@ -141,6 +235,9 @@ def execute_keyword_search(
         limit: Maximum results to return.
         where_clause: Optional SQL condition (without "WHERE") to filter results.
         where_params: Optional list of parameters for where_clause placeholders.
+        statement_timeout: Optional server-side timeout in seconds for the query.
+        include_content: Also select content_text (chunk text) and, when the
+            index stores them, start_line/end_line for each result.
 
     Returns:
         List of KeywordResult ordered by ts_rank (highest first).
@@ -163,20 +260,24 @@ def execute_keyword_search(
     if where_clause:
         where_parts.append(f"({where_clause})")
     full_where = " AND ".join(where_parts)
+    content_cols, include_lines = _content_columns(table_name, include_content)
 
     # Build tsquery using plainto_tsquery (handles spaces, simple matching)
     # Using 'simple' config for consistency with indexing (no stemming)
-    sql = f"""
+    sql = get_statement(
+        ("keyword", table_name, where_clause, content_cols),
+        lambda: f"""
         SELECT
             filename,
             lower(location) as start_byte,
             upper(location) as end_byte,
-            ts_rank(content_tsv, plainto_tsquery('simple', %s)) as rank
+            ts_rank(content_tsv, plainto_tsquery('simple', %s)) as rank{content_cols}
         FROM {table_name}
         WHERE {full_where}
         ORDER BY rank DESC
         LIMIT %s
-    """
+    """,
+    )
 
     # Build parameters: normalized (for ts_rank), normalized (for tsquery), where_params, limit
     params: list = [normalized, normalized]
@@ -187,7 +288,8 @@ def execute_keyword_search(
     with pool.connection() as conn:
         with conn.cursor() as cur:
             try:
-                cur.execute(sql, params)
+                _set_statement_timeout(cur, statement_timeout)
+                execute_statement(cur, sql, params)
                 rows = cur.fetchall()
             except Exception as e:
                 # Log at warning level and fall back to vector-only.
@@ -203,23 +305,84 @@ def execute_keyword_search(
             start_byte=int(row[1]),
             end_byte=int(row[2]),
             ts_rank=float(row[3]),
+            content=row[4] if include_content else None,
+            start_line=row[5] if include_lines else None,
+            end_line=row[6] if include_lines else None,
         )
         for row in rows
     ]
 
 
+def build_vector_source(
+    table_name: str, storage: VectorStorage, where_sql: str, query_vector: str
+) -> str:
+    """Build the FROM source of a nearest-neighbour query.
+
+    For full-precision storage this is the table and its WHERE clause. For
+    quantized storage (see ``VectorStorage``) it is a subquery taking the
+    top ``limit * rerankFactor`` candidates by the quantized expression, so
+    the quantized index serves the scan; the caller's ORDER BY on the
+    full-precision embedding then re-ranks them.
+
+    Callers resolve ``storage`` once per search and pass the same object
+    to ``vector_source_params`` (and into the statement key), so the SQL
+    and its parameters always agree even if the storage cache is reset
+    by a concurrent indexing run.
+
+    Args:
+        table_name: PostgreSQL table name.
+        storage: The table's vector storage (``get_vector_storage``).
+        where_sql: WHERE clause (with "WHERE" keyword) or empty string.
+        query_vector: SQL expression of the query vector.
+
+    Returns:
+        Source SQL; its parameters come from ``vector_source_params``.
+    """
+    if not storage.quantized:
+        return f"{table_name}\n        {where_sql}"
+
+    return f"""(
+            SELECT * FROM {table_name}
+            {where_sql}
+            ORDER BY {storage.candidate_order_sql(query_vector)}
+            LIMIT %s
+        ) AS candidates"""
+
+
+def vector_source_params(
+    storage: VectorStorage, query_params: list, limit: int
+) -> list:
+    """Parameters of ``build_vector_source`` that follow the where params.
+
+    Args:
+        storage: The storage the statement was built for.
+        query_params: Parameters consumed by the query vector expression.
+        limit: Number of results the caller will return.
+
+    Returns:
+        Empty for full-precision storage; otherwise the query vector
+        parameters and the candidate count.
+    """
+    if not storage.quantized:
+        return []
+    return [*query_params, limit * get_vector_search_settings().rerank_factor]
+
+
 def execute_vector_search(
     query: str,
     table_name: str,
     limit: int = 10,
     where_clause: str = "",
     where_params: list | None = None,
+    statement_timeout: float | None = None,
+    query_embedding: list[float] | None = None,
+    include_content: bool = False,
 ) -> list[VectorResult]:
     """Execute vector similarity search.
 
-    Embeds the query and performs cosine similarity search against
-    the embedding column. Automatically includes symbol columns
-    when available (v1.7+ indexes).
+    Embeds the query (unless an embedding is supplied) and performs cosine
+    similarity search against the embedding column. Automatically includes
+    symbol columns when available (v1.7+ indexes).
 
     Args:
         query: Search query (will be embedded).
@@ -227,14 +390,19 @@ def execute_vector_search(
         limit: Maximum results to return.
         where_clause: Optional SQL condition (without "WHERE") to filter results.
         where_params: Optional list of parameters for where_clause placeholders.
+        statement_timeout: Optional server-side timeout in seconds for the query.
+        query_embedding: Pre-computed query embedding (skips re-embedding).
+        include_content: Also select content_text (chunk text) and, when the
+            index stores them, start_line/end_line for each result.
 
     Returns:
         List of VectorResult ordered by similarity (highest first).
     """
     pool = get_connection_pool()
 
-    # Embed query
-    query_embedding = code_to_embedding.eval(query)
+    # Embed query unless the caller already did
+    if query_embedding is None:
+        query_embedding = embed_query(query, code_to_embedding.eval)
 
     # Build WHERE clause if provided
     where_sql = f"WHERE {where_clause}" if where_clause else ""
@@ -256,51 +424,82 @@ def execute_vector_search(
             symbol_type,
             symbol_name,
             symbol_signature"""
-
-    # Query with metadata columns
-    sql = f"""
+    content_cols, include_lines = _content_columns(table_name, include_content)
+    select_cols += content_cols
+
+    # Query with metadata columns; SQL and params share one storage lookup
+    storage = get_vector_storage(table_name)
+    sql = get_statement(
+        ("vector", table_name, storage, where_clause, select_cols),
+        lambda: f"""
         SELECT{select_cols}
-        FROM {table_name}
-        {where_sql}
+        FROM {build_vector_source(table_name, storage, where_sql, "%s::vector")}
         ORDER BY embedding <=> %s::vector
         LIMIT %s
-    """
+    """,
+    )
 
-    # Build parameters: embedding (for score), where_params, embedding (for ORDER BY), limit
+    # Build parameters: embedding (for score), where_params, quantized
+    # candidate params, embedding (for ORDER BY), limit
     params: list = [query_embedding]
     if where_params:
         params.extend(where_params)
+    params.extend(vector_source_params(storage, [query_embedding], limit))
     params.extend([query_embedding, limit])
 
     with pool.connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, params)
+            _set_statement_timeout(cur, statement_timeout)
+            relaxed = apply_vector_search_settings(cur, filtered=bool(where_clause))
+            execute_statement(cur, sql, params)
             rows = cur.fetchall()
+    if relaxed:
+        rows.sort(key=lambda row: row[3], reverse=True)
 
     # Build results, including symbol columns when available
     return [
-        VectorResult(
-            filename=row[0],
-            start_byte=int(row[1]),
-            end_byte=int(row[2]),
-            score=float(row[3]),
-            block_type=row[4] if row[4] else "",
-            hierarchy=row[5] if row[5] else "",
-            language_id=row[6] if row[6] else "",
-            **(
-                {
-                    "symbol_type": row[7] if row[7] else None,
-                    "symbol_name": row[8] if row[8] else None,
-                    "symbol_signature": row[9] if row[9] else None,
-                }
-                if include_symbol_columns
-                else {}
-            ),
+        _vector_result_from_row(
+            row, include_symbol_columns, include_content, include_lines
         )
         for row in rows
     ]
 
 
+def _vector_result_from_row(
+    row,
+    include_symbol_columns: bool,
+    include_content: bool = False,
+    include_lines: bool = False,
+) -> VectorResult:
+    """Build a VectorResult from a vector leg row.
+
+    Row layout: metadata columns, then symbol columns, content_text and
+    start_line/end_line when selected.
+    """
+    content_idx = 10 if include_symbol_columns else 7
+    return VectorResult(
+        filename=row[0],
+        start_byte=int(row[1]),
+        end_byte=int(row[2]),
+        score=float(row[3]),
+        block_type=row[4] if row[4] else "",
+        hierarchy=row[5] if row[5] else "",
+        language_id=row[6] if row[6] else "",
+        **(
+            {
+                "symbol_type": row[7] if row[7] else None,
+                "symbol_name": row[8] if row[8] else None,
+                "symbol_signature": row[9] if row[9] else None,
+            }
+            if include_symbol_columns
+            else {}
+        ),
+        content=row[content_idx] if include_content else None,
+        start_line=row[content_idx + 1] if include_lines else None,
+        end_line=row[content_idx + 2] if include_lines else None,
+    )
+
+
 def rrf_fusion(
     vector_results: list[VectorResult],
     keyword_results: list[KeywordResult],
@@ -355,6 +554,9 @@ def rrf_fusion(
         symbol_type: str | None = None
         symbol_name: str | None = None
         symbol_signature: str | None = None
+        content: str | None = None
+        start_line: int | None = None
+        end_line: int | None = None
 
         # Get filename and byte positions from either source
         if key in vector_by_key:
@@ -367,6 +569,9 @@ def rrf_fusion(
             symbol_type = v_result.symbol_type
             symbol_name = v_result.symbol_name
             symbol_signature = v_result.symbol_signature
+            content = v_result.content
+            start_line = v_result.start_line
+            end_line = v_result.end_line
             filename = v_result.filename
             start_byte = v_result.start_byte
             end_byte = v_result.end_byte
@@ -376,6 +581,11 @@ def rrf_fusion(
             k_rank, k_result = keyword_by_key[key]
             rrf_score += 1 / (k + k_rank)
             keyword_score = k_result.ts_rank
+            if content is None:
+                content = k_result.content
+            if start_line is None:
+                start_line = k_result.start_line
+                end_line = k_result.end_line
 
             # If we already have vector result, this is "both"
             if match_type == "semantic":
@@ -401,6 +611,9 @@ def rrf_fusion(
                 symbol_type=symbol_type,
                 symbol_name=symbol_name,
                 symbol_signature=symbol_signature,
+                content=content,
+                start_line=start_line,
+                end_line=end_line,
             )
         )
 
@@ -464,6 +677,9 @@ def apply_definition_boost(
                     symbol_type=result.symbol_type,
                     symbol_name=result.symbol_name,
                     symbol_signature=result.symbol_signature,
+                    content=result.content,
+                    start_line=result.start_line,
+                    end_line=result.end_line,
                 )
             )
         else:
@@ -479,6 +695,99 @@ def apply_definition_boost(
     return boosted_results
 
 
+def execute_legs_concurrently(
+    query: str,
+    table_name: str,
+    vector_limit: int,
+    keyword_limit: int,
+    where_clause: str = "",
+    where_params: list | None = None,
+    vector_timeout: float = VECTOR_LEG_TIMEOUT,
+    keyword_timeout: float = KEYWORD_LEG_TIMEOUT,
+    query_embedding: list[float] | None = None,
+    include_content: bool = False,
+    keyword_future: Future | None = None,
+) -> tuple[list[VectorResult], list[KeywordResult]]:
+    """Run the vector and keyword legs of a hybrid search in parallel.
+
+    The keyword leg doesn't depend on the query embedding, so it overlaps
+    with the embedding round-trip and the vector scan. Each leg runs on its
+    own pooled connection with a server-side statement timeout matching
+    its wait budget.
+
+    Args:
+        query: Search query.
+        table_name: PostgreSQL table name.
+        vector_limit: Maximum vector results to fetch.
+        keyword_limit: Maximum keyword results to fetch.
+        where_clause: Optional SQL condition (without "WHERE") for both legs.
+        where_params: Optional list of parameters for where_clause placeholders.
+        vector_timeout: Seconds to wait for the vector leg (embedding included).
+        keyword_timeout: Seconds to wait for the keyword leg.
+        query_embedding: Pre-computed query embedding for the vector leg.
+        include_content: Have both legs select content_text (and stored lines).
+        keyword_future: Keyword leg already submitted by the caller (with the
+            same query, limit and filters); used instead of submitting one.
+
+    Returns:
+        Tuple of (vector_results, keyword_results). keyword_results is empty
+        if the keyword leg timed out.
+
+    Raises:
+        TimeoutError: If the vector leg doesn't finish within vector_timeout.
+    """
+    executor = get_search_executor()
+    started = time.monotonic()
+
+    if keyword_future is None:
+        keyword_future = executor.submit(
+            execute_keyword_search,
+            query,
+            table_name,
+            keyword_limit,
+            where_clause,
+            where_params,
+            statement_timeout=keyword_timeout,
+            include_content=include_content,
+        )
+    vector_future = executor.submit(
+        execute_vector_search,
+        query,
+        table_name,
+        vector_limit,
+        where_clause,
+        where_params,
+        statement_timeout=vector_timeout,
+        query_embedding=query_embedding,
+        include_content=include_content,
+    )
+
+    try:
+        vector_results = vector_future.result(timeout=vector_timeout)
+    except TimeoutError:
+        vector_future.cancel()
+        keyword_future.cancel()
+        raise TimeoutError(
+            f"Vector search did not complete within {vector_timeout:.1f}s"
+        ) from None
+    except BaseException:
+        keyword_future.cancel()
+        raise
+
+    remaining = keyword_timeout - (time.monotonic() - started)
+    try:
+        keyword_results = keyword_future.result(timeout=max(remaining, 0.0))
+    except TimeoutError:
+        keyword_future.cancel()
+        logger.warning(
+            f"Keyword search did not complete within {keyword_timeout:.1f}s "
+            "(falling back to vector-only)"
+        )
+        keyword_results = []
+
+    return vector_results, keyword_results
+
+
 def hybrid_search(
     query: str,
     index_name: str,
@@ -486,6 +795,10 @@ def hybrid_search(
     symbol_type: str | list[str] | None = None,
     symbol_name: str | None = None,
     language_filter: str | None = None,
+    concurrent: bool = True,
+    query_embedding: list[float] | None = None,
+    include_content: bool = False,
+    keyword_future: Future | None = None,
 ) -> list[HybridSearchResult]:
     """Execute hybrid search combining vector and keyword matching.
 
@@ -502,21 +815,101 @@ def hybrid_search(
         symbol_name: Filter by symbol name using glob pattern (supports * and ?).
         language_filter: Filter by language via filename extension pattern.
             Format: comma-separated language names (e.g., "python,javascript").
+        concurrent: Run the vector and keyword legs in parallel (default True).
+            When False, the legs run one after the other without timeouts.
+        query_embedding: Pre-computed query embedding. When None, the vector
+            leg embeds the query itself (overlapping with the keyword leg).
+        include_content: Select content_text (and stored line numbers) so results
+            render without reading source files.
+        keyword_future: Keyword leg the caller already submitted to the
+            search executor (see search()), so it could run while the caller
+            embedded the query. Its results replace a fresh keyword search.
 
     Returns:
         List of HybridSearchResult ordered by combined score (highest first).
         Falls back to vector-only results if keyword search unavailable.
+
+    Raises:
+        TimeoutError: If concurrent and the vector leg exceeds VECTOR_LEG_TIMEOUT.
     """
     table_name = get_table_name(index_name)
 
-    # Build WHERE clause for symbol filters (applied before fusion)
+    # Build WHERE clause for symbol and language filters (applied before fusion)
+    where_clause, where_params = build_filter_clause(
+        symbol_type, symbol_name, language_filter, index_name=index_name
+    )
+
+    # Execute both searches
+    # Request more results from each to have better fusion
+    vector_limit = min(limit * 2, MAX_PREFETCH)
+    keyword_limit = min(limit * 2, MAX_PREFETCH)
+
+    if concurrent:
+        vector_results, keyword_results = execute_legs_concurrently(
+            query,
+            table_name,
+            vector_limit,
+            keyword_limit,
+            where_clause,
+            where_params if where_params else None,
+            query_embedding=query_embedding,
+            include_content=include_content,
+            keyword_future=keyword_future,
+        )
+    else:
+        vector_results = execute_vector_search(
+            query,
+            table_name,
+            vector_limit,
+            where_clause,
+            where_params if where_params else None,
+            query_embedding=query_embedding,
+            include_content=include_content,
+        )
+        if keyword_future is not None:
+            keyword_results = keyword_future.result()
+        else:
+            keyword_results = execute_keyword_search(
+                query,
+                table_name,
+                keyword_limit,
+                where_clause,
+                where_params if where_params else None,
+                include_content=include_content,
+            )
+
+    return fuse_results(vector_results, keyword_results, index_name, limit)
+
+
+def build_filter_clause(
+    symbol_type: str | list[str] | None = None,
+    symbol_name: str | None = None,
+    language_filter: str | None = None,
+    index_name: str | None = None,
+) -> tuple[str, list]:
+    """Build the shared WHERE condition for symbol and language filters.
+
+    Args:
+        symbol_type: Filter by symbol type. Single string or list of types.
+        symbol_name: Filter by symbol name using glob pattern.
+        language_filter: Comma-separated language names.
+        index_name: Index being searched. When it has a symbols side table,
+            symbol filters match any symbol in a chunk through that table.
+
+    Returns:
+        Tuple of (where_clause, where_params). where_clause has no "WHERE"
+        keyword and is empty when no filters apply.
+    """
     where_parts = []
     where_params: list = []
 
     # Add symbol filter conditions
     if symbol_type is not None or symbol_name is not None:
+        symbols_table = None
+        if index_name is not None and check_symbols_table_exists(index_name):
+            symbols_table = get_symbols_table_name(index_name)
         symbol_where, symbol_params = build_symbol_where_clause(
-            symbol_type, symbol_name
+            symbol_type, symbol_name, symbols_table
         )
         if symbol_where:
             where_parts.append(symbol_where)
@@ -545,29 +938,29 @@ def hybrid_search(
         if lang_conditions:
             where_parts.append(f"({' OR '.join(lang_conditions)})")
 
-    # Combine WHERE parts
-    where_clause = " AND ".join(where_parts) if where_parts else ""
+    return " AND ".join(where_parts) if where_parts else "", where_params
 
-    # Execute both searches
-    # Request more results from each to have better fusion
-    vector_limit = min(limit * 2, MAX_PREFETCH)
-    keyword_limit = min(limit * 2, MAX_PREFETCH)
 
-    vector_results = execute_vector_search(
-        query,
-        table_name,
-        vector_limit,
-        where_clause,
-        where_params if where_params else None,
-    )
-    keyword_results = execute_keyword_search(
-        query,
-        table_name,
-        keyword_limit,
-        where_clause,
-        where_params if where_params else None,
-    )
+def fuse_results(
+    vector_results: list[VectorResult],
+    keyword_results: list[KeywordResult],
+    index_name: str,
+    limit: int,
+) -> list[HybridSearchResult]:
+    """Fuse the two legs of a hybrid search into the final ranked list.
+
+    Applies RRF when keyword results exist (vector-only with
+    match_type="semantic" otherwise), then the definition boost and limit.
+
+    Args:
+        vector_results: Results from the vector leg.
+        keyword_results: Results from the keyword leg (may be empty).
+        index_name: Name of the index (for the definition boost).
+        limit: Maximum results to return.
 
+    Returns:
+        List of HybridSearchResult ordered by combined score (highest first).
+    """
     # If no keyword results, return vector-only with match_type="semantic"
     if not keyword_results:
         vector_only_results = [
@@ -585,6 +978,9 @@ def hybrid_search(
                 symbol_type=r.symbol_type,
                 symbol_name=r.symbol_name,
                 symbol_signature=r.symbol_signature,
+                content=r.content,
+                start_line=r.start_line,
+                end_line=r.end_line,
             )
             for r in vector_results[:limit]
         ]
@@ -598,3 +994,205 @@ def hybrid_search(
     boosted = apply_definition_boost(fused, index_name)
 
     return boosted[:limit]
+
+
+def _format_vector_literal(embedding) -> str:
+    """Render an embedding as pgvector text input ("[x,y,...]")."""
+    return "[" + ",".join(repr(float(x)) for x in embedding) + "]"
+
+
+def execute_vector_search_many(
+    query_embeddings: list[list[float]],
+    table_name: str,
+    limit: int = 10,
+    where_clause: str = "",
+    where_params: list | None = None,
+    statement_timeout: float | None = None,
+    include_content: bool = False,
+) -> list[list[VectorResult]]:
+    """Run the vector leg for several queries in one SQL statement.
+
+    The embeddings are unnested into a row set and each row drives a
+    LATERAL nearest-neighbour lookup, so N queries cost one round-trip
+    and one connection checkout instead of N.
+
+    Args:
+        query_embeddings: Pre-computed query embeddings.
+        table_name: PostgreSQL table name.
+        limit: Maximum results per query.
+        where_clause: Optional SQL condition (without "WHERE") applied to every query.
+        where_params: Optional list of parameters for where_clause placeholders.
+        statement_timeout: Optional server-side timeout in seconds for the statement.
+        include_content: Also select content_text (chunk text) and, when the
+            index stores them, start_line/end_line for each result.
+
+    Returns:
+        One list of VectorResult per embedding, in input order, each ordered
+        by similarity (highest first).
+    """
+    if not query_embeddings:
+        return []
+
+    pool = get_connection_pool()
+    where_sql = f"WHERE {where_clause}" if where_clause else ""
+    include_symbol_columns = check_symbol_columns_exist(table_name)
+
+    select_cols = """
+                filename,
+                lower(location) as start_byte,
+                upper(location) as end_byte,
+                1 - (embedding <=> q.query_vec) AS score,
+                block_type,
+                hierarchy,
+                language_id"""
+    if include_symbol_columns:
+        select_cols += """,
+                symbol_type,
+                symbol_name,
+                symbol_signature"""
+    content_cols, include_lines = _content_columns(table_name, include_content)
+    select_cols += content_cols
+
+    storage = get_vector_storage(table_name)
+    sql = get_statement(
+        ("vector_many", table_name, storage, where_clause, select_cols),
+        lambda: f"""
+        WITH q AS MATERIALIZED (
+            SELECT ord, vec::vector AS query_vec
+            FROM unnest(%s::text[]) WITH ORDINALITY AS u(vec, ord)
+        )
+        SELECT q.ord, c.*
+        FROM q
+        CROSS JOIN LATERAL (
+            SELECT{select_cols}
+            FROM {build_vector_source(table_name, storage, where_sql, "q.query_vec")}
+            ORDER BY embedding <=> q.query_vec
+            LIMIT %s
+        ) c
+        ORDER BY q.ord, c.score DESC
+    """,
+    )
+
+    params: list = [[_format_vector_literal(e) for e in query_embeddings]]
+    if where_params:
+        params.extend(where_params)
+    params.extend(vector_source_params(storage, [], limit))
+    params.append(limit)
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            _set_statement_timeout(cur, statement_timeout)
+            # The outer ORDER BY re-sorts each query's rows by score, so
+            # relaxed order is fine
+            apply_vector_search_settings(cur, filtered=bool(where_clause))
+            execute_statement(cur, sql, params)
+            rows = cur.fetchall()
+
+    results: list[list[VectorResult]] = [[] for _ in query_embeddings]
+    for row in rows:
+        results[int(row[0]) - 1].append(
+            _vector_result_from_row(
+                row[1:], include_symbol_columns, include_content, include_lines
+            )
+        )
+    return results
+
+
+def execute_keyword_search_many(
+    queries: list[str],
+    table_name: str,
+    limit: int = 10,
+    where_clause: str = "",
+    where_params: list | None = None,
+    statement_timeout: float | None = None,
+    include_content: bool = False,
+) -> list[list[KeywordResult]]:
+    """Run the keyword leg for several queries in one SQL statement.
+
+    Batched counterpart of execute_keyword_search(): each normalized query
+    becomes a tsquery row driving a LATERAL full-text lookup.
+
+    Args:
+        queries: Search queries (normalized to split identifiers).
+        table_name: PostgreSQL table name.
+        limit: Maximum results per query.
+        where_clause: Optional SQL condition (without "WHERE") applied to every query.
+        where_params: Optional list of parameters for where_clause placeholders.
+        statement_timeout: Optional server-side timeout in seconds for the statement.
+        include_content: Also select content_text (chunk text) and, when the
+            index stores them, start_line/end_line for each result.
+
+    Returns:
+        One list of KeywordResult per query, in input order, each ordered by
+        ts_rank (highest first). All lists are empty if the content_tsv
+        column doesn't exist or the statement fails.
+    """
+    if not queries:
+        return []
+
+    empty: list[list[KeywordResult]] = [[] for _ in queries]
+    if not check_column_exists(table_name, "content_tsv"):
+        logger.debug(
+            f"Table {table_name} lacks content_tsv column, skipping keyword search"
+        )
+        return empty
+
+    pool = get_connection_pool()
+    extra_where = f"AND ({where_clause})" if where_clause else ""
+    content_cols, include_lines = _content_columns(table_name, include_content)
+
+    sql = get_statement(
+        ("keyword_many", table_name, where_clause, content_cols),
+        lambda: f"""
+        WITH q AS MATERIALIZED (
+            SELECT ord, plainto_tsquery('simple', text) AS tsq
+            FROM unnest(%s::text[]) WITH ORDINALITY AS u(text, ord)
+        )
+        SELECT q.ord, c.*
+        FROM q
+        CROSS JOIN LATERAL (
+            SELECT
+                filename,
+                lower(location) as start_byte,
+                upper(location) as end_byte,
+                ts_rank(content_tsv, q.tsq) as rank{content_cols}
+            FROM {table_name}
+            WHERE content_tsv @@ q.tsq {extra_where}
+            ORDER BY rank DESC
+            LIMIT %s
+        ) c
+        ORDER BY q.ord, c.rank DESC
+    """,
+    )
+
+    params: list = [[normalize_query_for_keyword(q) for q in queries]]
+    if where_params:
+        params.extend(where_params)
+    params.append(limit)
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            try:
+                _set_statement_timeout(cur, statement_timeout)
+                execute_statement(cur, sql, params)
+                rows = cur.fetchall()
+            except Exception as e:
+                logger.warning(
+                    f"Batched keyword search failed (falling back to vector-only): {e}"
+                )
+                return empty
+
+    results = empty
+    for row in rows:
+        results[int(row[0]) - 1].append(
+            KeywordResult(
+                filename=row[1],
+                start_byte=int(row[2]),
+                end_byte=int(row[3]),
+                ts_rank=float(row[4]),
+                content=row[5] if include_content else None,
+                start_line=row[6] if include_lines else None,
+                end_line=row[7] if include_lines else None,
+            )
+        )
+    return results
@@ -5,17 +5,40 @@ performs vector similarity searches against the PostgreSQL database.
 """
 
 import logging
+import time
 from dataclasses import dataclass
 
 from cocosearch.indexer.embedder import code_to_embedding
 from cocosearch.search.cache import get_query_cache
+from cocosearch.search.embedding_cache import embed_queries, embed_query
 from cocosearch.search.db import (
+    apply_vector_search_settings,
     check_column_exists,
+    check_line_columns_exist,
     check_symbol_columns_exist,
+    check_symbols_table_exists,
+    execute_statement,
     get_connection_pool,
+    get_statement,
+    get_symbols_table_name,
     get_table_name,
+    get_vector_storage,
 )
 from cocosearch.search.filters import build_symbol_where_clause
+from cocosearch.search.hybrid import (
+    KEYWORD_LEG_TIMEOUT,
+    MAX_PREFETCH,
+    HybridSearchResult,
+    VectorResult,
+    build_filter_clause,
+    build_vector_source,
+    execute_keyword_search,
+    execute_keyword_search_many,
+    execute_vector_search_many,
+    fuse_results,
+    get_search_executor,
+    vector_source_params,
+)
 from cocosearch.search.hybrid import hybrid_search as execute_hybrid_search
 from cocosearch.search.query_analyzer import has_identifier_pattern
 from cocosearch.validation import validate_query
@@ -41,6 +64,12 @@ class SearchResult:
         symbol_type: Symbol type ("function", "class", "method", "interface", or None).
         symbol_name: Symbol name (e.g., "process_data", "UserService.get_user", or None).
         symbol_signature: Symbol signature (e.g., "def process_data(items: list)", or None).
+        content: Chunk text stored at index time (content_text), or None when
+            not requested or the index predates the column. Lets callers render
+            results without reopening the source file.
+        start_line: 1-based start line stored at index time, or None when not
+            requested or the index predates the column.
+        end_line: 1-based end line stored at index time, or None likewise.
     """
 
     filename: str
@@ -58,6 +87,9 @@ class SearchResult:
     symbol_type: str | None = None
     symbol_name: str | None = None
     symbol_signature: str | None = None
+    content: str | None = None
+    start_line: int | None = None
+    end_line: int | None = None
 
 
 # Language to file extension mapping
@@ -178,6 +210,9 @@ def _get_language_id_map() -> dict[str, str]:
     return _LANGUAGE_ID_MAP_CACHE
 
 
+# Upper bound on queries per search_many() call (one SQL statement each leg)
+MAX_BATCH_QUERIES = 32
+
 # Module-level flag for hybrid search column availability (pre-v1.7 graceful degradation)
 _has_content_text_column = True
 _hybrid_warning_emitted = False
@@ -230,6 +265,99 @@ def validate_language_filter(lang_str: str) -> list[str]:
     return resolved
 
 
+def _from_hybrid_result(hr: HybridSearchResult) -> SearchResult:
+    """Convert a HybridSearchResult into a SearchResult."""
+    return SearchResult(
+        filename=hr.filename,
+        start_byte=hr.start_byte,
+        end_byte=hr.end_byte,
+        score=hr.combined_score,
+        block_type=hr.block_type,
+        hierarchy=hr.hierarchy,
+        language_id=hr.language_id,
+        match_type=hr.match_type,
+        vector_score=hr.vector_score,
+        keyword_score=hr.keyword_score,
+        symbol_type=hr.symbol_type,
+        symbol_name=hr.symbol_name,
+        symbol_signature=hr.symbol_signature,
+        content=hr.content,
+        start_line=hr.start_line,
+        end_line=hr.end_line,
+    )
+
+
+def _from_vector_result(vr: VectorResult) -> SearchResult:
+    """Convert a VectorResult into a SearchResult (vector-only mode)."""
+    return SearchResult(
+        filename=vr.filename,
+        start_byte=vr.start_byte,
+        end_byte=vr.end_byte,
+        score=vr.score,
+        block_type=vr.block_type,
+        hierarchy=vr.hierarchy,
+        language_id=vr.language_id,
+        symbol_type=vr.symbol_type,
+        symbol_name=vr.symbol_name,
+        symbol_signature=vr.symbol_signature,
+        content=vr.content,
+        start_line=vr.start_line,
+        end_line=vr.end_line,
+    )
+
+
+def _validate_symbol_filter(
+    index_name: str,
+    table_name: str,
+    symbol_type: str | list[str] | None,
+    symbol_name: str | None,
+) -> None:
+    """Reject symbol filters on indexes without symbol columns (pre-v1.7)."""
+    if symbol_type is not None or symbol_name is not None:
+        if not check_symbol_columns_exist(table_name):
+            raise ValueError(
+                f"Symbol filtering requires v1.7+ index. Index '{index_name}' lacks symbol columns. "
+                "Re-index with 'cocosearch index' to enable symbol filtering."
+            )
+
+
+def _should_use_hybrid(query: str, use_hybrid: bool | None, table_name: str) -> bool:
+    """Decide whether a query runs as hybrid search.
+
+    Checks for the content_text column once per process and warns if it
+    is missing, then applies the use_hybrid mode (explicit or auto-detect).
+    """
+    global _has_content_text_column, _hybrid_warning_emitted
+
+    # Check for hybrid search capability (content_text column) on first call
+    if _has_content_text_column and not _hybrid_warning_emitted:
+        if not check_column_exists(table_name, "content_text"):
+            _has_content_text_column = False
+            logger.warning(
+                "Index lacks hybrid search columns (content_text). "
+                "Run 'cocosearch index' to enable hybrid search."
+            )
+            _hybrid_warning_emitted = True
+
+    if use_hybrid is True:
+        # Explicit request for hybrid search
+        if _has_content_text_column:
+            return True
+        # Fall back to vector-only silently (already warned above)
+        logger.debug(
+            "Hybrid search requested but content_text column missing, using vector-only"
+        )
+    elif use_hybrid is None:
+        # Auto-detect: use hybrid if query has identifier patterns AND column exists
+        if _has_content_text_column and has_identifier_pattern(query):
+            logger.debug(
+                "Auto-detected identifier pattern in query, using hybrid search"
+            )
+            return True
+    # use_hybrid is False: always use vector-only
+    return False
+
+
 def search(
     query: str,
     index_name: str,
@@ -240,6 +368,7 @@ def search(
     symbol_type: str | list[str] | None = None,
     symbol_name: str | None = None,
     no_cache: bool = False,
+    include_content: bool = False,
 ) -> list[SearchResult]:
     """Search for code similar to query.
 
@@ -248,6 +377,11 @@ def search(
     Optionally uses hybrid search (vector + keyword) for better results
     when searching for code identifiers.
 
+    With caching enabled, the query embedding is computed once after an
+    exact-match cache miss, used for the semantic cache probe, and then
+    reused by the vector search. For hybrid searches the keyword leg is
+    started before that embedding, so it overlaps with it.
+
     Args:
         query: Natural language search query.
         index_name: Name of the index to search.
@@ -262,6 +396,11 @@ def search(
             Can be a single string or list of types.
         symbol_name: Filter by symbol name using glob pattern (supports * and ?).
         no_cache: If True, bypass query cache (default False).
+        include_content: Also return each chunk's stored text (content_text)
+            in SearchResult.content, and its stored start_line/end_line, so
+            callers can skip reading source files. Ignored for indexes without
+            the columns. Cached results may lack them; callers should fall
+            back to the file.
 
     Returns:
         List of SearchResult ordered by similarity (highest first).
@@ -274,25 +413,23 @@ def search(
             if symbol filter is used on a pre-v1.7 index,
             or if symbol_type contains invalid type names.
     """
-    global _has_content_text_column, _hybrid_warning_emitted
-
     # Validate query input
     query = validate_query(query)
 
-    # Check cache first (exact match only at this point, semantic check after embedding)
-    if not no_cache:
-        cache = get_query_cache()
-        cached_results, hit_type = cache.get(
-            query=query,
-            index_name=index_name,
-            limit=limit,
-            min_score=min_score,
-            language_filter=language_filter,
-            use_hybrid=use_hybrid,
-            symbol_type=symbol_type,
-            symbol_name=symbol_name,
-            query_embedding=None,  # No embedding yet for semantic check
-        )
+    # Check cache first: exact match needs no embedding, so a hit skips Ollama
+    cache = get_query_cache() if not no_cache else None
+    cache_params = dict(
+        query=query,
+        index_name=index_name,
+        limit=limit,
+        min_score=min_score,
+        language_filter=language_filter,
+        use_hybrid=use_hybrid,
+        symbol_type=symbol_type,
+        symbol_name=symbol_name,
+    )
+    if cache is not None:
+        cached_results, hit_type = cache.get(**cache_params, query_embedding=None)
         if cached_results is not None:
             logger.debug(f"Cache hit ({hit_type})")
             return cached_results
@@ -301,50 +438,58 @@ def search(
     validated_languages = None
     if language_filter:
         validated_languages = validate_language_filter(language_filter)
+    hybrid_language_filter = (
+        ",".join(validated_languages) if validated_languages else language_filter
+    )
 
     pool = get_connection_pool()
     table_name = get_table_name(index_name)
 
     # Validate symbol filter (requires v1.7+ index with symbol columns)
-    if symbol_type is not None or symbol_name is not None:
-        if not check_symbol_columns_exist(table_name):
-            raise ValueError(
-                f"Symbol filtering requires v1.7+ index. Index '{index_name}' lacks symbol columns. "
-                "Re-index with 'cocosearch index' to enable symbol filtering."
-            )
+    _validate_symbol_filter(index_name, table_name, symbol_type, symbol_name)
 
     # Always include symbol columns when available (used by definition boost)
     include_symbol_columns = check_symbol_columns_exist(table_name)
 
-    # Check for hybrid search capability (content_text column) on first call
-    if _has_content_text_column and not _hybrid_warning_emitted:
-        if not check_column_exists(table_name, "content_text"):
-            _has_content_text_column = False
-            logger.warning(
-                "Index lacks hybrid search columns (content_text). "
-                "Run 'cocosearch index' to enable hybrid search."
-            )
-            _hybrid_warning_emitted = True
-
     # Determine whether to use hybrid search
-    should_use_hybrid = False
-    if use_hybrid is True:
-        # Explicit request for hybrid search
-        if _has_content_text_column:
-            should_use_hybrid = True
-        else:
-            # Fall back to vector-only silently (already warned above)
-            logger.debug(
-                "Hybrid search requested but content_text column missing, using vector-only"
+    should_use_hybrid = _should_use_hybrid(query, use_hybrid, table_name)
+    include_content = include_content and _has_content_text_column
+
+    query_embedding: list[float] | None = None
+    keyword_future = None
+    if cache is not None:
+        # Keyword leg doesn't need the embedding: start it before embedding
+        # for the semantic probe, and discard it on a semantic hit
+        if should_use_hybrid:
+            where_clause, where_params = build_filter_clause(
+                symbol_type, symbol_name, hybrid_language_filter, index_name=index_name
             )
-    elif use_hybrid is None:
-        # Auto-detect: use hybrid if query has identifier patterns AND column exists
-        if _has_content_text_column and has_identifier_pattern(query):
-            should_use_hybrid = True
-            logger.debug(
-                "Auto-detected identifier pattern in query, using hybrid search"
+            keyword_future = get_search_executor().submit(
+                execute_keyword_search,
+                query,
+                table_name,
+                min(limit * 2, MAX_PREFETCH),
+                where_clause,
+                where_params or None,
+                statement_timeout=KEYWORD_LEG_TIMEOUT,
+                include_content=include_content,
+            )
+
+        # Semantic check: embed once here and reuse the embedding below
+        try:
+            query_embedding = embed_query(query, code_to_embedding.eval)
+            cached_results, hit_type = cache.get(
+                **cache_params, query_embedding=query_embedding
             )
-    # use_hybrid is False: always use vector-only (no action needed)
+        except BaseException:
+            if keyword_future is not None:
+                keyword_future.cancel()
+            raise
+        if cached_results is not None:
+            if keyword_future is not None:
+                keyword_future.cancel()
+            logger.debug(f"Cache hit ({hit_type})")
+            return cached_results
 
     # Execute hybrid search if applicable
     # Hybrid search now supports language and symbol filtering (applied before RRF fusion)
@@ -355,34 +500,20 @@ def search(
             limit,
             symbol_type=symbol_type,
             symbol_name=symbol_name,
-            language_filter=",".join(validated_languages)
-            if validated_languages
-            else language_filter,
+            language_filter=hybrid_language_filter,
+            query_embedding=query_embedding,
+            include_content=include_content,
+            keyword_future=keyword_future,
         )
 
         # Convert HybridSearchResult to SearchResult, applying min_score filter
-        results = []
-        for hr in hybrid_results:
-            if hr.combined_score >= min_score:
-                results.append(
-                    SearchResult(
-                        filename=hr.filename,
-                        start_byte=hr.start_byte,
-                        end_byte=hr.end_byte,
-                        score=hr.combined_score,
-                        block_type=hr.block_type,
-                        hierarchy=hr.hierarchy,
-                        language_id=hr.language_id,
-                        match_type=hr.match_type,
-                        vector_score=hr.vector_score,
-                        keyword_score=hr.keyword_score,
-                        symbol_type=hr.symbol_type,
-                        symbol_name=hr.symbol_name,
-                        symbol_signature=hr.symbol_signature,
-                    )
-                )
+        results = [
+            _from_hybrid_result(hr)
+            for hr in hybrid_results
+            if hr.combined_score >= min_score
+        ]
 
-        # Cache results for future queries (hybrid search doesn't have embedding)
+        # Cache results for future queries (embedding enables semantic matching)
         if not no_cache:
             cache = get_query_cache()
             cache.put(
@@ -395,14 +526,15 @@ def search(
                 symbol_type=symbol_type,
                 symbol_name=symbol_name,
                 results=results,
-                query_embedding=None,  # Hybrid search doesn't expose query embedding
+                query_embedding=query_embedding,
             )
 
         return results
 
     # Vector-only search (existing behavior)
-    # Embed query using same model as indexing
-    query_embedding = code_to_embedding.eval(query)
+    # Embed query using same model as indexing (unless the cache probe already did)
+    if query_embedding is None:
+        query_embedding = embed_query(query, code_to_embedding.eval)
 
     # Build base SELECT columns (always include metadata)
     select_cols = (
@@ -413,6 +545,11 @@ def search(
     # Add symbol columns when symbol filtering is active
     if include_symbol_columns:
         select_cols += ", symbol_type, symbol_name, symbol_signature"
+    include_lines = include_content and check_line_columns_exist(table_name)
+    if include_content:
+        select_cols += ", content_text"
+    if include_lines:
+        select_cols += ", start_line, end_line"
 
     # Build WHERE clause for language filter
     where_parts = []
@@ -436,8 +573,11 @@ def search(
 
     # Build WHERE clause for symbol filter (combines with language filter via AND)
     if symbol_type is not None or symbol_name is not None:
+        symbols_table = None
+        if check_symbols_table_exists(index_name):
+            symbols_table = get_symbols_table_name(index_name)
         symbol_where, symbol_params = build_symbol_where_clause(
-            symbol_type, symbol_name
+            symbol_type, symbol_name, symbols_table
         )
         if symbol_where:
             where_parts.append(symbol_where)
@@ -447,21 +587,33 @@ def search(
     if where_parts:
         where_clause = "WHERE " + " AND ".join(where_parts)
 
-    # Build full SQL
-    sql = f"""
+    # Build full SQL (once per table and filter shape); quantized storage
+    # re-ranks candidates from the quantized index
+    storage = get_vector_storage(table_name)
+    sql = get_statement(
+        ("search", table_name, storage, where_clause, select_cols),
+        lambda: f"""
         SELECT {select_cols}
-        FROM {table_name}
-        {where_clause}
+        FROM {build_vector_source(table_name, storage, where_clause, "%s::vector")}
         ORDER BY embedding <=> %s::vector
         LIMIT %s
-    """
-    params = [query_embedding] + filter_params + [query_embedding, limit]
+    """,
+    )
+    params = (
+        [query_embedding]
+        + filter_params
+        + vector_source_params(storage, [query_embedding], limit)
+        + [query_embedding, limit]
+    )
 
     # Execute query (expects metadata columns to exist)
     with pool.connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, params)
+            relaxed = apply_vector_search_settings(cur, filtered=bool(where_parts))
+            execute_statement(cur, sql, params)
             rows = cur.fetchall()
+    if relaxed:
+        rows.sort(key=lambda row: row[3], reverse=True)
 
     # Filter by min_score and convert to SearchResult
     results = []
@@ -483,6 +635,11 @@ def search(
                 result.symbol_type = row[7] if row[7] else None
                 result.symbol_name = row[8] if row[8] else None
                 result.symbol_signature = row[9] if row[9] else None
+            # Add stored chunk text and line numbers if selected (trailing columns)
+            if include_lines:
+                result.content, result.start_line, result.end_line = row[-3:]
+            elif include_content:
+                result.content = row[-1]
             results.append(result)
 
     # Cache results for future queries (vector search includes embedding for semantic matching)
@@ -502,3 +659,185 @@ def search(
         )
 
     return results
+
+
+def search_many(
+    queries: list[str],
+    index_name: str,
+    limit: int = 10,
+    min_score: float = 0.0,
+    language_filter: str | None = None,
+    use_hybrid: bool | None = None,
+    symbol_type: str | list[str] | None = None,
+    symbol_name: str | None = None,
+    no_cache: bool = False,
+    include_content: bool = False,
+) -> list[list[SearchResult]]:
+    """Run several searches against one index in a single batch.
+
+    Equivalent to calling search() once per query with the same filters,
+    but the uncached queries are embedded together and each search leg
+    runs as one LATERAL SQL statement for the whole batch. The keyword
+    leg doesn't need embeddings, so it overlaps with the embedding step.
+    Results are fused with the same RRF and definition boost as search().
+
+    Args:
+        queries: Natural language search queries (at most MAX_BATCH_QUERIES).
+        index_name: Name of the index to search.
+        limit: Maximum results to return per query (default 10).
+        min_score: Minimum similarity score to include (0-1, default 0.0).
+        language_filter: Optional language filter (e.g., "python", "hcl,bash").
+        use_hybrid: Hybrid search mode, applied per query as in search().
+        symbol_type: Filter by symbol type ("function", "class", "method", "interface").
+            Can be a single string or list of types.
+        symbol_name: Filter by symbol name using glob pattern (supports * and ?).
+        no_cache: If True, bypass query cache (default False).
+        include_content: Also return each chunk's stored text, as in search().
+
+    Returns:
+        One list of SearchResult per query, in input order.
+
+    Raises:
+        ValueError: If the batch is empty or too large, if any query is
+            invalid, or for the same filter errors as search().
+    """
+    if not queries:
+        raise ValueError("At least one query is required")
+    if len(queries) > MAX_BATCH_QUERIES:
+        raise ValueError(
+            f"Too many queries in batch ({len(queries)}); maximum is {MAX_BATCH_QUERIES}"
+        )
+    queries = [validate_query(q) for q in queries]
+
+    results: list[list[SearchResult] | None] = [None] * len(queries)
+
+    # Exact cache probes first: hits need no embedding
+    cache = get_query_cache() if not no_cache else None
+
+    def _cache_params(query: str) -> dict:
+        return dict(
+            query=query,
+            index_name=index_name,
+            limit=limit,
+            min_score=min_score,
+            language_filter=language_filter,
+            use_hybrid=use_hybrid,
+            symbol_type=symbol_type,
+            symbol_name=symbol_name,
+        )
+
+    pending = list(range(len(queries)))
+    if cache is not None:
+        for i in pending:
+            cached, _ = cache.get(**_cache_params(queries[i]), query_embedding=None)
+            results[i] = cached
+        pending = [i for i in pending if results[i] is None]
+    if not pending:
+        return results  # type: ignore[return-value]
+
+    # Validate and resolve filters (shared by the whole batch)
+    validated_languages = None
+    if language_filter:
+        validated_languages = validate_language_filter(language_filter)
+    table_name = get_table_name(index_name)
+    _validate_symbol_filter(index_name, table_name, symbol_type, symbol_name)
+    where_clause, where_params = build_filter_clause(
+        symbol_type,
+        symbol_name,
+        ",".join(validated_languages) if validated_languages else None,
+        index_name=index_name,
+    )
+
+    hybrid = [
+        i for i in pending if _should_use_hybrid(queries[i], use_hybrid, table_name)
+    ]
+    hybrid_set = set(hybrid)
+    include_content = include_content and _has_content_text_column
+    vector_limit = min(limit * 2, MAX_PREFETCH) if hybrid else limit
+
+    # Keyword leg for hybrid queries overlaps with embedding + vector leg
+    keyword_future = None
+    keyword_started = time.monotonic()
+    if hybrid:
+        keyword_future = get_search_executor().submit(
+            execute_keyword_search_many,
+            [queries[i] for i in hybrid],
+            table_name,
+            min(limit * 2, MAX_PREFETCH),
+            where_clause,
+            where_params or None,
+            statement_timeout=KEYWORD_LEG_TIMEOUT,
+            include_content=include_content,
+        )
+
+    try:
+        embeddings = embed_queries(
+            [queries[i] for i in pending], code_to_embedding.eval
+        )
+        embedding_by_index = dict(zip(pending, embeddings))
+
+        # Semantic cache probes with the fresh embeddings
+        if cache is not None:
+            for i in pending:
+                cached, _ = cache.get(
+                    **_cache_params(queries[i]),
+                    query_embedding=embedding_by_index[i],
+                )
+                results[i] = cached
+            remaining = [i for i in pending if results[i] is None]
+        else:
+            remaining = pending
+
+        vector_batches = execute_vector_search_many(
+            [embedding_by_index[i] for i in remaining],
+            table_name,
+            vector_limit,
+            where_clause,
+            where_params or None,
+            include_content=include_content,
+        )
+    except BaseException:
+        if keyword_future is not None:
+            keyword_future.cancel()
+        raise
+
+    keyword_by_index = {}
+    if keyword_future is not None:
+        remaining_time = KEYWORD_LEG_TIMEOUT - (time.monotonic() - keyword_started)
+        try:
+            keyword_batches = keyword_future.result(timeout=max(remaining_time, 0.0))
+        except TimeoutError:
+            keyword_future.cancel()
+            logger.warning(
+                f"Batched keyword search did not complete within "
+                f"{KEYWORD_LEG_TIMEOUT:.1f}s (falling back to vector-only)"
+            )
+        else:
+            keyword_by_index = dict(zip(hybrid, keyword_batches))
+
+    for i, vector_results in zip(remaining, vector_batches):
+        if i in hybrid_set:
+            fused = fuse_results(
+                vector_results, keyword_by_index.get(i, []), index_name, limit
+            )
+            query_results = [
+                _from_hybrid_result(hr)
+                for hr in fused
+                if hr.combined_score >= min_score
+            ]
+        else:
+            query_results = [
+                _from_vector_result(vr)
+                for vr in vector_results[:limit]
+                if vr.score >= min_score
+            ]
+        results[i] = query_results
+
+        if cache is not None:
+            cache.put(
+                **_cache_params(queries[i]),
+                results=query_results,
+                query_embedding=embedding_by_index[i],
+            )
+
+    return results  # type: ignore[return-value]
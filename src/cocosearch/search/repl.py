@@ -106,6 +106,7 @@ class SearchREPL(cmd.Cmd):
                 limit=self.limit,
                 min_score=self.min_score,
                 language_filter=lang,
+                include_content=True,
             )
             format_pretty(
                 results, context_lines=self.context_lines, console=self.console
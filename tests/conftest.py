@@ -2,6 +2,7 @@
 
 This module provides common fixtures used across all test modules:
 - reset_db_pool: Autouse fixture that resets database pool between tests
+- reset_git_state: Autouse fixture that clears the cached git state
 - tmp_codebase: Creates temporary directory with sample Python files
 """
 
@@ -71,6 +72,20 @@ def reset_db_pool():
     db_module._pool = None
 
 
+@pytest.fixture(autouse=True)
+def reset_git_state():
+    """Clear the per-project git state cache between tests.
+
+    Tests patch the git helpers with different results for the same
+    project path; a cached value would leak from one test to the next.
+    """
+    from cocosearch.management.git import reset_git_state_cache
+
+    reset_git_state_cache()
+    yield
+    reset_git_state_cache()
+
+
 @pytest.fixture
 def tmp_codebase(tmp_path):
     """Create a temporary codebase directory with sample files.
@@ -28,6 +28,9 @@ def make_search_result():
         match_type: str = "",
         vector_score: float | None = None,
         keyword_score: float | None = None,
+        content: str | None = None,
+        start_line: int | None = None,
+        end_line: int | None = None,
     ) -> SearchResult:
         return SearchResult(
             filename=filename,
@@ -40,6 +43,9 @@ def make_search_result():
             match_type=match_type,
             vector_score=vector_score,
             keyword_score=keyword_score,
+            content=content,
+            start_line=start_line,
+            end_line=end_line,
         )
 
     return _make
@@ -4,6 +4,8 @@ Provides fixtures that mock cocosearch.search.db module functions
 to enable testing without a real PostgreSQL database.
 """
 
+import importlib
+
 import pytest
 from unittest.mock import patch
 
@@ -11,25 +13,62 @@ from tests.mocks.db import MockConnectionPool, MockCursor, MockConnection
 
 
 @pytest.fixture(autouse=True)
-def reset_search_module_state():
+def reset_search_module_state(tmp_path):
     """Reset search module state and patch DB-dependent column checks.
 
     Autouse fixture that:
     1. Patches check_column_exists to return True (simulates v1.7+ index)
     2. Patches check_symbol_columns_exist to return True (simulates v1.7+ index)
+       and check_line_columns_exist to return False (no stored line numbers)
+       and check_symbols_table_exists to return False (no symbols side table)
     3. Resets module-level flags after each test
-    4. Clears the query cache and symbol columns cache to prevent test pollution
+    4. Points the query cache singleton at a per-test directory so the
+       persistent tier never touches ~/.cache
+    5. Gives each test a fresh memory-only embedding cache
+    6. Pins vector search settings to their defaults and marks iterative
+       scans unsupported, so no settings query reaches the mocked cursor,
+       and reports full-precision vector storage (the statement registry
+       is emptied after each test)
+    7. Drops the index catalog after each test
+    8. Clears the query cache and symbol columns cache to prevent test pollution
 
     This prevents column checks from hitting a real database
     and ensures test isolation for module-level state.
     """
     import cocosearch.search.query as query_module
     import cocosearch.search.cache as cache_module
+    import cocosearch.search.catalog as catalog_module
     import cocosearch.search.db as db_module
+    import cocosearch.search.embedding_cache as embedding_cache_module
+    import cocosearch.search.hybrid as hybrid_module
+
+    # cocosearch.search re-exports an analyze() function that shadows the module
+    analyze_module = importlib.import_module("cocosearch.search.analyze")
+
+    cache_module._query_cache = cache_module.QueryCache(
+        cache_dir=str(tmp_path / "query-cache")
+    )
+    embedding_cache_module._embedding_cache = embedding_cache_module.EmbeddingCache(
+        persist=False
+    )
+
+    db_module._vector_search_settings = db_module.VectorSearchSettings()
+    db_module._iterative_scan_supported = False
 
     with (
         patch.object(query_module, "check_column_exists", return_value=True),
         patch.object(query_module, "check_symbol_columns_exist", return_value=False),
+        patch.object(query_module, "check_line_columns_exist", return_value=False),
+        patch.object(hybrid_module, "check_line_columns_exist", return_value=False),
+        patch.object(query_module, "check_symbols_table_exists", return_value=False),
+        patch.object(hybrid_module, "check_symbols_table_exists", return_value=False),
+        patch.object(analyze_module, "check_symbols_table_exists", return_value=False),
+        patch.object(
+            hybrid_module, "get_vector_storage", return_value=db_module.VectorStorage()
+        ),
+        patch.object(
+            query_module, "get_vector_storage", return_value=db_module.VectorStorage()
+        ),
     ):
         yield
 
@@ -39,9 +78,16 @@ def reset_search_module_state():
 
     # Clear query cache singleton to prevent test pollution
     cache_module._query_cache = None
+    embedding_cache_module._embedding_cache = None
 
     # Clear symbol columns cache to prevent cross-test pollution
     db_module._symbol_columns_available = {}
+    db_module._line_columns_available = {}
+    db_module._symbols_table_available = {}
+    db_module.reset_vector_search_settings()
+    db_module._vector_storage = {}
+    db_module._statements.clear()
+    catalog_module.invalidate_catalog()
 
 
 @pytest.fixture
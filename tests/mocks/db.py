@@ -23,11 +23,17 @@ class MockCursor:
         """
         self.results = list(results) if results else []
         self.calls: list[tuple[str, tuple | None]] = []
+        self.prepared: list[str] = []
+        self.connection: "MockConnection | None" = None
         self._fetch_index = 0
 
-    def execute(self, query: str, params: tuple | None = None) -> None:
-        """Record query execution for later assertions."""
+    def execute(
+        self, query: str, params: tuple | None = None, *, prepare: bool | None = None
+    ) -> None:
+        """Record query execution (and prepare requests) for later assertions."""
         self.calls.append((query, params))
+        if prepare:
+            self.prepared.append(query)
 
     def fetchone(self) -> tuple | None:
         """Return next result row."""
@@ -73,6 +79,7 @@ class MockConnection:
     def __init__(self, cursor: MockCursor | None = None):
         """Initialize with optional pre-configured cursor."""
         self._cursor = cursor or MockCursor()
+        self._cursor.connection = self
         self.committed = False
 
     def cursor(self) -> MockCursor:
@@ -56,7 +56,12 @@ class TestHybridWithSymbolFilters:
     @patch("cocosearch.search.query.check_column_exists")
     @patch("cocosearch.search.query.execute_hybrid_search")
     def test_search_uses_hybrid_with_symbol_filter(
-        self, mock_hybrid, mock_col_exists, mock_sym_cols, mock_pool
+        self,
+        mock_hybrid,
+        mock_col_exists,
+        mock_sym_cols,
+        mock_pool,
+        mock_code_to_embedding,
     ):
         """Verify search() calls hybrid_search with symbol filters when both are requested."""
         # Setup mocks
@@ -82,7 +87,12 @@ class TestHybridWithSymbolFilters:
     @patch("cocosearch.search.query.check_column_exists")
     @patch("cocosearch.search.query.execute_hybrid_search")
     def test_search_passes_language_filter_to_hybrid(
-        self, mock_hybrid, mock_col_exists, mock_sym_cols, mock_pool
+        self,
+        mock_hybrid,
+        mock_col_exists,
+        mock_sym_cols,
+        mock_pool,
+        mock_code_to_embedding,
     ):
         """Verify search() passes language_filter to hybrid_search."""
         mock_col_exists.return_value = True
@@ -105,7 +115,12 @@ class TestHybridWithSymbolFilters:
     @patch("cocosearch.search.query.check_column_exists")
     @patch("cocosearch.search.query.execute_hybrid_search")
     def test_search_passes_all_filters_to_hybrid(
-        self, mock_hybrid, mock_col_exists, mock_sym_cols, mock_pool
+        self,
+        mock_hybrid,
+        mock_col_exists,
+        mock_sym_cols,
+        mock_pool,
+        mock_code_to_embedding,
     ):
         """Verify search() passes all filter types to hybrid_search."""
         mock_col_exists.return_value = True
@@ -244,7 +259,12 @@ class TestSearchResultWithHybridSymbols:
     @patch("cocosearch.search.query.check_column_exists")
     @patch("cocosearch.search.query.execute_hybrid_search")
     def test_search_result_includes_symbol_fields_from_hybrid(
-        self, mock_hybrid, mock_col_exists, mock_sym_cols, mock_pool
+        self,
+        mock_hybrid,
+        mock_col_exists,
+        mock_sym_cols,
+        mock_pool,
+        mock_code_to_embedding,
     ):
         """Verify SearchResult includes symbol fields from HybridSearchResult."""
         mock_col_exists.return_value = True
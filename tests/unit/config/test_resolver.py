@@ -94,6 +94,11 @@ class TestParseEnvValue:
         assert parse_env_value("none", str) is None
         assert parse_env_value("None", str) is None
 
+    def test_parse_optional_int(self):
+        """Test optional fields parse as their non-None type."""
+        assert parse_env_value("64", int | None) == 64
+        assert parse_env_value("null", int | None) is None
+
 
 class TestConfigResolver:
     """Test ConfigResolver precedence logic."""
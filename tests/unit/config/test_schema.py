@@ -5,6 +5,7 @@ from pydantic import ValidationError
 
 from cocosearch.config import (
     CocoSearchConfig,
+    DatabaseSection,
     EmbeddingSection,
     IndexingSection,
     SearchSection,
@@ -70,6 +71,35 @@ class TestIndexingSection:
         assert "Input should be greater than or equal to 0" in str(exc_info.value)
 
 
+class TestVectorIndexSettings:
+    """Test vector index build settings in IndexingSection."""
+
+    def test_defaults_to_hnsw(self):
+        section = IndexingSection()
+        assert section.vectorIndex == "hnsw"
+        assert section.hnswM is None
+        assert section.ivfflatLists is None
+
+    def test_valid_settings(self):
+        section = IndexingSection(vectorIndex="ivfflat", ivfflatLists=200)
+        assert section.vectorIndex == "ivfflat"
+        assert section.ivfflatLists == 200
+
+    def test_unknown_index_type_rejected(self):
+        with pytest.raises(ValidationError):
+            IndexingSection(vectorIndex="diskann")
+
+    def test_vector_storage(self):
+        assert IndexingSection().vectorStorage == "full"
+        assert IndexingSection(vectorStorage="binary").vectorStorage == "binary"
+        with pytest.raises(ValidationError):
+            IndexingSection(vectorStorage="int8")
+
+    def test_hnsw_m_range(self):
+        with pytest.raises(ValidationError):
+            IndexingSection(hnswM=1)
+
+
 class TestSearchSection:
     """Test SearchSection model."""
 
@@ -116,6 +146,23 @@ class TestSearchSection:
             SearchSection(minScore=1.1)
         assert "Input should be less than or equal to 1" in str(exc_info.value)
 
+    def test_vector_scan_settings(self):
+        """Test vector index scan settings and their validation."""
+        section = SearchSection(
+            hnswEfSearch=100, ivfflatProbes=10, iterativeScan="strict_order"
+        )
+        assert section.hnswEfSearch == 100
+        assert section.ivfflatProbes == 10
+        assert SearchSection().iterativeScan == "relaxed_order"
+
+        with pytest.raises(ValidationError):
+            SearchSection(iterativeScan="sometimes")
+        with pytest.raises(ValidationError):
+            SearchSection(hnswEfSearch=0)
+        assert SearchSection().rerankFactor == 4
+        with pytest.raises(ValidationError):
+            SearchSection(rerankFactor=0)
+
 
 class TestEmbeddingSection:
     """Test EmbeddingSection model."""
@@ -137,6 +184,28 @@ class TestEmbeddingSection:
         assert "Extra inputs are not permitted" in str(exc_info.value)
 
 
+class TestDatabaseSection:
+    """Test DatabaseSection model."""
+
+    def test_default_values(self):
+        section = DatabaseSection()
+        assert section.poolMinSize == 2
+        assert section.poolMaxSize == 10
+        assert section.poolTimeout == 30.0
+        assert section.poolMaxIdle == 600.0
+
+    def test_integer_timeout_accepted(self):
+        assert DatabaseSection(poolTimeout=5).poolTimeout == 5.0
+
+    def test_pool_bounds(self):
+        with pytest.raises(ValidationError):
+            DatabaseSection(poolMaxSize=0)
+        with pytest.raises(ValidationError):
+            DatabaseSection(poolMinSize=-1)
+        with pytest.raises(ValidationError):
+            DatabaseSection(poolTimeout=0)
+
+
 class TestCocoSearchConfig:
     """Test root CocoSearchConfig model."""
 
@@ -147,6 +216,7 @@ class TestCocoSearchConfig:
         assert isinstance(config.indexing, IndexingSection)
         assert isinstance(config.search, SearchSection)
         assert isinstance(config.embedding, EmbeddingSection)
+        assert isinstance(config.database, DatabaseSection)
 
     def test_valid_config_all_fields(self):
         """Test valid configuration with all fields specified."""
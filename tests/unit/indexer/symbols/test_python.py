@@ -15,6 +15,14 @@ class TestFunctionExtraction:
         assert result.symbol_name == "foo"
         assert result.symbol_signature == "def foo():"
 
+    def test_function_after_non_ascii_text(self):
+        """Names are sliced by byte offset, so preceding non-ASCII is harmless."""
+        code = "# é日本\ndef fetch_user():\n    pass"
+        result = extract_symbol_metadata(code, "py")
+
+        assert result.symbol_name == "fetch_user"
+        assert result.symbol_signature == "def fetch_user():"
+
     def test_function_with_parameters(self):
         """Extract function with parameters."""
         code = "def bar(x, y=10): pass"
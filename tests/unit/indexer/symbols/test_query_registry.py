@@ -0,0 +1,75 @@
+"""Tests for the compiled symbol query registry."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cocosearch.indexer import symbols
+from cocosearch.indexer.symbols import (
+    extract_symbol_metadata,
+    get_symbol_query,
+    reload_symbol_queries,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    """Start and end each test with no resolved queries."""
+    reload_symbol_queries()
+    yield
+    reload_symbol_queries()
+
+
+class TestSymbolQueryRegistry:
+    """Queries are resolved and compiled once per language."""
+
+    def test_compiled_once_across_chunks(self):
+        """Repeated extraction reuses the compiled query without file access."""
+        with patch.object(
+            symbols, "_resolve_query_path", wraps=symbols._resolve_query_path
+        ) as mock_resolve:
+            for i in range(3):
+                result = extract_symbol_metadata(f"def f{i}():\n    pass\n", "py")
+                assert result.symbol_name == f"f{i}"
+
+        mock_resolve.assert_called_once_with("python")
+
+    def test_same_object_returned(self):
+        assert get_symbol_query("python") is get_symbol_query("python")
+
+    def test_unsupported_language_cached_as_none(self):
+        with patch.object(
+            symbols, "_resolve_query_path", return_value=None
+        ) as mock_resolve:
+            assert get_symbol_query("bash") is None
+            assert get_symbol_query("bash") is None
+
+        mock_resolve.assert_called_once()
+
+    def test_reload_picks_up_user_override(self, tmp_path, monkeypatch):
+        """An override added after first use applies after reload."""
+        builtin = get_symbol_query("python")
+
+        query_dir = tmp_path / ".cocosearch" / "queries"
+        query_dir.mkdir(parents=True)
+        (query_dir / "python.scm").write_text(
+            "(class_definition name: (identifier) @name) @definition.class\n"
+        )
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        assert get_symbol_query("python") is builtin
+
+        reload_symbol_queries()
+        override = get_symbol_query("python")
+
+        assert override is not builtin
+        result = extract_symbol_metadata("def f():\n    pass\n", "py")
+        assert result.symbol_name is None
+
+    def test_reload_reuses_unchanged_query(self):
+        """Reloading without file changes keeps the compiled query."""
+        first = get_symbol_query("python")
+        reload_symbol_queries()
+
+        assert get_symbol_query("python") is first
@@ -0,0 +1,193 @@
+"""Tests for the single-parse per-file analysis transform."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cocosearch.indexer import file_analysis, parse_tracking
+from cocosearch.indexer.file_analysis import (
+    analyze_file,
+    chunk_symbol_metadata,
+    chunk_symbols,
+)
+from cocosearch.indexer.parse_tracking import track_parse_results
+from cocosearch.indexer.symbols import (
+    FileSymbol,
+    _get_parser,
+    select_chunk_symbol,
+    select_chunk_symbols,
+)
+
+SOURCE = (
+    "# é\n"
+    "class Service:\n"
+    "    def start(self):\n"
+    "        x = 1\n"
+    "        return x\n"
+    "\n"
+    "def helper():\n"
+    "    pass\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_remembered_statuses():
+    """Keep recorded parse statuses from leaking between tests."""
+    parse_tracking._REMEMBERED_STATUSES.clear()
+    yield
+    parse_tracking._REMEMBERED_STATUSES.clear()
+
+
+def _symbol(start, end, name):
+    return FileSymbol(
+        start=start,
+        end=end,
+        name=name,
+        symbol_type="function",
+        symbol_name=name,
+        symbol_signature=f"def {name}():",
+    )
+
+
+class TestAnalyzeFile:
+    """Tests for analyze_file."""
+
+    def test_symbols_have_character_ranges(self):
+        """Offsets index the str content even after non-ASCII characters."""
+        result = analyze_file(SOURCE, "py")
+
+        names = [s.symbol_name for s in result.symbols]
+        assert names == ["Service", "Service.start", "helper"]
+        for symbol in result.symbols:
+            assert SOURCE[symbol.start :].startswith(("class", "def"))
+
+    def test_parses_file_once(self):
+        parser = MagicMock(wraps=_get_parser("python"))
+        with patch.object(file_analysis, "_get_parser", return_value=parser):
+            analyze_file(SOURCE, "py")
+
+        parser.parse.assert_called_once()
+
+    def test_unsupported_language_has_no_symbols(self):
+        assert analyze_file("whatever", "unknown-lang").symbols == []
+
+    def test_records_parse_status(self, tmp_path):
+        """track_parse_results reuses the status instead of parsing again."""
+        broken = "def broken(:\n    pass\n"
+        (tmp_path / "a.py").write_text(broken)
+        analyze_file(broken, "py")
+
+        cursor = MagicMock()
+        cursor.fetchall.side_effect = [[("a.py", "py")], []]
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+
+        with patch.object(parse_tracking, "detect_parse_status") as mock_detect:
+            summary = track_parse_results(conn, "myidx", str(tmp_path), "chunks")
+
+        mock_detect.assert_not_called()
+        assert summary["partial"] == 1
+        assert not parse_tracking._REMEMBERED_STATUSES
+
+    def test_changed_content_is_parsed(self, tmp_path):
+        """A status recorded for other content is not reused."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        analyze_file("def broken(:\n", "py")
+
+        cursor = MagicMock()
+        cursor.fetchall.side_effect = [[("a.py", "py")], []]
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+
+        summary = track_parse_results(conn, "myidx", str(tmp_path), "chunks")
+
+        assert summary["ok"] == 1
+
+
+class TestChunkSymbolMetadata:
+    """Tests for chunk symbol selection by range."""
+
+    def test_chunk_inside_method_gets_enclosing_symbol(self):
+        symbols = analyze_file(SOURCE, "py").symbols
+        start = SOURCE.index("x = 1")
+
+        result = chunk_symbol_metadata((start, start + 10), symbols)
+
+        assert result.symbol_name == "Service.start"
+        assert result.symbol_signature == "def start(self):"
+
+    def test_definition_starting_in_chunk_wins(self):
+        symbols = analyze_file(SOURCE, "py").symbols
+        start = SOURCE.index("return x")
+
+        result = chunk_symbol_metadata((start, len(SOURCE)), symbols)
+
+        assert result.symbol_name == "helper"
+
+    def test_no_symbol_returns_nulls(self):
+        result = chunk_symbol_metadata((0, 3), analyze_file(SOURCE, "py").symbols)
+
+        assert result.symbol_type is None
+        assert result.symbol_name is None
+        assert result.symbol_signature is None
+
+
+class TestSelectChunkSymbol:
+    """Tests for select_chunk_symbol."""
+
+    def test_innermost_enclosing(self):
+        outer, inner = _symbol(0, 100, "outer"), _symbol(10, 50, "inner")
+        assert select_chunk_symbol(20, 40, [outer, inner]) is inner
+
+    def test_ended_symbol_not_enclosing(self):
+        symbols = [_symbol(0, 10, "done")]
+        assert select_chunk_symbol(20, 40, symbols) is None
+
+    def test_symbol_after_chunk_ignored(self):
+        symbols = [_symbol(50, 60, "later")]
+        assert select_chunk_symbol(0, 50, symbols) is None
+
+
+class TestChunkSymbols:
+    """Tests for listing every symbol in a chunk."""
+
+    def test_lists_enclosing_and_contained_symbols(self):
+        symbols = analyze_file(SOURCE, "py").symbols
+        start = SOURCE.index("x = 1")
+
+        result = chunk_symbols((start, len(SOURCE)), symbols)
+
+        assert [(s.name, s.symbol_name) for s in result] == [
+            ("start", "Service.start"),
+            ("helper", "helper"),
+        ]
+
+    def test_whole_file_lists_every_symbol(self):
+        symbols = analyze_file(SOURCE, "py").symbols
+
+        result = chunk_symbols((0, len(SOURCE)), symbols)
+
+        assert [s.symbol_name for s in result] == [
+            "Service",
+            "Service.start",
+            "helper",
+        ]
+
+
+class TestSelectChunkSymbols:
+    """Tests for select_chunk_symbols."""
+
+    def test_only_innermost_enclosing_kept(self):
+        outer, inner = _symbol(0, 100, "outer"), _symbol(10, 50, "inner")
+        assert select_chunk_symbols(20, 40, [outer, inner]) == [inner]
+
+    def test_contained_symbols_in_order(self):
+        symbols = [_symbol(0, 100, "outer"), _symbol(30, 40, "a"), _symbol(50, 60, "b")]
+        assert [s.name for s in select_chunk_symbols(20, 55, symbols)] == [
+            "outer",
+            "a",
+            "b",
+        ]
+
+    def test_no_symbols(self):
+        assert select_chunk_symbols(0, 10, [_symbol(20, 30, "later")]) == []
@@ -116,6 +116,7 @@ class TestRunIndex:
         assert call_kwargs["include_patterns"] == ["*.py", "*.js"]
         assert call_kwargs["chunk_size"] == 500
         assert call_kwargs["chunk_overlap"] == 100
+        assert call_kwargs["vector_index_method"].kind == "Hnsw"
 
     def test_uses_default_config_when_none(self, tmp_path):
         """Uses default config when not provided."""
@@ -323,6 +324,43 @@ class TestRunIndex:
 
         mock_invalidate.assert_not_called()
 
+    def test_fresh_invalidates_cache_without_changes(self, tmp_path):
+        """A --fresh run invalidates the query cache even with zero changes."""
+        from cocosearch.indexer.flow import run_index
+
+        (tmp_path / "test.py").write_text("def hello(): pass")
+
+        mock_update_info = MagicMock()
+        mock_update_info.stats = {
+            "files": {"num_insertions": 0, "num_deletions": 0, "num_updates": 0}
+        }
+
+        mock_flow = MagicMock()
+        mock_flow.update.return_value = mock_update_info
+
+        mock_conn = MagicMock()
+
+        with patch("cocosearch.indexer.flow.cocoindex.init"):
+            with patch(
+                "cocosearch.indexer.flow.create_code_index_flow",
+                return_value=mock_flow,
+            ):
+                with patch(
+                    "cocosearch.indexer.flow.psycopg.connect",
+                    return_value=mock_conn,
+                ):
+                    with patch("cocosearch.indexer.flow.ensure_symbol_columns"):
+                        with patch(
+                            "cocosearch.indexer.flow.invalidate_index_cache"
+                        ) as mock_invalidate:
+                            run_index(
+                                index_name="testindex",
+                                codebase_path=str(tmp_path),
+                                fresh=True,
+                            )
+
+        mock_invalidate.assert_called_once_with("testindex")
+
     def test_runs_both_when_changes_detected(self, tmp_path):
         """Runs parse tracking and cache invalidation when changes are detected."""
         from cocosearch.indexer.flow import run_index
@@ -569,11 +607,12 @@ class TestFilenameContextIntegration:
 class TestSymbolIntegration:
     """Tests for symbol extraction integration in flow module."""
 
-    def test_extract_symbol_metadata_importable_from_flow(self):
-        """flow module successfully imports extract_symbol_metadata."""
+    def test_file_analysis_importable_from_flow(self):
+        """flow module successfully imports the per-file analysis transforms."""
         import cocosearch.indexer.flow as flow_module
 
-        assert hasattr(flow_module, "extract_symbol_metadata")
+        assert hasattr(flow_module, "analyze_file")
+        assert hasattr(flow_module, "chunk_symbol_metadata")
 
     def test_ensure_symbol_columns_importable_from_flow(self):
         """flow module successfully imports ensure_symbol_columns."""
@@ -586,8 +625,8 @@ class TestSymbolIntegration:
         import cocosearch.indexer.flow as flow_module
 
         source = inspect.getsource(flow_module)
+        assert "from cocosearch.indexer.file_analysis import" in source
         assert "from cocosearch.indexer.symbols import" in source
-        assert "extract_symbol_metadata" in source
 
     def test_flow_source_has_schema_migration_import(self):
         """flow module source contains the schema migration import."""
@@ -598,13 +637,15 @@ class TestSymbolIntegration:
         assert "ensure_symbol_columns" in source
 
     def test_flow_source_has_symbol_transform(self):
-        """flow module source contains the symbol metadata transform call."""
+        """flow module parses files once and selects chunk symbols by range."""
         import cocosearch.indexer.flow as flow_module
 
         source = inspect.getsource(flow_module)
-        assert 'chunk["symbol_metadata"]' in source
-        assert "extract_symbol_metadata" in source
-        assert 'language=file["extension"]' in source
+        assert 'file["analysis"]' in source
+        assert 'analyze_file, language=file["extension"]' in source
+        assert 'chunk["symbol_metadata"] = chunk["location"].transform(' in source
+        assert 'symbols=file["analysis"]["symbols"]' in source
+        assert "extract_symbol_metadata" not in source
 
     def test_flow_source_collects_symbol_fields(self):
         """flow module source collects all three symbol fields via bracket notation."""
@@ -615,6 +656,15 @@ class TestSymbolIntegration:
         assert 'symbol_name=chunk["symbol_metadata"]["symbol_name"]' in source
         assert 'symbol_signature=chunk["symbol_metadata"]["symbol_signature"]' in source
 
+    def test_flow_source_collects_line_fields(self):
+        """flow module source collects chunk start/end lines from the splitter."""
+        import cocosearch.indexer.flow as flow_module
+
+        source = inspect.getsource(flow_module)
+        assert 'start_line=chunk["start"]["line"]' in source
+        assert 'end_line=chunk["end"]["line"]' in source
+        assert "ensure_line_columns(conn, table_name)" in source
+
     def test_flow_source_calls_ensure_symbol_columns(self):
         """flow module source calls ensure_symbol_columns after setup."""
         import cocosearch.indexer.flow as flow_module
@@ -635,3 +685,327 @@ class TestSymbolIntegration:
         )
 
         assert flow is not None
+
+
+class TestEnsureLineColumns:
+    """Tests for the start_line/end_line schema migration."""
+
+    def test_adds_missing_columns(self):
+        """Missing columns are added as nullable INTEGER and committed."""
+        from cocosearch.indexer.schema_migration import ensure_line_columns
+        from tests.mocks.db import MockConnection, MockCursor
+
+        cursor = MockCursor(results=[("start_line",)])
+        conn = MockConnection(cursor)
+
+        result = ensure_line_columns(conn, "my_chunks")
+
+        assert result["columns_added"] == ["end_line"]
+        cursor.assert_query_contains(
+            "ALTER TABLE my_chunks ADD COLUMN end_line INTEGER NULL"
+        )
+        assert conn.committed
+
+    def test_idempotent_when_present(self):
+        """No ALTER is issued when both columns already exist."""
+        from cocosearch.indexer.schema_migration import ensure_line_columns
+        from tests.mocks.db import MockConnection, MockCursor
+
+        cursor = MockCursor(results=[("start_line",), ("end_line",)])
+
+        result = ensure_line_columns(MockConnection(cursor), "my_chunks")
+
+        assert result["already_exists"] is True
+        assert len(cursor.calls) == 1
+
+
+class TestSymbolsSideTable:
+    """Tests for the per-index symbols side table."""
+
+    def test_flow_source_exports_symbols_table(self):
+        """Every symbol in a chunk is collected and exported by the flow."""
+        import cocosearch.indexer.flow as flow_module
+
+        source = inspect.getsource(flow_module)
+        assert 'chunk["symbols"] = chunk["location"].transform(' in source
+        assert 'with chunk["symbols"].row() as symbol:' in source
+        assert 'f"{index_name}_symbols"' in source
+        assert "ensure_symbols_table_indexes(conn, index_name)" in source
+
+    def _conn(self, fetchone):
+        from unittest.mock import MagicMock
+
+        cursor = MagicMock()
+        cursor.fetchone.side_effect = fetchone
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        return conn, cursor
+
+    def _executed(self, cursor):
+        return [" ".join(c.args[0].split()) for c in cursor.execute.call_args_list]
+
+    def test_no_op_before_table_exists(self):
+        from cocosearch.indexer.schema_migration import ensure_symbols_table_indexes
+
+        conn, cursor = self._conn([(None,)])
+
+        result = ensure_symbols_table_indexes(conn, "myidx")
+
+        assert result == {"table_exists": False, "trigram_indexes": False}
+        assert cursor.execute.call_count == 1
+
+    def test_creates_btree_and_trigram_indexes(self):
+        from cocosearch.indexer.schema_migration import ensure_symbols_table_indexes
+
+        conn, cursor = self._conn([("t",), (1,)])
+
+        result = ensure_symbols_table_indexes(conn, "myidx")
+
+        assert result == {"table_exists": True, "trigram_indexes": True}
+        executed = self._executed(cursor)
+        table = "codeindex_myidx__myidx_symbols"
+        assert f"ON {table} (lower(name))" in " ".join(executed)
+        assert f"ON {table} USING GIN (name gin_trgm_ops)" in " ".join(executed)
+
+    def test_skips_trigram_indexes_without_extension(self):
+        import psycopg
+
+        from cocosearch.indexer.schema_migration import ensure_symbols_table_indexes
+
+        conn, cursor = self._conn([("t",), None])
+
+        def execute(sql, *args):
+            if sql.startswith("CREATE EXTENSION"):
+                raise psycopg.errors.InsufficientPrivilege("denied")
+
+        cursor.execute.side_effect = execute
+
+        result = ensure_symbols_table_indexes(conn, "myidx")
+
+        assert result == {"table_exists": True, "trigram_indexes": False}
+        assert not any("gin_trgm_ops" in sql for sql in self._executed(cursor))
+
+
+class TestEnsureFilterIndexes:
+    """Tests for the chunks table filter indexes."""
+
+    def test_flow_source_calls_ensure_filter_indexes(self):
+        import cocosearch.indexer.flow as flow_module
+
+        source = inspect.getsource(flow_module)
+        assert "ensure_filter_indexes(conn, table_name)" in source
+        assert "invalidate_statements()" in source
+
+    def _conn(self, columns, trigram):
+        from unittest.mock import MagicMock
+
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [(c,) for c in columns]
+        cursor.fetchone.return_value = (1,) if trigram else None
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        return conn, cursor
+
+    def _executed(self, cursor):
+        return " ".join(
+            " ".join(c.args[0].split()) for c in cursor.execute.call_args_list
+        )
+
+    def test_creates_btree_and_trigram_indexes(self):
+        from cocosearch.indexer.schema_migration import ensure_filter_indexes
+
+        conn, cursor = self._conn(
+            ["symbol_type", "symbol_name", "language_id"], trigram=True
+        )
+
+        result = ensure_filter_indexes(conn, "my_chunks")
+
+        assert result["trigram_indexes"] is True
+        executed = self._executed(cursor)
+        assert "idx_my_chunks_symbol_type ON my_chunks (symbol_type)" in executed
+        assert "idx_my_chunks_language_id ON my_chunks (language_id)" in executed
+        assert "idx_my_chunks_symbol_name ON my_chunks (lower(symbol_name))" in executed
+        assert "ON my_chunks USING GIN (symbol_name gin_trgm_ops)" in executed
+
+    def test_falls_back_to_btree_without_pg_trgm(self):
+        import psycopg
+
+        from cocosearch.indexer.schema_migration import ensure_filter_indexes
+
+        conn, cursor = self._conn(
+            ["symbol_type", "symbol_name", "language_id"], trigram=False
+        )
+
+        def execute(sql, *args):
+            if sql.startswith("CREATE EXTENSION"):
+                raise psycopg.errors.InsufficientPrivilege("denied")
+
+        cursor.execute.side_effect = execute
+
+        result = ensure_filter_indexes(conn, "my_chunks")
+
+        assert result["trigram_indexes"] is False
+        assert len(result["indexes"]) == 3
+        assert "gin_trgm_ops" not in self._executed(cursor)
+
+    def test_skips_missing_columns(self):
+        from cocosearch.indexer.schema_migration import ensure_filter_indexes
+
+        conn, cursor = self._conn(["language_id"], trigram=True)
+
+        result = ensure_filter_indexes(conn, "my_chunks")
+
+        assert result == {
+            "indexes": ["idx_my_chunks_language_id"],
+            "trigram_indexes": False,
+        }
+        assert "pg_trgm" not in self._executed(cursor)
+
+
+class TestVectorIndexMethod:
+    """Tests for the configured embedding index method."""
+
+    def test_hnsw_parameters(self):
+        from cocosearch.indexer.flow import vector_index_method
+
+        method = vector_index_method(
+            IndexingConfig(hnsw_m=32, hnsw_ef_construction=128)
+        )
+
+        assert method.kind == "Hnsw"
+        assert (method.m, method.ef_construction) == (32, 128)
+
+    def test_ivfflat_parameters(self):
+        from cocosearch.indexer.flow import vector_index_method
+
+        method = vector_index_method(
+            IndexingConfig(vector_index="ivfflat", ivfflat_lists=500)
+        )
+
+        assert method.kind == "IvfFlat"
+        assert method.lists == 500
+
+    def test_defaults_leave_pgvector_defaults(self):
+        from cocosearch.indexer.flow import vector_index_method
+
+        method = vector_index_method(IndexingConfig())
+
+        assert method.m is None
+        assert method.ef_construction is None
+
+    def test_flow_source_passes_method_to_vector_index(self):
+        import cocosearch.indexer.flow as flow_module
+
+        source = inspect.getsource(flow_module)
+        assert "method=vector_index_method," in source
+
+
+class TestEnsureVectorStorage:
+    """Tests for the quantized embedding index migration."""
+
+    def _conn(self, fetchone):
+        cursor = MagicMock()
+        cursor.fetchone.side_effect = fetchone
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        return conn, cursor
+
+    def _executed(self, cursor):
+        return [" ".join(c.args[0].split()) for c in cursor.execute.call_args_list]
+
+    def test_full_storage_drops_quantized_indexes(self):
+        from cocosearch.indexer.schema_migration import ensure_vector_storage
+
+        conn, cursor = self._conn([(1,), None])
+
+        result = ensure_vector_storage(conn, "my_chunks", "full")
+
+        assert result == {
+            "index": None,
+            "dropped": ["idx_my_chunks_embedding_halfvec"],
+            "deferred": False,
+        }
+        assert "DROP INDEX idx_my_chunks_embedding_halfvec" in self._executed(cursor)
+        assert conn.commit.called
+
+    def test_halfvec_hnsw_index(self):
+        from cocosearch.indexer.schema_migration import ensure_vector_storage
+
+        conn, cursor = self._conn([None, (768,), None])
+
+        result = ensure_vector_storage(
+            conn, "my_chunks", "halfvec", hnsw_m=32, hnsw_ef_construction=None
+        )
+
+        assert result["index"] == "idx_my_chunks_embedding_halfvec"
+        create = self._executed(cursor)[-1]
+        assert "USING hnsw ((embedding::halfvec(768)) halfvec_cosine_ops)" in create
+        assert create.endswith("WITH (m = 32)")
+
+    def test_binary_ivfflat_index(self):
+        from cocosearch.indexer.schema_migration import ensure_vector_storage
+
+        conn, cursor = self._conn([None, (768,), None, (False,)])
+
+        ensure_vector_storage(
+            conn, "my_chunks", "binary", vector_index="ivfflat", ivfflat_lists=100
+        )
+
+        create = self._executed(cursor)[-1]
+        assert (
+            "USING ivfflat ((binary_quantize(embedding)::bit(768)) bit_hamming_ops)"
+            in create
+        )
+        assert create.endswith("WITH (lists = 100)")
+
+    def test_matching_index_kept(self):
+        from cocosearch.indexer.schema_migration import ensure_vector_storage
+
+        conn, cursor = self._conn([None, (768,), ("hnsw", ["m=32"])])
+
+        result = ensure_vector_storage(conn, "my_chunks", "halfvec", hnsw_m=32)
+
+        assert result["index"] == "idx_my_chunks_embedding_halfvec"
+        assert result["dropped"] == []
+        assert not any("CREATE INDEX" in q for q in self._executed(cursor))
+
+    def test_changed_settings_rebuild_index(self):
+        from cocosearch.indexer.schema_migration import ensure_vector_storage
+
+        conn, cursor = self._conn([None, (768,), ("hnsw", ["m=16"])])
+
+        result = ensure_vector_storage(conn, "my_chunks", "halfvec", hnsw_m=32)
+
+        executed = self._executed(cursor)
+        assert result["dropped"] == ["idx_my_chunks_embedding_halfvec"]
+        assert "DROP INDEX idx_my_chunks_embedding_halfvec" in executed
+        assert executed[-1].endswith("WITH (m = 32)")
+
+    def test_ivfflat_deferred_on_empty_table(self):
+        from cocosearch.indexer.schema_migration import ensure_vector_storage
+
+        conn, cursor = self._conn([None, (768,), None, (True,)])
+
+        result = ensure_vector_storage(
+            conn, "my_chunks", "binary", vector_index="ivfflat", ivfflat_lists=100
+        )
+
+        assert result["deferred"] is True
+        assert result["index"] is None
+        assert not any("CREATE INDEX" in q for q in self._executed(cursor))
+
+    def test_requires_fixed_dimensions(self):
+        from cocosearch.indexer.schema_migration import ensure_vector_storage
+
+        conn, _ = self._conn([None, (-1,)])
+
+        with pytest.raises(ValueError, match="no fixed dimensions"):
+            ensure_vector_storage(conn, "my_chunks", "binary")
+
+    def test_flow_declares_vector_index_only_for_full_storage(self):
+        import cocosearch.indexer.flow as flow_module
+
+        source = inspect.getsource(flow_module)
+        assert 'if vector_storage == "full"' in source
+        assert "vector_storage=config.vector_storage" in source
+        assert "ensure_vector_storage(" in source
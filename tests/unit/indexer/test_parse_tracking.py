@@ -1,6 +1,12 @@
 """Tests for parse failure tracking module."""
 
-from cocosearch.indexer.parse_tracking import detect_parse_status, _collect_error_lines
+from unittest.mock import MagicMock, patch
+
+from cocosearch.indexer.parse_tracking import (
+    detect_parse_status,
+    _collect_error_lines,
+    track_parse_results,
+)
 
 
 class TestDetectParseStatus:
@@ -100,6 +106,26 @@ class TestCollectErrorLines:
         lines = _collect_error_lines(tree.root_node)
         assert lines == []
 
+    def test_limit_stops_walk_early(self):
+        """With a limit, collection stops after that many errors."""
+        from tree_sitter_language_pack import get_parser
+
+        parser = get_parser("python")
+        source = "".join(f"def f{i}(:\n    pass\n" for i in range(20)).encode()
+        tree = parser.parse(source)
+
+        assert len(_collect_error_lines(tree.root_node)) >= 20
+        assert len(_collect_error_lines(tree.root_node, limit=3)) == 3
+
+    def test_partial_message_truncated(self):
+        """More than ten error lines are reported as the first ten plus a marker."""
+        source = "".join(f"def f{i}(:\n    pass\n" for i in range(20))
+        status, msg = detect_parse_status(source, "py")
+
+        assert status == "partial"
+        assert msg.endswith("(+more)")
+        assert len(msg.split(":", 1)[1].split("(")[0].split(",")) == 10
+
     def test_returns_line_numbers_for_errors(self):
         """Returns line numbers of ERROR nodes."""
         from tree_sitter_language_pack import get_parser
@@ -169,3 +195,120 @@ class TestGrammarNamesSkip:
 
         for ext in ("py", "js", "ts", "go", "yaml"):
             assert ext not in _GRAMMAR_NAMES, f"{ext} should NOT be in _GRAMMAR_NAMES"
+
+
+def _mock_conn(indexed_files, previous_rows):
+    """Connection whose cursor returns indexed files, then stored parse rows."""
+    cursor = MagicMock()
+    cursor.fetchall.side_effect = [indexed_files, previous_rows]
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    return conn, cursor
+
+
+class TestTrackParseResultsIncremental:
+    """Only new or changed files are parsed; removed files are deleted."""
+
+    def test_new_files_parsed_and_upserted(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        conn, cursor = _mock_conn([("a.py", "py")], [])
+
+        summary = track_parse_results(conn, "myidx", str(tmp_path), "chunks")
+
+        assert summary["ok"] == 1
+        assert summary["parsed"] == 1
+        stat = (tmp_path / "a.py").stat()
+        copy = cursor.copy.return_value.__enter__.return_value
+        copy.write_row.assert_called_once_with(
+            ("a.py", "python", "ok", None, stat.st_mtime_ns, stat.st_size)
+        )
+        assert "COPY" in cursor.copy.call_args.args[0]
+        upsert = cursor.execute.call_args_list[-1].args[0]
+        assert "ON CONFLICT (file_path) DO UPDATE" in upsert
+        assert conn.commit.called
+
+    def test_unchanged_file_not_reparsed(self, tmp_path):
+        (tmp_path / "a.py").write_text("def broken(:\n")
+        stat = (tmp_path / "a.py").stat()
+        conn, cursor = _mock_conn(
+            [("a.py", "py")],
+            [("a.py", "partial", stat.st_mtime_ns, stat.st_size)],
+        )
+
+        with patch(
+            "cocosearch.indexer.parse_tracking.detect_parse_status"
+        ) as mock_detect:
+            summary = track_parse_results(conn, "myidx", str(tmp_path), "chunks")
+
+        mock_detect.assert_not_called()
+        copy = cursor.copy.return_value.__enter__.return_value
+        copy.write_row.assert_not_called()
+        assert summary["partial"] == 1
+        assert summary["parsed"] == 0
+
+    def test_changed_file_reparsed(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        conn, cursor = _mock_conn([("a.py", "py")], [("a.py", "partial", 1, 1)])
+
+        summary = track_parse_results(conn, "myidx", str(tmp_path), "chunks")
+
+        assert summary["ok"] == 1
+        assert summary["parsed"] == 1
+
+    def test_full_rewrite_replaces_table(self, tmp_path):
+        """When no stored row survives, the table is swapped, not merged."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        conn, cursor = _mock_conn(
+            [("a.py", "py")], [("a.py", "ok", 1, 1), ("gone.py", "ok", 1, 1)]
+        )
+
+        summary = track_parse_results(conn, "myidx", str(tmp_path), "chunks")
+
+        assert summary["parsed"] == 1
+        assert summary["removed"] == 1
+        executed = [c.args[0] for c in cursor.execute.call_args_list]
+        assert "DELETE FROM cocosearch_parse_results_myidx" in executed
+        assert not any("ON CONFLICT" in sql for sql in executed)
+
+    def test_removed_files_deleted(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        stat = (tmp_path / "a.py").stat()
+        conn, cursor = _mock_conn(
+            [("a.py", "py")],
+            [
+                ("a.py", "ok", stat.st_mtime_ns, stat.st_size),
+                ("gone.py", "ok", 1, 1),
+            ],
+        )
+
+        summary = track_parse_results(conn, "myidx", str(tmp_path), "chunks")
+
+        assert summary["removed"] == 1
+        delete_calls = [
+            c for c in cursor.execute.call_args_list if "DELETE" in c.args[0]
+        ]
+        assert delete_calls[0].args[1] == (["gone.py"],)
+
+    def test_large_batches_use_worker_pool(self, tmp_path):
+        """Past the threshold, files are parsed through the pool executor."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text("x = 1\n")
+        conn, cursor = _mock_conn([("a.py", "py"), ("b.py", "py"), ("c.py", "py")], [])
+
+        with (
+            patch("cocosearch.indexer.parse_tracking.PARALLEL_PARSE_MIN_FILES", 2),
+            patch("cocosearch.indexer.parse_tracking.PARSE_WORKERS", 2),
+            patch(
+                "cocosearch.indexer.parse_tracking.ProcessPoolExecutor",
+                side_effect=lambda max_workers, mp_context: ThreadPoolExecutor(
+                    max_workers
+                ),
+            ) as mock_pool,
+        ):
+            summary = track_parse_results(conn, "myidx", str(tmp_path), "chunks")
+
+        mock_pool.assert_called_once()
+        assert summary["ok"] == 3
+        assert summary["parsed"] == 3
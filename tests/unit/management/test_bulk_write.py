@@ -0,0 +1,87 @@
+"""Tests for cocosearch.management.bulk_write module."""
+
+from unittest.mock import MagicMock
+
+from cocosearch.management.bulk_write import copy_rows, replace_rows, upsert_rows
+
+COLUMNS = ("file_path", "parse_status", "file_size")
+TYPES = ("text", "text", "bigint")
+
+
+def _executed(cursor):
+    return [c.args[0] for c in cursor.execute.call_args_list]
+
+
+class TestCopyRows:
+    """Tests for copy_rows."""
+
+    def test_streams_rows_with_binary_copy(self):
+        cursor = MagicMock()
+        rows = iter([("a.py", "ok", 10), ("b.py", "partial", 20)])
+
+        written = copy_rows(cursor, "t", COLUMNS, TYPES, rows)
+
+        assert written == 2
+        sql = cursor.copy.call_args.args[0]
+        assert sql.startswith("COPY t (file_path, parse_status, file_size)")
+        assert "FORMAT BINARY" in sql
+        copy = cursor.copy.return_value.__enter__.return_value
+        copy.set_types.assert_called_once_with(list(TYPES))
+        assert copy.write_row.call_count == 2
+
+
+class TestUpsertRows:
+    """Tests for upsert_rows."""
+
+    def test_stages_then_merges(self):
+        cursor = MagicMock()
+
+        written = upsert_rows(
+            cursor, "t", COLUMNS, TYPES, [("a.py", "ok", 10)], key="file_path"
+        )
+
+        assert written == 1
+        executed = _executed(cursor)
+        assert "CREATE TEMP TABLE IF NOT EXISTS t_staging" in executed[0]
+        assert "ON COMMIT DROP" in executed[0]
+        assert executed[1] == "TRUNCATE t_staging"
+        assert "COPY t_staging" in cursor.copy.call_args.args[0]
+        merge = executed[-1]
+        assert "SELECT file_path, parse_status, file_size FROM t_staging" in merge
+        assert "ON CONFLICT (file_path) DO UPDATE SET" in merge
+        assert "file_path = EXCLUDED.file_path" not in merge
+        assert "file_size = EXCLUDED.file_size" in merge
+
+    def test_no_rows_skips_merge(self):
+        cursor = MagicMock()
+
+        written = upsert_rows(cursor, "t", COLUMNS, TYPES, [], key="file_path")
+
+        assert written == 0
+        assert not any("INSERT" in sql for sql in _executed(cursor))
+
+
+class TestReplaceRows:
+    """Tests for replace_rows."""
+
+    def test_swaps_contents_after_copy(self):
+        cursor = MagicMock()
+        order = []
+        cursor.copy.side_effect = lambda sql: order.append("copy") or MagicMock()
+        cursor.execute.side_effect = lambda sql, *a: order.append(sql.split()[0])
+
+        written = replace_rows(cursor, "t", COLUMNS, TYPES, [("a.py", "ok", 1)])
+
+        # COPY fills staging before the target is touched
+        assert order == ["CREATE", "TRUNCATE", "copy", "DELETE", "INSERT"]
+        executed = _executed(cursor)
+        assert executed[-2] == "DELETE FROM t"
+        assert "ON CONFLICT" not in executed[-1]
+        assert written == 1
+
+    def test_empty_rows_clears_table(self):
+        cursor = MagicMock()
+
+        replace_rows(cursor, "t", COLUMNS, TYPES, [])
+
+        assert "DELETE FROM t" in _executed(cursor)
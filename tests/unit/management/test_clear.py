@@ -71,8 +71,45 @@ class TestClearIndex:
 
         # Find the DROP TABLE queries and verify table names are included
         drop_queries = [q for q, _ in cursor.calls if "DROP TABLE" in q]
-        assert len(drop_queries) == 2
+        assert len(drop_queries) == 3
         # Chunks table drop
         assert "codeindex_" in drop_queries[0] or "myproject" in drop_queries[0]
+        # Symbols side table drop
+        assert "codeindex_myproject__myproject_symbols" in drop_queries[1]
         # Parse results table drop
-        assert "cocosearch_parse_results_myproject" in drop_queries[1]
+        assert "cocosearch_parse_results_myproject" in drop_queries[2]
+
+    def test_invalidates_prepared_statements(self, mock_db_pool):
+        """Statements prepared against the dropped tables are discarded."""
+        pool, cursor, conn = mock_db_pool(results=[(True,)])
+        with (
+            patch("cocosearch.management.clear.get_connection_pool", return_value=pool),
+            patch("cocosearch.management.clear.invalidate_statements") as mock_inv,
+        ):
+            clear_index("myproject")
+
+        mock_inv.assert_called_once()
+
+    def test_cached_search_misses_after_clear(self, mock_db_pool):
+        """Persisted query cache entries for the index are dropped."""
+        from cocosearch.search.cache import get_query_cache
+
+        cache_params = dict(
+            query="auth",
+            index_name="myproject",
+            limit=10,
+            min_score=0.0,
+            language_filter=None,
+            use_hybrid=None,
+            symbol_type=None,
+            symbol_name=None,
+        )
+        get_query_cache().put(**cache_params, results=[{"file": "auth.py"}])
+
+        pool, cursor, conn = mock_db_pool(results=[(True,)])
+        with patch(
+            "cocosearch.management.clear.get_connection_pool", return_value=pool
+        ):
+            clear_index("myproject")
+
+        assert get_query_cache().get(**cache_params) == (None, "miss")
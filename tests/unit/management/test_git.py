@@ -4,15 +4,23 @@ Tests get_git_root, derive_index_from_git, get_current_branch, and
 get_commit_hash functions using pytest-subprocess for git command mocking.
 """
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
+
+from cocosearch.management import git as git_module
 from cocosearch.management.git import (
+    GitState,
     get_git_root,
     derive_index_from_git,
     get_current_branch,
     get_commit_hash,
     get_commits_behind,
     get_branch_commit_count,
+    get_cached_commits_behind,
+    get_git_state,
 )
 
 
@@ -274,3 +282,95 @@ class TestGetBranchCommitCount:
         )
         result = get_branch_commit_count()
         assert result == 42
+
+
+def _touch(path: Path, content: str) -> None:
+    """Rewrite a file and move its mtime forward (coarse filesystem clocks)."""
+    path.write_text(content)
+    stamp = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Minimal .git layout: HEAD on main with a loose branch ref."""
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "refs" / "heads" / "main").write_text("a" * 40 + "\n")
+    return tmp_path
+
+
+class TestGitStateCache:
+    """Tests for the per-project git state cache."""
+
+    def _patched(self, branch="main", commit="abc1234", behind=3):
+        return (
+            patch.object(git_module, "get_current_branch", return_value=branch),
+            patch.object(git_module, "get_commit_hash", return_value=commit),
+            patch.object(git_module, "get_commits_behind", return_value=behind),
+        )
+
+    def test_repeated_checks_run_git_once(self, repo):
+        p_branch, p_commit, p_behind = self._patched()
+        with p_branch as mock_branch, p_commit as mock_commit, p_behind as mock_behind:
+            for _ in range(3):
+                assert get_git_state(repo) == GitState("main", "abc1234")
+                assert get_cached_commits_behind(repo, "0000000") == 3
+
+        assert mock_branch.call_count == 1
+        assert mock_commit.call_count == 1
+        assert mock_behind.call_count == 1
+
+    def test_new_commit_invalidates(self, repo):
+        p_branch, p_commit, p_behind = self._patched()
+        with p_branch, p_commit as mock_commit, p_behind:
+            get_git_state(repo)
+            _touch(repo / ".git" / "refs" / "heads" / "main", "b" * 40 + "\n")
+            get_git_state(repo)
+
+        assert mock_commit.call_count == 2
+
+    def test_checkout_invalidates(self, repo):
+        p_branch, p_commit, p_behind = self._patched()
+        with p_branch as mock_branch, p_commit, p_behind:
+            get_git_state(repo)
+            _touch(repo / ".git" / "HEAD", "ref: refs/heads/feature\n")
+            get_git_state(repo)
+
+        assert mock_branch.call_count == 2
+
+    def test_subdirectory_watches_enclosing_repo(self, repo):
+        sub = repo / "src"
+        sub.mkdir()
+        assert git_module._git_fingerprint(sub) == git_module._git_fingerprint(repo)
+        assert git_module._git_fingerprint(sub)[0] is not None
+
+    def test_worktree_gitdir_file_followed(self, tmp_path, repo):
+        worktree_git = repo / ".git" / "worktrees" / "wt"
+        worktree_git.mkdir(parents=True)
+        (worktree_git / "HEAD").write_text("ref: refs/heads/main\n")
+        (worktree_git / "commondir").write_text("../..\n")
+        checkout = tmp_path / "wt"
+        checkout.mkdir()
+        (checkout / ".git").write_text(f"gitdir: {worktree_git}\n")
+
+        git_dir, common_dir = git_module._find_git_dirs(checkout)
+
+        assert git_dir == worktree_git.resolve()
+        assert common_dir == (repo / ".git").resolve()
+
+    def test_non_git_path_uses_short_ttl(self, tmp_path, monkeypatch):
+        p_branch, p_commit, p_behind = self._patched(branch=None, commit=None)
+        clock = iter([100.0, 101.0, 100.0 + git_module.GIT_STATE_TTL + 1])
+        monkeypatch.setattr(git_module.time, "monotonic", lambda: next(clock))
+        with (
+            patch.object(git_module, "_find_git_dirs", return_value=None),
+            p_branch,
+            p_commit as mock_commit,
+            p_behind,
+        ):
+            for _ in range(3):
+                get_git_state(tmp_path)
+
+        assert mock_commit.call_count == 2
@@ -457,6 +457,20 @@ class TestRegisterIndexPath:
         set_clause = upsert_sql.split("DO UPDATE SET")[1]
         assert "status" not in set_clause
 
+    def test_status_written_in_same_statement(self, mock_db_pool, tmp_path):
+        """register_index_path writes an explicit status on insert and update."""
+        pool, cursor, conn = mock_db_pool(results=[])
+
+        with patch(
+            "cocosearch.management.metadata.get_connection_pool", return_value=pool
+        ):
+            with patch("cocosearch.management.metadata.ensure_metadata_table"):
+                register_index_path("myindex", tmp_path, status="indexed")
+
+        upsert_sql, params = cursor.calls[-1]
+        assert "status = EXCLUDED.status" in upsert_sql.split("DO UPDATE SET")[1]
+        assert params[2] == "indexed"
+
     def test_clears_cache_after_registration(self, mock_db_pool, tmp_path):
         """register_index_path clears lru_cache after write."""
         pool, cursor, conn = mock_db_pool(results=[])
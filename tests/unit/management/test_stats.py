@@ -291,6 +291,19 @@ class TestIndexStats:
 class TestCheckStaleness:
     """Tests for check_staleness function."""
 
+    def test_given_metadata_skips_query(self):
+        """updated_at from caller-supplied metadata is used directly."""
+        from datetime import timedelta
+
+        updated_at = datetime.now(timezone.utc) - timedelta(days=9)
+        with patch("cocosearch.management.stats.get_connection_pool") as mock_pool:
+            result = check_staleness("myproject", metadata={"updated_at": updated_at})
+            missing = check_staleness("myproject", metadata={})
+
+        mock_pool.assert_not_called()
+        assert result == (True, 9)
+        assert missing == (True, -1)
+
     def test_returns_stale_for_old_index(self, mock_db_pool):
         """Returns (True, days) for index older than threshold."""
         # 10 days ago
@@ -671,6 +684,31 @@ class TestCheckBranchStaleness:
         assert result["commits_changed"] is False
         assert result["commits_behind"] is None
 
+    def test_given_metadata_skips_query(self):
+        """Metadata passed by the caller is used without a database lookup."""
+        metadata = {
+            "canonical_path": "/path/to/project",
+            "branch": "main",
+            "commit_hash": "abc1234",
+        }
+
+        with (
+            patch("cocosearch.management.stats.get_index_metadata") as mock_meta,
+            patch("cocosearch.management.git.get_current_branch", return_value="main"),
+            patch("cocosearch.management.git.get_commit_hash", return_value="def5678"),
+            patch(
+                "cocosearch.management.git.get_commits_behind", return_value=2
+            ) as mock_behind,
+        ):
+            first = check_branch_staleness("myindex", metadata=metadata)
+            second = check_branch_staleness("myindex", metadata=metadata)
+
+        mock_meta.assert_not_called()
+        # Git state is cached per project between checks
+        mock_behind.assert_called_once()
+        assert first == second
+        assert first["commits_behind"] == 2
+
 
 class TestCollectWarningsBranch:
     """Tests for collect_warnings with branch staleness."""
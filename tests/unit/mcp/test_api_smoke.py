@@ -151,6 +151,9 @@ class TestApiSearchSmoke:
         mock_result.symbol_type = "function"
         mock_result.symbol_name = "hello"
         mock_result.symbol_signature = "def hello()"
+        mock_result.content = None
+        mock_result.start_line = None
+        mock_result.end_line = None
 
         with patch("cocosearch.mcp.server._ensure_cocoindex_init"):
             with patch("cocosearch.mcp.server.search", return_value=[mock_result]):
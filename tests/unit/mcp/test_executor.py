@@ -0,0 +1,191 @@
+"""Tests for cocosearch.mcp.executor module."""
+
+import asyncio
+import contextvars
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cocosearch.mcp import executor as executor_module
+from cocosearch.mcp.executor import BlockingExecutor, get_executor, reset_executor
+
+
+@pytest.fixture
+def pool():
+    executor = BlockingExecutor(max_workers=1, timeout=5.0)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def release():
+    """Event that unblocks worker calls; set on teardown so threads exit."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+async def _until(predicate):
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("condition not reached")
+
+
+class TestBlockingExecutor:
+    """Tests for BlockingExecutor.run and its counters."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop_thread(self, pool):
+        def work(a, b=0):
+            return threading.current_thread().name, a + b
+
+        name, total = await pool.run(work, 1, b=2)
+
+        assert name.startswith("cocosearch-worker")
+        assert total == 3
+        assert pool.stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_loop_stays_responsive_while_busy(self, pool, release):
+        task = asyncio.create_task(pool.run(release.wait))
+        await _until(lambda: pool.stats()["active"] == 1)
+
+        # Other coroutines keep running while the worker is blocked
+        await asyncio.sleep(0.01)
+        assert not task.done()
+
+        release.set()
+        assert await task is True
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limited_and_queue_depth_reported(self, pool, release):
+        first = asyncio.create_task(pool.run(release.wait))
+        second = asyncio.create_task(pool.run(release.wait))
+        await _until(lambda: pool.stats()["queued"] == 1)
+
+        assert pool.stats()["active"] == 1
+
+        release.set()
+        await asyncio.gather(first, second)
+        stats = pool.stats()
+        assert (stats["active"], stats["queued"], stats["completed"]) == (0, 0, 2)
+
+    @pytest.mark.asyncio
+    async def test_queued_call_dropped_at_deadline(self, release):
+        pool = BlockingExecutor(max_workers=1, timeout=0.05)
+        ran = []
+        blocker = asyncio.create_task(pool.run(release.wait))
+        await _until(lambda: pool.stats()["active"] == 1)
+
+        with pytest.raises(TimeoutError, match="append timed out"):
+            await pool.run(ran.append, "late")
+
+        release.set()
+        with pytest.raises(TimeoutError):
+            await blocker
+        pool.shutdown()
+        assert ran == []
+        stats = pool.stats()
+        assert stats["queued"] == 0
+        assert stats["timed_out"] == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_counted(self, pool):
+        def fail():
+            raise ValueError("bad filter")
+
+        with pytest.raises(ValueError, match="bad filter"):
+            await pool.run(fail)
+
+        assert pool.stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_from_func_not_rewritten(self, pool):
+        def fail():
+            raise TimeoutError("Vector search did not complete within 30.0s")
+
+        with pytest.raises(TimeoutError, match="Vector search did not complete"):
+            await pool.run(fail)
+
+        stats = pool.stats()
+        assert (stats["failed"], stats["timed_out"]) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_context_variables_copied(self, pool):
+        var = contextvars.ContextVar("var", default="unset")
+        var.set("request")
+
+        assert await pool.run(var.get) == "request"
+
+
+class TestSharedExecutor:
+    """Tests for the process-wide executor."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_executor(self):
+        reset_executor()
+        yield
+        reset_executor()
+
+    def test_sized_from_env(self, monkeypatch):
+        monkeypatch.setenv("COCOSEARCH_MCP_WORKERS", "3")
+        monkeypatch.setenv("COCOSEARCH_MCP_REQUEST_TIMEOUT", "2.5")
+
+        executor = get_executor()
+
+        assert (executor.max_workers, executor.timeout) == (3, 2.5)
+        assert get_executor() is executor
+
+    def test_invalid_env_falls_back_to_defaults(self, monkeypatch):
+        monkeypatch.setenv("COCOSEARCH_MCP_WORKERS", "0")
+        monkeypatch.setenv("COCOSEARCH_MCP_REQUEST_TIMEOUT", "soon")
+
+        executor = get_executor()
+
+        assert executor.max_workers == executor_module.DEFAULT_WORKERS
+        assert executor.timeout == executor_module.DEFAULT_REQUEST_TIMEOUT
+
+    def test_stats_none_before_first_use(self):
+        assert executor_module.get_executor_stats() is None
+
+    @pytest.mark.asyncio
+    async def test_run_blocking_uses_shared_executor(self):
+        assert await executor_module.run_blocking(sum, [1, 2]) == 3
+        assert executor_module.get_executor_stats()["completed"] == 1
+
+
+class TestServerOffload:
+    """Search handlers report executor timeouts instead of hanging."""
+
+    @pytest.mark.asyncio
+    async def test_search_code_timeout_returns_error(self):
+        from cocosearch.mcp.server import search_code
+
+        with patch(
+            "cocosearch.mcp.server.run_blocking",
+            side_effect=TimeoutError("_search_code_output timed out after 60s"),
+        ):
+            result = await search_code(query="q", ctx=MagicMock(), index_name="myindex")
+
+        assert result[0]["error"] == "Search timed out"
+        assert result[0]["results"] == []
+
+    @pytest.mark.asyncio
+    async def test_api_search_timeout_returns_504(self):
+        from cocosearch.mcp.server import api_search
+
+        request = MagicMock()
+        request.json = AsyncMock(return_value={"query": "q", "index_name": "idx"})
+        with (
+            patch("cocosearch.mcp.server._ensure_cocoindex_init"),
+            patch(
+                "cocosearch.mcp.server.run_blocking",
+                side_effect=TimeoutError("timed out"),
+            ),
+        ):
+            response = await api_search(request)
+
+        assert response.status_code == 504
@@ -8,6 +8,7 @@ from unittest.mock import patch, MagicMock
 from cocosearch.management.stats import IndexStats
 from cocosearch.mcp.server import (
     search_code,
+    search_code_batch,
     list_indexes,
     index_stats,
     clear_index,
@@ -120,6 +121,59 @@ class TestSearchCode:
         )
 
 
+class TestSearchCodeBatch:
+    """Tests for search_code_batch MCP tool."""
+
+    @pytest.mark.asyncio
+    async def test_returns_results_per_query(self):
+        """Returns one entry per query with formatted results."""
+        from cocosearch.search.query import SearchResult
+
+        batches = [
+            [SearchResult("/test/a.py", 0, 100, 0.9)],
+            [],
+        ]
+        with (
+            patch("cocoindex.init"),
+            patch(
+                "cocosearch.mcp.server.search_many", return_value=batches
+            ) as mock_search_many,
+            patch("cocosearch.mcp.server.byte_to_line", return_value=1),
+            patch("cocosearch.mcp.server.read_chunk_content", return_value="code"),
+        ):
+            result = await search_code_batch(
+                queries=["auth flow", "db setup"],
+                ctx=_make_mock_ctx(),
+                index_name="testindex",
+                smart_context=False,
+            )
+
+        assert mock_search_many.call_args.kwargs["queries"] == [
+            "auth flow",
+            "db setup",
+        ]
+        assert [entry["query"] for entry in result] == ["auth flow", "db setup"]
+        assert result[0]["results"][0]["file_path"] == "/test/a.py"
+        assert result[1]["results"] == []
+
+    @pytest.mark.asyncio
+    async def test_value_error_returned_as_error(self):
+        """Invalid batches are reported instead of raising."""
+        with (
+            patch("cocoindex.init"),
+            patch(
+                "cocosearch.mcp.server.search_many",
+                side_effect=ValueError("Too many queries"),
+            ),
+        ):
+            result = await search_code_batch(
+                queries=["q"], ctx=_make_mock_ctx(), index_name="testindex"
+            )
+
+        assert result[0]["error"] == "Search error"
+        assert "Too many queries" in result[0]["message"]
+
+
 class TestSearchCodeMetadata:
     """Tests for metadata fields in search_code MCP response."""
 
@@ -667,6 +721,25 @@ class TestMCPToolRegistration:
 class TestRunServer:
     """Tests for run_server transport selection."""
 
+    @pytest.fixture(autouse=True)
+    def mock_pool_warmup(self):
+        """Keep startup warmup from opening real database connections."""
+        with patch("cocosearch.mcp.server.warm_connection_pool") as mock_warm:
+            yield mock_warm
+
+    def test_warms_connection_pool_at_startup(self, monkeypatch, mock_pool_warmup):
+        monkeypatch.setenv("COCOSEARCH_NO_DASHBOARD", "1")
+        with patch("cocosearch.mcp.server.mcp"):
+            from cocosearch.mcp.server import run_server
+
+            with patch("cocosearch.mcp.server.threading.Thread") as mock_thread:
+                run_server(transport="stdio")
+
+        mock_thread.assert_called_once_with(
+            target=mock_pool_warmup, daemon=True, name="pool-warmup"
+        )
+        mock_thread.return_value.start.assert_called_once()
+
     def test_signature_has_transport_params(self):
         """run_server accepts transport, host, port parameters."""
         import inspect
@@ -795,6 +868,7 @@ class TestRegisterWithGit:
             branch="main",
             commit_hash="abc1234",
             branch_commit_count=1234,
+            status=None,
         )
 
     def test_passes_none_when_not_git_repo(self):
@@ -818,6 +892,7 @@ class TestRegisterWithGit:
             branch=None,
             commit_hash=None,
             branch_commit_count=None,
+            status=None,
         )
 
     def test_index_codebase_registers_with_git(self, tmp_codebase):
@@ -836,6 +911,7 @@ class TestRegisterWithGit:
         assert result["success"] is True
         # _register_with_git called twice: pre-start and post-index
         assert mock_rwg.call_count == 2
+        mock_rwg.assert_any_call("testindex", str(tmp_codebase), status="indexing")
         mock_rwg.assert_any_call("testindex", str(tmp_codebase))
 
 
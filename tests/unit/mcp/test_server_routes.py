@@ -130,6 +130,36 @@ class TestApiList:
         assert "branch" not in body[0]
 
 
+class TestApiMetrics:
+    """Tests for GET /api/metrics endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_reports_pool_and_executor_stats(self):
+        from cocosearch.mcp.server import api_metrics
+
+        pool = {"pool_size": 2, "requests_waiting": 0, "requests_wait_ms": 12}
+        executor = {"max_workers": 8, "active": 1, "queued": 3}
+        with (
+            patch("cocosearch.mcp.server.get_pool_stats", return_value=pool),
+            patch("cocosearch.mcp.server.get_executor_stats", return_value=executor),
+        ):
+            response = await api_metrics(_make_mock_request())
+
+        assert _parse_response(response) == {"pool": pool, "executor": executor}
+
+    @pytest.mark.asyncio
+    async def test_null_before_first_use(self):
+        from cocosearch.mcp.server import api_metrics
+
+        with (
+            patch("cocosearch.mcp.server.get_pool_stats", return_value=None),
+            patch("cocosearch.mcp.server.get_executor_stats", return_value=None),
+        ):
+            response = await api_metrics(_make_mock_request())
+
+        assert _parse_response(response) == {"pool": None, "executor": None}
+
+
 class TestApiAnalyze:
     """Tests for POST /api/analyze endpoint."""
 
@@ -579,6 +609,9 @@ class TestApiSearchEnhanced:
         mock_result.symbol_type = None
         mock_result.symbol_name = None
         mock_result.symbol_signature = None
+        mock_result.content = None
+        mock_result.start_line = None
+        mock_result.end_line = None
 
         mock_expander_instance = MagicMock()
         mock_expander_instance.get_context_lines.return_value = (
@@ -637,6 +670,9 @@ class TestApiSearchEnhanced:
         mock_result.symbol_type = None
         mock_result.symbol_name = None
         mock_result.symbol_signature = None
+        mock_result.content = None
+        mock_result.start_line = None
+        mock_result.end_line = None
 
         mock_expander_instance = MagicMock()
         mock_expander_instance.get_context_lines.return_value = (
@@ -690,6 +726,55 @@ class TestApiSearchEnhanced:
         # ContextExpander should not be instantiated
         mock_expander_cls.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_uses_stored_content_without_reading_file(self):
+        """Results carrying stored content skip read_chunk_content."""
+        from cocosearch.mcp.server import api_search
+        from cocosearch.search.query import SearchResult
+
+        request = _make_mock_request(
+            body={"query": "test query", "index_name": "myindex"}
+        )
+        result = SearchResult("/test/file.py", 0, 20, 0.9, content="line1\nline2")
+
+        with (
+            patch("cocosearch.mcp.server._ensure_cocoindex_init"),
+            patch("cocosearch.mcp.server.search", return_value=[result]) as mock_search,
+            patch("cocosearch.mcp.server.byte_to_line", return_value=5),
+            patch("cocosearch.mcp.server.read_chunk_content") as mock_read,
+        ):
+            response = await api_search(request)
+
+        item = _parse_response(response)["results"][0]
+        assert item["content"] == "line1\nline2"
+        assert (item["start_line"], item["end_line"]) == (5, 6)
+        assert mock_search.call_args.kwargs["include_content"] is True
+        mock_read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_uses_stored_line_numbers(self):
+        """Results carrying stored line numbers skip byte_to_line."""
+        from cocosearch.mcp.server import api_search
+        from cocosearch.search.query import SearchResult
+
+        request = _make_mock_request(
+            body={"query": "test query", "index_name": "myindex"}
+        )
+        result = SearchResult(
+            "/test/file.py", 0, 20, 0.9, content="a\nb", start_line=30, end_line=31
+        )
+
+        with (
+            patch("cocosearch.mcp.server._ensure_cocoindex_init"),
+            patch("cocosearch.mcp.server.search", return_value=[result]),
+            patch("cocosearch.mcp.server.byte_to_line") as mock_line,
+        ):
+            response = await api_search(request)
+
+        item = _parse_response(response)["results"][0]
+        assert (item["start_line"], item["end_line"]) == (30, 31)
+        mock_line.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_search_returns_query_time_ms(self):
         """Response includes query_time_ms field."""
@@ -770,6 +855,195 @@ class TestApiSearchEnhanced:
         assert "Search failed" in body["error"]
 
 
+class TestApiSearchBatch:
+    """Tests for POST /api/search/batch."""
+
+    @pytest.mark.asyncio
+    async def test_requires_query_list(self):
+        """Missing or empty queries returns 400."""
+        from cocosearch.mcp.server import api_search_batch
+
+        for body in (
+            {"index_name": "myindex"},
+            {"queries": [], "index_name": "myindex"},
+            {"queries": "single", "index_name": "myindex"},
+            {"queries": ["ok", "  "], "index_name": "myindex"},
+        ):
+            response = await api_search_batch(_make_mock_request(body=body))
+            assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_missing_index_name_returns_400(self):
+        """Missing index_name returns 400."""
+        from cocosearch.mcp.server import api_search_batch
+
+        response = await api_search_batch(_make_mock_request(body={"queries": ["q"]}))
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_returns_batches_in_order(self):
+        """Each query gets its own result list, in request order."""
+        from cocosearch.mcp.server import api_search_batch
+        from cocosearch.search.query import SearchResult
+
+        request = _make_mock_request(
+            body={
+                "queries": ["auth flow", "db setup"],
+                "index_name": "myindex",
+                "limit": 3,
+                "no_cache": True,
+            }
+        )
+        batches = [[], [SearchResult("/test/db.py", 0, 10, 0.8)]]
+
+        with (
+            patch("cocosearch.mcp.server._ensure_cocoindex_init"),
+            patch(
+                "cocosearch.mcp.server.search_many", return_value=batches
+            ) as mock_search_many,
+            patch("cocosearch.mcp.server.byte_to_line", return_value=1),
+            patch("cocosearch.mcp.server.read_chunk_content", return_value="code"),
+        ):
+            response = await api_search_batch(request)
+
+        body = _parse_response(response)
+        assert response.status_code == 200
+        assert body["total"] == 1
+        assert [b["query"] for b in body["batches"]] == ["auth flow", "db setup"]
+        assert body["batches"][1]["results"][0]["file_path"] == "/test/db.py"
+        assert "query_time_ms" in body
+        kwargs = mock_search_many.call_args.kwargs
+        assert kwargs["limit"] == 3
+        assert kwargs["no_cache"] is True
+
+    @pytest.mark.asyncio
+    async def test_value_error_returns_400(self):
+        """ValueError from search_many (e.g. batch too large) returns 400."""
+        from cocosearch.mcp.server import api_search_batch
+
+        request = _make_mock_request(body={"queries": ["q"], "index_name": "myindex"})
+        with (
+            patch("cocosearch.mcp.server._ensure_cocoindex_init"),
+            patch(
+                "cocosearch.mcp.server.search_many",
+                side_effect=ValueError("Too many queries"),
+            ),
+        ):
+            response = await api_search_batch(request)
+
+        assert response.status_code == 400
+
+
+class TestApiSearchStream:
+    """Tests for POST /api/search/stream."""
+
+    @staticmethod
+    async def _read(response):
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    @pytest.mark.asyncio
+    async def test_streams_ndjson_events_in_rank_order(self):
+        """meta, one result per hit in rank order, then done."""
+        from cocosearch.mcp.server import api_search_stream
+        from cocosearch.search.query import SearchResult
+
+        request = _make_mock_request(
+            body={"query": "auth", "index_name": "myindex", "limit": 2}
+        )
+        request.headers = {}
+        results = [
+            SearchResult("/test/a.py", 0, 10, 0.9),
+            SearchResult("/test/b.py", 0, 10, 0.8),
+        ]
+
+        with (
+            patch("cocosearch.mcp.server._ensure_cocoindex_init"),
+            patch("cocosearch.mcp.server.search", return_value=results) as mock_search,
+            patch("cocosearch.mcp.server.byte_to_line", return_value=1),
+            patch("cocosearch.mcp.server.read_chunk_content", return_value="code"),
+        ):
+            response = await api_search_stream(request)
+            events = [
+                json.loads(line) for line in (await self._read(response)).splitlines()
+            ]
+
+        assert response.media_type == "application/x-ndjson"
+        assert [e["type"] for e in events] == ["meta", "result", "result", "done"]
+        assert events[0]["total"] == 2
+        assert [e["rank"] for e in events[1:3]] == [1, 2]
+        assert events[2]["result"]["file_path"] == "/test/b.py"
+        assert events[3]["total"] == 2
+        assert mock_search.call_args.kwargs["limit"] == 2
+
+    @pytest.mark.asyncio
+    async def test_sse_when_requested(self):
+        """Accept: text/event-stream switches to SSE framing."""
+        from cocosearch.mcp.server import api_search_stream
+
+        request = _make_mock_request(body={"query": "auth", "index_name": "myindex"})
+        request.headers = {"accept": "text/event-stream"}
+
+        with (
+            patch("cocosearch.mcp.server._ensure_cocoindex_init"),
+            patch("cocosearch.mcp.server.search", return_value=[]),
+        ):
+            response = await api_search_stream(request)
+            text = await self._read(response)
+
+        assert response.media_type == "text/event-stream"
+        assert text.startswith("event: meta\ndata: ")
+        assert "event: done\n" in text
+
+    @pytest.mark.asyncio
+    async def test_enrichment_failure_reported_in_stream(self):
+        """A failure after headers are sent becomes an error event."""
+        from cocosearch.mcp.server import api_search_stream
+        from cocosearch.search.query import SearchResult
+
+        request = _make_mock_request(body={"query": "auth", "index_name": "myindex"})
+        request.headers = {}
+
+        with (
+            patch("cocosearch.mcp.server._ensure_cocoindex_init"),
+            patch(
+                "cocosearch.mcp.server.search",
+                return_value=[SearchResult("/test/a.py", 0, 10, 0.9)],
+            ),
+            patch(
+                "cocosearch.mcp.server.read_chunk_content",
+                side_effect=OSError("gone"),
+            ),
+        ):
+            response = await api_search_stream(request)
+            events = [
+                json.loads(line) for line in (await self._read(response)).splitlines()
+            ]
+
+        assert [e["type"] for e in events] == ["meta", "error"]
+        assert "gone" in events[1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_search_errors_keep_status_codes(self):
+        """Errors before streaming starts return JSON with a status code."""
+        from cocosearch.mcp.server import api_search_stream
+
+        response = await api_search_stream(_make_mock_request(body={"query": "q"}))
+        assert response.status_code == 400
+
+        request = _make_mock_request(body={"query": "q", "index_name": "myindex"})
+        with (
+            patch("cocosearch.mcp.server._ensure_cocoindex_init"),
+            patch(
+                "cocosearch.mcp.server.search",
+                side_effect=ValueError("Bad index"),
+            ),
+        ):
+            response = await api_search_stream(request)
+
+        assert response.status_code == 400
+        assert _parse_response(response)["error"] == "Bad index"
+
+
 class TestApiIndexEnhanced:
     """Tests for enhanced POST /api/index with new parameters."""
 
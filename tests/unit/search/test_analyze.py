@@ -63,6 +63,9 @@ def _patch_common(mocker):
         "cocosearch.search.analyze.check_symbol_columns_exist",
         return_value=True,
     )
+    mocker.patch("cocosearch.search.analyze.code_to_embedding").eval.return_value = [
+        0.1
+    ] * 1024
 
 
 class TestAnalyzeReturnsResult:
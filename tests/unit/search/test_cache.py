@@ -10,6 +10,7 @@ import pytest
 
 from cocosearch.search.cache import (
     QueryCache,
+    _EmbeddingIndex,
     _compute_cache_key,
     cosine_similarity,
     get_query_cache,
@@ -95,6 +96,72 @@ class TestCosineSimilarity:
         assert sim > 0.9
 
 
+class TestEmbeddingIndex:
+    """Tests for the matrix-backed semantic lookup table."""
+
+    def test_matches_best_first(self):
+        """Matches above threshold are returned in descending similarity."""
+        index = _EmbeddingIndex(dim=3)
+        index.add("x", [1.0, 0.0, 0.0])
+        index.add("y", [0.0, 1.0, 0.0])
+        index.add("xy", [1.0, 1.0, 0.0])
+
+        matches = index.matches([1.0, 0.1, 0.0], threshold=0.5)
+
+        assert [key for key, _ in matches] == ["x", "xy"]
+        assert matches[0][1] == pytest.approx(cosine_similarity([1, 0.1, 0], [1, 0, 0]))
+
+    def test_rows_are_normalized(self):
+        """Stored magnitude does not affect similarity."""
+        index = _EmbeddingIndex(dim=2)
+        index.add("big", [10.0, 0.0])
+
+        [(key, sim)] = index.matches([0.5, 0.0], threshold=0.9)
+
+        assert key == "big"
+        assert sim == pytest.approx(1.0)
+
+    def test_grows_beyond_initial_capacity(self):
+        """Adding past capacity reallocates without losing rows."""
+        index = _EmbeddingIndex(dim=2, capacity=2)
+        for i in range(5):
+            index.add(f"k{i}", [1.0, float(i)])
+
+        assert len(index) == 5
+        assert index.matches([1.0, 4.0], threshold=0.999)[0][0] == "k4"
+
+    def test_remove_swaps_last_row(self):
+        """Removing a middle row keeps the remaining rows addressable."""
+        index = _EmbeddingIndex(dim=2)
+        index.add("a", [1.0, 0.0])
+        index.add("b", [0.0, 1.0])
+        index.add("c", [-1.0, 0.0])
+
+        index.remove("a")
+
+        assert len(index) == 2
+        assert "a" not in index
+        assert index.matches([-1.0, 0.0], threshold=0.99)[0][0] == "c"
+        assert index.matches([0.0, 1.0], threshold=0.99)[0][0] == "b"
+        assert index.matches([1.0, 0.0], threshold=0.99) == []
+
+    def test_add_existing_key_overwrites(self):
+        """Re-adding a key replaces its row instead of duplicating it."""
+        index = _EmbeddingIndex(dim=2)
+        index.add("a", [1.0, 0.0])
+        index.add("a", [0.0, 1.0])
+
+        assert len(index) == 1
+        assert index.matches([1.0, 0.0], threshold=0.5) == []
+
+    def test_zero_query_matches_nothing(self):
+        """A zero query vector never matches."""
+        index = _EmbeddingIndex(dim=2)
+        index.add("a", [1.0, 0.0])
+
+        assert index.matches([0.0, 0.0], threshold=0.0) == []
+
+
 class TestQueryCache:
     """Tests for QueryCache class."""
 
@@ -222,6 +289,109 @@ class TestQueryCache:
         assert cached is None
         assert hit_type == "miss"
 
+    def test_semantic_lookup_scans_all_entries(self, cache):
+        """Semantic lookup is not limited to the most recent entries."""
+        cache.put(
+            query="oldest query",
+            index_name="test-index",
+            limit=10,
+            min_score=0.0,
+            language_filter=None,
+            use_hybrid=None,
+            symbol_type=None,
+            symbol_name=None,
+            results=[{"file": "oldest.py"}],
+            query_embedding=[1.0, 0.0, 0.0],
+        )
+        for i in range(100):
+            cache.put(
+                query=f"filler {i}",
+                index_name="test-index",
+                limit=10,
+                min_score=0.0,
+                language_filter=None,
+                use_hybrid=None,
+                symbol_type=None,
+                symbol_name=None,
+                results=[],
+                query_embedding=[0.0, 1.0, float(i)],
+            )
+
+        cached, hit_type = cache.get(
+            query="paraphrase",
+            index_name="test-index",
+            limit=10,
+            min_score=0.0,
+            language_filter=None,
+            use_hybrid=None,
+            symbol_type=None,
+            symbol_name=None,
+            query_embedding=[0.99, 0.01, 0.0],
+        )
+
+        assert cached == [{"file": "oldest.py"}]
+        assert hit_type == "semantic"
+
+    def test_semantic_match_scoped_to_search_params(self, cache):
+        """Semantic hits only come from entries cached with the same filters."""
+        cache.put(
+            query="original query",
+            index_name="test-index",
+            limit=10,
+            min_score=0.0,
+            language_filter="python",
+            use_hybrid=None,
+            symbol_type=None,
+            symbol_name=None,
+            results=[{"file": "test.py"}],
+            query_embedding=[1.0, 0.0, 0.0],
+        )
+
+        cached, hit_type = cache.get(
+            query="different query",
+            index_name="test-index",
+            limit=10,
+            min_score=0.0,
+            language_filter="go",
+            use_hybrid=None,
+            symbol_type=None,
+            symbol_name=None,
+            query_embedding=[1.0, 0.0, 0.0],
+        )
+
+        assert cached is None
+        assert hit_type == "miss"
+
+    def test_semantic_dimension_mismatch_misses(self, cache):
+        """A query embedding of a different dimension is a miss, not an error."""
+        cache.put(
+            query="original query",
+            index_name="test-index",
+            limit=10,
+            min_score=0.0,
+            language_filter=None,
+            use_hybrid=None,
+            symbol_type=None,
+            symbol_name=None,
+            results=[{"file": "test.py"}],
+            query_embedding=[1.0, 0.0, 0.0],
+        )
+
+        cached, hit_type = cache.get(
+            query="different query",
+            index_name="test-index",
+            limit=10,
+            min_score=0.0,
+            language_filter=None,
+            use_hybrid=None,
+            symbol_type=None,
+            symbol_name=None,
+            query_embedding=[1.0, 0.0],
+        )
+
+        assert cached is None
+        assert hit_type == "miss"
+
     def test_invalidate_index(self, cache):
         """Invalidation removes all entries for index."""
         results = [{"file": "test.py"}]
@@ -439,3 +609,132 @@ class TestGlobalCache:
 
         removed = invalidate_index_cache("global-test-index")
         assert removed >= 0  # May be 0 if test order varies
+
+
+class TestPersistentCache:
+    """Tests for the SQLite-backed persistent tier."""
+
+    @staticmethod
+    def _put(cache, query, index_name="test-index", results=None, embedding=None):
+        cache.put(
+            query=query,
+            index_name=index_name,
+            limit=10,
+            min_score=0.0,
+            language_filter=None,
+            use_hybrid=None,
+            symbol_type=None,
+            symbol_name=None,
+            results=results if results is not None else [{"file": "test.py"}],
+            query_embedding=embedding,
+        )
+
+    @staticmethod
+    def _get(cache, query, index_name="test-index", embedding=None):
+        return cache.get(
+            query=query,
+            index_name=index_name,
+            limit=10,
+            min_score=0.0,
+            language_filter=None,
+            use_hybrid=None,
+            symbol_type=None,
+            symbol_name=None,
+            query_embedding=embedding,
+        )
+
+    def test_exact_hit_survives_restart(self, tmp_path):
+        """A new cache instance serves entries written by a previous one."""
+        self._put(QueryCache(cache_dir=str(tmp_path)), "query1")
+
+        cached, hit_type = self._get(QueryCache(cache_dir=str(tmp_path)), "query1")
+
+        assert cached == [{"file": "test.py"}]
+        assert hit_type == "exact"
+
+    def test_search_results_round_trip(self, tmp_path):
+        """SearchResult objects are rebuilt from the persistent tier."""
+        from cocosearch.search.query import SearchResult
+
+        results = [
+            SearchResult(
+                filename="/path/file.py",
+                start_byte=0,
+                end_byte=100,
+                score=0.87,
+                language_id="python",
+                symbol_type="function",
+                symbol_name="main",
+            )
+        ]
+        self._put(QueryCache(cache_dir=str(tmp_path)), "query1", results=results)
+
+        cached, _ = self._get(QueryCache(cache_dir=str(tmp_path)), "query1")
+
+        assert cached == results
+        assert isinstance(cached[0], SearchResult)
+
+    def test_semantic_hit_survives_restart(self, tmp_path):
+        """Persisted embeddings take part in semantic lookup after restart."""
+        self._put(QueryCache(cache_dir=str(tmp_path)), "query1", embedding=[1.0, 0.0])
+
+        cached, hit_type = self._get(
+            QueryCache(cache_dir=str(tmp_path)), "paraphrase", embedding=[0.99, 0.01]
+        )
+
+        assert cached == [{"file": "test.py"}]
+        assert hit_type == "semantic"
+
+    def test_ttl_enforced_on_disk(self, tmp_path):
+        """Expired persisted entries are not served."""
+        self._put(QueryCache(cache_dir=str(tmp_path)), "query1")
+
+        cached, hit_type = self._get(
+            QueryCache(cache_dir=str(tmp_path), ttl=0), "query1"
+        )
+
+        assert cached is None
+        assert hit_type == "miss"
+
+    def test_invalidate_removes_persisted_entries(self, tmp_path):
+        """Invalidation from one instance clears entries for later instances."""
+        self._put(QueryCache(cache_dir=str(tmp_path)), "query1")
+        self._put(QueryCache(cache_dir=str(tmp_path)), "query2", index_name="other")
+
+        removed = QueryCache(cache_dir=str(tmp_path)).invalidate_index("test-index")
+
+        fresh = QueryCache(cache_dir=str(tmp_path))
+        assert removed == 1
+        assert self._get(fresh, "query1")[0] is None
+        assert self._get(fresh, "query2", index_name="other")[0] is not None
+
+    def test_evicts_oldest_beyond_size_budget(self, tmp_path):
+        """Oldest rows are evicted when the payload budget is exceeded."""
+        cache = QueryCache(cache_dir=str(tmp_path), max_disk_bytes=60)
+        self._put(cache, "query1", results=[{"file": "a" * 30}])
+        self._put(cache, "query2", results=[{"file": "b" * 30}])
+
+        fresh = QueryCache(cache_dir=str(tmp_path))
+        assert self._get(fresh, "query1")[0] is None
+        assert self._get(fresh, "query2")[0] == [{"file": "b" * 30}]
+
+    def test_disk_hits_respect_memory_limit(self, tmp_path, monkeypatch):
+        """Entries promoted from disk are subject to MAX_CACHE_ENTRIES."""
+        from cocosearch.search import cache as cache_module
+
+        self._put(QueryCache(cache_dir=str(tmp_path)), "query1")
+        self._put(QueryCache(cache_dir=str(tmp_path)), "query2", embedding=[1.0, 0.0])
+        monkeypatch.setattr(cache_module, "MAX_CACHE_ENTRIES", 1)
+        fresh = QueryCache(cache_dir=str(tmp_path))
+
+        assert self._get(fresh, "query1")[1] == "exact"
+        assert self._get(fresh, "paraphrase", embedding=[0.99, 0.01])[1] == "semantic"
+        assert len(fresh._cache) == 1
+
+    def test_persist_disabled(self, tmp_path):
+        """persist=False keeps the cache memory-only."""
+        self._put(QueryCache(cache_dir=str(tmp_path), persist=False), "query1")
+
+        cached, _ = self._get(QueryCache(cache_dir=str(tmp_path)), "query1")
+
+        assert cached is None
@@ -0,0 +1,156 @@
+"""Tests for cocosearch.search.catalog module."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from cocosearch.search import catalog as catalog_module
+from cocosearch.search.catalog import (
+    get_catalog,
+    index_name_from_table,
+    invalidate_catalog,
+    table_has_column,
+)
+
+CHUNKS = "codeindex_myproject__myproject_chunks"
+
+COLUMN_ROWS = [
+    (CHUNKS, "filename"),
+    (CHUNKS, "content_text"),
+    (CHUNKS, "content_tsv"),
+    ("codeindex_myproject__myproject_symbols", "symbol_name"),
+    ("codeindex_old__old_chunks", "filename"),
+]
+
+
+@pytest.fixture
+def db(mock_db_pool):
+    """Catalog backed by a mock pool; yields the cursor for query counting."""
+    pool, cursor, _ = mock_db_pool(results=COLUMN_ROWS)
+    updated = datetime.now() - timedelta(seconds=90)
+    rows = [("myproject", "/p", updated, updated, "indexing", "main", "abc", 3)]
+    with (
+        patch.object(catalog_module, "get_connection_pool", return_value=pool),
+        patch(
+            "cocosearch.management.metadata.list_index_metadata_rows",
+            return_value=rows,
+        ),
+    ):
+        yield cursor
+
+
+def _reset_cursor(cursor):
+    cursor._fetch_index = 0
+
+
+class TestIndexNameFromTable:
+    """Tests for index_name_from_table."""
+
+    def test_chunks_table(self):
+        assert index_name_from_table("codeindex_my_app__my_app_chunks") == "my_app"
+
+    def test_other_tables_ignored(self):
+        assert index_name_from_table("codeindex_a__a_symbols") is None
+        assert index_name_from_table("cocosearch_index_metadata") is None
+
+
+class TestCatalog:
+    """Tests for catalog loading and lookups."""
+
+    def test_loads_once_and_serves_from_memory(self, db):
+        assert table_has_column(CHUNKS, "content_tsv") is True
+        assert table_has_column(CHUNKS, "content_text") is True
+        assert table_has_column(CHUNKS, "start_line") is False
+
+        assert len(db.calls) == 1
+        db.assert_query_contains("information_schema.columns")
+
+    def test_lists_indexes_like_discovery(self, db):
+        assert get_catalog().indexes() == [
+            {"name": "myproject", "table_name": CHUNKS},
+            {"name": "old", "table_name": "codeindex_old__old_chunks"},
+        ]
+
+    def test_metadata_elapsed_computed_at_lookup(self, db):
+        metadata = get_catalog().index_metadata("myproject")
+
+        assert metadata["canonical_path"] == "/p"
+        assert metadata["status"] == "indexing"
+        assert metadata["indexing_elapsed_seconds"] >= 90
+        assert get_catalog().index_metadata("missing") is None
+
+    def test_reloads_after_ttl(self, db):
+        get_catalog()
+        _reset_cursor(db)
+
+        get_catalog(max_age=0)
+
+        assert len(db.calls) == 2
+
+    def test_invalidate_forces_reload(self, db):
+        get_catalog()
+        _reset_cursor(db)
+
+        invalidate_catalog()
+        get_catalog()
+
+        assert len(db.calls) == 2
+
+    def test_unknown_table_reloads_at_most_once_per_interval(self, db):
+        get_catalog()
+        _reset_cursor(db)
+
+        with patch.object(catalog_module, "_MIN_RELOAD_INTERVAL", 0.0):
+            assert table_has_column("codeindex_new__new_chunks", "filename") is False
+        assert len(db.calls) == 2
+
+        # Within the interval, a missing table is answered from memory
+        _reset_cursor(db)
+        assert table_has_column("codeindex_new__new_chunks", "filename") is False
+        assert len(db.calls) == 2
+
+
+class TestCheckColumnExistsUsesCatalog:
+    """check_column_exists answers index tables from the catalog."""
+
+    def test_index_table_from_catalog(self, db):
+        from cocosearch.search.db import check_column_exists
+
+        assert check_column_exists(CHUNKS, "content_tsv") is True
+        assert check_column_exists(CHUNKS, "content_tsv") is True
+
+        assert len(db.calls) == 1
+
+
+class TestCachedLookups:
+    """list_indexes and get_index_metadata read the catalog when cached."""
+
+    def test_list_indexes_cached(self, db):
+        from cocosearch.management.discovery import list_indexes
+
+        assert [idx["name"] for idx in list_indexes(cached=True)] == [
+            "myproject",
+            "old",
+        ]
+        list_indexes(cached=True)
+
+        assert len(db.calls) == 1
+
+    def test_get_index_metadata_cached(self, db):
+        from cocosearch.management.metadata import get_index_metadata
+
+        assert get_index_metadata("myproject", cached=True)["branch"] == "main"
+
+    def test_metadata_write_invalidates(self, db, mock_db_pool):
+        from cocosearch.management.metadata import set_index_status
+
+        get_catalog()
+        pool, cursor, _ = mock_db_pool()
+        cursor.rowcount = 1
+        with patch(
+            "cocosearch.management.metadata.get_connection_pool", return_value=pool
+        ):
+            set_index_status("myproject", "indexed")
+
+        assert catalog_module._catalog is None
@@ -4,10 +4,13 @@ Tests smart context expansion with tree-sitter boundary detection,
 LRU caching, and edge case handling.
 """
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from cocosearch.search.context_expander import (
     ContextExpander,
+    _FileIndex,
     get_context_with_boundaries,
     MAX_CONTEXT_LINES,
     LINE_TRUNCATION_LENGTH,
@@ -634,6 +637,54 @@ class TestCaching:
         assert info.misses >= 1
 
 
+# ============================================================================
+# Test File Index
+# ============================================================================
+
+
+class TestFileIndex:
+    """Tests for the per-file line offset index."""
+
+    def test_byte_to_line_matches_newline_count(self):
+        """Binary search agrees with counting newlines before the offset."""
+        content = b"a\nbb\n\nccc\nd"
+        index = _FileIndex(content)
+
+        for offset in range(len(content) + 1):
+            assert index.byte_to_line(offset) == content[:offset].count(b"\n") + 1
+
+    def test_line_to_byte_with_crlf(self):
+        """Line starts come from the bytes, so CRLF endings are counted."""
+        index = _FileIndex(b"one\r\ntwo\r\nthree\r\n")
+
+        assert index.lines == ["one", "two", "three"]
+        assert index.line_to_byte(2) == 5
+        assert index.line_to_byte(3) == 10
+
+    def test_line_to_byte_clamps(self):
+        """Out-of-range line numbers clamp to the first and last line."""
+        index = _FileIndex(b"x\ny")
+
+        assert index.line_to_byte(0) == 0
+        assert index.line_to_byte(99) == 2
+
+    def test_empty_content(self):
+        """Empty files have no lines."""
+        assert _FileIndex(b"").lines == []
+
+    def test_results_in_same_file_share_one_parse(self, expander, sample_python_file):
+        """Several scope lookups in one file read and parse it once."""
+        parser = MagicMock(wraps=expander._get_parser("python"))
+
+        with patch.object(expander, "_get_parser", return_value=parser):
+            first = expander.find_enclosing_scope(sample_python_file, 6, 6, "python")
+            second = expander.find_enclosing_scope(sample_python_file, 18, 18, "python")
+
+        assert first[0] <= 4 and second[0] <= 18
+        parser.parse.assert_called_once()
+        assert expander._read_file_cached.cache_info().misses == 1
+
+
 # ============================================================================
 # Test Edge Cases
 # ============================================================================
@@ -32,6 +32,87 @@ class TestGetConnectionPool:
             "conninfo", call_kwargs.args[0] if call_kwargs.args else ""
         )
 
+    def test_pool_sized_and_checked_from_settings(self):
+        db_module._pool = None
+        settings = db_module.PoolSettings(
+            min_size=3, max_size=12, timeout=5.0, max_idle=60.0
+        )
+
+        with (
+            patch.object(db_module, "get_pool_settings", return_value=settings),
+            patch("cocosearch.search.db.ConnectionPool") as mock_pool_cls,
+        ):
+            get_connection_pool()
+
+        kwargs = mock_pool_cls.call_args.kwargs
+        assert kwargs["min_size"] == 3
+        assert kwargs["max_size"] == 12
+        assert kwargs["timeout"] == 5.0
+        assert kwargs["max_idle"] == 60.0
+        assert kwargs["check"] is mock_pool_cls.check_connection
+        db_module._pool = None
+
+
+class TestPoolSettings:
+    """Tests for connection pool settings, warmup, and metrics."""
+
+    def test_defaults(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        assert db_module.get_pool_settings() == db_module.PoolSettings()
+
+    def test_resolved_from_env_and_config(self, tmp_path, monkeypatch):
+        (tmp_path / "cocosearch.yaml").write_text(
+            "database:\n  poolMinSize: 4\n  poolTimeout: 5\n"
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("COCOSEARCH_DATABASE_POOL_MAX_SIZE", "20")
+
+        assert db_module.get_pool_settings() == db_module.PoolSettings(
+            min_size=4, max_size=20, timeout=5.0
+        )
+
+    def test_max_size_raised_to_min_size(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("COCOSEARCH_DATABASE_POOL_MIN_SIZE", "16")
+
+        assert db_module.get_pool_settings().max_size == 16
+
+    def test_warmup_waits_for_min_connections(self):
+        pool = MagicMock(timeout=30.0)
+        with patch.object(db_module, "get_connection_pool", return_value=pool):
+            assert db_module.warm_connection_pool() is True
+
+        pool.wait.assert_called_once_with(timeout=30.0)
+
+    def test_warmup_failure_is_reported_not_raised(self):
+        pool = MagicMock()
+        pool.wait.side_effect = Exception("pool initialization incomplete")
+        with patch.object(db_module, "get_connection_pool", return_value=pool):
+            assert db_module.warm_connection_pool(timeout=1.0) is False
+
+    def test_stats_none_without_pool(self, monkeypatch):
+        monkeypatch.setattr(db_module, "_pool", None)
+
+        assert db_module.get_pool_stats() is None
+
+    def test_stats_include_zero_counters(self, monkeypatch):
+        pool = MagicMock()
+        pool.get_stats.return_value = {
+            "pool_min": 2,
+            "pool_size": 2,
+            "requests_waiting": 1,
+            "requests_num": 7,
+        }
+        monkeypatch.setattr(db_module, "_pool", pool)
+
+        stats = db_module.get_pool_stats()
+
+        assert stats["requests_waiting"] == 1
+        assert stats["requests_num"] == 7
+        assert stats["connections_errors"] == 0
+        assert stats["requests_wait_ms"] == 0
+
 
 class TestGetTableName:
     """Tests for get_table_name function."""
@@ -172,3 +253,253 @@ class TestCheckSymbolColumnsExist:
         # Verify cache is empty
         assert "test_table" not in db_module._symbol_columns_available
         assert len(db_module._symbol_columns_available) == 0
+
+
+class TestCheckLineColumnsExist:
+    """Tests for check_line_columns_exist function."""
+
+    def _mock_pool(self, rows):
+        mock_pool = MagicMock()
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = rows
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_pool.connection.return_value.__enter__.return_value = mock_conn
+        return mock_pool, mock_cursor
+
+    def test_both_present_cached(self):
+        """Should return True and query the database only once."""
+        mock_pool, mock_cursor = self._mock_pool([("start_line",), ("end_line",)])
+
+        with patch.object(db_module, "get_connection_pool", return_value=mock_pool):
+            assert db_module.check_line_columns_exist("test_table") is True
+            assert db_module.check_line_columns_exist("test_table") is True
+
+        assert mock_cursor.execute.call_count == 1
+
+    def test_partial_is_false(self):
+        """Should return False unless both columns exist."""
+        mock_pool, _ = self._mock_pool([("start_line",)])
+
+        with patch.object(db_module, "get_connection_pool", return_value=mock_pool):
+            assert db_module.check_line_columns_exist("test_table") is False
+
+    def test_reset_line_columns_cache(self):
+        """Should clear the cache when reset function is called."""
+        db_module._line_columns_available["test_table"] = True
+
+        db_module.reset_line_columns_cache()
+
+        assert len(db_module._line_columns_available) == 0
+
+
+class TestCheckSymbolsTableExists:
+    """Tests for check_symbols_table_exists function."""
+
+    def _mock_pool(self, exists):
+        mock_pool = MagicMock()
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (exists,)
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_pool.connection.return_value.__enter__.return_value = mock_conn
+        return mock_pool, mock_cursor
+
+    def test_table_name(self):
+        assert db_module.get_symbols_table_name("myidx") == (
+            "codeindex_myidx__myidx_symbols"
+        )
+
+    def test_present_cached(self):
+        """Should return True and query the database only once."""
+        mock_pool, mock_cursor = self._mock_pool(True)
+
+        with patch.object(db_module, "get_connection_pool", return_value=mock_pool):
+            assert db_module.check_symbols_table_exists("myidx") is True
+            assert db_module.check_symbols_table_exists("myidx") is True
+
+        assert mock_cursor.execute.call_count == 1
+        assert mock_cursor.execute.call_args.args[1] == (
+            "codeindex_myidx__myidx_symbols",
+        )
+
+    def test_missing_is_false(self):
+        mock_pool, _ = self._mock_pool(False)
+
+        with patch.object(db_module, "get_connection_pool", return_value=mock_pool):
+            assert db_module.check_symbols_table_exists("myidx") is False
+
+    def test_reset_symbols_table_cache(self):
+        db_module._symbols_table_available["myidx"] = True
+
+        db_module.reset_symbols_table_cache()
+
+        assert len(db_module._symbols_table_available) == 0
+
+
+class TestVectorSearchSettings:
+    """Tests for per-query vector index scan settings."""
+
+    def _apply(self, settings, filtered, supported=True):
+        db_module._vector_search_settings = settings
+        db_module._iterative_scan_supported = supported
+        cursor = MagicMock()
+        relaxed = db_module.apply_vector_search_settings(cursor, filtered=filtered)
+        return relaxed, cursor
+
+    def _gucs(self, cursor):
+        if not cursor.execute.called:
+            return {}
+        params = cursor.execute.call_args.args[1]
+        return dict(zip(params[::2], params[1::2]))
+
+    def test_defaults_send_nothing_unfiltered(self):
+        relaxed, cursor = self._apply(db_module.VectorSearchSettings(), False)
+
+        assert relaxed is False
+        cursor.execute.assert_not_called()
+
+    def test_scan_sizes_set_transaction_locally(self):
+        settings = db_module.VectorSearchSettings(hnsw_ef_search=100, ivfflat_probes=8)
+
+        _, cursor = self._apply(settings, False)
+
+        sql = cursor.execute.call_args.args[0]
+        assert sql.count("set_config(%s, %s, true)") == 2
+        assert self._gucs(cursor) == {"hnsw.ef_search": "100", "ivfflat.probes": "8"}
+
+    def test_filtered_query_enables_relaxed_iterative_scan(self):
+        relaxed, cursor = self._apply(db_module.VectorSearchSettings(), True)
+
+        assert relaxed is True
+        assert self._gucs(cursor) == {
+            "hnsw.iterative_scan": "relaxed_order",
+            "ivfflat.iterative_scan": "relaxed_order",
+        }
+
+    def test_strict_order_only_applies_to_hnsw(self):
+        settings = db_module.VectorSearchSettings(iterative_scan="strict_order")
+
+        relaxed, cursor = self._apply(settings, True)
+
+        assert relaxed is False
+        assert self._gucs(cursor) == {"hnsw.iterative_scan": "strict_order"}
+
+    def test_old_pgvector_skips_iterative_scan(self):
+        relaxed, cursor = self._apply(db_module.VectorSearchSettings(), True, False)
+
+        assert relaxed is False
+        cursor.execute.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "version,expected", [("0.8.0", True), ("0.7.4", False), ("1.0", True)]
+    )
+    def test_pgvector_version_detected_once(self, version, expected):
+        db_module._iterative_scan_supported = None
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (version,)
+
+        assert db_module._check_iterative_scan_supported(cursor) is expected
+        assert db_module._check_iterative_scan_supported(cursor) is expected
+        assert cursor.execute.call_count == 1
+
+    def test_resolved_from_env_and_config(self, tmp_path, monkeypatch):
+        (tmp_path / "cocosearch.yaml").write_text(
+            "search:\n  hnswEfSearch: 80\n  iterativeScan: strict_order\n"
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("COCOSEARCH_SEARCH_IVFFLAT_PROBES", "4")
+        db_module.reset_vector_search_settings()
+
+        settings = db_module.get_vector_search_settings()
+
+        assert settings == db_module.VectorSearchSettings(
+            hnsw_ef_search=80, ivfflat_probes=4, iterative_scan="strict_order"
+        )
+        assert db_module.get_vector_search_settings() is settings
+
+
+class TestVectorStorage:
+    """Tests for quantized vector storage detection and ordering."""
+
+    def test_candidate_order_matches_index_expressions(self):
+        halfvec = db_module.VectorStorage("halfvec", 768)
+        binary = db_module.VectorStorage("binary", 768)
+
+        assert halfvec.candidate_order_sql("%s::vector") == (
+            "(embedding::halfvec(768)) <=> (%s::vector)::halfvec(768)"
+        )
+        assert binary.candidate_order_sql("q.query_vec") == (
+            "(binary_quantize(embedding)::bit(768)) <~> binary_quantize(q.query_vec)"
+        )
+        assert not db_module.VectorStorage().quantized
+
+    def _mock_pool(self, index_names, dims=768):
+        mock_pool = MagicMock()
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [(name,) for name in index_names]
+        mock_cursor.fetchone.return_value = (dims,)
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_pool.connection.return_value.__enter__.return_value = mock_conn
+        return mock_pool, mock_cursor
+
+    def test_detects_quantized_index_cached(self):
+        mock_pool, mock_cursor = self._mock_pool(
+            ["t_pkey", "idx_t_embedding_binary"], dims=1024
+        )
+
+        with patch.object(db_module, "get_connection_pool", return_value=mock_pool):
+            storage = db_module.get_vector_storage("t")
+            assert db_module.get_vector_storage("t") is storage
+
+        assert storage == db_module.VectorStorage("binary", 1024)
+        assert mock_cursor.execute.call_count == 2
+
+    def test_full_without_quantized_index(self):
+        mock_pool, _ = self._mock_pool(["t_pkey", "t__embedding_idx"])
+
+        with patch.object(db_module, "get_connection_pool", return_value=mock_pool):
+            assert db_module.get_vector_storage("t") == db_module.VectorStorage()
+
+    def test_reset_vector_storage_cache(self):
+        db_module._vector_storage["t"] = db_module.VectorStorage()
+
+        db_module.reset_vector_storage_cache()
+
+        assert len(db_module._vector_storage) == 0
+
+
+class TestStatementRegistry:
+    """Tests for the prepared search statement registry."""
+
+    def test_builds_once_per_key(self):
+        build = MagicMock(return_value="SELECT 1")
+
+        assert db_module.get_statement(("k", "t"), build) == "SELECT 1"
+        assert db_module.get_statement(("k", "t"), build) == "SELECT 1"
+
+        build.assert_called_once()
+
+    def test_bounded_lru(self):
+        with patch.object(db_module, "MAX_STATEMENTS", 2):
+            db_module.get_statement("a", lambda: "A")
+            db_module.get_statement("b", lambda: "B")
+            db_module.get_statement("a", lambda: "A")
+            db_module.get_statement("c", lambda: "C")
+
+        assert list(db_module._statements) == ["a", "c"]
+
+    def test_executes_prepared(self):
+        cursor = MagicMock()
+
+        db_module.execute_statement(cursor, "SELECT %s", [1])
+
+        cursor.execute.assert_called_once_with("SELECT %s", [1], prepare=True)
+
+    def test_invalidation_rebuilds_statements(self):
+        db_module.get_statement("k", lambda: "old")
+
+        db_module.invalidate_statements()
+
+        assert db_module.get_statement("k", lambda: "new") == "new"
@@ -0,0 +1,180 @@
+"""Unit tests for the query embedding cache.
+
+Tests key normalization, LRU eviction, hit/miss counters, the persistent
+tier, and that search() reuses embeddings across filter changes.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cocosearch.search.embedding_cache import (
+    EmbeddingCache,
+    embed_query,
+    get_embedding_cache,
+    normalize_query_text,
+)
+
+
+class TestNormalizeQueryText:
+    """Tests for cache key normalization."""
+
+    def test_collapses_whitespace(self):
+        assert normalize_query_text("  find   auth\n code ") == "find auth code"
+
+    def test_preserves_case(self):
+        assert normalize_query_text("getUserById") == "getUserById"
+
+
+class TestEmbeddingCache:
+    """Tests for the in-memory LRU tier."""
+
+    def test_miss_then_hit(self):
+        cache = EmbeddingCache(persist=False)
+        embed = MagicMock(return_value=[0.5, 0.25])
+
+        first = cache.get_or_embed("auth flow", embed)
+        second = cache.get_or_embed("auth flow", embed)
+
+        assert first == second == [0.5, 0.25]
+        embed.assert_called_once_with("auth flow")
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_whitespace_variants_share_entry(self):
+        cache = EmbeddingCache(persist=False)
+        embed = MagicMock(return_value=[1.0])
+
+        cache.get_or_embed("auth flow", embed)
+        cache.get_or_embed("  auth   flow ", embed)
+
+        embed.assert_called_once()
+
+    def test_keyed_by_model(self):
+        cache = EmbeddingCache(persist=False)
+        cache.put("auth", [1.0], model="model-a")
+
+        assert cache.get("auth", model="model-a") == [1.0]
+        assert cache.get("auth", model="model-b") is None
+
+    def test_model_defaults_to_env(self, monkeypatch):
+        cache = EmbeddingCache(persist=False)
+        monkeypatch.setenv("COCOSEARCH_EMBEDDING_MODEL", "model-a")
+        cache.put("auth", [1.0])
+
+        monkeypatch.setenv("COCOSEARCH_EMBEDDING_MODEL", "model-b")
+        assert cache.get("auth") is None
+
+    def test_lru_eviction(self):
+        cache = EmbeddingCache(persist=False, max_entries=2)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+        cache.get("a")  # refresh "a" so "b" is least recently used
+        cache.put("c", [3.0])
+
+        assert cache.get("a") == [1.0]
+        assert cache.get("b") is None
+        assert cache.get("c") == [3.0]
+        assert cache.stats()["entries"] == 2
+
+    def test_returns_exact_values_from_memory(self):
+        cache = EmbeddingCache(persist=False)
+        cache.put("q", [0.1] * 4)
+        assert cache.get("q") == [0.1] * 4
+
+    def test_clear_resets_entries_and_counters(self):
+        cache = EmbeddingCache(persist=False)
+        cache.get_or_embed("q", lambda text: [1.0])
+        cache.clear()
+
+        assert cache.get("q") is None
+        assert cache.stats()["misses"] == 0
+        assert cache.stats()["entries"] == 0
+
+
+class TestPersistentEmbeddingCache:
+    """Tests for the SQLite-backed persistent tier."""
+
+    def test_survives_restart(self, tmp_path):
+        EmbeddingCache(cache_dir=str(tmp_path)).put("auth", [0.5, 0.25])
+
+        restarted = EmbeddingCache(cache_dir=str(tmp_path))
+        embed = MagicMock()
+        assert restarted.get_or_embed("auth", embed) == [0.5, 0.25]
+        embed.assert_not_called()
+
+    def test_disk_tier_bounded(self, tmp_path):
+        cache = EmbeddingCache(cache_dir=str(tmp_path), max_disk_entries=2)
+        for text in ("a", "b", "c"):
+            cache.put(text, [1.0])
+
+        restarted = EmbeddingCache(cache_dir=str(tmp_path))
+        assert restarted.get("a") is None
+        assert restarted.get("b") == [1.0]
+        assert restarted.get("c") == [1.0]
+
+    def test_disk_hit_survives_eviction(self, tmp_path):
+        cache = EmbeddingCache(cache_dir=str(tmp_path), max_disk_entries=2)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+
+        # Re-read "a" from disk after a restart, then push one entry out
+        restarted = EmbeddingCache(cache_dir=str(tmp_path), max_disk_entries=2)
+        assert restarted.get("a") == [1.0]
+        restarted.put("c", [3.0])
+
+        reopened = EmbeddingCache(cache_dir=str(tmp_path))
+        assert reopened.get("a") == [1.0]
+        assert reopened.get("b") is None
+
+    def test_clear_removes_disk_rows(self, tmp_path):
+        cache = EmbeddingCache(cache_dir=str(tmp_path))
+        cache.put("auth", [1.0])
+        cache.clear()
+
+        assert EmbeddingCache(cache_dir=str(tmp_path)).get("auth") is None
+
+    def test_unwritable_dir_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = EmbeddingCache(cache_dir=str(blocker / "sub"))
+
+        assert cache.stats()["persistent"] is False
+        cache.put("auth", [1.0])
+        assert cache.get("auth") == [1.0]
+
+
+class TestGlobalEmbeddingCache:
+    """Tests for the singleton and embed_query helper."""
+
+    def test_singleton(self):
+        assert get_embedding_cache() is get_embedding_cache()
+
+    def test_embed_query_uses_singleton(self):
+        embed = MagicMock(return_value=[1.0])
+        embed_query("auth", embed)
+        embed_query("auth", embed)
+
+        embed.assert_called_once()
+        assert get_embedding_cache().stats()["hits"] == 1
+
+
+class TestSearchReusesEmbedding:
+    """search() should not re-embed the same text when only filters change."""
+
+    @pytest.mark.parametrize("no_cache", [False, True])
+    def test_limit_change_skips_ollama(self, mock_db_pool, no_cache):
+        from cocosearch.search.query import search
+
+        pool, _cursor, _conn = mock_db_pool(results=[])
+        mock_embedding = MagicMock()
+        mock_embedding.eval.return_value = [0.1] * 8
+
+        with (
+            patch("cocosearch.search.query.get_connection_pool", return_value=pool),
+            patch("cocosearch.search.query.code_to_embedding", mock_embedding),
+        ):
+            search("auth flow", "idx", limit=5, use_hybrid=False, no_cache=no_cache)
+            search("auth flow", "idx", limit=20, use_hybrid=False, no_cache=no_cache)
+
+        mock_embedding.eval.assert_called_once_with("auth flow")
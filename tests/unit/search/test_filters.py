@@ -83,6 +83,12 @@ class TestBuildSymbolWhereClause:
         assert where == "symbol_name ILIKE %s"
         assert params == ["get%"]
 
+    def test_exact_name_uses_lower_equality(self):
+        """Name without wildcards should compare lower() values (btree-served)."""
+        where, params = build_symbol_where_clause(symbol_name="get_user")
+        assert where == "lower(symbol_name) = lower(%s)"
+        assert params == ["get_user"]
+
     def test_type_and_name(self):
         """Both type and name should combine with AND."""
         where, params = build_symbol_where_clause(
@@ -132,3 +138,44 @@ class TestBuildSymbolWhereClause:
         )
         assert where == "symbol_type IN (%s, %s, %s)"
         assert params == ["function", "method", "class"]
+
+
+class TestSymbolsTableClause:
+    """Tests for filtering through the per-index symbols side table."""
+
+    TABLE = "codeindex_idx__idx_symbols"
+
+    def test_semi_join_on_chunk_key(self):
+        """Conditions are applied inside a (filename, location) semi-join."""
+        where, _ = build_symbol_where_clause(
+            symbol_type="method", symbols_table=self.TABLE
+        )
+        assert where == (
+            "(filename, location) IN (SELECT filename, location "
+            f"FROM {self.TABLE} WHERE symbol_type IN (%s))"
+        )
+
+    def test_exact_name_matches_bare_or_qualified(self):
+        """Names without wildcards compare lower() values."""
+        where, params = build_symbol_where_clause(
+            symbol_name="Service.start", symbols_table=self.TABLE
+        )
+        assert "lower(name) = lower(%s) OR lower(qualified_name) = lower(%s)" in where
+        assert params == ["Service.start", "Service.start"]
+
+    def test_glob_name_uses_ilike(self):
+        """Glob patterns match either name column with ILIKE."""
+        where, params = build_symbol_where_clause(
+            symbol_type=["function", "method"],
+            symbol_name="get_*",
+            symbols_table=self.TABLE,
+        )
+        assert (
+            "symbol_type IN (%s, %s) AND (name ILIKE %s OR qualified_name ILIKE %s)"
+            in where
+        )
+        assert params == ["function", "method", "get\\_%", "get\\_%"]
+
+    def test_invalid_type_still_rejected(self):
+        with pytest.raises(ValueError, match="Invalid symbol type"):
+            build_symbol_where_clause(symbol_type="bogus", symbols_table=self.TABLE)
@@ -313,6 +313,68 @@ class TestFormatPretty:
         assert "results" in captured
 
 
+class TestFormatStoredContent:
+    """Formatters use content stored in the index instead of the source file."""
+
+    def test_json_uses_stored_content(self, make_search_result):
+        """Stored content is emitted and the end line comes from its newlines."""
+        results = [make_search_result(content="def f():\n    return 1\n")]
+
+        with (
+            patch(
+                "cocosearch.search.formatter.byte_to_line", return_value=10
+            ) as mock_line,
+            patch("cocosearch.search.formatter.read_chunk_content") as mock_read,
+        ):
+            output = format_json(results, smart_context=False)
+
+        item = json.loads(output)[0]
+        assert item["content"] == "def f():\n    return 1\n"
+        assert item["start_line"] == 10
+        assert item["end_line"] == 12
+        mock_line.assert_called_once()
+        mock_read.assert_not_called()
+
+    def test_json_uses_stored_line_numbers(self, make_search_result):
+        """Line numbers stored at index time skip byte-offset conversion."""
+        results = [
+            make_search_result(content="a\nb", start_line=40, end_line=41),
+        ]
+
+        with patch("cocosearch.search.formatter.byte_to_line") as mock_line:
+            output = format_json(results, smart_context=False)
+
+        item = json.loads(output)[0]
+        assert (item["start_line"], item["end_line"]) == (40, 41)
+        mock_line.assert_not_called()
+
+    def test_json_missing_file_keeps_zero_lines(self, make_search_result):
+        """When the source file is gone, stored content still renders."""
+        results = [make_search_result(content="a\nb")]
+
+        with patch("cocosearch.search.formatter.byte_to_line", return_value=0):
+            output = format_json(results, smart_context=False)
+
+        item = json.loads(output)[0]
+        assert item["content"] == "a\nb"
+        assert (item["start_line"], item["end_line"]) == (0, 0)
+
+    def test_pretty_uses_stored_content(self, make_search_result):
+        """Pretty output renders stored content without reading the file."""
+        results = [make_search_result(content="stored_chunk = 1")]
+        buf = io.StringIO()
+        console = Console(file=buf, force_terminal=False, width=120)
+
+        with (
+            patch("cocosearch.search.formatter.byte_to_line", return_value=1),
+            patch("cocosearch.search.formatter.read_chunk_content") as mock_read,
+        ):
+            format_pretty(results, smart_context=False, console=console)
+
+        assert "stored_chunk" in buf.getvalue()
+        mock_read.assert_not_called()
+
+
 class TestExtensionLangMap:
     """Tests for EXTENSION_LANG_MAP constant."""
 
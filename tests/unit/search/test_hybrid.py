@@ -187,3 +187,147 @@ class TestApplyDefinitionBoost:
         assert result.symbol_type == "method"
         assert result.symbol_name == "Foo.bar"
         assert result.symbol_signature == "def bar(self, x: int) -> str"
+
+
+class TestBuildFilterClause:
+    """Tests for build_filter_clause symbol filtering."""
+
+    def test_uses_symbols_table_when_present(self):
+        from unittest.mock import patch
+
+        from cocosearch.search import hybrid
+
+        with patch.object(hybrid, "check_symbols_table_exists", return_value=True):
+            where, params = hybrid.build_filter_clause(
+                symbol_name="helper", index_name="myidx"
+            )
+
+        assert "FROM codeindex_myidx__myidx_symbols" in where
+        assert params == ["helper", "helper"]
+
+    def test_falls_back_to_chunk_columns(self):
+        from cocosearch.search import hybrid
+
+        where, params = hybrid.build_filter_clause(
+            symbol_name="helper", index_name="myidx"
+        )
+
+        assert where == "lower(symbol_name) = lower(%s)"
+        assert params == ["helper"]
+
+
+class TestVectorSearchRelaxedOrder:
+    """Tests for re-sorting relaxed iterative scan results."""
+
+    def test_rows_resorted_by_score(self):
+        from unittest.mock import MagicMock, patch
+
+        from cocosearch.search import hybrid
+
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [
+            ("a.py", 0, 10, 0.7, "", "", "py"),
+            ("b.py", 0, 10, 0.9, "", "", "py"),
+        ]
+        pool = MagicMock()
+        pool.connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value = cursor
+
+        with (
+            patch.object(hybrid, "get_connection_pool", return_value=pool),
+            patch.object(hybrid, "check_symbol_columns_exist", return_value=False),
+            patch.object(
+                hybrid, "apply_vector_search_settings", return_value=True
+            ) as mock_apply,
+        ):
+            results = hybrid.execute_vector_search(
+                "q",
+                "t",
+                where_clause="language_id = %s",
+                where_params=["py"],
+                query_embedding=[0.1],
+            )
+
+        mock_apply.assert_called_once_with(cursor, filtered=True)
+        assert [r.filename for r in results] == ["b.py", "a.py"]
+
+
+class TestBuildVectorSource:
+    """Tests for quantized candidate selection with full-precision re-rank."""
+
+    def test_full_storage_reads_table(self):
+        from cocosearch.search import db, hybrid
+
+        storage = db.VectorStorage()
+        source = hybrid.build_vector_source("t", storage, "WHERE x = %s", "%s::vector")
+
+        assert source.split() == ["t", "WHERE", "x", "=", "%s"]
+        assert hybrid.vector_source_params(storage, [[0.1]], 10) == []
+
+    def test_quantized_storage_reranks_candidates(self):
+        from cocosearch.search import db, hybrid
+
+        storage = db.VectorStorage("halfvec", 4)
+        source = hybrid.build_vector_source("t", storage, "WHERE x = %s", "%s::vector")
+        params = hybrid.vector_source_params(storage, [[0.1]], 10)
+
+        sql = " ".join(source.split())
+        assert sql.startswith("( SELECT * FROM t WHERE x = %s")
+        assert "ORDER BY (embedding::halfvec(4)) <=> (%s::vector)::halfvec(4)" in sql
+        assert sql.endswith("LIMIT %s ) AS candidates")
+        # rerankFactor (default 4) candidates per requested result
+        assert params == [[0.1], 40]
+
+    def test_storage_change_between_searches_rebuilds_statement(self):
+        """SQL and params come from one storage lookup, keyed in the registry.
+
+        A storage cache reset by a concurrent indexing run can't pair the
+        statement built for one storage mode with params for the other.
+        """
+        from unittest.mock import patch
+
+        from cocosearch.search import db, hybrid
+        from tests.mocks.db import MockConnection, MockConnectionPool, MockCursor
+
+        cursor = MockCursor()
+        pool = MockConnectionPool(MockConnection(cursor))
+        storages = [db.VectorStorage(), db.VectorStorage("halfvec", 4)]
+
+        with (
+            patch.object(hybrid, "get_connection_pool", return_value=pool),
+            patch.object(hybrid, "check_symbol_columns_exist", return_value=False),
+            patch.object(hybrid, "get_vector_storage", side_effect=storages),
+        ):
+            for _ in storages:
+                hybrid.execute_vector_search("q", "t", query_embedding=[0.1])
+
+        (full_sql, full_params), (quantized_sql, quantized_params) = [
+            call for call in cursor.calls if "embedding <=>" in call[0]
+        ]
+        assert "candidates" not in full_sql
+        assert full_sql.count("%s") == len(full_params)
+        assert "candidates" in quantized_sql
+        assert quantized_sql.count("%s") == len(quantized_params)
+
+
+class TestPreparedStatements:
+    """Search legs run registry statements as prepared statements."""
+
+    def test_keyword_search_prepared_and_reused(self):
+        from unittest.mock import patch
+
+        from cocosearch.search import db, hybrid
+        from tests.mocks.db import MockConnection, MockConnectionPool, MockCursor
+
+        cursor = MockCursor()
+        pool = MockConnectionPool(MockConnection(cursor))
+
+        with (
+            patch.object(hybrid, "get_connection_pool", return_value=pool),
+            patch.object(hybrid, "check_column_exists", return_value=True),
+        ):
+            hybrid.execute_keyword_search("get user", "t", where_clause="x = %s")
+            hybrid.execute_keyword_search("other", "t", where_clause="x = %s")
+
+        assert len(cursor.prepared) == 2
+        assert cursor.prepared[0] is cursor.prepared[1]
+        assert ("keyword", "t", "x = %s", "") in db._statements
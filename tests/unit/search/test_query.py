@@ -656,3 +656,365 @@ class TestSymbolFilters:
         assert "symbol_type," not in last_query
         assert "symbol_name," not in last_query
         assert "symbol_signature" not in last_query
+
+
+class TestSemanticCacheIntegration:
+    """Tests for embedding reuse and semantic cache hits in search()."""
+
+    @staticmethod
+    def _fixed_embedding():
+        from unittest.mock import MagicMock
+
+        mock = MagicMock()
+        mock.eval.return_value = [1.0, 0.0, 0.0]
+        return mock
+
+    def test_embeds_query_once(self, mock_db_pool):
+        """The embedding computed for the cache probe is reused by the search."""
+        pool, cursor, _conn = mock_db_pool(results=[])
+        mock_embedding = self._fixed_embedding()
+
+        with (
+            patch("cocosearch.search.query.get_connection_pool", return_value=pool),
+            patch("cocosearch.search.query.code_to_embedding", mock_embedding),
+        ):
+            search(query="find auth code", index_name="testindex")
+
+        mock_embedding.eval.assert_called_once_with("find auth code")
+        cursor.assert_called_with_param([1.0, 0.0, 0.0])
+
+    def test_paraphrase_hits_semantic_cache(self, mock_db_pool):
+        """A query with a near-identical embedding is served from cache."""
+        pool, cursor, _conn = mock_db_pool(
+            results=[("/path/file.py", 0, 100, 0.85, "", "", "")]
+        )
+        mock_embedding = self._fixed_embedding()
+
+        with (
+            patch("cocosearch.search.query.get_connection_pool", return_value=pool),
+            patch("cocosearch.search.query.code_to_embedding", mock_embedding),
+        ):
+            first = search(query="find auth code", index_name="testindex")
+            calls_after_first = len(cursor.calls)
+            second = search(query="authentication logic", index_name="testindex")
+
+        assert second == first
+        assert len(cursor.calls) == calls_after_first
+
+    def test_semantic_hit_requires_same_filters(self, mock_db_pool):
+        """A paraphrase with a different limit is not served from cache."""
+        pool, cursor, _conn = mock_db_pool(results=[])
+        mock_embedding = self._fixed_embedding()
+
+        with (
+            patch("cocosearch.search.query.get_connection_pool", return_value=pool),
+            patch("cocosearch.search.query.code_to_embedding", mock_embedding),
+        ):
+            search(query="find auth code", index_name="testindex")
+            calls_after_first = len(cursor.calls)
+            search(query="authentication logic", index_name="testindex", limit=5)
+
+        assert len(cursor.calls) > calls_after_first
+
+    def test_hybrid_receives_embedding_and_is_cached(self):
+        """Hybrid search gets the probe embedding and its results join the cache."""
+        mock_embedding = self._fixed_embedding()
+
+        with (
+            patch("cocosearch.search.query.code_to_embedding", mock_embedding),
+            patch(
+                "cocosearch.search.query.execute_hybrid_search", return_value=[]
+            ) as mock_hybrid,
+        ):
+            search(query="getUserById", index_name="testindex", use_hybrid=True)
+            search(query="get_user_by_id", index_name="testindex", use_hybrid=True)
+
+        mock_hybrid.assert_called_once()
+        assert mock_hybrid.call_args.kwargs["query_embedding"] == [1.0, 0.0, 0.0]
+
+    def test_no_cache_defers_embedding_to_hybrid(self):
+        """With no_cache, hybrid search embeds inside its vector leg."""
+        mock_embedding = self._fixed_embedding()
+
+        with (
+            patch("cocosearch.search.query.code_to_embedding", mock_embedding),
+            patch(
+                "cocosearch.search.query.execute_hybrid_search", return_value=[]
+            ) as mock_hybrid,
+        ):
+            search(
+                query="getUserById",
+                index_name="testindex",
+                use_hybrid=True,
+                no_cache=True,
+            )
+
+        mock_embedding.eval.assert_not_called()
+        assert mock_hybrid.call_args.kwargs["query_embedding"] is None
+
+    def test_keyword_leg_starts_before_embedding(self):
+        """The keyword leg runs while the query is embedded for the cache probe."""
+        import threading
+        from unittest.mock import MagicMock
+
+        keyword_started = threading.Event()
+        started_before_embed = []
+
+        def keyword_search(*args, **kwargs):
+            keyword_started.set()
+            return []
+
+        def embed(text):
+            # Blocks until the keyword leg starts (or fails after the timeout)
+            started_before_embed.append(keyword_started.wait(timeout=5))
+            return [1.0, 0.0, 0.0]
+
+        mock_embedding = MagicMock()
+        mock_embedding.eval.side_effect = embed
+
+        with (
+            patch("cocosearch.search.query.code_to_embedding", mock_embedding),
+            patch(
+                "cocosearch.search.query.execute_keyword_search",
+                side_effect=keyword_search,
+            ) as mock_keyword,
+            patch(
+                "cocosearch.search.query.execute_hybrid_search", return_value=[]
+            ) as mock_hybrid,
+        ):
+            search(query="getUserById", index_name="testindex", use_hybrid=True)
+
+        assert started_before_embed == [True]
+        mock_keyword.assert_called_once()
+        keyword_future = mock_hybrid.call_args.kwargs["keyword_future"]
+        assert keyword_future.result() == []
+
+
+class TestSearchMany:
+    """Tests for batched search_many()."""
+
+    @staticmethod
+    def _embedding_mock():
+        from unittest.mock import MagicMock
+
+        mock = MagicMock()
+        mock.eval.side_effect = lambda text: [float(len(text)), 1.0]
+        return mock
+
+    def test_one_vector_statement_for_batch(self):
+        """Vector-only queries are embedded and looked up as one batch."""
+        from cocosearch.search.hybrid import VectorResult
+        from cocosearch.search.query import search_many
+
+        batches = [
+            [VectorResult("/a.py", 0, 10, 0.9), VectorResult("/b.py", 0, 10, 0.2)],
+            [VectorResult("/c.py", 0, 10, 0.8)],
+        ]
+        mock_embedding = self._embedding_mock()
+
+        with (
+            patch("cocosearch.search.query.code_to_embedding", mock_embedding),
+            patch(
+                "cocosearch.search.query.execute_vector_search_many",
+                return_value=batches,
+            ) as mock_vector,
+            patch("cocosearch.search.query.execute_keyword_search_many") as mock_kw,
+        ):
+            results = search_many(
+                ["find auth code", "db setup"],
+                "testindex",
+                min_score=0.5,
+                use_hybrid=False,
+            )
+
+        mock_vector.assert_called_once()
+        assert mock_vector.call_args[0][0] == [[14.0, 1.0], [8.0, 1.0]]
+        mock_kw.assert_not_called()
+        assert [r.filename for r in results[0]] == ["/a.py"]
+        assert [r.filename for r in results[1]] == ["/c.py"]
+        assert results[0][0].match_type == ""
+
+    def test_hybrid_queries_fused_with_keyword_batch(self):
+        """Identifier queries get a batched keyword leg and RRF fusion."""
+        from cocosearch.search.hybrid import KeywordResult, VectorResult
+        from cocosearch.search.query import search_many
+
+        with (
+            patch("cocosearch.search.query.code_to_embedding", self._embedding_mock()),
+            patch(
+                "cocosearch.search.query.execute_vector_search_many",
+                return_value=[
+                    [VectorResult("/a.py", 0, 10, 0.9)],
+                    [VectorResult("/b.py", 0, 10, 0.9)],
+                ],
+            ),
+            patch(
+                "cocosearch.search.query.execute_keyword_search_many",
+                return_value=[[KeywordResult("/a.py", 0, 10, 0.5)]],
+            ) as mock_kw,
+            patch(
+                "cocosearch.search.hybrid.check_symbol_columns_exist",
+                return_value=False,
+            ),
+        ):
+            results = search_many(["getUserById", "how are users loaded"], "idx")
+
+        assert mock_kw.call_args[0][0] == ["getUserById"]
+        assert results[0][0].match_type == "both"
+        assert results[1][0].match_type == ""
+
+    def test_slow_keyword_batch_falls_back_to_vector_only(self):
+        """A keyword leg past KEYWORD_LEG_TIMEOUT is dropped, not waited on."""
+        import time
+
+        from cocosearch.search.hybrid import KeywordResult, VectorResult
+        from cocosearch.search.query import search_many
+
+        def slow_keyword(*args, **kwargs):
+            time.sleep(0.5)
+            return [[KeywordResult("/a.py", 0, 10, 0.5)]]
+
+        with (
+            patch("cocosearch.search.query.code_to_embedding", self._embedding_mock()),
+            patch(
+                "cocosearch.search.query.execute_vector_search_many",
+                return_value=[[VectorResult("/a.py", 0, 10, 0.9)]],
+            ),
+            patch(
+                "cocosearch.search.query.execute_keyword_search_many",
+                side_effect=slow_keyword,
+            ) as mock_kw,
+            patch("cocosearch.search.query.KEYWORD_LEG_TIMEOUT", 0.05),
+            patch(
+                "cocosearch.search.hybrid.check_symbol_columns_exist",
+                return_value=False,
+            ),
+        ):
+            results = search_many(["getUserById"], "idx")
+
+        assert mock_kw.call_args.kwargs["statement_timeout"] == 0.05
+        assert results[0][0].match_type == "semantic"
+
+    def test_cached_queries_skip_batch(self):
+        """Exact cache hits are returned without embedding or querying."""
+        from cocosearch.search.hybrid import VectorResult
+        from cocosearch.search.query import search_many
+
+        mock_embedding = self._embedding_mock()
+        with (
+            patch("cocosearch.search.query.code_to_embedding", mock_embedding),
+            patch(
+                "cocosearch.search.query.execute_vector_search_many",
+                side_effect=lambda embeddings, *a, **kw: [
+                    [VectorResult("/a.py", 0, 10, 0.9)] for _ in embeddings
+                ],
+            ) as mock_vector,
+        ):
+            first = search_many(["auth flow"], "idx", use_hybrid=False)
+            second = search_many(["auth flow"], "idx", use_hybrid=False)
+
+        assert first == second
+        mock_vector.assert_called_once()
+        mock_embedding.eval.assert_called_once()
+
+    def test_duplicate_queries_embedded_once(self):
+        """Repeated query text in a batch costs a single embedding call."""
+        from cocosearch.search.query import search_many
+
+        mock_embedding = self._embedding_mock()
+        with (
+            patch("cocosearch.search.query.code_to_embedding", mock_embedding),
+            patch(
+                "cocosearch.search.query.execute_vector_search_many",
+                return_value=[[], []],
+            ),
+        ):
+            search_many(
+                ["auth flow", "auth flow"], "idx", use_hybrid=False, no_cache=True
+            )
+
+        mock_embedding.eval.assert_called_once()
+
+    def test_rejects_empty_and_oversized_batches(self):
+        """Empty batches and batches above MAX_BATCH_QUERIES are rejected."""
+        from cocosearch.search.query import MAX_BATCH_QUERIES, search_many
+
+        with pytest.raises(ValueError, match="At least one query"):
+            search_many([], "idx")
+        with pytest.raises(ValueError, match="Too many queries"):
+            search_many(["q"] * (MAX_BATCH_QUERIES + 1), "idx")
+
+
+class TestIncludeContent:
+    """Tests for returning stored chunk text (content_text) from search()."""
+
+    def test_selects_content_text_when_requested(
+        self, mock_db_pool, mock_code_to_embedding
+    ):
+        """include_content adds content_text to the SELECT and the result."""
+        pool, cursor, _conn = mock_db_pool(
+            results=[("/path/file.py", 0, 12, 0.9, "", "", "", "x = 1\ny = 2")]
+        )
+
+        with patch("cocosearch.search.query.get_connection_pool", return_value=pool):
+            results = search(
+                "assign values", "testindex", use_hybrid=False, include_content=True
+            )
+
+        cursor.assert_query_contains("content_text")
+        assert results[0].content == "x = 1\ny = 2"
+
+    def test_selects_stored_lines_when_available(
+        self, mock_db_pool, mock_code_to_embedding
+    ):
+        """Indexes with start_line/end_line return them alongside the content."""
+        pool, cursor, _conn = mock_db_pool(
+            results=[("/path/file.py", 0, 12, 0.9, "", "", "", "x = 1\ny = 2", 8, 9)]
+        )
+
+        with (
+            patch("cocosearch.search.query.get_connection_pool", return_value=pool),
+            patch(
+                "cocosearch.search.query.check_line_columns_exist", return_value=True
+            ),
+        ):
+            results = search(
+                "assign values", "testindex", use_hybrid=False, include_content=True
+            )
+
+        cursor.assert_query_contains("start_line, end_line")
+        assert results[0].content == "x = 1\ny = 2"
+        assert (results[0].start_line, results[0].end_line) == (8, 9)
+
+    def test_content_not_selected_by_default(
+        self, mock_db_pool, mock_code_to_embedding
+    ):
+        """Without include_content the SELECT is unchanged."""
+        pool, cursor, _conn = mock_db_pool(
+            results=[("/path/file.py", 0, 12, 0.9, "", "", "")]
+        )
+
+        with patch("cocosearch.search.query.get_connection_pool", return_value=pool):
+            results = search("assign values", "testindex", use_hybrid=False)
+
+        assert "content_text" not in cursor.calls[-1][0]
+        assert results[0].content is None
+
+    def test_ignored_without_content_text_column(
+        self, mock_db_pool, mock_code_to_embedding
+    ):
+        """Pre-v1.7 indexes without content_text don't select the column."""
+        pool, cursor, _conn = mock_db_pool(
+            results=[("/path/file.py", 0, 12, 0.9, "", "", "")]
+        )
+
+        with (
+            patch("cocosearch.search.query.get_connection_pool", return_value=pool),
+            patch("cocosearch.search.query.check_column_exists", return_value=False),
+        ):
+            results = search(
+                "assign values", "testindex", use_hybrid=False, include_content=True
+            )
+
+        assert "content_text" not in cursor.calls[-1][0]
+        assert results[0].content is None
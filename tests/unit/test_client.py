@@ -1,10 +1,9 @@
 """Unit tests for cocosearch.client — HTTP client for remote CocoSearch server."""
 
-import io
+import http.client
 import json
-import urllib.error
-import urllib.request
-from unittest.mock import MagicMock, patch
+import time
+from unittest.mock import patch
 
 import pytest
 
@@ -20,14 +19,70 @@ from cocosearch.client import (
 # ---------------------------------------------------------------------------
 
 
-def mock_urlopen_response(data, status=200):
-    """Create a mock response for urlopen."""
-    resp = MagicMock()
-    resp.read.return_value = json.dumps(data).encode("utf-8")
-    resp.__enter__ = MagicMock(return_value=resp)
-    resp.__exit__ = MagicMock(return_value=False)
-    resp.status = status
-    return resp
+class FakeResponse:
+    """Stand-in for http.client.HTTPResponse."""
+
+    def __init__(self, data=b"", status=200, headers=None, will_close=False):
+        if not isinstance(data, bytes):
+            data = json.dumps(data).encode("utf-8")
+        self.status = status
+        self.reason = "Reason"
+        self.will_close = will_close
+        self._headers = headers or {}
+        self._chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+    def read(self):
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+    def read1(self, n=-1):
+        return self._chunks.pop(0) if self._chunks else b""
+
+
+class FakeConnection:
+    """Stand-in for http.client.HTTPConnection serving scripted outcomes.
+
+    Each outcome is a FakeResponse to return or an exception to raise.
+    """
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.requests = []
+        self.closed = False
+
+    def request(self, method, path, body=None, headers=None):
+        self.requests.append((method, path, body, headers))
+
+    def getresponse(self):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def server():
+    """Patch HTTPConnection; yields (outcomes, connections) for scripting.
+
+    Every connection the client opens takes its responses from the shared
+    outcomes list; connections lists each one opened.
+    """
+    outcomes, connections = [], []
+
+    def connect(netloc, timeout=None):
+        conn = FakeConnection(outcomes)
+        conn.netloc, conn.timeout = netloc, timeout
+        connections.append(conn)
+        return conn
+
+    with patch("http.client.HTTPConnection", side_effect=connect), patch("time.sleep"):
+        yield outcomes, connections
 
 
 # ---------------------------------------------------------------------------
@@ -38,85 +93,200 @@ def mock_urlopen_response(data, status=200):
 class TestRequest:
     """Tests for the low-level _request method."""
 
-    def test_successful_get_request(self):
+    def test_successful_get_request(self, server):
         """GET request returns parsed JSON."""
-        client = CocoSearchClient("http://localhost:8080")
-        payload = {"ok": True}
+        outcomes, connections = server
+        outcomes.append(FakeResponse({"ok": True}))
+        client = CocoSearchClient("http://localhost:8080", timeout=5)
 
-        with patch(
-            "urllib.request.urlopen", return_value=mock_urlopen_response(payload)
-        ) as mock_open:
-            result = client._request("GET", "/api/stats")
+        result = client._request("GET", "/api/stats")
 
-        assert result == payload
-        req = mock_open.call_args[0][0]
-        assert req.full_url == "http://localhost:8080/api/stats"
-        assert req.method == "GET"
-        assert req.data is None
+        assert result == {"ok": True}
+        assert (connections[0].netloc, connections[0].timeout) == ("localhost:8080", 5)
+        method, path, body, headers = connections[0].requests[0]
+        assert (method, path, body) == ("GET", "/api/stats", None)
+        assert "Content-Type" not in headers
 
-    def test_successful_post_request_with_body(self):
+    def test_successful_post_request_with_body(self, server):
         """POST request sends JSON body and returns parsed response."""
+        outcomes, connections = server
+        outcomes.append(FakeResponse({"results": [], "total": 0}))
         client = CocoSearchClient("http://localhost:8080/")
         body = {"query": "hello", "index_name": "myindex"}
-        response_data = {"results": [], "total": 0}
 
-        with patch(
-            "urllib.request.urlopen", return_value=mock_urlopen_response(response_data)
-        ) as mock_open:
-            result = client._request("POST", "/api/search", body)
+        result = client._request("POST", "/api/search", body)
 
-        assert result == response_data
-        req = mock_open.call_args[0][0]
-        assert req.full_url == "http://localhost:8080/api/search"
-        assert req.method == "POST"
-        assert json.loads(req.data.decode("utf-8")) == body
-        assert req.headers["Content-type"] == "application/json"
-
-    def test_http_error_raises_client_error_with_json_body(self):
-        """HTTPError with JSON error body raises CocoSearchClientError with message."""
-        client = CocoSearchClient("http://localhost:8080")
-        error_body = json.dumps({"error": "Index not found"}).encode("utf-8")
-        http_error = urllib.error.HTTPError(
-            url="http://localhost:8080/api/stats/missing",
-            code=404,
-            msg="Not Found",
-            hdrs={},
-            fp=io.BytesIO(error_body),
-        )
+        assert result == {"results": [], "total": 0}
+        method, path, data, headers = connections[0].requests[0]
+        assert (method, path) == ("POST", "/api/search")
+        assert json.loads(data.decode("utf-8")) == body
+        assert headers["Content-Type"] == "application/json"
+
+    def test_server_url_path_is_prefixed(self, server):
+        """A server URL with a path prefixes every request path."""
+        outcomes, connections = server
+        outcomes.append(FakeResponse([]))
+
+        CocoSearchClient("http://proxy:80/coco/")._request("GET", "/api/list")
 
-        with patch("urllib.request.urlopen", side_effect=http_error):
-            with pytest.raises(CocoSearchClientError, match="Index not found"):
-                client._request("GET", "/api/stats/missing")
+        assert connections[0].requests[0][1] == "/coco/api/list"
 
-    def test_http_error_raises_client_error_with_non_json_body(self):
-        """HTTPError with non-JSON body falls back to str(e)."""
+    def test_http_error_raises_client_error_with_json_body(self, server):
+        """Error status with JSON error body raises CocoSearchClientError with message."""
+        outcomes, _ = server
+        outcomes.append(FakeResponse({"error": "Index not found"}, status=404))
         client = CocoSearchClient("http://localhost:8080")
-        http_error = urllib.error.HTTPError(
-            url="http://localhost:8080/api/bad",
-            code=500,
-            msg="Internal Server Error",
-            hdrs={},
-            fp=io.BytesIO(b"not json"),
-        )
 
-        with patch("urllib.request.urlopen", side_effect=http_error):
-            with pytest.raises(CocoSearchClientError):
-                client._request("GET", "/api/bad")
+        with pytest.raises(CocoSearchClientError, match="Index not found"):
+            client._request("GET", "/api/stats/missing")
+
+    def test_http_error_raises_client_error_with_non_json_body(self, server):
+        """Error status with non-JSON body falls back to the status line."""
+        outcomes, _ = server
+        outcomes.append(FakeResponse(b"not json", status=500))
+        client = CocoSearchClient("http://localhost:8080")
+
+        with pytest.raises(CocoSearchClientError, match="HTTP Error 500"):
+            client._request("GET", "/api/bad")
+
+    def test_connection_refused_raises_connection_error(self, server):
+        """Connection failures are retried, then raise CocoSearchConnectionError."""
+        outcomes, connections = server
+        outcomes.extend([ConnectionRefusedError("refused")] * 3)
+        client = CocoSearchClient("http://localhost:9999", retries=2)
+
+        with pytest.raises(CocoSearchConnectionError, match="Cannot connect"):
+            client._request("GET", "/api/stats")
+
+        assert len(connections) == 3
 
-    def test_url_error_raises_connection_error(self):
-        """URLError raises CocoSearchConnectionError."""
-        client = CocoSearchClient("http://localhost:9999")
-        url_error = urllib.error.URLError("Connection refused")
+    def test_invalid_url_raises_connection_error(self):
+        """A URL without http(s) scheme raises CocoSearchConnectionError."""
+        client = CocoSearchClient("localhost:8080")
 
-        with patch("urllib.request.urlopen", side_effect=url_error):
-            with pytest.raises(CocoSearchConnectionError, match="Cannot connect"):
-                client._request("GET", "/api/stats")
+        with pytest.raises(CocoSearchConnectionError, match="http://"):
+            client._request("GET", "/api/stats")
 
     def test_trailing_slash_stripped_from_server_url(self):
         """Server URL trailing slash is stripped to avoid double slashes."""
         client = CocoSearchClient("http://localhost:8080/")
         assert client.server_url == "http://localhost:8080"
 
+    def test_connection_reused_across_requests(self, server):
+        """Fully read keep-alive responses return their connection to the pool."""
+        outcomes, connections = server
+        outcomes.extend([FakeResponse([]), FakeResponse([])])
+        client = CocoSearchClient("http://localhost:8080")
+
+        client._request("GET", "/api/list")
+        client._request("GET", "/api/list")
+
+        assert len(connections) == 1
+        assert len(connections[0].requests) == 2
+
+    def test_closing_response_not_pooled(self, server):
+        """A response with Connection: close gets a new connection next time."""
+        outcomes, connections = server
+        outcomes.extend([FakeResponse([], will_close=True), FakeResponse([])])
+        client = CocoSearchClient("http://localhost:8080")
+
+        client._request("GET", "/api/list")
+        client._request("GET", "/api/list")
+
+        assert len(connections) == 2
+        assert connections[0].closed
+
+    def test_close_closes_idle_connections(self, server):
+        """close() closes pooled connections."""
+        outcomes, connections = server
+        outcomes.append(FakeResponse([]))
+
+        with CocoSearchClient("http://localhost:8080") as client:
+            client._request("GET", "/api/list")
+
+        assert connections[0].closed
+
+    def test_stale_pooled_connection_replaced_without_retry(self, server):
+        """A keep-alive connection closed by the server is replaced transparently."""
+        outcomes, connections = server
+        outcomes.extend(
+            [
+                FakeResponse([]),
+                http.client.RemoteDisconnected("closed"),
+                FakeResponse({"success": True}),
+            ]
+        )
+        client = CocoSearchClient("http://localhost:8080")
+        client._request("GET", "/api/list")
+
+        result = client._request("POST", "/api/delete-index", {}, retry=False)
+
+        assert result == {"success": True}
+        assert len(connections) == 2
+
+    def test_unavailable_retried_with_backoff(self, server):
+        """502 responses are retried with exponentially growing delays."""
+        outcomes, _ = server
+        outcomes.extend(
+            [
+                FakeResponse({"error": "bad gateway"}, status=502),
+                FakeResponse({"error": "bad gateway"}, status=502),
+                FakeResponse({"ok": True}),
+            ]
+        )
+        client = CocoSearchClient("http://localhost:8080", backoff=0.1)
+
+        with patch("time.sleep") as mock_sleep:
+            result = client._request("GET", "/api/stats")
+
+        assert result == {"ok": True}
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.1, 0.2]
+
+    def test_no_retry_when_disabled(self, server):
+        """retry=False surfaces the first 502."""
+        outcomes, _ = server
+        outcomes.extend(
+            [
+                FakeResponse({"error": "bad gateway"}, status=502),
+                FakeResponse({"ok": True}),
+            ]
+        )
+        client = CocoSearchClient("http://localhost:8080")
+
+        with pytest.raises(CocoSearchClientError, match="bad gateway"):
+            client._request("POST", "/api/index", {}, retry=False)
+
+    @pytest.mark.parametrize(
+        "status, error",
+        [(504, "search timed out after 60s"), (503, "Database not initialized")],
+    )
+    def test_server_timeout_and_unavailable_not_retried(self, server, status, error):
+        """504 (server deadline) and 503 (no database) are raised on the first try."""
+        outcomes, connections = server
+        outcomes.extend(
+            [FakeResponse({"error": error}, status=status), FakeResponse({})]
+        )
+        client = CocoSearchClient("http://localhost:8080")
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(CocoSearchClientError, match=error):
+                client._request("POST", "/api/search", {"query": "q"})
+
+        assert len(connections[0].requests) == 1
+        assert len(outcomes) == 1
+        mock_sleep.assert_not_called()
+
+    def test_timeout_not_retried(self, server):
+        """A timed-out request is not sent again."""
+        outcomes, connections = server
+        outcomes.append(TimeoutError("timed out"))
+        client = CocoSearchClient("http://localhost:8080")
+
+        with pytest.raises(CocoSearchConnectionError, match="timed out"):
+            client._request("POST", "/api/search", {})
+
+        assert len(connections) == 1
+
 
 # ---------------------------------------------------------------------------
 # TestPathTranslation
@@ -274,6 +444,112 @@ class TestSearch:
         assert result["results"][1]["file_path"] == "/home/user/GIT/myapp/utils.py"
 
 
+# ---------------------------------------------------------------------------
+# TestSearchStream
+# ---------------------------------------------------------------------------
+
+
+def ndjson(events):
+    """Encode events as an NDJSON body."""
+    return b"".join(json.dumps(e).encode("utf-8") + b"\n" for e in events)
+
+
+class TestSearchStream:
+    """Tests for the search_stream method."""
+
+    def test_yields_results_in_order(self, server, monkeypatch):
+        """Yields result payloads with host paths; skips meta and done."""
+        monkeypatch.setenv("COCOSEARCH_PATH_PREFIX", "/home/user/GIT:/projects")
+        outcomes, connections = server
+        events = [
+            {"type": "meta", "query_time_ms": 5, "total": 2},
+            {"type": "result", "rank": 1, "result": {"file_path": "/projects/a.py"}},
+            {"type": "result", "rank": 2, "result": {"file_path": "/projects/b.py"}},
+            {"type": "done", "total": 2, "elapsed_ms": 9},
+        ]
+        outcomes.append(FakeResponse(ndjson(events)))
+        client = CocoSearchClient("http://localhost:8080")
+
+        results = list(client.search_stream(query="q", index_name="idx"))
+
+        assert [r["file_path"] for r in results] == [
+            "/home/user/GIT/a.py",
+            "/home/user/GIT/b.py",
+        ]
+        method, path, data, headers = connections[0].requests[0]
+        assert path == "/api/search/stream"
+        assert headers["Accept"] == "application/x-ndjson"
+        assert json.loads(data) == {
+            "query": "q",
+            "index_name": "idx",
+            "limit": 10,
+            "min_score": 0.3,
+        }
+        # Fully read, so the connection went back to the pool
+        assert client._idle == [connections[0]]
+
+    def test_error_event_raises(self, server):
+        """An in-band error event raises CocoSearchClientError."""
+        outcomes, connections = server
+        events = [
+            {"type": "meta", "query_time_ms": 5, "total": 1},
+            {"type": "error", "error": "Search failed: gone"},
+        ]
+        outcomes.append(FakeResponse(ndjson(events)))
+        client = CocoSearchClient("http://localhost:8080")
+
+        with pytest.raises(CocoSearchClientError, match="gone"):
+            list(client.search_stream(query="q", index_name="idx"))
+
+        # Abandoned mid-stream, so the connection is not reused
+        assert connections[0].closed
+        assert client._idle == []
+
+
+class TestSearchBatching:
+    """Tests for search_batch and search_many."""
+
+    def test_search_batch_posts_queries(self, monkeypatch):
+        """search_batch() POSTs all queries to /api/search/batch."""
+        monkeypatch.setenv("COCOSEARCH_PATH_PREFIX", "/home/user/GIT:/projects")
+        client = CocoSearchClient("http://localhost:8080")
+        response = {"batches": [{"results": [{"file_path": "/projects/a.py"}]}]}
+
+        with patch.object(client, "_request", return_value=response) as mock_req:
+            result = client.search_batch(["q1", "q2"], "idx", limit=3)
+
+        mock_req.assert_called_once_with(
+            "POST",
+            "/api/search/batch",
+            {
+                "index_name": "idx",
+                "limit": 3,
+                "min_score": 0.3,
+                "queries": ["q1", "q2"],
+            },
+        )
+        assert result["batches"][0]["results"][0]["file_path"] == "/home/user/GIT/a.py"
+
+    def test_search_many_keeps_order(self):
+        """search_many() runs searches concurrently and keeps input order."""
+        client = CocoSearchClient("http://localhost:8080")
+
+        def fake_search(query, index_name, **kwargs):
+            time.sleep(0.01 if query == "first" else 0)
+            return {"query": query, "index": index_name}
+
+        with patch.object(client, "search", side_effect=fake_search):
+            results = client.search_many(
+                [
+                    {"query": "first", "index_name": "a"},
+                    {"query": "second", "index_name": "b"},
+                ]
+            )
+
+        assert [r["query"] for r in results] == ["first", "second"]
+        assert client.search_many([]) == []
+
+
 # ---------------------------------------------------------------------------
 # TestIndex
 # ---------------------------------------------------------------------------
@@ -292,7 +568,7 @@ class TestIndex:
 
         call_count = 0
 
-        def fake_request(method, path, body=None):
+        def fake_request(method, path, body=None, retry=True):
             nonlocal call_count
             call_count += 1
             if method == "POST" and path == "/api/index":
@@ -359,7 +635,7 @@ class TestIndex:
         ]
         poll_iter = iter(poll_responses)
 
-        def fake_request(method, path, body=None):
+        def fake_request(method, path, body=None, retry=True):
             if method == "POST" and path == "/api/index":
                 return index_response
             if method == "GET" and path == "/api/stats/myindex":
@@ -406,7 +682,7 @@ class TestIndex:
 
         call_count = 0
 
-        def fake_request(method, path, body=None):
+        def fake_request(method, path, body=None, retry=True):
             nonlocal call_count
             if method == "POST":
                 return index_response
@@ -501,7 +777,7 @@ class TestClear:
             result = client.clear("myindex")
 
         mock_req.assert_called_once_with(
-            "POST", "/api/delete-index", {"index_name": "myindex"}
+            "POST", "/api/delete-index", {"index_name": "myindex"}, retry=False
         )
         assert result == response
 
@@ -1,6 +1,10 @@
 """Unit tests for hybrid search module."""
 
-from unittest.mock import patch
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from cocosearch.search.hybrid import (
     KeywordResult,
@@ -8,6 +12,9 @@ from cocosearch.search.hybrid import (
     HybridSearchResult,
     rrf_fusion,
     execute_keyword_search,
+    execute_keyword_search_many,
+    execute_legs_concurrently,
+    execute_vector_search_many,
     hybrid_search,
 )
 
@@ -31,6 +38,31 @@ class TestRRFFusion:
         assert fused[0].keyword_score is None
         assert fused[1].match_type == "semantic"
 
+    def test_rrf_fusion_carries_content(self):
+        """Fused results keep stored content from whichever leg supplied it."""
+        vector_results = [VectorResult("/a.py", 0, 10, 0.9, content="vector text")]
+        keyword_results = [
+            KeywordResult("/a.py", 0, 10, 0.5, content="keyword text"),
+            KeywordResult("/b.py", 0, 10, 0.4, content="keyword only"),
+        ]
+
+        fused = {r.filename: r for r in rrf_fusion(vector_results, keyword_results)}
+
+        assert fused["/a.py"].content == "vector text"
+        assert fused["/b.py"].content == "keyword only"
+
+    def test_rrf_fusion_carries_stored_lines(self):
+        """Stored line numbers come from the vector leg, else the keyword leg."""
+        vector_results = [VectorResult("/a.py", 0, 10, 0.9, start_line=3, end_line=5)]
+        keyword_results = [
+            KeywordResult("/b.py", 0, 10, 0.4, start_line=7, end_line=9),
+        ]
+
+        fused = {r.filename: r for r in rrf_fusion(vector_results, keyword_results)}
+
+        assert (fused["/a.py"].start_line, fused["/a.py"].end_line) == (3, 5)
+        assert (fused["/b.py"].start_line, fused["/b.py"].end_line) == (7, 9)
+
     def test_rrf_fusion_single_source_keyword_only(self):
         """Test RRF with only keyword results."""
         vector_results = []
@@ -221,6 +253,41 @@ class TestExecuteKeywordSearch:
 
         assert results == []
 
+    def test_keyword_search_include_content(self, mock_db_pool):
+        """include_content selects content_text into KeywordResult.content."""
+        pool, cursor, conn = mock_db_pool(
+            results=[("/path/file.py", 0, 100, 0.5, "def getUserById(): ...")]
+        )
+
+        with patch("cocosearch.search.hybrid.get_connection_pool", return_value=pool):
+            with patch(
+                "cocosearch.search.hybrid.check_column_exists", return_value=True
+            ):
+                results = execute_keyword_search(
+                    "getUserById", "test_table", include_content=True
+                )
+
+        cursor.assert_query_contains("content_text")
+        assert results[0].content == "def getUserById(): ..."
+
+    def test_keyword_search_include_content_with_stored_lines(self, mock_db_pool):
+        """Stored start_line/end_line are selected when the index has them."""
+        pool, cursor, conn = mock_db_pool(
+            results=[("/path/file.py", 0, 100, 0.5, "def f(): ...", 12, 14)]
+        )
+
+        with (
+            patch("cocosearch.search.hybrid.get_connection_pool", return_value=pool),
+            patch("cocosearch.search.hybrid.check_column_exists", return_value=True),
+            patch(
+                "cocosearch.search.hybrid.check_line_columns_exist", return_value=True
+            ),
+        ):
+            results = execute_keyword_search("f", "test_table", include_content=True)
+
+        cursor.assert_query_contains("content_text, start_line, end_line")
+        assert (results[0].start_line, results[0].end_line) == (12, 14)
+
     def test_keyword_search_normalizes_query(self, mock_db_pool):
         """Test that query is normalized to split identifiers."""
         pool, cursor, conn = mock_db_pool(results=[])
@@ -241,6 +308,282 @@ class TestExecuteKeywordSearch:
         assert any("get" in str(p).lower() for p in params if isinstance(p, str))
 
 
+class TestExecuteLegsConcurrently:
+    """Tests for concurrent execution of the vector and keyword legs."""
+
+    def test_legs_run_in_parallel(self):
+        """Both legs are in flight at the same time."""
+        barrier = threading.Barrier(2, timeout=2)
+
+        def vector_leg(*args, **kwargs):
+            barrier.wait()
+            return [VectorResult("/path/vector.py", 0, 100, 0.9)]
+
+        def keyword_leg(*args, **kwargs):
+            barrier.wait()
+            return [KeywordResult("/path/keyword.py", 0, 100, 0.5)]
+
+        with (
+            patch(
+                "cocosearch.search.hybrid.execute_vector_search",
+                side_effect=vector_leg,
+            ),
+            patch(
+                "cocosearch.search.hybrid.execute_keyword_search",
+                side_effect=keyword_leg,
+            ),
+        ):
+            vector, keyword = execute_legs_concurrently("query", "test_table", 10, 10)
+
+        assert vector[0].filename == "/path/vector.py"
+        assert keyword[0].filename == "/path/keyword.py"
+
+    def test_passes_statement_timeouts(self):
+        """Each leg receives its timeout as a server-side statement timeout."""
+        with (
+            patch(
+                "cocosearch.search.hybrid.execute_vector_search", return_value=[]
+            ) as mock_vector,
+            patch(
+                "cocosearch.search.hybrid.execute_keyword_search", return_value=[]
+            ) as mock_keyword,
+        ):
+            execute_legs_concurrently(
+                "query",
+                "test_table",
+                10,
+                10,
+                vector_timeout=3.0,
+                keyword_timeout=1.5,
+            )
+
+        assert mock_vector.call_args.kwargs["statement_timeout"] == 3.0
+        assert mock_keyword.call_args.kwargs["statement_timeout"] == 1.5
+
+    def test_keyword_timeout_falls_back_to_vector_only(self):
+        """A slow keyword leg is abandoned and yields no keyword results."""
+
+        def slow_keyword(*args, **kwargs):
+            time.sleep(0.5)
+            return [KeywordResult("/path/keyword.py", 0, 100, 0.5)]
+
+        with (
+            patch(
+                "cocosearch.search.hybrid.execute_vector_search",
+                return_value=[VectorResult("/path/vector.py", 0, 100, 0.9)],
+            ),
+            patch(
+                "cocosearch.search.hybrid.execute_keyword_search",
+                side_effect=slow_keyword,
+            ),
+        ):
+            vector, keyword = execute_legs_concurrently(
+                "query", "test_table", 10, 10, keyword_timeout=0.05
+            )
+
+        assert len(vector) == 1
+        assert keyword == []
+
+    def test_vector_timeout_raises(self):
+        """A slow vector leg fails the search with TimeoutError."""
+
+        def slow_vector(*args, **kwargs):
+            time.sleep(0.5)
+            return []
+
+        with (
+            patch(
+                "cocosearch.search.hybrid.execute_vector_search",
+                side_effect=slow_vector,
+            ),
+            patch("cocosearch.search.hybrid.execute_keyword_search", return_value=[]),
+        ):
+            with pytest.raises(TimeoutError):
+                execute_legs_concurrently(
+                    "query", "test_table", 10, 10, vector_timeout=0.05
+                )
+
+    def test_vector_error_propagates(self):
+        """Errors from the vector leg are re-raised to the caller."""
+        with (
+            patch(
+                "cocosearch.search.hybrid.execute_vector_search",
+                side_effect=RuntimeError("embedding failed"),
+            ),
+            patch("cocosearch.search.hybrid.execute_keyword_search", return_value=[]),
+        ):
+            with pytest.raises(RuntimeError, match="embedding failed"):
+                execute_legs_concurrently("query", "test_table", 10, 10)
+
+    def test_search_executor_is_shared(self):
+        """get_search_executor() returns the same pool on every call."""
+        from cocosearch.search.hybrid import get_search_executor
+
+        assert get_search_executor() is get_search_executor()
+
+    def test_uses_submitted_keyword_future(self):
+        """A keyword leg submitted by the caller replaces a fresh keyword search."""
+        from concurrent.futures import Future
+
+        keyword_future = Future()
+        keyword_future.set_result([KeywordResult("/path/keyword.py", 0, 100, 0.5)])
+
+        with (
+            patch("cocosearch.search.hybrid.execute_vector_search", return_value=[]),
+            patch(
+                "cocosearch.search.hybrid.execute_keyword_search", return_value=[]
+            ) as mock_keyword,
+        ):
+            _, keyword = execute_legs_concurrently(
+                "query", "test_table", 10, 10, keyword_future=keyword_future
+            )
+
+        mock_keyword.assert_not_called()
+        assert keyword[0].filename == "/path/keyword.py"
+
+    def test_keyword_search_sets_statement_timeout(self, mock_db_pool):
+        """statement_timeout is applied via set_config before the query."""
+        pool, cursor, conn = mock_db_pool(results=[])
+
+        with patch("cocosearch.search.hybrid.get_connection_pool", return_value=pool):
+            with patch(
+                "cocosearch.search.hybrid.check_column_exists", return_value=True
+            ):
+                execute_keyword_search("query", "test_table", statement_timeout=2.5)
+
+        query, params = cursor.calls[0]
+        assert "set_config('statement_timeout'" in query
+        assert params == ("2500",)
+        cursor.assert_query_contains("plainto_tsquery")
+
+
+class TestBatchedLegs:
+    """Tests for the LATERAL-batched vector and keyword legs."""
+
+    def test_vector_many_single_statement(self, mock_db_pool):
+        """All embeddings go out in one statement and rows split by ordinal."""
+        pool, cursor, conn = mock_db_pool(
+            results=[
+                (1, "/path/a.py", 0, 100, 0.9, "", "", "", None, None, None),
+                (2, "/path/b.py", 0, 50, 0.8, "", "", "", "function", "f", None),
+                (2, "/path/c.py", 0, 50, 0.7, "", "", "", None, None, None),
+            ]
+        )
+
+        with (
+            patch("cocosearch.search.hybrid.get_connection_pool", return_value=pool),
+            patch(
+                "cocosearch.search.hybrid.check_symbol_columns_exist",
+                return_value=True,
+            ),
+        ):
+            batches = execute_vector_search_many(
+                [[0.5, 0.25], [1.0, 0.0], [0.0, 1.0]], "test_table", limit=5
+            )
+
+        assert len(cursor.calls) == 1
+        cursor.assert_query_contains("CROSS JOIN LATERAL")
+        cursor.assert_query_contains("unnest(%s::text[]) WITH ORDINALITY")
+        _, params = cursor.calls[0]
+        assert params[0] == ["[0.5,0.25]", "[1.0,0.0]", "[0.0,1.0]"]
+        assert params[-1] == 5
+        assert [r.filename for r in batches[0]] == ["/path/a.py"]
+        assert [r.filename for r in batches[1]] == ["/path/b.py", "/path/c.py"]
+        assert batches[1][0].symbol_type == "function"
+        assert batches[2] == []
+
+    def test_vector_many_stored_lines(self, mock_db_pool):
+        """Content and stored lines follow the symbol columns in each row."""
+        pool, cursor, conn = mock_db_pool(
+            results=[
+                (1, "/a.py", 0, 9, 0.9, "", "", "", "function", "f", None, "x", 4, 6),
+            ]
+        )
+
+        with (
+            patch("cocosearch.search.hybrid.get_connection_pool", return_value=pool),
+            patch(
+                "cocosearch.search.hybrid.check_symbol_columns_exist",
+                return_value=True,
+            ),
+            patch(
+                "cocosearch.search.hybrid.check_line_columns_exist", return_value=True
+            ),
+        ):
+            batches = execute_vector_search_many(
+                [[0.5, 0.25]], "test_table", include_content=True
+            )
+
+        result = batches[0][0]
+        assert result.symbol_name == "f"
+        assert result.content == "x"
+        assert (result.start_line, result.end_line) == (4, 6)
+
+    def test_vector_many_passes_filters(self, mock_db_pool):
+        """Shared WHERE clause and params are applied inside the lateral lookup."""
+        pool, cursor, conn = mock_db_pool(results=[])
+
+        with (
+            patch("cocosearch.search.hybrid.get_connection_pool", return_value=pool),
+            patch(
+                "cocosearch.search.hybrid.check_symbol_columns_exist",
+                return_value=False,
+            ),
+        ):
+            execute_vector_search_many(
+                [[1.0]], "test_table", 10, "language_id = %s", ["hcl"]
+            )
+
+        cursor.assert_query_contains("WHERE language_id = %s")
+        _, params = cursor.calls[0]
+        assert params[1:] == ["hcl", 10]
+
+    def test_vector_many_empty_input(self):
+        """No embeddings means no database round-trip."""
+        with patch("cocosearch.search.hybrid.get_connection_pool") as mock_pool:
+            assert execute_vector_search_many([], "test_table") == []
+        mock_pool.assert_not_called()
+
+    def test_keyword_many_single_statement(self, mock_db_pool):
+        """Normalized queries go out in one statement and rows split by ordinal."""
+        pool, cursor, conn = mock_db_pool(
+            results=[
+                (2, "/path/a.py", 0, 100, 0.5),
+            ]
+        )
+
+        with (
+            patch("cocosearch.search.hybrid.get_connection_pool", return_value=pool),
+            patch("cocosearch.search.hybrid.check_column_exists", return_value=True),
+        ):
+            batches = execute_keyword_search_many(
+                ["first query", "getUserById"], "test_table", limit=4
+            )
+
+        assert len(cursor.calls) == 1
+        cursor.assert_query_contains("plainto_tsquery('simple', text)")
+        _, params = cursor.calls[0]
+        assert "get" in params[0][1].lower()
+        assert batches[0] == []
+        assert batches[1][0].filename == "/path/a.py"
+
+    def test_keyword_many_column_missing(self):
+        """Missing content_tsv degrades to empty lists per query."""
+        with patch("cocosearch.search.hybrid.check_column_exists", return_value=False):
+            assert execute_keyword_search_many(["a", "b"], "test_table") == [[], []]
+
+    def test_keyword_many_error_degrades(self, mock_db_pool):
+        """A failing statement degrades to empty lists instead of raising."""
+        pool, cursor, conn = mock_db_pool()
+        cursor.execute = MagicMock(side_effect=RuntimeError("boom"))
+
+        with (
+            patch("cocosearch.search.hybrid.get_connection_pool", return_value=pool),
+            patch("cocosearch.search.hybrid.check_column_exists", return_value=True),
+        ):
+            assert execute_keyword_search_many(["a"], "test_table") == [[]]
+
+
 class TestHybridSearch:
     """Tests for hybrid_search function."""
 
@@ -312,7 +655,9 @@ class TestHybridSearch:
                                 "cocosearch.search.hybrid.code_to_embedding"
                             ) as mock_embed:
                                 mock_embed.eval.return_value = [0.1] * 1024
-                                results = hybrid_search("getUserById", "test_index")
+                                results = hybrid_search(
+                                    "getUserById", "test_index", concurrent=False
+                                )
 
         # Should have results from both sources
         assert len(results) >= 1
@@ -4,7 +4,7 @@ Tests hybrid search column detection and backward compatibility
 for pre-v1.7 indexes that lack content_text column.
 """
 
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 
 class TestCheckColumnExists:
@@ -235,10 +235,15 @@ class TestHybridSearchModes:
                     with patch.object(
                         query_module, "get_table_name", return_value="test_table"
                     ):
-                        # camelCase query should trigger hybrid search
-                        results = query_module.search("getUserById", "test_index")
-
-                # Hybrid search should have been called (with filter params)
+                        with patch.object(
+                            query_module, "code_to_embedding"
+                        ) as mock_embedding:
+                            mock_embedding.eval.return_value = [0.1] * 1024
+                            # camelCase query should trigger hybrid search
+                            results = query_module.search("getUserById", "test_index")
+
+                # Hybrid search should have been called (with filter params and
+                # the embedding computed for the semantic cache probe)
                 mock_hybrid.assert_called_once_with(
                     "getUserById",
                     "test_index",
@@ -246,6 +251,9 @@ class TestHybridSearchModes:
                     symbol_type=None,
                     symbol_name=None,
                     language_filter=None,
+                    query_embedding=[0.1] * 1024,
+                    include_content=False,
+                    keyword_future=ANY,
                 )
 
         # Results should have match_type from hybrid search
@@ -254,7 +262,9 @@ class TestHybridSearchModes:
         assert results[0].vector_score == 0.85
         assert results[0].keyword_score == 0.75
 
-    def test_search_auto_hybrid_triggered_by_snake_case(self, mock_db_pool):
+    def test_search_auto_hybrid_triggered_by_snake_case(
+        self, mock_db_pool, mock_code_to_embedding
+    ):
         """Test that snake_case queries auto-trigger hybrid search."""
         import cocosearch.search.query as query_module
 
@@ -295,7 +305,7 @@ class TestHybridSearchModes:
         assert len(results) == 1
         assert results[0].match_type == "keyword"
 
-    def test_search_explicit_hybrid_mode(self, mock_db_pool):
+    def test_search_explicit_hybrid_mode(self, mock_db_pool, mock_code_to_embedding):
         """Test that use_hybrid=True forces hybrid search even for plain queries."""
         import cocosearch.search.query as query_module
 